@@ -9,8 +9,6 @@ if is_pynastrangui_exe or is_installed:
     # pyInstaller
     from pyNastran.version import __version__, __releaseDate__
 else:
-    import subprocess
-
     # this is still a requirement, but disabling it so readthedocs works
     if sys.version_info < (3, 7):  # pragma: no cover
         IMAJOR, MINOR1, MINOR2 = sys.version_info[:3]
@@ -22,6 +20,7 @@ else:
     def get_git_revision_short_hash():
         """determines the git revision; only works if the packages was checked
         out using git"""
+        import subprocess
         try:
             #ghash = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'])
 
@@ -38,8 +37,18 @@ else:
             ghash = 'no.checksum.error'
         return 'dev.%s' % ghash
 
-    revision = get_git_revision_short_hash()
-    __version__ = '1.4.0+%s' % revision
+    def __getattr__(name):
+        """
+        Gets ``pyNastran.__version__`` the first time it's used, so
+        ``import pyNastran`` doesn't have to wait on ``git describe``
+        """
+        if name == '__version__':
+            global __version__
+            revision = get_git_revision_short_hash()
+            __version__ = '1.4.0+%s' % revision
+            return __version__
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
     __releaseDate__ = '2020/4/xx'
     __releaseDate2__ = 'APRIL xx, 2020'
 
@@ -52,14 +61,15 @@ __pyside_copyright__ = 'Copyright LGPLv3 - pySide'
 __pyqt_copyright__ = 'Copyright GPLv3 - PyQt'
 __website__ = 'https://github.com/SteveDoyle2/pyNastran'
 #__docs__ = 'http://pynastran.m4-engineering.com/master'  # still not setup...
-if 'dev' in  __version__:
-    __docs_rtd__ = 'https://pynastran-git.readthedocs.io/en/latest/quick_start/index.html'
-    __docs__ = __docs_rtd__
-else:
+if is_pynastrangui_exe or is_installed:
     # 1.3
     # we don't do separate doc releases for 1.3 vs 1.3.1
     __docs_rtd__ = f'https://pynastran-git.readthedocs.io/en/{__version__[:3]}/quick_start/index.html'
     __docs__ = f'http://pynastran.m4-engineering.com/{__version__}'
+else:
+    # a dev version
+    __docs_rtd__ = 'https://pynastran-git.readthedocs.io/en/latest/quick_start/index.html'
+    __docs__ = __docs_rtd__
 
 __issue__ = 'https://github.com/SteveDoyle2/pyNastran/issues'
 __discussion_forum__ = 'https://groups.google.com/forum/#!forum/pynastran-discuss'
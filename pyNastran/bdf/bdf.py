@@ -13,13 +13,14 @@ from io import StringIO, IOBase
 import traceback
 from collections import defaultdict
 
-from typing import List, Dict, Set, Tuple, Sequence, Optional, Union, Any # , cast
+from typing import List, Dict, Set, Tuple, Sequence, Optional, Union, Iterator, Any # , cast
 from pickle import load, dump, dumps  # type: ignore
 
 import numpy as np  # type: ignore
 from cpylog import get_logger2
 
 from pyNastran.utils import object_attributes, check_path
+from pyNastran.utils.compressed_file import open_file, is_file
 from .utils import parse_patran_syntax
 from .bdf_interface.utils import (
     _parse_pynastran_header, to_fields, parse_executive_control_deck,
@@ -176,10 +177,21 @@ from .errors import (CrossReferenceError, DuplicateIDsError,
                                   CardParseSyntaxError, UnsupportedCard, DisabledCardError,
                                   SuperelementFlagError, ReplicationError)
 from .bdf_interface.pybdf import (
-    BDFInputPy, _clean_comment, _clean_comment_bulk, EXECUTIVE_CASE_SPACES)
+    BDFInputPy, _clean_comment, _clean_comment_bulk, _iter_bulk_data_lines,
+    EXECUTIVE_CASE_SPACES)
+from .bdf_interface.model_cache import (
+    get_cache_key, get_file_signature, load_cached_model, save_cached_model)
+from .bdf_interface.include_refresh import (
+    remove_cards_by_ifile, get_xref_flags, uncross_reference_by_flags)
+from .bdf_interface.fast_parse import fast_parse_cards
+from .bdf_interface.lazy_cards import split_lazy_cards, hide_lazy_cards
+from .bdf_interface.coord_table import CoordTable
 
 #from .bdf_interface.add_card import CARD_MAP
 
+#: cards where the card_lines are passed directly to add_card
+RAW_LINES_CARDS = {'DEQATN', 'PBRSECT', 'PBMSECT', 'GMCURV', 'GMSURF', 'OUTPUT', 'ADAPT'}
+
 
 def load_bdf_object(obj_filename:str, xref: bool=True, log=None, debug: bool=True):
     model = BDF(log=log, debug=debug)
@@ -263,6 +275,25 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         # flag that allows for OpenMDAO-style optimization syntax to be used
         self._is_dynamic_syntax = False
 
+        # the number of processes used to create card objects in read_bdf
+        self._nworkers = 1
+
+        # use the vectorized parser for the small field GRID/element cards
+        self._fast_parse = False
+
+        # store the card lines and parse the cards when they're used
+        self._lazy = False
+        self._lazy_validate = False
+
+        # the cached coordinate systems used by get_coord_table
+        self._coord_table = None
+
+        # used by refresh_includes (save_file_structure=True)
+        #   the signature of each file in active_filenames
+        #   the card_count by ifile
+        self._include_signatures = []  # type: List[Dict[str, Any]]
+        self._ifile_card_count = {}  # type: Dict[int, Dict[str, int]]
+
         # lines that were rejected b/c they were for a card that isnt supported
         self.reject_lines = []  # type: List[List[str]]
 
@@ -627,12 +658,22 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             del state['_card_parser_prepare']
         return state
 
+    def __setstate__(self, state):
+        """rebuilds the variables that were cleared out by ``__getstate__``"""
+        self.__dict__.update(state)
+        if 'log' not in state:
+            self.log = get_logger2(log=None, debug=True)
+        self._make_card_parser()
+        if self._nastran_format == 'zona':
+            self.zona.update_for_zona()
+
     def get_h5attrs(self) -> List[str]:
         """helper method for dict_to_h5py"""
         attrs = self.object_attributes(mode='both', keys_to_skip=None)
         return attrs
 
-    def export_hdf5_filename(self, hdf5_filename:str) -> None:
+    def export_hdf5_filename(self, hdf5_filename:str,
+                             compression: Optional[str]=None) -> None:
         """
         Converts the BDF objects into hdf5 object
 
@@ -640,6 +681,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         ----------
         hdf5_filename : str
             the path to the hdf5 file
+        compression : str; default=None
+            the h5py compression filter for the card arrays
+            (e.g., 'gzip', 'lzf'); the arrays are always chunked
 
         TODO: doesn't support:
           - BucklingEigenvalues
@@ -648,9 +692,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         import h5py
         with h5py.File(hdf5_filename, 'w') as hdf5_file:
             #self.log.info('starting export_hdf5_file of %r' % hdf5_filename)
-            self.export_hdf5_file(hdf5_file)
+            self.export_hdf5_file(hdf5_file, compression=compression)
 
-    def export_hdf5_file(self, hdf5_file, exporter=None) -> None:
+    def export_hdf5_file(self, hdf5_file, exporter=None,
+                         compression: Optional[str]=None) -> None:
         """
         Converts the BDF objects into hdf5 object
 
@@ -660,12 +705,16 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             an h5py object
         exporter : HDF5Exporter; default=None
             unused
+        compression : str; default=None
+            the h5py compression filter for the card arrays
+            (e.g., 'gzip', 'lzf'); the arrays are always chunked
 
         """
         from pyNastran.bdf.bdf_interface.hdf5_exporter import export_bdf_to_hdf5_file
-        export_bdf_to_hdf5_file(hdf5_file, self)
+        export_bdf_to_hdf5_file(hdf5_file, self, compression=compression)
 
-    def load_hdf5_filename(self, hdf5_filename:str) -> None:
+    def load_hdf5_filename(self, hdf5_filename:str,
+                           cards: Optional[List[str]]=None) -> None:
         """
         Loads a BDF object from an hdf5 filename
 
@@ -673,14 +722,16 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         ----------
         hdf5_filename : str
             the path to the hdf5 file
+        cards : List[str]; default=None -> all
+            the cards to load (e.g., ['GRID', 'CQUAD4'])
 
         """
         import h5py
         with h5py.File(hdf5_filename, 'r') as hdf5_file:
             #self.log.info('starting load_hdf5_file of %r' % hdf5_filename)
-            self.load_hdf5_file(hdf5_file)
+            self.load_hdf5_file(hdf5_file, cards=cards)
 
-    def load_hdf5_file(self, h5_file) -> None:
+    def load_hdf5_file(self, h5_file, cards: Optional[List[str]]=None) -> None:
         """
         Loads a BDF object from an hdf5 object
 
@@ -688,12 +739,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         ----------
         hdf5_file : H5File()
             an h5py object
-        exporter : HDF5Exporter; default=None
-            unused
+        cards : List[str]; default=None -> all
+            the cards to load (e.g., ['GRID', 'CQUAD4']); see
+            ``load_bdf_from_hdf5_file``
 
         """
         from pyNastran.bdf.bdf_interface.hdf5_loader import load_bdf_from_hdf5_file
-        load_bdf_from_hdf5_file(h5_file, self)
+        load_bdf_from_hdf5_file(h5_file, self, cards=cards)
 
     def saves(self, unxref: bool=True) -> str:
         """Saves a pickled string"""
@@ -737,7 +789,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             'material_ids', 'caero_ids', 'is_long_ids',
             'nnodes', 'npoints', 'ncoords', 'nelements', 'nproperties',
             'nmaterials', 'ncaeros', 'nid_map',
-            'is_bdf_vectorized', 'type_slot_str',
+            'is_bdf_vectorized', 'type_slot_str', 'xref_arrays', 'profile_stats',
             #'dmigs', 'dmijs', 'dmiks', 'dmijis', 'dtis', 'dmis',
 
             'point_ids', 'subcases',
@@ -948,11 +1000,17 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
     def read_bdf(self, bdf_filename: Optional[str]=None,
                  validate: bool=True,
-                 xref: bool=True,
+                 xref: Union[bool, str]=True,
                  punch: bool=False,
                  read_includes: bool=True,
                  save_file_structure: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 nworkers: int=1,
+                 cache_dir: Optional[str]=None,
+                 cache_hash: bool=False,
+                 fast_parse: bool=False,
+                 lazy: bool=False,
+                 profile: Union[bool, str]=False) -> None:
         """
         Read method for the bdf files
 
@@ -960,10 +1018,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         ----------
         bdf_filename : str / None
             the input bdf (default=None; popup a dialog)
+            gzip (.gz), bzip2 (.bz2), lzma (.xz) files and files in a
+            zip archive (e.g., 'models.zip/model.bdf') are read as
+            streams; INCLUDE files may be compressed/archived as well
         validate : bool; default=True
             runs various checks on the BDF
-        xref :  bool; default=True
+        xref :  bool / str; default=True
             should the bdf be cross referenced
+            'arrays' : build the id/index arrays (``model.xref_arrays``)
+                       instead of linking the cards
         punch : bool; default=False
             indicates whether the file is a punch file
         read_includes : bool; default=True
@@ -972,6 +1035,36 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             enables the ``write_bdfs`` method
         encoding : str; default=None -> system default
             the unicode encoding
+        nworkers : int; default=1
+            the number of processes used to create the bulk data card
+            objects; the cards are added to the model in deck order, so
+            the result is the same as the serial reader
+        cache_dir : str; default=None
+            None : don't use a cache
+            str : the directory for a cache of parsed (not cross-referenced)
+                  models; the cache is used when the main file and all the
+                  INCLUDE files are unchanged and is rebuilt otherwise
+        cache_hash : bool; default=False
+            False : a file is unchanged if the path, size and modification
+                    time are the same
+            True : also compare the sha1 of the file contents
+        fast_parse : bool; default=False
+            parse the small field GRID, CQUAD4, CTRIA3, CTETRA, CHEXA and
+            CBAR cards with a vectorized parser; unusual cards (e.g., CSV,
+            large field) use the standard parser
+        lazy : bool; default=False
+            store the lines of the common cards (e.g., nodes, elements,
+            properties, materials) and parse them the first time that
+            model attribute is used (e.g., ``model.elements``);
+            ``card_count`` and ``get_bdf_stats`` don't parse the cards.
+            Use xref=False; cross referencing parses all the cards.
+            The lazy cards are validated when they're parsed.
+        profile : bool / str; default=False
+            record the wall time and count of each phase (e.g., reading
+            the lines, adding the cards, cross referencing) and card type
+            (see ``model.profile_stats`` and ``model.get_profile_stats()``)
+            'memory' : also track the change in memory with tracemalloc,
+                       which makes reading the deck ~5-10x slower
 
         .. code-block:: python
 
@@ -991,30 +1084,74 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         self.save_file_structure = save_file_structure
+        self._nworkers = nworkers
+        self._fast_parse = fast_parse
+        self._lazy = lazy
+        self._lazy_validate = False
+        if lazy and save_file_structure:
+            raise NotImplementedError('lazy=True does not support save_file_structure=True')
         if bdf_filename and not isinstance(bdf_filename, (StringIO, list)):
             check_path(bdf_filename, 'bdf_filename')
+        # a profile from an earlier read_bdf is replaced
+        self._profiler = None
+        self._profile_stats = None
+        is_started = self._start_profile(profile)
+        try:
+            self._read_bdf(bdf_filename, validate, xref, punch, read_includes,
+                           save_file_structure, encoding, nworkers,
+                           cache_dir, cache_hash, fast_parse, lazy)
+        finally:
+            if is_started:
+                self._stop_profile()
+
+    def _read_bdf(self, bdf_filename: Optional[str], validate: bool,
+                  xref: Union[bool, str], punch: bool, read_includes: bool,
+                  save_file_structure: bool, encoding: Optional[str], nworkers: int,
+                  cache_dir: Optional[str], cache_hash: bool,
+                  fast_parse: bool, lazy: bool) -> None:
+        """helper for ``read_bdf``"""
+        phase = self._profile_phase
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
         self.log.debug('---starting BDF.read_bdf of %s---' % self.bdf_filename)
-        self._parse_primary_file_header(bdf_filename)
 
-        obj = BDFInputPy(self.read_includes, self.dumplines, self._encoding,
-                         nastran_format=self.nastran_format,
-                         consider_superelements=self.is_superelements,
-                         log=self.log, debug=self.debug)
-        out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
-        system_lines, executive_control_lines, case_control_lines, bulk_data_lines, bulk_data_ilines, superelement_lines, superelement_ilines = out
-        self._set_pybdf_attributes(obj, save_file_structure)
+        cache_key = None
+        if cache_dir is not None and isinstance(self.bdf_filename, str):
+            with phase('load_cache'):
+                cache_key = get_cache_key(self.bdf_filename, self, self.punch,
+                                          self.read_includes, self._encoding,
+                                          save_file_structure)
+                bdf_filename_cached = self.bdf_filename
+                is_cached = load_cached_model(self, cache_dir, cache_key,
+                                              hash_contents=cache_hash)
+            if is_cached:
+                self.bdf_filename = bdf_filename_cached
+                self.case_control_deck.solmap_to_value = self._solmap_to_value
+                self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
+                self._finish_read_bdf(validate, xref)
+                return
+
+        with phase('read_lines'):
+            self._parse_primary_file_header(bdf_filename)
+
+            obj = BDFInputPy(self.read_includes, self.dumplines, self._encoding,
+                             nastran_format=self.nastran_format,
+                             consider_superelements=self.is_superelements,
+                             log=self.log, debug=self.debug)
+            out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
+            system_lines, executive_control_lines, case_control_lines, bulk_data_lines, bulk_data_ilines, superelement_lines, superelement_ilines = out
+            self._set_pybdf_attributes(obj, save_file_structure)
 
         self.system_command_lines = system_lines
         self.executive_control_lines = executive_control_lines
         self.case_control_lines = case_control_lines
 
-        sol, method, sol_iline = parse_executive_control_deck(executive_control_lines)
-        self.update_solution(sol, method, sol_iline)
+        with phase('control_decks'):
+            sol, method, sol_iline = parse_executive_control_deck(executive_control_lines)
+            self.update_solution(sol, method, sol_iline)
 
-        self.case_control_deck = CaseControlDeck(case_control_lines, self.log)
-        self.case_control_deck.solmap_to_value = self._solmap_to_value
-        self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
+            self.case_control_deck = CaseControlDeck(case_control_lines, self.log)
+            self.case_control_deck.solmap_to_value = self._solmap_to_value
+            self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
 
         try:
             self._parse_all_cards(bulk_data_lines, bulk_data_ilines)
@@ -1025,25 +1162,125 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             self.clear_attributes()
             self.log.error('Attempting to use is_superelements=True.')
             self.is_superelements = True
-            self.read_bdf(bdf_filename=bdf_filename, validate=validate, xref=xref, punch=punch,
-                          read_includes=read_includes, save_file_structure=save_file_structure,
-                          encoding=encoding)
+            self._read_bdf(bdf_filename, validate, xref, punch, read_includes,
+                           save_file_structure, encoding, nworkers,
+                           cache_dir, cache_hash, fast_parse, lazy)
             return
 
         if superelement_lines:
-            self._add_superelements(superelement_lines, superelement_ilines)
+            with phase('superelements'):
+                self._add_superelements(superelement_lines, superelement_ilines)
 
         self.pop_parse_errors()
-        fill_dmigs(self)
-
+        with phase('fill_dmigs'):
+            fill_dmigs(self)
+
+        if save_file_structure and isinstance(self.bdf_filename, str):
+            self._include_signatures = [get_file_signature(filename)
+                                        for filename in self.active_filenames]
+        if cache_key is not None:
+            with phase('save_cache'):
+                save_cached_model(self, cache_dir, cache_key, hash_contents=cache_hash)
+        self._finish_read_bdf(validate, xref)
+
+    def _finish_read_bdf(self, validate: bool, xref: bool) -> None:
+        """validates and cross-references the parsed model for ``read_bdf``"""
         if validate:
-            self.validate()
+            with self._profile_phase('validate'):
+                if self._lazy:
+                    # the lazy cards are validated when they're parsed
+                    self._lazy_validate = True
+                    with hide_lazy_cards(self):
+                        self.validate()
+                else:
+                    self.validate()
 
         self.cross_reference(xref=xref)
-        self._xref = xref
+        # the cards aren't linked for xref='arrays'
+        self._xref = False if xref == 'arrays' else xref
 
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
+    def refresh_includes(self) -> List[str]:
+        """
+        Re-reads the INCLUDE files that changed since ``read_bdf``.
+
+        The cards from a changed file are removed, the file is parsed
+        again and, if the model is cross-referenced, only the card groups
+        that could point to the changed cards are cross-referenced.
+
+        Returns
+        -------
+        refreshed_filenames : List[str]
+            the INCLUDE files that were re-read
+
+        .. code-block:: python
+
+           >>> model = read_bdf(bdf_filename, save_file_structure=True)
+           # ...edit an INCLUDE file...
+           >>> model.refresh_includes()
+           ['/path/to/edited.inc']
+
+        .. note:: requires ``read_bdf(..., save_file_structure=True)``
+        .. warning:: the main file and INCLUDE files with INCLUDEs can't
+                     be refreshed; call ``read_bdf`` instead
+
+        """
+        if not self.save_file_structure or not self._include_signatures:
+            raise RuntimeError('refresh_includes requires read_bdf(..., save_file_structure=True)')
+
+        changed_ifiles = []
+        for ifile, signature in enumerate(self._include_signatures):
+            filename = signature['path']
+            if is_file(filename) and get_file_signature(filename) == signature:
+                continue
+            if ifile == 0:
+                raise RuntimeError('the main file %r changed; call read_bdf' % filename)
+            if self.include_filenames.get(ifile):
+                raise NotImplementedError(
+                    '%r changed and has INCLUDE files; call read_bdf' % filename)
+            changed_ifiles.append(ifile)
+
+        slots = set()
+        for ifile in changed_ifiles:
+            filename = self._include_signatures[ifile]['path']
+            self.log.debug('refreshing %r' % filename)
+            slots.update(remove_cards_by_ifile(self, ifile))
+            for card_name, count in self._ifile_card_count.pop(ifile, {}).items():
+                self.card_count[card_name] -= count
+                if self.card_count[card_name] == 0:
+                    del self.card_count[card_name]
+
+            # the INCLUDE file is read as a punch file, so the encoding
+            # and comments are handled like in read_bdf
+            obj = BDFInputPy(False, self.dumplines, self._encoding,
+                             nastran_format=self.nastran_format,
+                             consider_superelements=self.is_superelements,
+                             log=self.log, debug=self.debug)
+            out = obj.get_lines(filename, punch=True, make_ilines=True)
+            bulk_data_lines, bulk_data_ilines, superelement_lines = out[3], out[4], out[5]
+            if obj.include_lines or superelement_lines:
+                raise NotImplementedError(
+                    '%r now has INCLUDE files or superelements; call read_bdf' % filename)
+            bulk_data_ilines[:, 0] = ifile
+            cards_list, cards_dict, card_count = self.get_bdf_cards(
+                bulk_data_lines, bulk_data_ilines)
+            self._parse_cards(cards_list, cards_dict, card_count)
+            slots.update(self._type_to_slot_map[card_name]
+                         for card_name in self._ifile_card_count.get(ifile, {})
+                         if card_name in self._type_to_slot_map)
+            self._include_signatures[ifile] = get_file_signature(filename)
+
+        self.pop_parse_errors()
+        if changed_ifiles and self._xref:
+            # the cards that point to the changed cards are linked again
+            xref_flags = get_xref_flags(slots)
+            uncross_reference_by_flags(self, xref_flags)
+            self.cross_reference(xref=True, **xref_flags)
+        elif changed_ifiles and self._xref_arrays is not None:
+            self.cross_reference(xref='arrays')
+        return [self._include_signatures[ifile]['path'] for ifile in changed_ifiles]
+
     def _add_superelements(self, superelement_lines: List[str],
                            superelement_ilines: Any) -> None:  # pragma: no cover
         self.log.warning('_add_superelements should be overwritten')
@@ -1052,9 +1289,11 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         """creates and loads all the cards the bulk data section"""
         cards_list = []
         cards_dict = {}
+        phase = self._profile_phase
         if self._is_cards_dict:
-            cards_dict, card_count = self.get_bdf_cards_dict(
-                bulk_data_lines, bulk_data_ilines)
+            with phase('tokenize'):
+                cards_dict, card_count = self.get_bdf_cards_dict(
+                    bulk_data_lines, bulk_data_ilines)
             #if 0:
                 #with open('dump.bdf', 'w') as bdf_file_obj:
                     #bdf_file_obj.write('\n'.join(executive_control_lines))
@@ -1065,13 +1304,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                             #bdf_file_obj.write('\n'.join(cardlines) + '\n')
                         #bdf_file_obj.write('\n')
         else:
-            cards_list, cards_dict, card_count = self.get_bdf_cards(
-                bulk_data_lines, bulk_data_ilines)
+            with phase('tokenize'):
+                cards_list, cards_dict, card_count = self.get_bdf_cards(
+                    bulk_data_lines, bulk_data_ilines)
             #for card in cards_list:
                 #card_name = card[0]
                 #if card_name == 'CBAR':
                     #print(card)
-        self._parse_cards(cards_list, cards_dict, card_count)
+        with phase('add_cards'):
+            self._parse_cards(cards_list, cards_dict, card_count)
 
         if self.values_to_skip:
             for key, values in self.values_to_skip.items():
@@ -1352,6 +1593,68 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self.echo = False
         return cards_list, cards_dict, card_count
 
+    def iter_bdf_cards(self, bdf_filename: Union[str, StringIO],
+                       punch: Optional[bool]=False, read_includes: bool=True,
+                       encoding: Optional[str]=None) -> Iterator[
+                           Tuple[str, List[Any], str, int, int]]:
+        """
+        Streams the bulk data cards without building the model.
+
+        The deck (and the INCLUDE files) are read one line at a time, so
+        memory doesn't scale with the size of the deck.  No card objects
+        are created and the model isn't changed (other than the
+        ``active_filenames``/``include_filenames``).
+
+        Parameters
+        ----------
+        bdf_filename : str / StringIO
+            the input bdf
+        punch : bool / None; default=False
+            None : guess
+            True : no executive/case control decks
+            False : executive/case control decks exist
+        read_includes : bool; default=True
+            should include files be read
+        encoding : str; default=None -> system default
+            the unicode encoding
+
+        Yields
+        ------
+        card_name : str
+            the card name (e.g., 'GRID')
+        fields : List[str]
+            the fields of the card (e.g., ['GRID', '1', None, '0.0'])
+            the lines of the card for DEQATN, PBRSECT, ...
+        comment : str
+            the comment above the card
+        ifile : int
+            the index of the file that the card is in (0 = main file)
+        iline : int
+            the 0-based line number of the first line of the card
+
+        .. code-block:: python
+
+           >>> model = BDF()
+           >>> nelements = 0
+           >>> for card_name, fields, comment, ifile, iline in model.iter_bdf_cards(bdf_filename):
+           ...     if card_name == 'CQUAD4':
+           ...         nelements += 1
+
+        """
+        self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
+        obj = BDFInputPy(self.read_includes, self.dumplines, self._encoding,
+                         nastran_format=self.nastran_format,
+                         consider_superelements=self.is_superelements,
+                         log=self.log, debug=self.debug)
+        lines = _iter_bulk_data_lines(obj.iter_lines(self.bdf_filename), self.punch)
+        for card_name, comment, card_lines, ifile, iline in _iter_card_lines(lines):
+            if card_name in RAW_LINES_CARDS:
+                fields = card_lines
+            else:
+                fields = wipe_empty_fields(to_fields(card_lines, card_name))
+            yield card_name, fields, comment, ifile, iline
+        self._set_pybdf_attributes(obj, save_file_structure=False)
+
     def get_bdf_cards_dict(self, bulk_data_lines, bulk_data_ilines=None):
         """Parses the BDF lines into a list of card_lines"""
         if bulk_data_ilines is None:
@@ -1667,7 +1970,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         """
         card_name = card_name.upper()
         self.increase_card_count(card_name)
-        if card_name in ['DEQATN', 'PBRSECT', 'PBMSECT', 'GMCURV', 'GMSURF', 'OUTPUT', 'ADAPT']:
+        if card_name in RAW_LINES_CARDS:
             card_obj = card_lines
             card = card_lines
         else:
@@ -2684,10 +2987,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         """Same as ``add_card`` except it has an ifile parameter"""
         assert isinstance(ifile, (int, np.int32)), 'ifile=%s type=%s' % (ifile, type(ifile))
         card_name = card_name.upper()
+        profiler = self._profiler
+        if profiler is not None:
+            start = profiler.start_card()
         card_obj, unused_card = self.create_card_object(
             card_lines, card_name,
             is_list=is_list, has_none=has_none)
         self._add_card_helper_ifile(ifile, card_obj, card_name, card_name, comment)
+        if profiler is not None:
+            profiler.stop_card(card_name, start)
         return card_obj
 
     def add_card(self, card_lines: List[str], card_name: str,
@@ -2759,10 +3067,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         card_name = card_name.upper()
+        profiler = self._profiler
+        if profiler is not None:
+            start = profiler.start_card()
         card_obj, unused_card = self.create_card_object(
             card_lines, card_name,
             is_list=is_list, has_none=has_none)
         self._add_card_helper(card_obj, card_name, card_name, ifile, comment)
+        if profiler is not None:
+            profiler.stop_card(card_name, start)
         return card_obj
 
     def add_card_fields(self, card_lines, card_name, comment='', has_none=True):
@@ -3122,9 +3435,6 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         [2]
 
         """
-        nids_cd_transform = defaultdict(list)  # type: Dict[int, np.ndarray]
-        nids_cp_transform = defaultdict(list)  # type: Dict[int, np.ndarray]
-
         nnodes = len(self.nodes)
         nspoints = 0
         nepoints = 0
@@ -3144,18 +3454,22 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 nnodes, nspoints, nepoints, nrings)
             raise ValueError(msg)
 
-        i = 0
         nxyz = nnodes + nspoints + nepoints + ngridb
         xyz_cp = np.zeros((nxyz, 3), dtype=fdtype)
         nid_cp_cd = np.zeros((nxyz, 3), dtype=idtype)
-        for nid, node in sorted(self.nodes.items()):
-            cd = node.Cd()
-            cp = node.Cp()
-            nids_cp_transform[cp].append(nid)
-            nids_cd_transform[cd].append(nid)
-            nid_cp_cd[i, :] = [nid, cp, cd]
-            xyz_cp[i, :] = node.xyz
-            i += 1
+        if nnodes:
+            nids = sorted(self.nodes)
+            nodes = [self.nodes[nid] for nid in nids]
+            nid_cp_cd[:nnodes, 0] = nids
+            nid_cp_cd[:nnodes, 1] = [node.Cp() for node in nodes]
+            nid_cp_cd[:nnodes, 2] = [node.Cd() for node in nodes]
+            xyz_cp[:nnodes, :] = [node.xyz for node in nodes]
+
+        # only the GRIDs are transformed
+        is_grid = np.zeros(nxyz, dtype='bool')
+        is_grid[:nnodes] = True
+
+        i = nnodes
         if nspoints:
             for nid in sorted(spoints):
                 nid_cp_cd[i, 0] = nid
@@ -3184,24 +3498,25 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             isort = nids.argsort()
             nid_cp_cd = nid_cp_cd[isort, :]
             xyz_cp = xyz_cp[isort, :]
+            is_grid = is_grid[isort]
 
         icp_transform = {}
         icd_transform = {}
-        nids_all = nid_cp_cd[:, 0]
 
         # get the indicies of the xyz array where the nodes that
         # need to be transformed are
-        for cd, nids in sorted(nids_cd_transform.items()):
+        igrid = np.where(is_grid)[0]
+        cps = nid_cp_cd[igrid, 1]
+        cds = nid_cp_cd[igrid, 2]
+        for cd in np.unique(cds).tolist():
             if cd in [0, -1]:
                 continue
-            nids = np.array(nids)
-            icd_transform[cd] = np.where(np.in1d(nids_all, nids))[0]
+            icd_transform[cd] = igrid[cds == cd]
 
-        for cp, nids in sorted(nids_cp_transform.items()):
+        for cp in np.unique(cps).tolist():
             if cp in [-1]:
                 continue
-            nids = np.array(nids)
-            icp_transform[cp] = np.where(np.in1d(nids_all, nids))[0]
+            icp_transform[cp] = igrid[cps == cp]
         return icd_transform, icp_transform, xyz_cp, nid_cp_cd
 
     def get_xyz_in_coord_array(self, cid: int=0,
@@ -3249,6 +3564,55 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                                                   cid=cid, in_place=False, atol=1e-6)
         return nid_cp_cd, xyz_cid, xyz_cp, icd_transform, icp_transform
 
+    def get_coord_table(self) -> CoordTable:
+        """
+        Gets the cached origins and transformation matrices of the
+        coordinate systems.  The table is rebuilt when a coordinate
+        card is added, removed or modified, so the model doesn't
+        need to be cross-referenced.
+
+        Returns
+        -------
+        coord_table : CoordTable
+            the coordinate systems in the basic frame
+
+        """
+        coord_table = self._coord_table
+        if coord_table is None or not coord_table.is_valid(self):
+            coord_table = CoordTable(self)
+            self._coord_table = coord_table
+        return coord_table
+
+    def transform_xyz_to_cid(self, xyz_cp: Any, cps: Any, cid: int=0) -> Any:
+        """
+        Vectorized method for transforming points defined in many
+        different coordinate systems to an arbitrary coordinate system.
+
+        Parameters
+        ----------
+        xyz_cp : (n, 3) float ndarray
+            points in the CP coordinate systems
+        cps : (n, ) int ndarray
+            the CP coordinate system of each point
+        cid : int; default=0
+            the coordinate system to get xyz in
+
+        Returns
+        -------
+        xyz_cid : (n, 3) float ndarray
+            points in the CID coordinate system
+
+        Examples
+        --------
+        >>> out = model.get_displacement_index_xyz_cp_cd()
+        >>> icd_transform, icp_transform, xyz_cp, nid_cp_cd = out
+        >>> cps = nid_cp_cd[:, 1]
+        >>> xyz_cid0 = model.transform_xyz_to_cid(xyz_cp, cps, cid=0)
+        >>> xyz_cid1 = model.transform_xyz_to_cid(xyz_cp, cps, cid=1)
+
+        """
+        return self.get_coord_table().transform(xyz_cp, cps, cid=cid)
+
     def transform_xyzcp_to_xyz_cid(self, xyz_cp: Any, nids: Any, icp_transform: Any,
                                    cid: int=0, in_place: bool=False, atol: float=1e-6) -> Any:
         """
@@ -3270,6 +3634,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         in_place : bool, default=False
             If true the original xyz_cp is modified, otherwise a
             new one is created.
+        atol : float; default=1e-6
+            the tolerance used to check the result of the vectorized
+            BDF; None -> no check
 
         Returns
         -------
@@ -3295,6 +3662,22 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         #F:\work\pyNastran\examples\femap_examples\Support\nast\tpl\heli112em7.dat
+        if not self.is_bdf_vectorized:
+            # use the cached coordinate systems
+            cps = np.zeros(len(nids), dtype='int64')
+            for cp, inode in icp_transform.items():
+                cps[inode] = cp
+            xyz_cid0 = self.transform_xyz_to_cid(xyz_cp, cps, cid=0).astype(
+                xyz_cp.dtype, copy=False)
+            if in_place:
+                xyz_cp[:, :] = xyz_cid0
+                xyz_cid0 = xyz_cp
+            if cid == 0:
+                return xyz_cid0
+            xyz_cid = self.transform_xyz_to_cid(
+                xyz_cid0, np.zeros(len(nids), dtype='int64'), cid=cid)
+            return xyz_cid.astype(xyz_cp.dtype, copy=False)
+
         if self.is_bdf_vectorized:
             # this is used when xref=False (only for vectorized=True)
             # we now require nids, where the other approach
@@ -3813,6 +4196,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         if cards_dict: # self._is_cards_dict = True
             self._parse_cards_dict(cards_dict)
 
+        if cards_list and self._lazy:
+            cards_list = split_lazy_cards(self, cards_list)
+
         if cards_list:
             # this is the block that actually runs
             self._parse_cards_list(cards_list)
@@ -3837,7 +4223,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
     def _parse_cards_list(self, cards_list):
         """parses the cards that are in list format"""
         save_file_structure = self.save_file_structure
+        parsed_cards = {}
+        if self._fast_parse and not self._is_dynamic_syntax:
+            with self._profile_phase('fast_parse'):
+                parsed_cards = fast_parse_cards(self, cards_list)
+        parsed_cards.update(self._parse_cards_list_parallel(cards_list, parsed_cards))
         if save_file_structure:
+            ifile_card_count = self._ifile_card_count
             for icard, card in enumerate(cards_list):
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 if card_name is None:
@@ -3845,6 +4237,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     msg += 'card_lines = %s' % card_lines
                     raise RuntimeError(msg)
 
+                if ifile not in ifile_card_count:
+                    ifile_card_count[ifile] = defaultdict(int)
+
                 if '=' in card_name:
                     #print(card)
                     try:
@@ -3858,15 +4253,19 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     for replicated_card in replicated_cards:
                         self.add_card_ifile(ifile, replicated_card, replicated_card[0],
                                             comment=comment, is_list=True, has_none=True)
+                        ifile_card_count[ifile][replicated_card[0].upper()] += 1
                     continue
 
                 if self.is_reject(card_name):  # pragma: no cover
                     msg = "save_file_structure=True doesn't support %s" % card_name
                     raise NotImplementedError(msg)
                     #self.reject_card_lines(card_name, card_lines, comment)
+                elif icard in parsed_cards:
+                    self._add_parsed_card(card_name, parsed_cards.pop(icard), ifile=ifile)
                 else:
                     self.add_card_ifile(ifile, card_lines, card_name, comment=comment,
                                         is_list=False, has_none=False)
+                ifile_card_count[ifile][card_name] += 1
 
         else:
             for icard, card in enumerate(cards_list):
@@ -3894,10 +4293,117 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
                 if self.is_reject(card_name):
                     self.reject_card_lines(card_name, card_lines, comment=comment)
+                elif icard in parsed_cards:
+                    self._add_parsed_card(card_name, parsed_cards.pop(icard))
                 else:
                     self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
                                   is_list=False, has_none=False)
 
+    def _parse_cards_list_parallel(self, cards_list, parsed_cards=None):
+        """
+        Creates the card objects for the simple cards in a process pool.
+
+        Only cards that are built by a ``card_class.add_card(card, comment)``
+        call are sent to the workers.  Replicated cards, rejected cards,
+        special cards (e.g., DEQATN) and cards that need the model to be
+        created (``_card_parser_prepare``) are left for the serial loop.
+
+        Parameters
+        ----------
+        cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+            the cards from ``get_bdf_cards``
+        parsed_cards : Dict[icard] = (class_instance, card_obj, exception); default=None
+            the cards that were already created (e.g., by ``fast_parse_cards``)
+
+        Returns
+        -------
+        parsed_cards : Dict[icard] = (class_instance, card_obj, exception)
+            class_instance : the card object; None if there was an error
+            card_obj : BDFCard; None if there was not an error
+            exception : the parsing error; None if there was not an error
+
+        """
+        nworkers = self._nworkers
+        if nworkers is None or nworkers <= 1 or self._is_dynamic_syntax:
+            return {}
+        if any(card[0] == 'ECHOON' for card in cards_list):
+            return {}
+
+        icards = []
+        cards_to_parse = []
+        for icard, (card_name, comment, card_lines, unused_ifile_iline) in enumerate(cards_list):
+            if parsed_cards and icard in parsed_cards:
+                continue
+            if (card_name not in self.cards_to_read or
+                    card_name not in self._card_parser or
+                    card_name in RAW_LINES_CARDS):
+                continue
+            card_class = self._card_parser[card_name][0]
+            if '<locals>' in card_class.__qualname__:
+                # Crash can't be pickled
+                continue
+            icards.append(icard)
+            cards_to_parse.append((card_class, card_name, comment, card_lines))
+
+        ncards = len(icards)
+        if ncards < nworkers:
+            return {}
+
+        # a few chunks per worker balances the load without paying
+        # too much for the process communication
+        nchunks = min(ncards, nworkers * 4)
+        chunk_size = int(np.ceil(ncards / nchunks))
+        chunks = [cards_to_parse[i:i + chunk_size]
+                  for i in range(0, ncards, chunk_size)]
+
+        self.log.debug('parsing %i cards with %i workers' % (ncards, nworkers))
+        from concurrent.futures import ProcessPoolExecutor
+        with self._profile_phase('parse_parallel'), \
+                ProcessPoolExecutor(max_workers=nworkers) as executor:
+            results = []
+            for chunk_results in executor.map(_parse_cards_chunk, chunks):
+                results.extend(chunk_results)
+        return dict(zip(icards, results))
+
+    def _add_parsed_card(self, card_name: str, parsed_card: Any,
+                         ifile: Optional[int]=None) -> None:
+        """
+        Adds a card that was created by ``_parse_cards_list_parallel``
+        or ``fast_parse_cards``.
+        This mirrors ``_add_card_helper``, so the duplicate/parsing errors
+        are the same as the serial path.
+        """
+        self.increase_card_count(card_name)
+        class_instance, card_obj, exception = parsed_card
+        if exception is None:
+            profiler = self._profiler
+            if profiler is not None:
+                # only the time to add the card; the parsing time is in
+                # the fast_parse/parse_parallel phases
+                start = profiler.start_card()
+            if ifile is not None:
+                class_instance.ifile = ifile
+            if card_name in self._card_parser:
+                unused_card_class, add_card_function = self._card_parser[card_name]
+            else:
+                # a CBAR/CTETRA/CHEXA from fast_parse_cards
+                add_card_function = self._add_element_object
+            add_card_function(class_instance)
+            if profiler is not None:
+                profiler.stop_card(card_name, start)
+            return
+
+        # pop_parse_errors re-raises the active exception, so we need one
+        try:
+            raise exception
+        except (SyntaxError, AssertionError, KeyError, ValueError):
+            self._iparse_errors += 1
+            self.log.error(card_obj)
+            var = traceback.format_exception_only(type(exception), exception)
+            self._stored_parse_errors.append((card_name, var))
+            if self._iparse_errors > self._nparse_errors:
+                self.pop_parse_errors()
+
     #def _is_case_control_deck(self, line):
         #line_upper = line.upper().strip()
         #if 'CEND' in line.upper():
@@ -3934,10 +4440,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         try:
-            with open(bdf_filename, 'r') as bdf_file:
+            with open_file(bdf_filename, 'r') as bdf_file:
                 lines = bdf_file.readlines()
         except UnicodeDecodeError:
-            with open(bdf_filename, 'r', errors='ignore') as bdf_file:
+            with open_file(bdf_filename, 'r', errors='ignore') as bdf_file:
                 line = bdf_file.readline()
                 iline = 1
                 while line:
@@ -4261,7 +4767,8 @@ class BDF(BDF_):
         'nnodes', 'node_ids', 'point_ids', 'npoints',
         'nelements', 'element_ids', 'nproperties', 'property_ids',
         'nmaterials', 'material_ids', 'ncoords', 'coord_ids',
-        'ncaeros', 'caero_ids', 'wtmass', 'is_bdf_vectorized', 'nid_map',
+        'ncaeros', 'caero_ids', 'wtmass', 'is_bdf_vectorized', 'nid_map', 'xref_arrays',
+        'profile_stats',
         #'dmigs', 'dmijs', 'dmiks', 'dmijis', 'dtis', 'dmis',
     ]
 
@@ -4296,6 +4803,55 @@ class BDF(BDF_):
         self.loads = {}  # type: Dict[int, List[Any]]
         self.load_combinations = {}  # type: Dict[int, List[Any]]
 
+    def save_snapshot(self, snapshot_filename: str='model.snapshot') -> None:
+        """
+        Saves the model as a binary snapshot, which is much faster and
+        smaller than ``save`` for big models
+
+        Parameters
+        ----------
+        snapshot_filename : str / file; default='model.snapshot'
+            the path to the snapshot or a binary file object
+
+        The model isn't modified, but the snapshot is uncross-referenced.
+        See ``pyNastran.bdf.bdf_interface.snapshot`` for the format.
+
+        """
+        from pyNastran.bdf.bdf_interface.snapshot import save_snapshot
+        save_snapshot(self, snapshot_filename)
+
+    def load_snapshot(self, snapshot_filename: str='model.snapshot') -> None:
+        """
+        Loads a snapshot from ``save_snapshot`` into an empty model
+
+        Parameters
+        ----------
+        snapshot_filename : str / file; default='model.snapshot'
+            the path to the snapshot or a binary file object
+
+        """
+        from pyNastran.bdf.bdf_interface.snapshot import load_snapshot
+        load_snapshot(snapshot_filename, model=self)
+
+    def copy(self, xref: Optional[bool]=None) -> 'BDF':
+        """
+        Copies the model, which is faster than ``deepcopy``
+
+        Parameters
+        ----------
+        xref : bool; default=None
+            cross-reference the copy
+            None : cross-reference the copy if the model is cross-referenced
+
+        Returns
+        -------
+        model : BDF()
+            the copied model
+
+        """
+        from pyNastran.bdf.bdf_interface.snapshot import copy_model
+        return copy_model(self, xref=xref)
+
     def __deepcopy__(self, memo: Dict[str, Any]):
         """performs a deepcopy"""
         #newone = type(self)()
@@ -4348,13 +4904,20 @@ def _echo_card(card, card_obj):
         else:
             print(print_card_16(card_obj).rstrip())
 
-def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=True, punch: bool=False,
+def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
+             xref: Union[bool, str]=True, punch: bool=False,
              save_file_structure: bool=False,
              skip_cards: Optional[List[str]]=None,
              read_cards: Optional[List[str]]=None,
              encoding: Optional[str]=None,
              log=None,
-             debug: bool=True, mode: str='msc') -> BDF:
+             debug: bool=True, mode: str='msc',
+             nworkers: int=1,
+             cache_dir: Optional[str]=None,
+             cache_hash: bool=False,
+             fast_parse: bool=False,
+             lazy: bool=False,
+             profile: Union[bool, str]=False) -> BDF:
     # Optional[SimpleLogger]
     """
     Creates the BDF object
@@ -4363,6 +4926,7 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     ----------
     bdf_filename : str (default=None -> popup)
         the bdf filename
+        (a .gz/.bz2/.xz file or a file in a zip archive may be used)
     debug : bool/None
         used to set the logger if no logger is passed in
             True:  logs debug/info/error messages
@@ -4373,8 +4937,10 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
         settings the logging object has
     validate : bool; default=True
         runs various checks on the BDF
-    xref :  bool; default=True
+    xref :  bool / str; default=True
         should the bdf be cross referenced
+        'arrays' : build the id/index arrays (``model.xref_arrays``)
+                   instead of linking the cards
     punch : bool; default=False
         indicates whether the file is a punch file
     save_file_structure : bool; default=False
@@ -4390,6 +4956,20 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    nworkers : int; default=1
+        the number of processes used to create the bulk data card objects
+    cache_dir : str; default=None
+        the directory for a cache of parsed models (see ``BDF.read_bdf``)
+    cache_hash : bool; default=False
+        compare the sha1 of the file contents for the cache
+    fast_parse : bool; default=False
+        use a vectorized parser for the small field GRID/element cards
+    lazy : bool; default=False
+        parse the common cards (e.g., elements) when they're first used
+        (see ``BDF.read_bdf``)
+    profile : bool / str; default=False
+        time the phases and card types (see ``BDF.read_bdf``)
+        'memory' : also track the change in memory
 
     Returns
     -------
@@ -4431,7 +5011,9 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
                    xref=xref, punch=punch, read_includes=True,
                    save_file_structure=save_file_structure,
-                   encoding=encoding)
+                   encoding=encoding, nworkers=nworkers,
+                   cache_dir=cache_dir, cache_hash=cache_hash,
+                   fast_parse=fast_parse, lazy=lazy, profile=profile)
 
     #if 0:
         ### TODO: remove all the extra methods
@@ -4488,6 +5070,96 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     return model
 
 
+def _parse_cards_chunk(cards_chunk):
+    """
+    Creates the card objects for ``BDF._parse_cards_list_parallel``.
+    This runs in a worker process, so it can't touch the model.
+
+    Parameters
+    ----------
+    cards_chunk : List[(card_class, card_name, comment, card_lines)]
+        the cards to create
+
+    Returns
+    -------
+    results : List[(class_instance, card_obj, exception)]
+        see ``BDF._parse_cards_list_parallel``
+
+    """
+    results = []
+    for card_class, card_name, comment, card_lines in cards_chunk:
+        fields = to_fields(card_lines, card_name)
+        card = wipe_empty_fields(fields)
+        card_obj = BDFCard(card, has_none=False)
+        try:
+            class_instance = card_class.add_card(card_obj, comment=comment)
+        except (SyntaxError, AssertionError, KeyError, ValueError) as exception:
+            results.append((None, card_obj, exception))
+            continue
+        results.append((class_instance, None, None))
+    return results
+
+def _iter_card_lines(lines):
+    """
+    Groups the bulk data lines into cards (see ``BDF.get_bdf_cards``)
+
+    Parameters
+    ----------
+    lines : Iterator[(line, ifile, iline)]
+        the bulk data lines
+
+    Yields
+    ------
+    card_name : str
+        the card name
+    comment : str
+        the comment above the card
+    card_lines : List[str]
+        the lines of the card
+    ifile / iline : int
+        the location of the first line of the card
+
+    """
+    full_comment = ''
+    card_lines = []
+    old_card_name = None
+    old_ifile = old_iline = 0
+    backup_comment = ''
+    for line, ifile, iline in lines:
+        comment = ''
+        if '$' in line:
+            line, comment = line.split('$', 1)
+        card_name = line.split(',', 1)[0].split('\t', 1)[0][:8].rstrip().upper()
+        if card_name and card_name[0] not in ['+', '*']:
+            if old_card_name:
+                yield old_card_name, _prep_comment(full_comment), card_lines, old_ifile, old_iline
+                card_lines = []
+                full_comment = ''
+            old_ifile = ifile
+            old_iline = iline
+            old_card_name = card_name.rstrip(' *')
+            if old_card_name == 'ENDDATA':
+                return
+
+        comment = _clean_comment(comment)
+        if line.rstrip():
+            card_lines.append(line)
+            if backup_comment:
+                if comment:
+                    full_comment += backup_comment + comment + '\n'
+                else:
+                    full_comment += backup_comment
+                backup_comment = ''
+            elif comment:
+                full_comment += comment + '\n'
+                backup_comment = ''
+        elif comment:
+            backup_comment += comment + '\n'
+
+    if card_lines:
+        yield (old_card_name, _prep_comment(backup_comment + full_comment), card_lines,
+               old_ifile, old_iline)
+
 def _prep_comment(comment):
     return comment.rstrip()
     #print('comment = %r' % comment)
@@ -0,0 +1,349 @@
+"""
+Defines the array container for the cards of one class:
+ - CardArray(card_class, id_name, cards)
+
+Each attribute of the cards is stored as a column:
+ - int, float, str, bool : (n, ) ndarray
+ - array : (n, ...) ndarray (e.g., GRID xyz)
+ - list : (n, nvalues) ndarray (e.g., CQUAD4 nodes)
+ - ragged : flat ndarray and (n+1, ) offsets (e.g., SPC1 nodes)
+ - object : list (e.g., CBAR g0/x, which may be None)
+
+Blank (None) values are stored as 0/nan/'' and a mask, so the cards
+can be recreated exactly.
+
+.. code-block:: python
+
+   >>> quads = CardArray(CQUAD4, 'eid', cquad4_cards)
+   >>> quads.eid
+   array([1, 2, 3])
+   >>> quads.nodes
+   array([[1, 2, 3, 4], ...])
+   >>> quads.get_index([3, 1])
+   array([2, 0])
+   >>> cards = quads.to_cards()
+
+"""
+from __future__ import annotations
+from copy import deepcopy
+from operator import attrgetter
+from typing import List, Dict, Tuple, Any
+
+import numpy as np
+
+from pyNastran.bdf.cards.base_card import BaseCard
+from pyNastran.bdf.bdf_interface.snapshot import (
+    MISSING, _get_slot_names, _uncross_reference_value, _rebuild_card)
+
+#: the column kind and dtype of a scalar type
+SCALAR_KINDS = {int: ('int', 'int64'), float: ('float', 'float64'),
+                str: ('str', 'U'), bool: ('bool', 'bool')}
+#: the value that is used for a blank (None) value
+NULL_VALUES = {'int': 0, 'float': np.nan, 'str': '', 'bool': False}
+
+
+class CardArray:
+    """
+    The cards of one class (e.g., CQUAD4, CTETRA10) stored as arrays that
+    are sorted by the card id
+
+    Attributes
+    ----------
+    card_class : type
+        the card class
+    card_type : str
+        the card name (e.g., 'CTETRA' for a CTETRA10)
+    id_name : str
+        the name of the id attribute (e.g., 'eid', 'nid', 'sid')
+    columns : List[str]
+        the attributes of the cards
+
+    The columns are accessed as attributes (e.g., ``quads.nodes``);
+    a ragged column is a list of arrays.
+
+    """
+    def __init__(self, card_class: type, id_name: str, cards: List[BaseCard]) -> None:
+        """
+        Creates the CardArray
+
+        Parameters
+        ----------
+        card_class : type
+            the card class
+        id_name : str
+            the name of the id attribute (e.g., 'eid', 'nid', 'sid')
+        cards : List[BaseCard]
+            the cards; they don't need to be sorted
+
+        """
+        self.card_class = card_class
+        self.card_type = cards[0].type if cards else card_class.type
+        self.id_name = id_name
+        self._kinds = {}  # type: Dict[str, str]
+        self._data = {}  # type: Dict[str, Any]
+        self._masks = {}  # type: Dict[str, np.ndarray]
+        self._offsets = {}  # type: Dict[str, np.ndarray]
+
+        names = _get_slot_names(card_class)
+        if cards and hasattr(cards[0], '__dict__'):
+            names_set = set(names)
+            for card in cards:
+                for name in card.__dict__:
+                    if name not in names_set:
+                        names_set.add(name)
+                        names.append(name)
+        if cards and id_name not in names:
+            raise AttributeError('%s has no attribute %r' % (card_class.__name__, id_name))
+
+        # a stable sort, so cards with the same id (e.g., loads) are kept
+        # in the same order
+        ids = np.array([getattr(card, id_name) for card in cards], dtype='int64')
+        isort = np.argsort(ids, kind='stable')
+        if np.array_equal(isort, np.arange(len(cards))):
+            isort = None
+        for name in names:
+            try:
+                values = list(map(attrgetter(name), cards))
+            except AttributeError:
+                values = [getattr(card, name, MISSING) for card in cards]
+            if name.endswith('_ref') and values.count(None) != len(values):
+                values = [_uncross_reference_value(name, value) for value in values]
+            if isort is not None:
+                values = [values[i] for i in isort]
+            self._add_column(name, values)
+        self.columns = names
+
+    @property
+    def nrows(self) -> int:
+        """the number of cards"""
+        if self.id_name in self._data:
+            return len(self._data[self.id_name])
+        return 0
+
+    def __len__(self) -> int:
+        return self.nrows
+
+    def __getattr__(self, name: str) -> Any:
+        # __getattr__ is only called for names that aren't found
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            kind = self._kinds[name]
+        except KeyError:
+            raise AttributeError('%r object has no attribute %r' % (
+                self.__class__.__name__, name))
+        if kind == 'none':
+            return [None] * self.nrows
+        data = self._data[name]
+        if kind == 'ragged':
+            return np.split(data, self._offsets[name][1:-1])
+        return data
+
+    @property
+    def ids(self) -> np.ndarray:
+        """the sorted ids of the cards"""
+        return self._data[self.id_name]
+
+    def get_index(self, ids, msg: str='') -> np.ndarray:
+        """
+        Gets the index of the ids with ``np.searchsorted``
+
+        Parameters
+        ----------
+        ids : int / (n, ) int ndarray
+            the ids to find
+        msg : str; default=''
+            additional information for the error message
+
+        Returns
+        -------
+        index : int / (n, ) int ndarray
+            the index of the first card with each id
+
+        """
+        all_ids = self.ids
+        ids_array = np.asarray(ids)
+        index = np.searchsorted(all_ids, ids_array)
+        index_clipped = np.minimum(index, len(all_ids) - 1)
+        is_found = (index < len(all_ids)) & (all_ids[index_clipped] == ids_array)
+        if not np.all(is_found):
+            missing = np.atleast_1d(ids_array)[~np.atleast_1d(is_found)]
+            raise KeyError('%s=%s are not %s cards%s' % (
+                self.id_name, missing.tolist(), self.card_type, msg))
+        return index
+
+    def get_slice(self, id_value: int) -> slice:
+        """
+        Gets the rows with an id (e.g., the FORCE cards for a load id)
+
+        Parameters
+        ----------
+        id_value : int
+            the id (e.g., a load id)
+
+        Returns
+        -------
+        rows : slice
+            the rows; may be empty
+
+        """
+        all_ids = self.ids
+        i0 = np.searchsorted(all_ids, id_value, side='left')
+        i1 = np.searchsorted(all_ids, id_value, side='right')
+        return slice(int(i0), int(i1))
+
+    def get_values(self, name: str) -> List[Any]:
+        """gets a column as python objects (e.g., a None for a blank field)"""
+        kind = self._kinds[name]
+        nrows = self.nrows
+        if kind == 'none':
+            return [None] * nrows
+        data = self._data[name]
+        if kind == 'object':
+            return deepcopy(data)
+        if kind == 'array':
+            return list(data.copy())
+
+        if kind == 'ragged':
+            flat = data.tolist()
+            offsets = self._offsets[name].tolist()
+            if name in self._masks:
+                for i in np.flatnonzero(self._masks[name]).tolist():
+                    flat[i] = None
+            return [flat[i0:i1] for i0, i1 in zip(offsets[:-1], offsets[1:])]
+
+        values = data.tolist()
+        if name in self._masks:
+            mask = self._masks[name]
+            if kind == 'list':
+                for i, j in zip(*np.nonzero(mask)):
+                    values[i][j] = None
+            else:
+                for i in np.flatnonzero(mask).tolist():
+                    values[i] = None
+        return values
+
+    def to_cards(self) -> List[BaseCard]:
+        """creates the (uncross-referenced) card objects"""
+        columns = [(name, self.get_values(name)) for name in self.columns]
+        cards = []
+        for irow in range(self.nrows):
+            state = {}
+            for name, values in columns:
+                value = values[irow]
+                if value is not MISSING:
+                    state[name] = value
+            cards.append(_rebuild_card(self.card_class, state))
+        return cards
+
+    def _add_column(self, name: str, values: List[Any]) -> None:
+        """packs the values of an attribute"""
+        value_types = set(map(type, values))
+        is_none = type(None) in value_types
+        value_types.discard(type(None))
+        kind = 'object'
+        if not value_types:
+            kind = 'none'
+        elif len(value_types) == 1:
+            value_type = value_types.pop()
+            if value_type in SCALAR_KINDS:
+                kind, dtype = SCALAR_KINDS[value_type]
+                kind = self._add_scalar_column(name, values, kind, dtype, is_none)
+            elif value_type is np.ndarray and not is_none:
+                if len({(value.shape, value.dtype) for value in values}) == 1:
+                    kind = 'array'
+                    self._data[name] = np.array(values)
+            elif value_type is list and not is_none:
+                kind = self._add_list_column(name, values)
+
+        if kind == 'object':
+            self._data[name] = values
+        self._kinds[name] = kind
+
+    def _add_scalar_column(self, name: str, values: List[Any], kind: str, dtype: str,
+                           is_none: bool) -> str:
+        """packs an int/float/str/bool column"""
+        if is_none:
+            self._masks[name] = np.array([value is None for value in values])
+            null = NULL_VALUES[kind]
+            values = [null if value is None else value for value in values]
+        try:
+            self._data[name] = np.array(values, dtype=dtype)
+        except OverflowError:
+            # a big integer
+            self._masks.pop(name, None)
+            return 'object'
+        return kind
+
+    def _add_list_column(self, name: str, values: List[List[Any]]) -> str:
+        """packs a list column (e.g., the nodes of an element)"""
+        flat = [value for valuesi in values for value in valuesi]
+        value_types = set(map(type, flat))
+        is_none = type(None) in value_types
+        value_types.discard(type(None))
+        if len(value_types) != 1:
+            # empty or mixed (e.g., int/float)
+            return 'object'
+        value_type = value_types.pop()
+        if value_type not in SCALAR_KINDS:
+            return 'object'
+        kind, dtype = SCALAR_KINDS[value_type]
+        null = NULL_VALUES[kind]
+        nvalues = {len(valuesi) for valuesi in values}
+        if is_none:
+            mask = np.array([value is None for value in flat])
+            flat = [null if value is None else value for value in flat]
+
+        try:
+            flat_array = np.array(flat, dtype=dtype)
+        except OverflowError:
+            return 'object'
+
+        if len(nvalues) == 1:
+            nrows = len(values)
+            ncols = nvalues.pop()
+            self._data[name] = flat_array.reshape(nrows, ncols)
+            if is_none:
+                self._masks[name] = mask.reshape(nrows, ncols)
+            return 'list'
+
+        offsets = np.zeros(len(values) + 1, dtype='int64')
+        offsets[1:] = np.cumsum([len(valuesi) for valuesi in values])
+        self._data[name] = flat_array
+        self._offsets[name] = offsets
+        if is_none:
+            self._masks[name] = mask
+        return 'ragged'
+
+    def get_kinds(self) -> Dict[str, str]:
+        """gets the kind of each column (e.g., 'int', 'list', 'object')"""
+        return dict(self._kinds)
+
+    def __repr__(self) -> str:
+        return 'CardArray(card_class=%s, nrows=%s)' % (self.card_class.__name__, self.nrows)
+
+
+def get_sorted_ids(card_arrays: Dict[str, CardArray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the sorted ids and the card class of a group of CardArrays
+    (e.g., all the shells)
+
+    Returns
+    -------
+    ids : (n, ) int ndarray
+        the sorted ids
+    iarray : (n, ) int ndarray
+        the index into ``list(card_arrays)``
+
+    """
+    ids_list = []
+    iarrays = []
+    for iarray, card_array in enumerate(card_arrays.values()):
+        ids_list.append(card_array.ids)
+        iarrays.append(np.full(len(card_array), iarray, dtype='int32'))
+    if not ids_list:
+        return np.zeros(0, dtype='int64'), np.zeros(0, dtype='int32')
+    ids = np.hstack(ids_list)
+    iarray = np.hstack(iarrays)
+    isort = np.argsort(ids, kind='stable')
+    return ids[isort], iarray[isort]
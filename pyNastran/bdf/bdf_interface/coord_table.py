@@ -0,0 +1,238 @@
+"""
+Defines the cached coordinate system table:
+ - CoordTable(model)
+
+The table stores the origin and transformation matrix of every
+coordinate system in the basic frame, so points in many different
+coordinate systems can be transformed at once.  It's built from the
+card fields (e.g., CORD2R's e1, e2, e3 and rid), so the model doesn't
+need to be cross-referenced.  ``BDF.get_coord_table`` rebuilds the
+table when a coordinate card is added, removed or modified.
+
+"""
+from __future__ import annotations
+from typing import List, Tuple, Any, TYPE_CHECKING
+import numpy as np
+
+from pyNastran.femutils.coord_transforms import (
+    xyz_to_rtz_array, xyz_to_rtp_array, rtz_to_xyz_array, rtp_to_xyz_array)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the integer coordinate system type
+RECTANGULAR = 0
+CYLINDRICAL = 1
+SPHERICAL = 2
+COORD_TYPE_MAP = {'R': RECTANGULAR, 'C': CYLINDRICAL, 'S': SPHERICAL}
+
+CORD1_TYPES = {'CORD1R', 'CORD1C', 'CORD1S'}
+CORD2_TYPES = {'CORD2R', 'CORD2C', 'CORD2S'}
+
+
+class CoordTable:
+    r"""
+    The origins and transformation matrices of the coordinate systems
+    in the basic frame
+
+    .. math:: p_{basic} = (p_{coord}) [\beta] + p_{origin}
+
+    Attributes
+    ----------
+    cids : (ncoords, ) int ndarray
+        the sorted coordinate system ids
+    coord_types : (ncoords, ) int ndarray
+        0=rectangular, 1=cylindrical, 2=spherical
+    origins : (ncoords, 3) float ndarray
+        the origin in the basic frame
+    betas : (ncoords, 3, 3) float ndarray
+        the [i, j, k] axes in the basic frame
+    fingerprint : tuple
+        the card data used to build the table
+
+    """
+    def __init__(self, model: BDF) -> None:
+        self.fingerprint = get_coords_fingerprint(model)
+        cids = np.array(sorted(model.coords), dtype='int64')
+        ncoords = len(cids)
+        self.cids = cids
+        self.coord_types = np.zeros(ncoords, dtype='int32')
+        self.origins = np.zeros((ncoords, 3), dtype='float64')
+        self.betas = np.zeros((ncoords, 3, 3), dtype='float64')
+        self.betas[:] = np.eye(3, dtype='float64')
+        self._build(model)
+
+    def is_valid(self, model: BDF) -> bool:
+        """is the table up to date with the coordinate cards?"""
+        return self.fingerprint == get_coords_fingerprint(model)
+
+    def _build(self, model: BDF) -> None:
+        """resolves the coordinate systems in dependency order"""
+        coords = model.coords
+        cids = self.cids
+        for icid, cid in enumerate(cids):
+            # CORD3G is checked below
+            coord_type = getattr(coords[cid], 'Type', 'R')
+            self.coord_types[icid] = COORD_TYPE_MAP[coord_type]
+
+        resolved = {0}
+        cids_to_resolve = [cid for cid in cids.tolist() if cid != 0]
+        while cids_to_resolve:
+            cids_unresolved = []
+            for cid in cids_to_resolve:
+                coord = coords[cid]
+                if coord.type in CORD2_TYPES:
+                    e123 = np.array([coord.e1, coord.e2, coord.e3], dtype='float64')
+                    rid = coord.Rid()
+                    if rid not in resolved:
+                        cids_unresolved.append(cid)
+                        continue
+                    e123 = self.transform(e123, [rid] * 3, cid=0)
+                elif coord.type in CORD1_TYPES:
+                    nodes = [model.nodes[nid] for nid in coord.node_ids]
+                    cps = [node.Cp() for node in nodes]
+                    if any(cp not in resolved for cp in cps):
+                        cids_unresolved.append(cid)
+                        continue
+                    e123 = np.array([node.xyz for node in nodes], dtype='float64')
+                    e123 = self.transform(e123, cps, cid=0)
+                else:
+                    # ACOORD, CORD3G; use the coord's own transform
+                    if coord.origin is None or coord.i is None:
+                        raise NotImplementedError(coord.rstrip())
+                    icid = np.searchsorted(cids, cid)
+                    self.origins[icid, :] = coord.origin
+                    self.betas[icid, :, :] = coord.beta()
+                    resolved.add(cid)
+                    continue
+
+                icid = np.searchsorted(cids, cid)
+                self.origins[icid, :] = e123[0, :]
+                self.betas[icid, :, :] = _get_ijk(cid, e123)
+                resolved.add(cid)
+
+            if len(cids_unresolved) == len(cids_to_resolve):
+                msg = 'coordinate systems could not be resolved; cids=%s\n' % cids_unresolved
+                for cid in cids_unresolved:
+                    msg += coords[cid].rstrip() + '\n'
+                raise RuntimeError(msg)
+            cids_to_resolve = cids_unresolved
+
+    def get_index(self, cids) -> np.ndarray:
+        """gets the index of the coordinate systems in ``cids``"""
+        cids = np.asarray(cids)
+        icids = np.searchsorted(self.cids, cids)
+        icids_clipped = np.clip(icids, 0, len(self.cids) - 1)
+        is_found = self.cids[icids_clipped] == cids
+        if not is_found.all():
+            missing = np.unique(cids[~is_found]).tolist()
+            raise KeyError('cids=%s could not be found; allowed=%s' % (
+                missing, self.cids.tolist()))
+        return icids
+
+    def transform(self, xyz_cp, cps, cid: int=0) -> np.ndarray:
+        """
+        Transforms points in the CP coordinate systems to the CID
+        coordinate system in one vectorized pass
+
+        Parameters
+        ----------
+        xyz_cp : (n, 3) float ndarray
+            the points in the CP coordinate systems
+            (e.g., R-theta-z for a cylindrical system)
+        cps : (n, ) int ndarray
+            the coordinate system of each point
+        cid : int; default=0
+            the coordinate system to get xyz in
+
+        Returns
+        -------
+        xyz_cid : (n, 3) float ndarray
+            the points in the CID coordinate system
+
+        """
+        xyz_cp = np.atleast_2d(np.asarray(xyz_cp, dtype='float64'))
+        cps = np.asarray(cps)
+        assert xyz_cp.shape == (len(cps), 3), 'xyz_cp.shape=%s ncps=%s' % (
+            str(xyz_cp.shape), len(cps))
+
+        # CP -> local rectangular -> basic
+        icps = self.get_index(cps)
+        if len(icps) and (icps == icps[0]).all():
+            # a single coordinate system is a matrix multiply
+            icp = icps[0]
+            if self.cids[icp] == cid:
+                return xyz_cp.copy()
+            xyz_local = _coord_to_xyz(xyz_cp, self.coord_types[icps])
+            if self.cids[icp] == 0:
+                xyz_cid0 = xyz_local
+            else:
+                xyz_cid0 = xyz_local @ self.betas[icp, :, :] + self.origins[icp, :]
+        else:
+            xyz_local = _coord_to_xyz(xyz_cp, self.coord_types[icps])
+            xyz_cid0 = np.einsum('ni,nij->nj', xyz_local, self.betas[icps]) + self.origins[icps, :]
+        if cid == 0:
+            return xyz_cid0
+
+        # basic -> local rectangular -> CID
+        icid = self.get_index([cid])[0]
+        xyz_coord = (xyz_cid0 - self.origins[icid, :]) @ self.betas[icid, :, :].T
+        coord_type = self.coord_types[icid]
+        if coord_type == CYLINDRICAL:
+            xyz_coord = xyz_to_rtz_array(xyz_coord)
+        elif coord_type == SPHERICAL:
+            xyz_coord = xyz_to_rtp_array(xyz_coord)
+        return xyz_coord
+
+    def __repr__(self) -> str:
+        return 'CoordTable(ncoords=%s)' % len(self.cids)
+
+
+def get_coords_fingerprint(model: BDF) -> Tuple[Any, ...]:
+    """
+    Gets the card data that defines the coordinate systems.  CORD1x
+    cards also depend on the location of their nodes.
+    """
+    fingerprint = []  # type: List[Any]
+    nodes = model.nodes
+    for cid, coord in sorted(model.coords.items()):
+        if coord.type in CORD2_TYPES:
+            data = (coord.Rid(), tuple(coord.e1), tuple(coord.e2), tuple(coord.e3))
+        elif coord.type in CORD1_TYPES:
+            data = tuple((nid, nodes[nid].Cp(), tuple(nodes[nid].xyz))
+                         if nid in nodes else (nid, ) for nid in coord.node_ids)
+        elif coord.origin is None or coord.i is None:
+            data = ()
+        else:
+            data = (tuple(coord.origin), tuple(coord.beta().ravel()))
+        fingerprint.append((cid, id(coord), coord.type, data))
+    return tuple(fingerprint)
+
+
+def _coord_to_xyz(xyz_cp: np.ndarray, coord_types: np.ndarray) -> np.ndarray:
+    """converts R-theta-z/rho-theta-phi points to local rectangular points"""
+    xyz_local = xyz_cp.copy()
+    is_cylindrical = coord_types == CYLINDRICAL
+    if is_cylindrical.any():
+        xyz_local[is_cylindrical, :] = rtz_to_xyz_array(xyz_cp[is_cylindrical, :])
+    is_spherical = coord_types == SPHERICAL
+    if is_spherical.any():
+        xyz_local[is_spherical, :] = rtp_to_xyz_array(xyz_cp[is_spherical, :])
+    return xyz_local
+
+
+def _get_ijk(cid: int, e123: np.ndarray) -> np.ndarray:
+    """gets the [i, j, k] axes from the basic e1, e2, e3 points"""
+    e1, e2, e3 = e123
+    e12 = e2 - e1
+    e13 = e3 - e1
+    normk = np.linalg.norm(e12)
+    j = np.cross(e12, e13)
+    normj = np.linalg.norm(j)
+    if normk == 0. or normj == 0.:
+        raise RuntimeError('cid=%s has an invalid unit vector; e1=%s e2=%s e3=%s' % (
+            cid, e1, e2, e3))
+    k = e12 / normk
+    j = np.cross(k, e13)
+    j /= np.linalg.norm(j)
+    i = np.cross(j, k)
+    return np.vstack([i, j, k])
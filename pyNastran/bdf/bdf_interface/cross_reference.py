@@ -70,10 +70,15 @@ around the idea of cross-referencing, so it's recommended that you use it.
 # pylint: disable=R0902,R0904,R0914
 from collections import defaultdict
 import traceback
-from typing import List, Dict, Any
+from contextlib import nullcontext
+from typing import List, Dict, Union, Optional, Any
 
 from numpy import zeros, argsort, arange, array_equal, array
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.xref_arrays import XrefArrays
+from pyNastran.bdf.bdf_interface.profiler import ReadProfiler, get_profile_stats
+
+_NULL_CONTEXT = nullcontext()
 
 class XrefMesh(BDFAttributes):
     """Links up the various cards in the BDF."""
@@ -83,6 +88,14 @@ class XrefMesh(BDFAttributes):
         self._nxref_errors = 100
         self._stop_on_xref_error = True
 
+        #: the id/index arrays for xref='arrays'
+        self._xref_arrays = None
+
+        #: the active ReadProfiler (profile=True)
+        self._profiler = None
+        #: the stats from the last profiled read_bdf/cross_reference
+        self._profile_stats = None
+
     # def geom_check(self):
         # """
         # Performs various geometry checks
@@ -91,8 +104,75 @@ class XrefMesh(BDFAttributes):
         # for elem in model.elements:
             # elem.check_unique_nodes()
 
+    @property
+    def xref_arrays(self) -> Optional[XrefArrays]:
+        """the id/index arrays from ``cross_reference(xref='arrays')``"""
+        return self._xref_arrays
+
+    @property
+    def profile_stats(self) -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        the timing from ``read_bdf(..., profile=True)`` or
+        ``cross_reference(..., profile=True)``
+
+        {'phases' : {phase_name : {'time': time, 'count': count, 'memory': memory}},
+         'cards' : {card_name : {'time': time, 'count': count, 'memory': memory}},}
+        """
+        return self._profile_stats
+
+    def get_profile_stats(self, return_type: str='string') -> Union[str, List[str]]:
+        """
+        Print the timing/memory of the phases and card types from
+        ``read_bdf(..., profile=True)``
+
+        Parameters
+        ----------
+        return_type : str (default='string')
+            the output type ('list', 'string')
+                'list' : list of strings
+                'string' : single, joined string
+
+        Returns
+        -------
+        return_data : str, optional
+            the output data
+
+        """
+        return get_profile_stats(self._profile_stats, return_type=return_type)
+
+    def _start_profile(self, profile: Union[bool, str]) -> bool:
+        """
+        Starts a ReadProfiler if profiling is requested and there isn't
+        an active one (e.g., cross_reference from read_bdf).
+
+        Returns
+        -------
+        is_started : bool
+            this call started the profiler, so it should stop it
+        """
+        if not profile or self._profiler is not None:
+            return False
+        if profile not in [True, 'memory']:
+            raise ValueError("profile=%r and must be in [False, True, 'memory']" % profile)
+        self._profiler = ReadProfiler(memory=(profile == 'memory'))
+        self._profiler.start()
+        return True
+
+    def _stop_profile(self) -> None:
+        """stops the active ReadProfiler and saves the stats"""
+        profiler = self._profiler
+        profiler.stop()
+        self._profiler = None
+        self._profile_stats = profiler.to_dict()
+
+    def _profile_phase(self, name: str):
+        """times a block of code if profiling is active"""
+        if self._profiler is None:
+            return _NULL_CONTEXT
+        return self._profiler.phase(name)
+
     def cross_reference(self,
-                        xref: bool=True,
+                        xref: Union[bool, str]=True,
                         xref_nodes: bool=True,
                         xref_elements: bool=True,
                         xref_nodes_with_elements: bool=False,
@@ -104,14 +184,20 @@ class XrefMesh(BDFAttributes):
                         xref_aero: bool=True,
                         xref_sets: bool=True,
                         xref_optimization: bool=True,
-                        word: str='') -> None:
+                        word: str='',
+                        profile: Union[bool, str]=False) -> None:
         """
         Links up all the cards to the cards they reference
 
         Parameters
         ----------
-        xref : bool; default=True
+        xref : bool / str; default=True
            cross references the model
+           'arrays' : don't link the cards; build sorted id -> index
+                      arrays for the nodes, coordinate systems,
+                      properties, materials and the element connectivity
+                      (see ``model.xref_arrays``); the other flags are
+                      ignored
         xref_nodes : bool; default=True
            set cross referencing of nodes/coords
         xref_element : bool; default=True
@@ -132,6 +218,10 @@ class XrefMesh(BDFAttributes):
             set cross referencing of SETx
         word : str; default=''
             model flag
+        profile : bool / str; default=False
+            time the cross referencing of each card group
+            (see ``model.profile_stats``)
+            'memory' : also track the change in memory
 
         To only cross-reference nodes:
 
@@ -148,46 +238,107 @@ class XrefMesh(BDFAttributes):
         """
         if not xref:
             return
+        is_started = self._start_profile(profile)
+        try:
+            with self._profile_phase('cross_reference'):
+                self._cross_reference(
+                    xref, xref_nodes, xref_elements, xref_nodes_with_elements,
+                    xref_properties, xref_masses, xref_materials, xref_loads,
+                    xref_constraints, xref_aero, xref_sets, xref_optimization,
+                    word=word)
+            # the cards aren't linked for xref='arrays'
+            if xref != 'arrays':
+                self._xref = True
+        finally:
+            if is_started:
+                self._stop_profile()
+
+    def _cross_reference(self, xref: Union[bool, str],
+                         xref_nodes: bool, xref_elements: bool,
+                         xref_nodes_with_elements: bool,
+                         xref_properties: bool, xref_masses: bool,
+                         xref_materials: bool, xref_loads: bool,
+                         xref_constraints: bool, xref_aero: bool,
+                         xref_sets: bool, xref_optimization: bool,
+                         word: str='') -> None:
+        """helper for ``cross_reference``"""
+        if xref == 'arrays':
+            self._cross_reference_arrays(word=word)
+            return
         self.log.debug("Cross Referencing%s..." % word)
+        phase = self._profile_phase
         if xref_nodes:
-            self._cross_reference_nodes()
-            self._cross_reference_coordinates()
+            with phase('cross_reference.nodes'):
+                self._cross_reference_nodes()
+            with phase('cross_reference.coordinates'):
+                self._cross_reference_coordinates()
 
         if xref_elements:
-            self._cross_reference_elements()
+            with phase('cross_reference.elements'):
+                self._cross_reference_elements()
         if xref_properties:
-            self._cross_reference_properties()
+            with phase('cross_reference.properties'):
+                self._cross_reference_properties()
         if xref_masses:
-            self._cross_reference_masses()
+            with phase('cross_reference.masses'):
+                self._cross_reference_masses()
         if xref_materials:
-            self._cross_reference_materials()
+            with phase('cross_reference.materials'):
+                self._cross_reference_materials()
 
         if xref_aero:
-            self._cross_reference_aero()
+            with phase('cross_reference.aero'):
+                self._cross_reference_aero()
         if xref_constraints:
-            self._cross_reference_constraints()
+            with phase('cross_reference.constraints'):
+                self._cross_reference_constraints()
         if xref_loads:
-            self._cross_reference_loads()
+            with phase('cross_reference.loads'):
+                self._cross_reference_loads()
         if xref_sets:
-            self._cross_reference_sets()
+            with phase('cross_reference.sets'):
+                self._cross_reference_sets()
         if xref_optimization:
-            self._cross_reference_optimization()
+            with phase('cross_reference.optimization'):
+                self._cross_reference_optimization()
         if xref_nodes_with_elements:
-            self._cross_reference_nodes_with_elements()
-        self._cross_reference_contact()
-        self._cross_reference_superelements()
+            with phase('cross_reference.nodes_with_elements'):
+                self._cross_reference_nodes_with_elements()
+        with phase('cross_reference.contact'):
+            self._cross_reference_contact()
+        with phase('cross_reference.superelements'):
+            self._cross_reference_superelements()
         #self.case_control_deck.cross_reference(self)
         self.pop_xref_errors()
 
         for super_id, superelement in sorted(self.superelement_models.items()):
-            superelement.cross_reference(
-                xref=xref, xref_nodes=xref_nodes, xref_elements=xref_elements,
-                xref_nodes_with_elements=xref_nodes_with_elements,
-                xref_properties=xref_properties, xref_masses=xref_masses,
-                xref_materials=xref_materials, xref_loads=xref_loads,
-                xref_constraints=xref_constraints, xref_aero=xref_aero,
-                xref_sets=xref_sets, xref_optimization=xref_optimization,
-                word=' (Superelement %i)' % super_id)
+            with phase('cross_reference.superelement_models'):
+                superelement.cross_reference(
+                    xref=xref, xref_nodes=xref_nodes, xref_elements=xref_elements,
+                    xref_nodes_with_elements=xref_nodes_with_elements,
+                    xref_properties=xref_properties, xref_masses=xref_masses,
+                    xref_materials=xref_materials, xref_loads=xref_loads,
+                    xref_constraints=xref_constraints, xref_aero=xref_aero,
+                    xref_sets=xref_sets, xref_optimization=xref_optimization,
+                    word=' (Superelement %i)' % super_id)
+
+    def _cross_reference_arrays(self, word: str='') -> None:
+        """
+        Builds the id/index arrays for ``cross_reference(xref='arrays')``.
+        Only the coordinate systems (and the nodes used by the CORD1x
+        cards) are linked.
+        """
+        self.log.debug("Cross Referencing%s (arrays)..." % word)
+        for coord in self.coords.values():
+            if coord.type in ['CORD1R', 'CORD1C', 'CORD1S']:
+                msg = ', which is required by %s cid=%s' % (coord.type, coord.cid)
+                for nid in coord.node_ids:
+                    self.Node(nid, msg=msg).cross_reference(self)
+        self._cross_reference_coordinates()
+        self._xref_arrays = XrefArrays(self)
+
+        for super_id, superelement in sorted(self.superelement_models.items()):
+            superelement.cross_reference(xref='arrays', word=' (Superelement %i)' % super_id)
 
     def _cross_reference_constraints(self) -> None:
         """
@@ -0,0 +1,477 @@
+"""
+Defines a vectorized parser for the small field (fixed format) cards that
+dominate large meshes:
+ - fast_parse_cards(model, cards_list)
+
+The cards are grouped by card type and number of lines, split into
+8-character fields with numpy and converted one column at a time (e.g.,
+all the x1 values of the GRIDs), including Nastran's implicit exponent
+(e.g., 1.-3).  Anything unusual (e.g., CSV/large field/tabs, an invalid
+value or an unexpected card length) is left for ``BDF.add_card``, which
+also raises the error.
+
+"""
+from __future__ import annotations
+import re
+from collections import defaultdict
+from typing import List, Dict, Tuple, Callable, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.bdf_interface.assign_type import (
+    components_or_blank, integer_double_or_blank, integer_string_or_blank)
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10, CHEXA8, CHEXA20
+from pyNastran.bdf.cards.elements.bars import CBAR
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the number of lines that are supported for each card
+FAST_CARDS = {
+    'GRID' : (1, ),
+    'CQUAD4' : (1, ),
+    'CTRIA3' : (1, ),
+    'CTETRA' : (1, 2),
+    'CHEXA' : (2, 3),
+    'CBAR' : (1, 2),
+}
+
+#: the characters that require to_fields (CSV, large field, tabs, equals)
+SLOW_CHARACTERS = re.compile('[,*\t=]')
+
+
+def fast_parse_cards(model: BDF, cards_list: List[Any]) -> Dict[int, Tuple[Any, None, None]]:
+    """
+    Creates the GRID, CQUAD4, CTRIA3, CTETRA, CHEXA and CBAR card objects
+    for the cards that are small field and have a simple form.
+
+    Parameters
+    ----------
+    model : BDF()
+        the model (used for ``cards_to_read`` and the BAROR)
+    cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+        the cards from ``get_bdf_cards``
+
+    Returns
+    -------
+    parsed_cards : Dict[icard] = (class_instance, None, None)
+        the created cards (see ``BDF._parse_cards_list_parallel``)
+
+    """
+    if any(card[0] == 'ECHOON' for card in cards_list):
+        return {}
+    card_names = set(FAST_CARDS).intersection(model.cards_to_read)
+    if model.baror is not None:
+        # the CBAR defaults depend on the BAROR
+        card_names.discard('CBAR')
+
+    groups = defaultdict(list)
+    for icard, card in enumerate(cards_list):
+        card_name = card[0]
+        if card_name in card_names:
+            nlines = len(card[2])
+            if nlines in FAST_CARDS[card_name]:
+                groups[(card_name, nlines)].append(icard)
+
+    parsed_cards = {}
+    for (card_name, nlines), icards in groups.items():
+        texts = [''.join(cards_list[icard][2]) for icard in icards]
+        text = ''.join(texts)
+        if not text.isascii() or SLOW_CHARACTERS.search(text):
+            icards = [icard for icard, texti in zip(icards, texts)
+                      if texti.isascii() and not SLOW_CHARACTERS.search(texti)]
+            if not icards:
+                continue
+        cards = [cards_list[icard] for icard in icards]
+        fields = _get_fields([card[2] for card in cards], nlines)
+        comments = [card[1] for card in cards]
+        objs = FAST_CARD_FUNCTIONS[card_name](fields, comments)
+        for icard, obj in zip(icards, objs):
+            if obj is not None:
+                parsed_cards[icard] = (obj, None, None)
+    model.log.debug('fast parsed %i/%i cards' % (len(parsed_cards), len(cards_list)))
+    return parsed_cards
+
+
+def _get_fields(cards_lines: List[List[str]], nlines: int) -> np.ndarray:
+    """
+    Splits small field cards into fields (see ``to_fields``)
+
+    Parameters
+    ----------
+    cards_lines : List[List[str]]
+        the lines of each card
+    nlines : int
+        the number of lines of each card
+
+    Returns
+    -------
+    fields : (ncards, 9 + 8*(nlines-1)) bytes ndarray
+        the stripped fields; the continuation fields are removed
+
+    """
+    ncards = len(cards_lines)
+    if nlines == 1:
+        text = [card_lines[0][:72].ljust(72) for card_lines in cards_lines]
+    else:
+        text = [''.join([line[:72].ljust(72) for line in card_lines])
+                for card_lines in cards_lines]
+    all_fields = np.array(text, dtype='S%i' % (72 * nlines)).view('S8').reshape(
+        ncards, 9 * nlines)
+
+    # drop the continuation field at the start of every line (after the 1st)
+    ifields = [0] + [ifield for ifield in range(9 * nlines) if ifield % 9 != 0]
+    fields = np.char.strip(all_fields[:, ifields])
+    return fields
+
+
+def _get_nfields(fields: np.ndarray) -> np.ndarray:
+    """gets len(card) after the trailing blank fields are removed"""
+    is_blank = fields == b''
+    nfields = fields.shape[1] - np.argmin(is_blank[:, ::-1], axis=1)
+    return nfields
+
+
+def _pad_fields(fields: np.ndarray, nfields: int) -> np.ndarray:
+    """adds blank fields, so fields[:, nfields-1] exists"""
+    ncards, nfields_old = fields.shape
+    if nfields_old >= nfields:
+        return fields
+    fields2 = np.zeros((ncards, nfields), dtype=fields.dtype)
+    fields2[:, :nfields_old] = fields
+    return fields2
+
+
+def _integers(fields: np.ndarray, default: Any=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses a column of integer/blank fields (see ``integer_or_blank``)
+
+    Parameters
+    ----------
+    fields : (ncards, ) bytes ndarray
+        the stripped fields
+    default : int / None
+        None : the field is required (see ``integer``)
+
+    Returns
+    -------
+    values : (ncards, ) int64 ndarray
+        the values; blanks are set to 0
+    is_valid : (ncards, ) bool ndarray
+        can the value be parsed
+
+    """
+    is_blank = fields == b''
+    is_valid = ~is_blank if default is None else np.ones(len(fields), dtype='bool')
+    fields = np.where(is_blank, b'0', fields)
+    try:
+        values = fields.astype('int64')
+    except (ValueError, OverflowError):
+        values = np.zeros(len(fields), dtype='int64')
+        for i, field in enumerate(fields):
+            try:
+                values[i] = int(field)
+            except (ValueError, OverflowError):
+                is_valid[i] = False
+    if default is not None:
+        values[is_blank] = default
+    return values, is_valid
+
+
+def _doubles(fields: np.ndarray, default: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses a column of double/blank fields (see ``double_or_blank``)
+
+    Handles:
+     - 1.0, 1.0E+3, 1.0e-3, .5
+     - 1.0D+3, 1.0D-3
+     - 1.0+3, 1.0-3, -1.-3
+
+    Parameters
+    ----------
+    fields : (ncards, ) bytes ndarray
+        the stripped fields
+    default : float
+        the value for a blank field
+
+    Returns
+    -------
+    values : (ncards, ) float64 ndarray
+        the values
+    is_valid : (ncards, ) bool ndarray
+        can the value be parsed
+
+    """
+    is_blank = fields == b''
+    # an integer (1, but not +1 or -1) isn't a float
+    is_valid = ~np.char.isdigit(fields)
+    fields = np.where(is_blank, b'0.', fields)
+    try:
+        values = fields.astype('float64')
+    except ValueError:
+        fields = _add_implicit_exponents(np.char.replace(np.char.upper(fields), b'D', b'E'))
+        try:
+            values = fields.astype('float64')
+        except ValueError:
+            values = np.zeros(len(fields), dtype='float64')
+            for i, field in enumerate(fields):
+                try:
+                    values[i] = float(field)
+                except ValueError:
+                    is_valid[i] = False
+    values[is_blank] = default
+    return values, is_valid
+
+
+def _add_implicit_exponents(fields: np.ndarray) -> np.ndarray:
+    """
+    Adds the E to an implicit exponent (e.g., 1.-3 -> 1.E-3)
+
+    Parameters
+    ----------
+    fields : (ncards, ) bytes ndarray
+        the stripped, upper case fields
+
+    Returns
+    -------
+    fields : (ncards, ) S9 ndarray
+        the fields with an explicit exponent
+
+    """
+    ncards = len(fields)
+    chars = np.zeros((ncards, 9), dtype='uint8')
+    chars[:, :8] = np.ascontiguousarray(fields, dtype='S8').view('uint8').reshape(ncards, 8)
+
+    # a sign that isn't the first character and doesn't follow an E
+    is_sign = (chars == ord('+')) | (chars == ord('-'))
+    is_sign[:, 0] = False
+    is_sign[:, 1:] &= chars[:, :-1] != ord('E')
+    isign = np.where(is_sign.any(axis=1), is_sign.argmax(axis=1), 9)[:, np.newaxis]
+
+    # shift the characters after the sign and insert the E
+    icols = np.arange(9)[np.newaxis, :]
+    icols_from = np.where(icols < isign, icols, icols - 1)
+    chars2 = chars[np.arange(ncards)[:, np.newaxis], icols_from]
+    chars2[icols == isign] = ord('E')
+    return chars2.view('S9').ravel()
+
+
+def _parse_unique(fields: np.ndarray, func: Callable, fieldname: str,
+                  default: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses a column of fields with few unique values (e.g., a PS or
+    OFFT field) using the standard ``assign_type`` function.
+
+    Parameters
+    ----------
+    fields : (ncards, ) bytes ndarray
+        the stripped fields
+    func : function
+        the ``assign_type`` function (e.g., ``components_or_blank``)
+    fieldname : str
+        the name of the field
+    default : int / float / str
+        the default value
+
+    Returns
+    -------
+    values : (ncards, ) object ndarray
+        the values
+    is_valid : (ncards, ) bool ndarray
+        can the value be parsed
+
+    """
+    unique_fields, inverse = np.unique(fields, return_inverse=True)
+    unique_values = np.empty(len(unique_fields), dtype='object')
+    unique_is_valid = np.ones(len(unique_fields), dtype='bool')
+    for i, field in enumerate(unique_fields):
+        svalue = field.decode('ascii') if field else None
+        try:
+            unique_values[i] = func(BDFCard([None, svalue], has_none=False), 1,
+                                    fieldname, default)
+        except SyntaxError:
+            unique_is_valid[i] = False
+    return unique_values[inverse], unique_is_valid[inverse]
+
+
+def _grid(fields: np.ndarray, comments: List[str]) -> List[Any]:
+    """creates the GRIDs (see ``GRID.add_card``)"""
+    nid, is_valid = _integers(fields[:, 1])
+    cp, is_valid2 = _integers(fields[:, 2], 0)
+    is_valid &= is_valid2
+    xyz = np.zeros((len(nid), 3), dtype='float64')
+    for i in range(3):
+        xyz[:, i], is_valid2 = _doubles(fields[:, 3 + i], 0.)
+        is_valid &= is_valid2
+    cd, is_valid2 = _integers(fields[:, 6], 0)
+    is_valid &= is_valid2
+    ps, is_valid2 = _parse_unique(fields[:, 7], components_or_blank, 'ps', '')
+    is_valid &= is_valid2
+    seid, is_valid2 = _integers(fields[:, 8], 0)
+    is_valid &= is_valid2
+
+    nid = nid.tolist()
+    cp = cp.tolist()
+    cd = cd.tolist()
+    ps = ps.tolist()
+    seid = seid.tolist()
+    return [GRID(nid[i], xyzi.copy(), cp[i], cd[i], ps[i], seid[i], comment=comments[i])
+            if valid else None for i, (xyzi, valid) in enumerate(zip(xyz, is_valid.tolist()))]
+
+
+def _shell(fields: np.ndarray, nnodes: int) -> Tuple[List[int], List[int], List[List[int]],
+                                                        np.ndarray, List[float], np.ndarray]:
+    """parses the common fields of the single line CTRIA3/CQUAD4"""
+    eid, is_valid = _integers(fields[:, 1])
+    pid, is_valid2 = _integers(fields[:, 2], 0)
+    is_valid &= is_valid2
+    pid = np.where(fields[:, 2] == b'', eid, pid)
+
+    nids = np.zeros((len(eid), nnodes), dtype='int64')
+    for i in range(nnodes):
+        nids[:, i], is_valid2 = _integers(fields[:, 3 + i])
+        is_valid &= is_valid2
+
+    itheta = 3 + nnodes
+    theta_mcid, is_valid2 = _parse_unique(
+        fields[:, itheta], integer_double_or_blank, 'theta_mcid', 0.0)
+    is_valid &= is_valid2
+    zoffset, is_valid2 = _doubles(fields[:, itheta + 1], 0.0)
+    is_valid &= is_valid2
+    return (eid.tolist(), pid.tolist(), nids.tolist(), theta_mcid.tolist(), zoffset.tolist(),
+            is_valid)
+
+
+def _cquad4(fields: np.ndarray, comments: List[str]) -> List[Any]:
+    """creates the single line CQUAD4s (see ``CQUAD4.add_card``)"""
+    eid, pid, nids, theta_mcid, zoffset, is_valid = _shell(fields, 4)
+    return [CQUAD4(eid[i], pid[i], nids[i], theta_mcid[i], zoffset[i], comment=comments[i])
+            if valid else None for i, valid in enumerate(is_valid.tolist())]
+
+
+def _ctria3(fields: np.ndarray, comments: List[str]) -> List[Any]:
+    """creates the single line CTRIA3s (see ``CTRIA3.add_card``)"""
+    eid, pid, nids, theta_mcid, zoffset, is_valid = _shell(fields, 3)
+    is_valid &= fields[:, 8] == b''
+    return [CTRIA3(eid[i], pid[i], nids[i], zoffset=zoffset[i], theta_mcid=theta_mcid[i],
+                   comment=comments[i])
+            if valid else None for i, valid in enumerate(is_valid.tolist())]
+
+
+def _solid(fields: np.ndarray, comments: List[str],
+           nnodes_min: int, nnodes_max: int, class_min: Any, class_max: Any) -> List[Any]:
+    """
+    creates the CTETRA4/CTETRA10 or CHEXA8/CHEXA20s
+    (see ``BDF._prepare_ctetra``/``BDF._prepare_chexa``)
+    """
+    nfields = _get_nfields(fields)
+    fields = _pad_fields(fields, 3 + nnodes_max)
+    eid, is_valid = _integers(fields[:, 1])
+    pid, is_valid2 = _integers(fields[:, 2])
+    is_valid &= is_valid2
+    is_min = nfields == 3 + nnodes_min
+    is_valid &= nfields <= 3 + nnodes_max
+
+    nids = np.zeros((len(eid), nnodes_max), dtype='int64')
+    is_blank = fields[:, 3:3 + nnodes_max] == b''
+    for i in range(nnodes_max):
+        nids[:, i], is_valid2 = _integers(fields[:, 3 + i], None if i < nnodes_min else 0)
+        is_valid &= is_valid2
+
+    eid = eid.tolist()
+    pid = pid.tolist()
+    nids = nids.tolist()
+    is_min = is_min.tolist()
+    is_blank = is_blank.tolist()
+    elements = []
+    for i, valid in enumerate(is_valid.tolist()):
+        if not valid:
+            elements.append(None)
+        elif is_min[i]:
+            elements.append(class_min(eid[i], pid[i], nids[i][:nnodes_min], comment=comments[i]))
+        else:
+            nidsi = [None if blank else nid for nid, blank in zip(nids[i], is_blank[i])]
+            elements.append(class_max(eid[i], pid[i], nidsi, comment=comments[i]))
+    return elements
+
+
+def _ctetra(fields: np.ndarray, comments: List[str]) -> List[Any]:
+    """creates the CTETRA4/CTETRA10s"""
+    return _solid(fields, comments, 4, 10, CTETRA4, CTETRA10)
+
+
+def _chexa(fields: np.ndarray, comments: List[str]) -> List[Any]:
+    """creates the CHEXA8/CHEXA20s"""
+    return _solid(fields, comments, 8, 20, CHEXA8, CHEXA20)
+
+
+def _cbar(fields: np.ndarray, comments: List[str]) -> List[Any]:
+    """creates the CBARs without a BAROR (see ``CBAR.add_card``)"""
+    fields = _pad_fields(fields, 17)
+    eid, is_valid = _integers(fields[:, 1])
+    pid, is_valid2 = _integers(fields[:, 2], 0)
+    is_valid &= is_valid2
+    pid = np.where(fields[:, 2] == b'', eid, pid)
+    ga, is_valid2 = _integers(fields[:, 3])
+    is_valid &= is_valid2
+    gb, is_valid2 = _integers(fields[:, 4])
+    is_valid &= is_valid2
+
+    # G0 or X1
+    field5, is_valid2 = _parse_unique(fields[:, 5], integer_double_or_blank, 'g0_x1', 0.)
+    is_valid &= is_valid2
+    is_g0 = np.array([isinstance(value, int) for value in field5], dtype='bool')
+    x = np.zeros((len(eid), 3), dtype='float64')
+    x[:, 0] = [value if isinstance(value, float) else 0. for value in field5]
+    for i, ifield in enumerate([6, 7]):
+        x[:, i + 1], is_valid2 = _doubles(fields[:, ifield], 0.)
+        is_valid &= is_valid2 | is_g0
+    # a zero length vector is an error
+    is_valid &= is_g0 | (np.linalg.norm(x, axis=1) != 0.)
+
+    offt, is_valid2 = _parse_unique(fields[:, 8], integer_string_or_blank, 'offt', 'GGG')
+    is_valid &= is_valid2
+    pa, is_valid2 = _integers(fields[:, 9], 0)
+    is_valid &= is_valid2
+    pb, is_valid2 = _integers(fields[:, 10], 0)
+    is_valid &= is_valid2
+
+    wab = np.zeros((len(eid), 6), dtype='float64')
+    for i in range(6):
+        wab[:, i], is_valid2 = _doubles(fields[:, 11 + i], 0.)
+        is_valid &= is_valid2
+
+    eid = eid.tolist()
+    pid = pid.tolist()
+    ga = ga.tolist()
+    gb = gb.tolist()
+    pa = pa.tolist()
+    pb = pb.tolist()
+    is_g0 = is_g0.tolist()
+    offt = offt.tolist()
+    elements = []
+    for i, valid in enumerate(is_valid.tolist()):
+        if not valid:
+            elements.append(None)
+            continue
+        if is_g0[i]:
+            xi = None
+            g0 = field5[i]
+        else:
+            xi = x[i, :].copy()
+            g0 = None
+        elements.append(CBAR(eid[i], pid[i], [ga[i], gb[i]], xi, g0, offt[i], pa[i], pb[i],
+                             wab[i, :3].copy(), wab[i, 3:].copy(), comment=comments[i]))
+    return elements
+
+
+FAST_CARD_FUNCTIONS = {
+    'GRID' : _grid,
+    'CQUAD4' : _cquad4,
+    'CTRIA3' : _ctria3,
+    'CTETRA' : _ctetra,
+    'CHEXA' : _chexa,
+    'CBAR' : _cbar,
+}
@@ -34,6 +34,7 @@ from typing import List, Dict, Set, Tuple, Optional, Union, Any
 import numpy as np
 
 from pyNastran.bdf.bdf_interface.get_methods import GetMethods
+from pyNastran.bdf.bdf_interface.lazy_cards import load_lazy_cards
 from pyNastran.utils.numpy_utils import integer_types
 
 from pyNastran.bdf.mesh_utils.dvxrel import get_dvprel_ndarrays
@@ -106,6 +107,7 @@ class GetCard(GetMethods):
             card_types = [card_types]
         elif not isinstance(card_types, (list, tuple)):
             raise TypeError('card_types must be a list/tuple; type=%s' % type(card_types))
+        load_lazy_cards(self, card_types)
 
         #if reset_type_to_slot_map or self._type_to_slot_map is None:
             #self._type_to_slot_map = rslot_map
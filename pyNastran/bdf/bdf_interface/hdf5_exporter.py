@@ -1,7 +1,7 @@
 """Defines various helper functions for exporting a HDF5 BDF file"""
 from __future__ import annotations
 from collections import defaultdict
-from typing import List, Any, TYPE_CHECKING
+from typing import List, Optional, Any, TYPE_CHECKING
 from io import StringIO
 import numpy as np
 
@@ -13,6 +13,9 @@ from pyNastran.utils import object_attributes
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
 
+#: the target size of an hdf5 chunk; the arrays are chunked by row
+CHUNK_BYTES = 256 * 1024
+
 # dict[key] : [value1, value2, ...]
 dict_int_list_obj_attrs = [
     'spcs', 'spcadds',
@@ -175,7 +178,8 @@ LIST_OBJ_KEYS = [  ## TODO: not done
 ]
 
 
-def export_bdf_to_hdf5_file(hdf5_file, model: BDF, exporter=None):
+def export_bdf_to_hdf5_file(hdf5_file, model: BDF, exporter=None,
+                            compression: Optional[str]=None):
     """
     Converts the BDF objects into hdf5 object
 
@@ -185,23 +189,29 @@ def export_bdf_to_hdf5_file(hdf5_file, model: BDF, exporter=None):
         an h5py object
     exporter : HDF5Exporter; default=None
         unused
+    compression : str; default=None
+        the h5py compression filter (e.g., 'gzip', 'lzf') for the
+        card arrays (e.g., the GRID xyz); the arrays are always chunked,
+        so a subset of the rows may be read
 
     """
     unused_attrs = object_attributes(model, mode='both', keys_to_skip=None,
                                      filter_properties=True)
     encoding = model.get_encoding()
 
+    # the cards (e.g., GRID, CQUAD4) are written as columns of arrays
+    chunked_file = ChunkedGroup(hdf5_file, compression=compression)
     if 'GRID' in model.card_count:
         model.log.debug('exporting nodes')
-        node_group = hdf5_file.create_group('nodes')
+        node_group = chunked_file.create_group('nodes')
         grid_group = node_group.create_group('GRID')
         nids = model._type_to_id_map['GRID']
         if len(nids) == 0:
             assert len(model.nodes) == 0, len(model.nodes)
         CARD_MAP['GRID'].export_to_hdf5(grid_group, model, nids)
 
-    _hdf5_export_group(hdf5_file, model, 'coords', encoding, debug=False)
-    _hdf5_export_elements(hdf5_file, model, encoding)
+    _hdf5_export_group(chunked_file, model, 'coords', encoding, debug=False)
+    _hdf5_export_elements(chunked_file, model, encoding)
 
     # explicit groups
     #
@@ -222,7 +232,7 @@ def export_bdf_to_hdf5_file(hdf5_file, model: BDF, exporter=None):
         'methods', 'tables', 'desvars', 'topvar',
     ]
     for group_name in groups_to_export:
-        _hdf5_export_group(hdf5_file, model, group_name, encoding)
+        _hdf5_export_group(chunked_file, model, group_name, encoding)
 
 
     unused_dict_int_attrs = [  # TODO: not used...
@@ -311,6 +321,50 @@ def export_bdf_to_hdf5_file(hdf5_file, model: BDF, exporter=None):
     #asd
 
 
+class ChunkedGroup:
+    """
+    Wraps an h5py group/file, so the numerical arrays written by the
+    cards (e.g., ``GRID.export_to_hdf5``) are chunked by row and
+    optionally compressed.  Everything else is passed to the group.
+    """
+    def __init__(self, group, compression: Optional[str]=None,
+                 chunk_bytes: int=CHUNK_BYTES):
+        self.group = group
+        self.compression = compression
+        self.chunk_bytes = chunk_bytes
+
+    def create_group(self, name: str) -> ChunkedGroup:
+        """creates a chunked sub-group"""
+        group = self.group.create_group(name)
+        return ChunkedGroup(group, compression=self.compression,
+                            chunk_bytes=self.chunk_bytes)
+
+    def create_dataset(self, name: str, data=None, **kwargs):
+        """creates a dataset, which is chunked if it's a numerical array"""
+        if data is not None and 'chunks' not in kwargs:
+            try:
+                array = np.asarray(data)
+            except ValueError:  # ragged lists
+                array = None
+            if array is not None and array.ndim and array.size and array.dtype.kind in 'biuf':
+                row_bytes = array.nbytes // len(array)
+                nrows = min(len(array), max(1, self.chunk_bytes // row_bytes))
+                kwargs['chunks'] = (nrows, ) + array.shape[1:]
+                if self.compression is not None:
+                    kwargs['compression'] = self.compression
+                data = array
+        return self.group.create_dataset(name, data=data, **kwargs)
+
+    def __getitem__(self, name: str):
+        return self.group[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.group
+
+    def __getattr__(self, name: str):
+        return getattr(self.group, name)
+
+
 def _export_dconstrs(hdf5_file, model: BDF, encoding):
     """exports the dconstrs, which includes DCONSTRs and DCONADDs"""
     if model.dconstrs:
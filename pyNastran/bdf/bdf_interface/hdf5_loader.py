@@ -27,7 +27,19 @@ dict_attrs = [
     #'_type_to_slot_map',
 ]
 
-def load_bdf_from_hdf5_file(h5_file, model):
+#: the groups that have a sub-group for each card type (e.g., elements/CQUAD4)
+CARD_TYPE_GROUPS = [
+    'coords', 'elements', 'properties', 'masses', 'rigid_elements', 'plotels',
+    'materials', 'thermal_materials', 'creep_materials', 'hyperelastic_materials',
+    'caeros', 'splines', 'flutters', 'trims', 'csschds', 'gusts',
+    'methods', 'tables', 'desvars', 'topvar',
+]
+
+#: the groups that are always loaded
+MODEL_GROUPS = ['minor_attributes', 'case_control_deck', 'cards_to_read', 'active_filenames']
+
+
+def load_bdf_from_hdf5_file(h5_file, model, cards=None):
     """
     Loads an h5 file object into an OP2 object
 
@@ -37,10 +49,19 @@ def load_bdf_from_hdf5_file(h5_file, model):
         an h5py file object
     model : BDF()
         the BDF file to put the data into
+    cards : List[str]; default=None -> all
+        the cards to load (e.g., ['GRID', 'CQUAD4']).  The nodes,
+        elements, properties, materials, ... are stored by card type,
+        so only the requested card types are read.  The other groups
+        (e.g., loads, spcs) are loaded if one of the requested cards
+        belongs to them (e.g., FORCE -> loads), so they may have
+        additional card types.
 
     """
     encoding = _cast(h5_file['minor_attributes']['encoding'])
     keys = h5_file.keys()
+    if cards is not None:
+        keys = _filter_hdf5_keys(h5_file, model, cards)
 
     mapper = {
         'elements' : hdf5_load_elements,
@@ -110,6 +131,10 @@ def load_bdf_from_hdf5_file(h5_file, model):
     for key in keys:
         #model.log.debug('loading %s' % key)
         group = h5_file[key]
+        if cards is not None and key in CARD_TYPE_GROUPS:
+            # only read the requested card types
+            group = {card_type: group[card_type] for card_type in group.keys()
+                     if card_type in cards}
         if key == 'nodes':
             grids = group['GRID']
             nids = _cast(grids['nid'])
@@ -119,6 +144,8 @@ def load_bdf_from_hdf5_file(h5_file, model):
             ps = _cast(grids['ps'])
             seid = _cast(grids['seid'])
             for nid, xyzi, cpi, cdi, psi, seidi in zip(nids, xyz, cp, cd, ps, seid):
+                # ps is exported as an integer with 0 for blank
+                psi = str(psi) if psi else ''
                 model.add_grid(nid, xyzi, cp=cpi, cd=cdi, ps=psi, seid=seidi, comment='')
             model.card_count['GRID'] = len(nids)
 
@@ -226,6 +253,20 @@ def load_bdf_from_hdf5_file(h5_file, model):
     cards_to_read = [key.decode(encoding) for key in cards_to_read]
     model.cards_to_read = set(list(cards_to_read))
 
+def _filter_hdf5_keys(h5_file, model, cards):
+    """gets the hdf5 groups that are needed to load the cards"""
+    slots = {model._type_to_slot_map[card_type] for card_type in cards
+             if card_type in model._type_to_slot_map}
+    keys = []
+    for key in h5_file.keys():
+        if key in MODEL_GROUPS or key in slots:
+            keys.append(key)
+        elif key in CARD_TYPE_GROUPS:
+            if any(card_type in cards for card_type in h5_file[key].keys()):
+                keys.append(key)
+    return keys
+
+
 def _load_minor_attributes(unused_key, group, model, encoding):
     keys_attrs = group.keys()
     for keyi in keys_attrs:
@@ -0,0 +1,195 @@
+"""
+Defines helpers for ``BDF.refresh_includes``, which re-reads the INCLUDE
+files that changed since the model was read:
+ - remove_cards_by_ifile(model, ifile)
+ - get_xref_flags(slots)
+ - uncross_reference_by_flags(model, xref_flags)
+
+"""
+from __future__ import annotations
+from typing import Set, Dict, Iterable, TYPE_CHECKING
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the model attributes (slots) that are linked by each cross_reference flag
+XREF_FAMILY_SLOTS = {
+    'nodes' : {
+        'nodes', 'spoints', 'epoints', 'coords', 'points', 'grdset', 'ringaxs', 'ringfl',
+        'gridb', 'seqgp'},
+    'elements' : {'elements', 'rigid_elements', 'plotels', 'normals', 'ao_element_flags'},
+    'properties' : {
+        'properties', 'pbusht', 'pdampt', 'pelast', 'convection_properties', 'phbdys'},
+    'masses' : {'masses', 'properties_mass', 'nsms', 'nsmadds'},
+    'materials' : {
+        'materials', 'thermal_materials', 'creep_materials', 'hyperelastic_materials',
+        'MATS1', 'MATS3', 'MATS8',
+        'MATT1', 'MATT2', 'MATT3', 'MATT4', 'MATT5', 'MATT8', 'MATT9'},
+    'loads' : {
+        'loads', 'load_combinations', 'dloads', 'dload_entries', 'dareas', 'delays',
+        'dphases', 'tempds', 'tics'},
+    'constraints' : {
+        'spcs', 'spcadds', 'mpcs', 'mpcadds', 'spcoffs', 'suport', 'suport1', 'se_suport'},
+    'aero' : {
+        'aero', 'aeros', 'caeros', 'paeros', 'splines', 'aecomps', 'aefacts', 'aelinks',
+        'aelists', 'aeparams', 'aestats', 'aesurf', 'aesurfs', 'csschds', 'flfacts',
+        'flutters', 'gusts', 'mkaeros', 'trims', 'divergs', 'monitor_points'},
+    'sets' : {
+        'sets', 'asets', 'bsets', 'csets', 'qsets', 'usets', 'omits',
+        'se_sets', 'se_bsets', 'se_csets', 'se_qsets', 'se_usets'},
+    'optimization' : {
+        'desvars', 'dresps', 'dconstrs', 'dvprels', 'dvmrels', 'dvcrels', 'dvgrids',
+        'ddvals', 'dlinks', 'dequations', 'doptprm', 'dtable', 'dscreen', 'topvar'},
+}
+
+#: the flags that need to be rerun when the cards of a flag change
+#: (e.g., the elements point to the properties)
+XREF_DEPENDENTS = {
+    'elements' : {'elements', 'loads', 'optimization'},
+    'properties' : {'properties', 'elements', 'masses', 'optimization'},
+    'masses' : {'masses', 'optimization'},
+    'materials' : {'materials', 'properties', 'optimization'},
+    'loads' : {'loads'},
+    'constraints' : {'constraints'},
+    'aero' : {'aero'},
+    'sets' : {'sets', 'aero'},
+    'optimization' : {'optimization'},
+}
+
+#: cards that are not in the ``_slot_to_type_map``
+EXTRA_SLOTS = ['spoints', 'epoints']
+
+
+def remove_cards_by_ifile(model: BDF, ifile: int) -> Set[str]:
+    """
+    Removes the cards that were read from a file
+
+    Parameters
+    ----------
+    model : BDF()
+        a model that was read with ``save_file_structure=True``
+    ifile : int
+        the file index (model.active_filenames[ifile])
+
+    Returns
+    -------
+    slots : Set[str]
+        the model attributes (e.g., 'nodes', 'elements') that were changed
+
+    """
+    slots = set()
+    for slot in list(model._slot_to_type_map) + EXTRA_SLOTS:
+        if not hasattr(model, slot):
+            continue
+        cards = getattr(model, slot)
+        if isinstance(cards, dict):
+            for key in list(cards.keys()):
+                value = cards[key]
+                if isinstance(value, list):
+                    kept_cards = [card for card in value if not _is_ifile(card, ifile)]
+                    if len(kept_cards) == len(value):
+                        continue
+                    for card in value:
+                        if _is_ifile(card, ifile):
+                            _remove_type_to_id(model, card, key)
+                    if kept_cards:
+                        cards[key] = kept_cards
+                    else:
+                        del cards[key]
+                    slots.add(slot)
+                elif _is_ifile(value, ifile):
+                    _remove_type_to_id(model, value, key)
+                    del cards[key]
+                    slots.add(slot)
+        elif isinstance(cards, list):
+            kept_cards = [card for card in cards if not _is_ifile(card, ifile)]
+            if len(kept_cards) != len(cards):
+                setattr(model, slot, kept_cards)
+                slots.add(slot)
+        elif _is_ifile(cards, ifile):
+            setattr(model, slot, None)
+            slots.add(slot)
+    return slots
+
+
+def _is_ifile(card, ifile: int) -> bool:
+    """was the card read from file ifile?"""
+    return getattr(card, 'ifile', None) == ifile
+
+
+def _remove_type_to_id(model: BDF, card, key) -> None:
+    """removes a card from ``model._type_to_id_map``"""
+    card_type = getattr(card, 'type', None)
+    if card_type is None:
+        return
+    ids = model._type_to_id_map.get(card_type)
+    if ids and key in ids:
+        ids.remove(key)
+
+
+def get_xref_flags(slots: Iterable[str]) -> Dict[str, bool]:
+    """
+    Gets the ``cross_reference`` flags to update the cards that point
+    to the changed cards
+
+    Parameters
+    ----------
+    slots : Set[str]
+        the changed model attributes (e.g., 'nodes', 'elements')
+
+    Returns
+    -------
+    xref_flags : Dict[str, bool]
+        the kwargs for ``cross_reference`` (e.g., {'xref_nodes': False, ...})
+
+    """
+    families = set()
+    for slot in slots:
+        for family, family_slots in XREF_FAMILY_SLOTS.items():
+            if slot in family_slots:
+                break
+        else:
+            # we don't know what points to it (e.g., a TABLEx), so do everything
+            family = 'nodes'
+
+        if family == 'nodes':
+            # everything points to the nodes/coords
+            families.update(XREF_FAMILY_SLOTS)
+            break
+        families.update(XREF_DEPENDENTS[family])
+
+    xref_flags = {'xref_%s' % family: family in families
+                  for family in XREF_FAMILY_SLOTS}
+    return xref_flags
+
+
+def uncross_reference_by_flags(model: BDF, xref_flags: Dict[str, bool]) -> None:
+    """
+    Uncross-references the card groups that will be cross-referenced
+    again, so the cards aren't linked twice
+
+    Parameters
+    ----------
+    model : BDF()
+        the cross-referenced model
+    xref_flags : Dict[str, bool]
+        the kwargs for ``cross_reference`` (see ``get_xref_flags``)
+
+    """
+    if all(xref_flags.values()):
+        model.uncross_reference()
+        return
+
+    for family in XREF_FAMILY_SLOTS:
+        if not xref_flags['xref_%s' % family]:
+            continue
+        if family == 'nodes':
+            model._uncross_reference_nodes()
+            model._uncross_reference_coords()
+        else:
+            getattr(model, '_uncross_reference_%s' % family)()
+
+    # these are always cross-referenced
+    model._uncross_reference_contact()
+    model._uncross_reference_superelements()
+    for superelement in model.superelement_models.values():
+        uncross_reference_by_flags(superelement, xref_flags)
@@ -0,0 +1,277 @@
+"""
+Defines the lazy card storage for ``read_bdf(..., lazy=True)``:
+ - LazyCardDict(model, slot, cards)
+ - split_lazy_cards(model, cards_list)
+ - load_lazy_cards(model, card_types=None)
+ - hide_lazy_cards(model)
+
+The card lines of the lazy cards are stored on the model attribute
+(e.g., ``model.elements``) they'd be added to.  The cards are parsed
+the first time that attribute is used, so a script that only uses the
+nodes doesn't pay for parsing the elements.
+
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import List, Set, Optional, Any, TYPE_CHECKING
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.verify_validate import _validate_dict
+
+#: the model attributes that support lazy loading
+LAZY_SLOTS = {
+    'nodes', 'points',
+    'elements', 'rigid_elements', 'plotels', 'masses',
+    'properties', 'properties_mass', 'pbusht', 'pdampt', 'pelast',
+    'materials', 'thermal_materials', 'creep_materials', 'hyperelastic_materials',
+    'MATS1', 'MATS3', 'MATS8',
+    'MATT1', 'MATT2', 'MATT3', 'MATT4', 'MATT5', 'MATT8', 'MATT9',
+    'tables', 'tables_d', 'tables_m', 'random_tables', 'tables_sdamping',
+    'methods', 'cMethods', 'nlparms', 'tsteps', 'tstepnls',
+    'caeros', 'paeros', 'splines', 'aefacts', 'aelists', 'aesurf', 'aesurfs', 'flfacts',
+    'desvars', 'dresps', 'dvprels', 'dvmrels', 'dvcrels',
+}
+
+#: cards that are not stored in the attribute of their ``_type_to_slot_map``
+LAZY_SKIP_CARDS = {'SPOINT', 'EPOINT'}
+
+
+class LazyCardDict(dict):
+    """
+    A dictionary of cards (e.g., ``model.elements``) that parses its
+    lazy cards the first time it's used.
+
+    The cards are parsed by the standard reader, so the result is the
+    same as ``read_bdf(..., lazy=False)``.  Once the cards are loaded,
+    the model attribute is replaced by a normal dictionary, so later
+    lookups don't go through this class.  A reference to this object
+    that was taken before the load isn't updated by later changes to
+    the model.
+
+    """
+    def __init__(self, model: BDF, slot: str, cards: Any) -> None:
+        dict.__init__(self, cards)
+        self._model = model
+        self._slot = slot
+
+        #: List[card_name, comment, card_lines, (ifile, iline)]
+        self._pending = []
+
+    @property
+    def is_loaded(self) -> bool:
+        """have the lazy cards been parsed?"""
+        return not self._pending
+
+    def card_types(self) -> Set[str]:
+        """gets the card types (e.g., CQUAD4) without parsing the cards"""
+        card_types = {card[0] for card in self._pending}
+        for card in dict.values(self):
+            if isinstance(card, list):
+                card_types.update(cardi.type for cardi in card)
+            else:
+                card_types.add(card.type)
+        return card_types
+
+    def load(self) -> None:
+        """parses the lazy cards"""
+        if not self._pending:
+            return
+        cards_list = self._pending
+        # clear the list first, so adding the cards doesn't recurse
+        self._pending = []
+
+        model = self._model
+        model.log.debug('loading %i lazy cards for %s' % (len(cards_list), self._slot))
+        card_count = {card_name: model.card_count[card_name]
+                      for card_name in {card[0] for card in cards_list}}
+        model._parse_cards_list(cards_list)
+
+        # the cards were counted by read_bdf
+        model.card_count.update(card_count)
+        model.pop_parse_errors()
+        if model._lazy_validate:
+            # the lazy attributes are dictionaries of cards
+            _validate_dict(model, self)
+
+        # the overridden methods are slow, so swap in a normal dictionary
+        if getattr(model, self._slot) is self:
+            setattr(model, self._slot, dict(dict.items(self)))
+
+    def __getitem__(self, key):
+        self.load()
+        return dict.__getitem__(self, key)
+
+    def __delitem__(self, key):
+        self.load()
+        dict.__delitem__(self, key)
+
+    def __contains__(self, key):
+        self.load()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self.load()
+        return dict.__iter__(self)
+
+    def __reversed__(self):
+        self.load()
+        return dict.__reversed__(self)
+
+    def __len__(self):
+        self.load()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self.load()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self.load()
+        return dict.__ne__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self.load()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        # pickle/deepcopy as a normal dictionary
+        self.load()
+        return dict, (dict(dict.items(self)),)
+
+    def get(self, key, default=None):
+        self.load()
+        return dict.get(self, key, default)
+
+    def keys(self):
+        self.load()
+        return dict.keys(self)
+
+    def values(self):
+        self.load()
+        return dict.values(self)
+
+    def items(self):
+        self.load()
+        return dict.items(self)
+
+    def pop(self, *args):
+        self.load()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self.load()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self.load()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self.load()
+        dict.update(self, *args, **kwargs)
+
+    def copy(self):
+        self.load()
+        return dict(dict.items(self))
+
+    def clear(self):
+        self._pending = []
+        dict.clear(self)
+
+
+def split_lazy_cards(model: BDF, cards_list: List[Any]) -> List[Any]:
+    """
+    Stores the lazy cards on the model
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+        the cards from ``get_bdf_cards``
+
+    Returns
+    -------
+    cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+        the cards that must be parsed now
+
+    """
+    # replicated cards depend on the previous card
+    if any('=' in card[0] for card in cards_list if card[0]):
+        model.log.debug('lazy loading is not supported for replicated cards')
+        return cards_list
+    if any(card[0] in ('ECHOON', 'ECHOOFF') for card in cards_list):
+        return cards_list
+
+    card_parser = model._card_parser
+    card_parser_prepare = model._card_parser_prepare
+    type_to_slot_map = model._type_to_slot_map
+    slot_cache = {}
+    eager_cards = []
+    for card in cards_list:
+        card_name = card[0]
+        slot = slot_cache.get(card_name)
+        if slot is None:
+            slot = type_to_slot_map.get(card_name, '')
+            is_lazy = (
+                slot in LAZY_SLOTS and card_name not in LAZY_SKIP_CARDS and
+                card_name in model.cards_to_read and
+                (card_name in card_parser or card_name in card_parser_prepare))
+            if not is_lazy:
+                slot = ''
+            slot_cache[card_name] = slot
+
+        if not slot:
+            eager_cards.append(card)
+            continue
+
+        cards = getattr(model, slot)
+        if not isinstance(cards, LazyCardDict):
+            cards = LazyCardDict(model, slot, cards)
+            setattr(model, slot, cards)
+        cards._pending.append(card)
+        model.increase_card_count(card_name)
+    return eager_cards
+
+
+def load_lazy_cards(model: BDF, card_types: Optional[List[str]]=None) -> None:
+    """
+    Parses the lazy cards
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    card_types : List[str]; default=None -> all cards
+        the card types that are needed (e.g., ['CQUAD4', 'GRID']);
+        all the cards in the model attribute of a card type are parsed
+
+    """
+    for slot in sorted(LAZY_SLOTS):
+        cards = getattr(model, slot, None)
+        if not isinstance(cards, LazyCardDict) or cards.is_loaded:
+            continue
+        if card_types is None or any(card[0] in card_types for card in cards._pending):
+            cards.load()
+
+
+@contextmanager
+def hide_lazy_cards(model: BDF):
+    """
+    Temporarily replaces the unparsed lazy attributes (e.g., ``model.elements``)
+    with the cards that were parsed, so the model can be validated without
+    parsing the lazy cards.
+    """
+    lazy_cards = {}
+    for slot in LAZY_SLOTS:
+        cards = getattr(model, slot, None)
+        if isinstance(cards, LazyCardDict) and not cards.is_loaded:
+            lazy_cards[slot] = cards
+            setattr(model, slot, dict(dict.items(cards)))
+    try:
+        yield
+    finally:
+        for slot, cards in lazy_cards.items():
+            setattr(model, slot, cards)
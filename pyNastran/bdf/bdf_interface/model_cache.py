@@ -0,0 +1,191 @@
+"""
+Defines a disk cache for parsed (not cross-referenced) BDF models:
+ - get_cache_key(...)
+ - load_cached_model(model, cache_dir, cache_key, hash_contents=False)
+ - save_cached_model(model, cache_dir, cache_key, hash_contents=False)
+
+A cache entry is a pair of files:
+ - <key>.json : the (path, size, mtime, sha1) signature of the main
+                file and every INCLUDE file that was read
+ - <key>.snapshot : the model (see ``BDF.save_snapshot``)
+
+An entry is only used when every file in the signature is unchanged, so
+editing an INCLUDE file (or a parent file to add/remove an INCLUDE)
+invalidates it.
+
+"""
+from __future__ import annotations
+import os
+import json
+import hashlib
+from typing import List, Dict, Optional, Any, TYPE_CHECKING
+
+import pyNastran
+from pyNastran.utils.compressed_file import open_file, split_zip_filename, is_file
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: bump this if the contents of the cache change
+CACHE_VERSION = 3
+
+
+def get_cache_key(bdf_filename: str, model: BDF, punch: bool,
+                  read_includes: bool, encoding: str,
+                  save_file_structure: bool) -> str:
+    """
+    Gets the cache key for a read_bdf call.  The key depends on the main
+    file and the reader options (not the file contents).
+    """
+    key_data = [
+        CACHE_VERSION,
+        pyNastran.__version__,
+        os.path.abspath(bdf_filename),
+        model.nastran_format,
+        punch,
+        read_includes,
+        encoding,
+        save_file_structure,
+        model.is_superelements,
+        sorted(model.cards_to_read),
+    ]
+    key_str = json.dumps(key_data)
+    return hashlib.sha1(key_str.encode('utf8')).hexdigest()
+
+
+def _get_cache_filenames(cache_dir: str, cache_key: str) -> (str, str):
+    """gets the signature/model filenames for a cache entry"""
+    json_filename = os.path.join(cache_dir, cache_key + '.json')
+    snapshot_filename = os.path.join(cache_dir, cache_key + '.snapshot')
+    return json_filename, snapshot_filename
+
+
+def get_file_signature(filename: str, hash_contents: bool=False) -> Dict[str, Any]:
+    """
+    Gets the signature of a file
+
+    Parameters
+    ----------
+    filename : str
+        the file to check
+    hash_contents : bool; default=False
+        False : use the path, size and modification time
+        True : also use the sha1 of the file contents
+
+    Returns
+    -------
+    signature : Dict[str, Any]
+        the path, size, mtime and (optionally) sha1 of the file
+
+    """
+    # a file in a zip archive uses the size/time of the archive
+    zip_filename = split_zip_filename(filename)[0]
+    stat = os.stat(filename if zip_filename is None else zip_filename)
+    signature = {
+        'path': os.path.abspath(filename),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime_ns,
+    }
+    if hash_contents:
+        sha1 = hashlib.sha1()
+        with open_file(filename, 'rb') as bdf_file:
+            for block in iter(lambda: bdf_file.read(1024 * 1024), b''):
+                sha1.update(block)
+        signature['sha1'] = sha1.hexdigest()
+    return signature
+
+
+def _is_signature_valid(signatures: List[Dict[str, Any]], hash_contents: bool) -> bool:
+    """are all the files in the cache entry unchanged?"""
+    for signature in signatures:
+        filename = signature['path']
+        if not is_file(filename):
+            return False
+        is_hashed = 'sha1' in signature
+        if hash_contents and not is_hashed:
+            return False
+        if get_file_signature(filename, hash_contents=is_hashed) != signature:
+            return False
+    return True
+
+
+def load_cached_model(model: BDF, cache_dir: str, cache_key: str,
+                      hash_contents: bool=False) -> bool:
+    """
+    Loads a parsed model from the cache
+
+    Parameters
+    ----------
+    model : BDF()
+        the model to fill
+    cache_dir : str
+        the cache directory
+    cache_key : str
+        see ``get_cache_key``
+    hash_contents : bool; default=False
+        require a sha1 check of the file contents
+
+    Returns
+    -------
+    is_loaded : bool
+        was the model loaded from the cache
+
+    """
+    json_filename, snapshot_filename = _get_cache_filenames(cache_dir, cache_key)
+    if not (os.path.exists(json_filename) and os.path.exists(snapshot_filename)):
+        return False
+
+    try:
+        with open(json_filename, 'r') as json_file:
+            signatures = json.load(json_file)
+        if not _is_signature_valid(signatures, hash_contents):
+            model.log.debug('cache for %s is stale' % model.bdf_filename)
+            return False
+        model.load_snapshot(snapshot_filename)
+    except Exception as error:
+        # a bad cache is not an error; we'll just read the deck
+        model.log.warning('failed to load the cache %r; %s' % (snapshot_filename, str(error)))
+        return False
+    model.log.debug('loaded %s from the cache %r' % (model.bdf_filename, snapshot_filename))
+    return True
+
+
+def save_cached_model(model: BDF, cache_dir: str, cache_key: str,
+                      hash_contents: bool=False) -> None:
+    """
+    Saves a parsed (not cross-referenced) model to the cache
+
+    Parameters
+    ----------
+    model : BDF()
+        the model to save
+    cache_dir : str
+        the cache directory
+    cache_key : str
+        see ``get_cache_key``
+    hash_contents : bool; default=False
+        store a sha1 of the file contents
+
+    """
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    json_filename, snapshot_filename = _get_cache_filenames(cache_dir, cache_key)
+
+    # a file in a zip archive is signed with the size/time of the archive
+    filenames = [model.bdf_filename] + [filename for filename in model.active_filenames
+                                        if is_file(filename)]
+    signatures = []
+    used_filenames = set()
+    for filename in filenames:
+        abs_filename = os.path.abspath(filename)
+        if abs_filename in used_filenames:
+            continue
+        used_filenames.add(abs_filename)
+        signatures.append(get_file_signature(abs_filename, hash_contents=hash_contents))
+
+    # write to temporary files, so a crash can't leave a partial entry
+    model.save_snapshot(snapshot_filename + '.tmp')
+    with open(json_filename + '.tmp', 'w') as json_file:
+        json.dump(signatures, json_file, indent=1)
+    os.replace(snapshot_filename + '.tmp', snapshot_filename)
+    os.replace(json_filename + '.tmp', json_filename)
+    model.log.debug('saved %s to the cache %r' % (model.bdf_filename, snapshot_filename))
@@ -0,0 +1,175 @@
+"""
+Defines the timing/memory instrumentation for ``read_bdf`` and
+``cross_reference``:
+ - ReadProfiler(memory=False)
+
+The profile is enabled with:
+
+.. code-block:: python
+
+   >>> model = read_bdf(bdf_filename, profile=True)
+   >>> print(model.get_profile_stats())
+   >>> model.profile_stats['cards']['GRID']
+   {'time': 0.52, 'count': 90601, 'memory': None}
+
+"""
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+from typing import List, Dict, Tuple, Union, Optional, Any
+
+
+class ReadProfiler:
+    """
+    Accumulates the wall time, count and memory delta of the
+    ``read_bdf``/``cross_reference`` phases and the cards by type.
+    """
+    def __init__(self, memory: bool=False) -> None:
+        """
+        Creates the ReadProfiler
+
+        Parameters
+        ----------
+        memory : bool; default=False
+            track the change in the allocated (python) memory with
+            tracemalloc, which makes reading the deck ~5-10x slower
+
+        """
+        self.memory = memory
+        #: phase_name -> [time, count, memory]; in start order
+        self.phases = {}  # type: Dict[str, List[Any]]
+        #: card_name -> [time, count, memory]
+        self.cards = {}  # type: Dict[str, List[Any]]
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """starts tracemalloc (if required)"""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """stops tracemalloc if this object started it"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _get_memory(self) -> int:
+        """gets the currently allocated memory (in bytes)"""
+        if self.memory:
+            return tracemalloc.get_traced_memory()[0]
+        return 0
+
+    @contextmanager
+    def phase(self, name: str):
+        """times a block of code"""
+        # the key is added first, so an outer phase is listed before
+        # the phases it contains
+        stats = self.phases.setdefault(name, [0., 0, 0])
+        memory0 = self._get_memory()
+        time0 = perf_counter()
+        try:
+            yield
+        finally:
+            stats[0] += perf_counter() - time0
+            stats[1] += 1
+            stats[2] += self._get_memory() - memory0
+
+    def start_card(self) -> Tuple[float, int]:
+        """gets the start time/memory for ``stop_card``"""
+        return perf_counter(), self._get_memory()
+
+    def stop_card(self, card_name: str, start: Tuple[float, int]) -> None:
+        """adds a card to the stats for the card type"""
+        dt = perf_counter() - start[0]
+        dmemory = self._get_memory() - start[1]
+        try:
+            stats = self.cards[card_name]
+        except KeyError:
+            stats = self.cards[card_name] = [0., 0, 0]
+        stats[0] += dt
+        stats[1] += 1
+        stats[2] += dmemory
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Gets the profile as a dictionary
+
+        Returns
+        -------
+        stats : Dict[str, Dict[str, Dict[str, Any]]]
+            {'phases' : {phase_name : {'time': time, 'count': count,
+                                       'memory': memory}},
+             'cards' : {card_name : {...}},}
+            time : float
+                the wall time (sec)
+            count : int
+                the number of calls/cards
+            memory : int / None
+                the change in the allocated memory (bytes);
+                None if the memory wasn't tracked
+
+        """
+        return {
+            'phases': self._to_dict(self.phases),
+            'cards': self._to_dict(self.cards),
+        }
+
+    def _to_dict(self, stats: Dict[str, List[Any]]) -> Dict[str, Dict[str, Any]]:
+        """helper for ``to_dict``"""
+        out = {}
+        for name, (time, count, memory) in stats.items():
+            out[name] = {
+                'time': time,
+                'count': count,
+                'memory': memory if self.memory else None,
+            }
+        return out
+
+
+def get_profile_stats(profile_stats: Optional[Dict[str, Dict[str, Dict[str, Any]]]],
+                      return_type: str='string') -> Union[str, List[str]]:
+    """
+    Gets a table of the profile from ``ReadProfiler.to_dict``
+
+    Parameters
+    ----------
+    profile_stats : dict / None
+        the profile (see ``ReadProfiler.to_dict``)
+    return_type : str (default='string')
+        the output type ('list', 'string')
+            'list' : list of strings
+            'string' : single, joined string
+
+    Returns
+    -------
+    return_data : str, optional
+        the output data
+
+    """
+    msg = ['---BDF Profile---']
+    if profile_stats is None:
+        msg.append('profiling was not enabled; use read_bdf(..., profile=True)')
+    else:
+        msg.append('%-32s %10s %8s %12s' % ('phase', 'time (s)', 'count', 'memory (MB)'))
+        msg.extend(_get_rows(profile_stats['phases']))
+        cards = profile_stats['cards']
+        if cards:
+            # the slowest card types are first
+            cards_sorted = dict(sorted(cards.items(), key=lambda item: -item[1]['time']))
+            msg.append('')
+            msg.append('%-32s %10s %8s %12s' % ('card', 'time (s)', 'count', 'memory (MB)'))
+            msg.extend(_get_rows(cards_sorted))
+    if return_type == 'string':
+        return '\n'.join(msg) + '\n'
+    return msg
+
+
+def _get_rows(stats: Dict[str, Dict[str, Any]]) -> List[str]:
+    """helper for ``get_profile_stats``"""
+    rows = []
+    for name, stat in stats.items():
+        memory = stat['memory']
+        memory_str = '' if memory is None else '%.3f' % (memory / 1024 ** 2)
+        rows.append('%-32s %10.4f %8i %12s' % (name, stat['time'], stat['count'], memory_str))
+    return rows
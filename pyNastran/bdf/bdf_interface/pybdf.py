@@ -7,13 +7,14 @@ Main BDF class.  Defines:
 import os
 from collections import defaultdict
 from itertools import count
-from typing import List, Tuple, Optional, Union, Any, cast
+from typing import List, Tuple, Optional, Union, Iterator, Any, cast
 from io import StringIO
 
 import numpy as np
 from cpylog import get_logger2
 from pyNastran.nptyping import NDArrayN2int
 from pyNastran.utils import print_bad_path, _filename
+from pyNastran.utils.compressed_file import open_file, is_zip_member, normalize_zip_filename
 
 from pyNastran.bdf import BULK_DATA_CARDS, FLAGGED_CARDS
 from pyNastran.bdf.errors import MissingDeckSections
@@ -281,6 +282,75 @@ class BDFInputPy:
             #assert nlines == ilines.shape[0], 'nlines=%s nilines=%s' % (nlines, nilines)
         return lines, ilines
 
+    def iter_lines(self, bdf_filename: Union[str, StringIO]) -> Iterator[Tuple[str, int, int]]:
+        """
+        Streams the lines in the deck, reading the INCLUDE files as they
+        are found.  Unlike ``get_main_lines``/``lines_to_deck_lines``,
+        the lines are never stored.
+
+        Parameters
+        ----------
+        bdf_filename : str / StringIO
+            the main bdf_filename
+
+        Yields
+        ------
+        line : str
+            the line without the trailing newline
+        ifile : int
+            the index of the file in ``active_filenames``
+        iline : int
+            the 0-based line number in the file
+
+        """
+        # the next ifile
+        self._nfiles = 1
+        if hasattr(bdf_filename, 'read') and hasattr(bdf_filename, 'write'):
+            yield from self._iter_file_lines(bdf_filename, 0)
+            return
+
+        bdf_filename = cast(str, bdf_filename)
+        self.bdf_filename = bdf_filename
+        self.include_dir = os.path.dirname(os.path.abspath(bdf_filename))
+        with self._open_file(bdf_filename, basename=True) as bdf_file:
+            yield from self._iter_file_lines(bdf_file, 0)
+
+    def _iter_file_lines(self, bdf_file: Any, ifile: int) -> Iterator[Tuple[str, int, int]]:
+        """streams the lines in an open file (see ``iter_lines``)"""
+        iline = -1
+        for line in bdf_file:
+            iline += 1
+            line = line.rstrip('\r\n')
+            if not line.upper().startswith('INCLUDE'):
+                yield line, ifile, iline
+                continue
+
+            # an INCLUDE may be split across multiple lines
+            line_base = line.split('$')[0]
+            include_lines = [line_base.strip()]
+            line_base = line_base[8:].strip()
+            if "'" in line_base and not (line_base.startswith("'") and line_base.endswith("'")):
+                while not line.split('$')[0].endswith("'"):
+                    line = next(bdf_file, None)
+                    if line is None:
+                        msg = 'There was an invalid filename found while parsing (index).\n'
+                        msg += 'include_lines = %s' % include_lines
+                        raise IndexError(msg)
+                    iline += 1
+                    line = line.split('$')[0].strip()
+                    include_lines.append(line)
+
+            bdf_filename2 = get_include_filename(include_lines, include_dir=self.include_dir)
+            self.include_lines[ifile].append((include_lines, bdf_filename2))
+            if not self.read_includes:
+                continue
+
+            self._open_file_checks(bdf_filename2)
+            jfile = self._nfiles
+            self._nfiles += 1
+            with self._open_file(bdf_filename2, basename=False) as bdf_file2:
+                yield from self._iter_file_lines(bdf_file2, jfile)
+
     def _update_include(self, lines: List[str], nlines: int, ilines,
                         include_lines: List[str], bdf_filename2: str, i: int, j: int, ifile: int,
                         make_ilines: bool=False):
@@ -493,8 +563,10 @@ class BDFInputPy:
             bdf_filename_inc = os.path.join(self.include_dir, os.path.basename(bdf_filename))
         else:
             bdf_filename_inc = os.path.join(self.include_dir, bdf_filename)
+        bdf_filename_inc = normalize_zip_filename(bdf_filename_inc)
 
-        if not os.path.exists(_filename(bdf_filename_inc)):
+        is_member = is_zip_member(bdf_filename_inc)
+        if not is_member and not os.path.exists(_filename(bdf_filename_inc)):
             msg = 'No such bdf_filename: %r\n' % bdf_filename_inc
             msg += 'cwd: %r\n' % os.getcwd()
             msg += 'include_dir: %r\n' % self.include_dir
@@ -512,6 +584,8 @@ class BDFInputPy:
                 % (bdf_filename, self.active_filenames)
             self.log.error(msg)
             raise RuntimeError(msg)
+        elif is_member:
+            pass
         elif os.path.isdir(_filename(bdf_filename)):
             current_filename = self.active_filename if len(self.active_filenames) > 0 else 'None'
             msg = 'Found a directory: bdf_filename=%r\ncurrent_file=%s' % (
@@ -528,6 +602,9 @@ class BDFInputPy:
         """
         Opens a new bdf_filename with the proper encoding and include directory
 
+        gzip (.gz), bzip2 (.bz2), lzma (.xz) files and files in a zip
+        archive (e.g., 'models.zip/model.bdf') are decoded as they're read
+
         Parameters
         ----------
         bdf_filename : str
@@ -549,6 +626,7 @@ class BDFInputPy:
             bdf_filename_inc = os.path.join(self.include_dir, os.path.basename(bdf_filename))
         else:
             bdf_filename_inc = os.path.join(self.include_dir, bdf_filename)
+        bdf_filename_inc = normalize_zip_filename(bdf_filename_inc)
 
         self._validate_open_file(bdf_filename, bdf_filename_inc, check)
 
@@ -558,7 +636,7 @@ class BDFInputPy:
 
         #print('ENCODING - _open_file=%r' % self.encoding)
         #self._check_pynastran_header(lines)
-        bdf_file = open(_filename(bdf_filename_inc), 'r', encoding=encoding)
+        bdf_file = open_file(_filename(bdf_filename_inc), 'r', encoding=encoding)
         return bdf_file
 
     def _validate_open_file(self, bdf_filename: Union[str, StringIO],
@@ -586,7 +664,8 @@ class BDFInputPy:
 
         """
         if check:
-            if not os.path.exists(_filename(bdf_filename_inc)):
+            is_member = is_zip_member(bdf_filename_inc)
+            if not is_member and not os.path.exists(_filename(bdf_filename_inc)):
                 msg = 'No such bdf_filename: %r\n' % bdf_filename_inc
                 msg += 'cwd: %r\n' % os.getcwd()
                 msg += 'include_dir: %r\n' % self.include_dir
@@ -600,6 +679,8 @@ class BDFInputPy:
                 msg = 'bdf_filename=%s is already active.\nactive_filenames=%s' \
                     % (bdf_filename, self.active_filenames)
                 raise RuntimeError(msg)
+            elif is_member:
+                pass
             elif os.path.isdir(_filename(bdf_filename)):
                 current_fname = self.active_filename if len(self.active_filenames) > 0 else 'None'
                 raise IOError('Found a directory: bdf_filename=%r\ncurrent_file=%s' % (
@@ -653,6 +734,52 @@ def _is_bulk_data_line(text: str) -> bool:
     return False
 
 
+def _iter_bulk_data_lines(lines: Iterator[Tuple[str, int, int]],
+                          punch: Optional[bool]) -> Iterator[Tuple[str, int, int]]:
+    """
+    Streams the bulk data lines (see ``BDFInputPy.iter_lines``)
+
+    Parameters
+    ----------
+    lines : Iterator[(line, ifile, iline)]
+        all the active lines in the deck
+    punch : bool / None
+        None : guess
+        True : starts from the bulk data deck
+        False : skip to the BEGIN BULK
+
+    .. note:: the lines of superelements/auxmodels are not split out
+
+    """
+    if not punch:
+        # the comments before the first line (only kept for a punch file)
+        comment_lines = []
+        for line, ifile, iline in lines:
+            text = line.split('$')[0].strip()
+            if not text:
+                if punch is None:
+                    comment_lines.append((line, ifile, iline))
+                continue
+            if punch is None:
+                # guess using the first line
+                punch = _is_bulk_data_line(line)
+                if punch:
+                    yield from comment_lines
+                    yield line, ifile, iline
+                    break
+                comment_lines = []
+            uline = text.upper()
+            if uline.startswith('BEGIN') and _is_begin_bulk(uline):
+                break
+
+    for line, ifile, iline in lines:
+        uline = line.lstrip().upper()
+        if uline.startswith('BEGIN') and 'BULK' in uline:
+            # BEGIN BULK SUPER=2
+            continue
+        yield line, ifile, iline
+
+
 def _check_pynastran_encoding(bdf_filename: Union[str, StringIO], encoding: str) -> str:
     """updates the $pyNastran: key=value variables"""
     line = '$pyNastran: punch=False'
@@ -662,7 +789,7 @@ def _check_pynastran_encoding(bdf_filename: Union[str, StringIO], encoding: str)
         'version', 'punch', 'nnodes', 'nelements', 'dumplines',
         'is_superelements', 'skip_cards', 'units']
 
-    with open(bdf_filename, 'rb') as bdf_file:
+    with open_file(bdf_filename, 'rb') as bdf_file:
         line = bdf_file.readline()
         line_str = line.decode('ascii')
         while '$' in line_str:
@@ -1413,7 +1540,7 @@ def _show_bad_file(self: Any, bdf_filename: Union[str, StringIO],
     lines = []  # type: List[str]
     print('ENCODING - show_bad_file=%r' % encoding)
 
-    with open(_filename(bdf_filename), 'r', encoding=encoding) as bdf_file:
+    with open_file(_filename(bdf_filename), 'r', encoding=encoding) as bdf_file:
         iline = 0
         nblank = 0
         while 1:
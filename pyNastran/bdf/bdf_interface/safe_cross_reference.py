@@ -4,13 +4,20 @@ Creates safe cross referencing
 Safe cross-referencing skips failed xref's
 
 """
+import sys
+import threading
 from collections import defaultdict
-from typing import List, Dict, Any
+from typing import List, Dict, Tuple, Callable, Optional, Any
 
 import numpy as np
 from numpy import zeros, argsort, arange, array_equal
 from pyNastran.bdf.bdf_interface.cross_reference import XrefMesh
 
+#: the log messages/xref errors of the safe_cross_reference task that is
+#: running on the current thread (None on the main thread)
+_THREAD_STATE = threading.local()
+LOG_LEVELS = {'debug', 'info', 'warning', 'error', 'exception', 'critical'}
+
 
 class SafeXrefMesh(XrefMesh):
     """
@@ -43,10 +50,22 @@ class SafeXrefMesh(XrefMesh):
                              xref_optimization=True,
                              create_superelement_geometry=False,
                              debug=True,
-                             word=''):
+                             word='',
+                             nworkers=1):
         """
         Performs cross referencing in a way that skips data gracefully.
 
+        Parameters
+        ----------
+        nworkers : int; default=1
+            the number of threads used to cross-reference the independent
+            card families (aero, constraints, loads, optimization) after
+            the nodes, coordinate systems, elements, properties, masses,
+            materials and sets; the log messages and xref errors are the
+            same as nworkers=1.  Threads are slower than nworkers=1 when
+            the GIL is enabled, so nworkers is only used by a
+            free-threaded Python.
+
         .. warning:: not fully implemented
         """
         if not xref:
@@ -56,6 +75,46 @@ class SafeXrefMesh(XrefMesh):
             self._cross_reference_nodes()
             self._cross_reference_coordinates()
 
+        if nworkers > 1 and _is_free_threaded():
+            self._safe_cross_reference_parallel(
+                nworkers, xref_elements=xref_elements, xref_properties=xref_properties,
+                xref_masses=xref_masses, xref_materials=xref_materials,
+                xref_loads=xref_loads, xref_constraints=xref_constraints,
+                xref_aero=xref_aero, xref_sets=xref_sets,
+                xref_optimization=xref_optimization)
+        else:
+            self._safe_cross_reference_serial(
+                xref_elements=xref_elements, xref_properties=xref_properties,
+                xref_masses=xref_masses, xref_materials=xref_materials,
+                xref_loads=xref_loads, xref_constraints=xref_constraints,
+                xref_aero=xref_aero, xref_sets=xref_sets,
+                xref_optimization=xref_optimization)
+
+        if xref_nodes_with_elements:
+            self._cross_reference_nodes_with_elements()
+
+        self._safe_cross_reference_contact()
+        self._safe_cross_reference_superelements(create_superelement_geometry)
+        self._xref = True
+
+        self.pop_xref_errors()
+        for super_id, superelement in sorted(self.superelement_models.items()):
+            superelement.safe_cross_reference(
+                xref=xref, xref_nodes=xref_nodes, xref_elements=xref_elements,
+                xref_nodes_with_elements=xref_nodes_with_elements,
+                xref_properties=xref_properties, xref_masses=xref_masses,
+                xref_materials=xref_materials, xref_loads=xref_loads,
+                xref_constraints=xref_constraints, xref_aero=xref_aero,
+                xref_sets=xref_sets, xref_optimization=xref_optimization,
+                word=' (Superelement %i)' % super_id, nworkers=nworkers)
+
+    def _safe_cross_reference_serial(self, xref_elements=True, xref_properties=True,
+                                     xref_masses=True, xref_materials=True,
+                                     xref_loads=True, xref_constraints=True,
+                                     xref_aero=True, xref_sets=True,
+                                     xref_optimization=True):
+        # type: (bool, bool, bool, bool, bool, bool, bool, bool, bool) -> None
+        """cross references the cards after the nodes/coordinate systems"""
         if xref_elements:
             self._safe_cross_reference_elements()
         if xref_properties:
@@ -77,22 +136,72 @@ class SafeXrefMesh(XrefMesh):
             self._cross_reference_sets()
         if xref_optimization:
             self._safe_cross_reference_optimization()
-        if xref_nodes_with_elements:
-            self._cross_reference_nodes_with_elements()
 
-        self._safe_cross_reference_contact()
-        self._safe_cross_reference_superelements(create_superelement_geometry)
+    def _safe_cross_reference_parallel(self, nworkers, xref_elements=True,
+                                       xref_properties=True, xref_masses=True,
+                                       xref_materials=True, xref_loads=True,
+                                       xref_constraints=True, xref_aero=True,
+                                       xref_sets=True, xref_optimization=True):
+        # type: (int, bool, bool, bool, bool, bool, bool, bool, bool, bool) -> None
+        """
+        Cross references the card families on a thread pool.
 
-        self.pop_xref_errors()
-        for super_id, superelement in sorted(self.superelement_models.items()):
-            superelement.safe_cross_reference(
-                xref=xref, xref_nodes=xref_nodes, xref_elements=xref_elements,
-                xref_nodes_with_elements=xref_nodes_with_elements,
-                xref_properties=xref_properties, xref_masses=xref_masses,
-                xref_materials=xref_materials, xref_loads=xref_loads,
-                xref_constraints=xref_constraints, xref_aero=xref_aero,
-                xref_sets=xref_sets, xref_optimization=xref_optimization,
-                word=' (Superelement %i)' % super_id)
+        The elements, properties, masses and materials are cross-referenced
+        first and the sets are cross-referenced before and after the loads,
+        which is the serial order.  The aero, constraint, load and
+        optimization cards are run on the threads.  The log messages and
+        the xref errors of each task are buffered and then replayed in the
+        serial order, so the output doesn't depend on the thread timing.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        if xref_elements:
+            self._safe_cross_reference_elements()
+        if xref_properties:
+            self._cross_reference_properties()
+        if xref_masses:
+            self._cross_reference_masses()
+        if xref_materials:
+            self._cross_reference_materials()
+        if xref_sets:
+            self._cross_reference_sets()
+
+        tasks = [
+            func for is_xref, func in [
+                (xref_aero, self._safe_cross_reference_aero),
+                (xref_constraints, self._safe_cross_reference_constraints),
+                (xref_loads, self._safe_cross_reference_loads),
+                (xref_optimization, self._safe_cross_reference_optimization)]
+            if is_xref]
+
+        log = self.log
+        self.log = _BufferedLog(log)
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(nworkers, len(tasks)))) as executor:
+                results = list(executor.map(_run_buffered, [[func] for func in tasks]))
+        finally:
+            self.log = log
+
+        for func, (events, error) in zip(tasks, results):
+            if xref_sets and func == self._safe_cross_reference_optimization:
+                self._cross_reference_sets()
+            for event in events:
+                if event[0] == 'log':
+                    unused_name, level, args, kwargs = event
+                    getattr(log, level)(*args, **kwargs)
+                else:
+                    unused_name, xref_error, card = event
+                    self._store_xref_error(xref_error, card)
+            if error is not None:
+                raise error
+        if xref_sets and not xref_optimization:
+            self._cross_reference_sets()
+
+    def _store_xref_error(self, error, card) -> None:
+        events = getattr(_THREAD_STATE, 'events', None)
+        if events is None:
+            XrefMesh._store_xref_error(self, error, card)
+        else:
+            events.append(('xref_error', error, card))
 
     def _safe_cross_reference_constraints(self):
         # type: () -> None
@@ -635,3 +744,57 @@ class SafeXrefMesh(XrefMesh):
             tableh_ref = None
             xref_errors['tableh'].append((ref_id, tableh_id))
         return tableh_ref
+
+
+class _BufferedLog:
+    """
+    Forwards to a log; the messages from a parallel safe_cross_reference
+    task are buffered instead
+    """
+    def __init__(self, log):
+        self.log = log
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self.log, name)
+        if name not in LOG_LEVELS:
+            return value
+
+        def log_message(*args, **kwargs):
+            events = getattr(_THREAD_STATE, 'events', None)
+            if events is None:
+                return value(*args, **kwargs)
+            events.append(('log', name, args, kwargs))
+            return None
+        return log_message
+
+
+def _is_free_threaded() -> bool:
+    """is the GIL disabled (e.g., python3.13t)?"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _run_buffered(funcs: List[Callable[[], None]]) -> Tuple[List[Tuple[Any, ...]],
+                                                             Optional[Exception]]:
+    """
+    Runs a parallel safe_cross_reference task
+
+    Returns
+    -------
+    events : List[Tuple[Any, ...]]
+        the log messages ('log', level, args, kwargs) and
+        xref errors ('xref_error', error, card) in order
+    error : Exception / None
+        the exception that stopped the task
+
+    """
+    events = []
+    _THREAD_STATE.events = events
+    try:
+        for func in funcs:
+            func()
+    except Exception as error:
+        return events, error
+    finally:
+        _THREAD_STATE.events = None
+    return events, None
@@ -0,0 +1,412 @@
+"""
+Defines a fast, name-only pre-scan of a deck:
+ - scan = scan_bdf(bdf_filename)
+
+The deck is read in binary blocks and only the card names are pulled
+out (with a regex), so no cards are created and the scan runs at close
+to disk speed.  It's intended to get the card counts and the include
+structure of a deck before reading it.
+
+"""
+from __future__ import annotations
+import os
+import re
+import sys
+from collections import defaultdict
+from typing import List, Dict, Tuple, Optional, Any
+
+import numpy as np
+from pyNastran.utils import _filename
+from pyNastran.utils.compressed_file import open_file, normalize_zip_filename
+from pyNastran.bdf.bdf_interface.pybdf import (
+    BDFInputPy, _is_bulk_data_line, _is_begin_bulk)
+from pyNastran.bdf.bdf_interface.include_file import get_include_filename
+from pyNastran.bdf.bdf_interface.utils import _parse_pynastran_header
+
+#: the size of the blocks that are read
+BLOCK_SIZE = 8 * 1024 * 1024
+
+# a bulk data card starts with a letter in the first column (or a '='
+# for a replicated card); continuation lines start with a '+', '*', ','
+# or a blank field and comments with a '$'
+CARD_REGEX = re.compile(rb'^([A-Za-z=][^ \t,$*\r\n]*)', re.MULTILINE)
+
+# the executive/case control decks only need the BEGIN BULK and INCLUDEs
+CONTROL_REGEX = re.compile(rb'^[ \t]*(BEGIN|INCLUDE)', re.MULTILINE | re.IGNORECASE)
+
+# the first line that isn't blank or a comment
+FIRST_LINE_REGEX = re.compile(rb'^[ \t]*[^ \t\r\n$]', re.MULTILINE)
+
+# the same regexes for an upper case block with a leading newline, which
+# are much faster than using '^'
+BLOCK_CARD_REGEX = re.compile(rb'\n([A-Z=][^ \t,$*\r\n]*)')
+
+# the cards that change the state of the scan
+BLOCK_SPECIAL_REGEX = re.compile(rb'\n(?:INCLUDE|BEGIN|ENDDATA|=)')
+
+
+class BDFScan:
+    """
+    The results of ``scan_bdf``
+
+    Attributes
+    ----------
+    filenames : List[str]
+        the files in the order they were opened (0 is the main file)
+    include_tree : Dict[int, List[int]]
+        the files that are included by each file (by index)
+    card_count : Dict[str, int]
+        the number of each card
+    card_offsets : Dict[str, (ncards, 2) int ndarray]
+        the [ifile, byte offset] of the first line of each card
+    nbytes : int
+        the total number of bytes that were scanned
+
+    """
+    def __init__(self, filenames: List[str], include_tree: Dict[int, List[int]],
+                 card_offsets: Dict[str, np.ndarray], nbytes: int) -> None:
+        self.filenames = filenames
+        self.include_tree = include_tree
+        self.card_offsets = card_offsets
+        self.card_count = {card_name: len(offsets)
+                           for card_name, offsets in sorted(card_offsets.items())}
+        self.nbytes = nbytes
+
+    @property
+    def ncards(self) -> int:
+        """the total number of cards"""
+        return sum(self.card_count.values())
+
+    def get_include_tree(self) -> str:
+        """gets the include tree as an indented string"""
+        msg = []
+        if not self.filenames:
+            return ''
+
+        def _add_file(ifile: int, level: int) -> None:
+            msg.append('%s%s\n' % ('  ' * level, self.filenames[ifile]))
+            for jfile in self.include_tree.get(ifile, []):
+                _add_file(jfile, level + 1)
+        _add_file(0, 0)
+        return ''.join(msg)
+
+    def get_stats(self) -> str:
+        """gets a summary of the card counts and the include tree"""
+        msg = ['---BDF Scan---\n']
+        msg.append('nfiles = %s\n' % len(self.filenames))
+        msg.append('nbytes = %s\n' % self.nbytes)
+        msg.append('ncards = %s\n\n' % self.ncards)
+        msg.append('include tree:\n')
+        msg.append(self.get_include_tree())
+        msg.append('\ncard count:\n')
+        for card_name, ncards in self.card_count.items():
+            msg.append('  %-8s %s\n' % (card_name, ncards))
+        return ''.join(msg)
+
+    def __repr__(self) -> str:
+        return 'BDFScan(nfiles=%s, ncards=%s)' % (len(self.filenames), self.ncards)
+
+
+def scan_bdf(bdf_filename: str, punch: Optional[bool]=False,
+             encoding: Optional[str]=None, log: Any=None,
+             debug: Optional[bool]=False) -> BDFScan:
+    """
+    Gets the card names of a deck without creating the cards.
+
+    Continuation lines (small/large/free field), comments and INCLUDE
+    files are handled, so the card counts match ``model.card_count``.
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the input bdf
+    punch : bool / None; default=False
+        None : guess
+        True : no executive/case control decks
+        False : executive/case control decks exist
+    encoding : str; default=None -> system default
+        the unicode encoding of the INCLUDE lines
+    log : logger(); default=None
+        a logger
+    debug : bool; default=False
+        used to set the logger if no logger is passed in
+
+    Returns
+    -------
+    scan : BDFScan
+        the card counts, byte offsets and include tree
+
+    .. note:: the cards of the superelements/auxmodels are not split out
+
+    .. code-block:: python
+
+       >>> scan = scan_bdf('fem.bdf')
+       >>> scan.card_count['CQUAD4']
+       1024
+       >>> print(scan.get_stats())
+
+    """
+    if encoding is None:
+        encoding = sys.getdefaultencoding()
+    punch = _get_header_punch(bdf_filename, punch, encoding)
+    obj = BDFInputPy(True, False, encoding, log=log, debug=debug)
+    obj.include_dir = os.path.dirname(os.path.abspath(bdf_filename))
+    scanner = _Scanner(obj, punch)
+    scanner.scan_file(bdf_filename, basename=True)
+
+    card_offsets = {}
+    for card_name, file_offsets in scanner.card_offsets.items():
+        offsets = []
+        for ifile, offsetsi in file_offsets.items():
+            offsetsi = np.array(offsetsi, dtype='int64')
+            ifiles = np.full(len(offsetsi), ifile, dtype='int64')
+            offsets.append(np.column_stack([ifiles, offsetsi]))
+        card_offsets[card_name.decode('latin1')] = np.vstack(offsets)
+    filenames = list(obj.active_filenames)
+    include_tree = dict(scanner.include_tree)
+    return BDFScan(filenames, include_tree, card_offsets, scanner.nbytes)
+
+
+class _Scanner:
+    """the state of ``scan_bdf`` across the INCLUDE files"""
+    def __init__(self, obj: BDFInputPy, punch: Optional[bool]) -> None:
+        self.obj = obj
+        self.encoding = obj.encoding
+
+        #: None=guess, False=executive/case control, True=bulk data
+        self.is_bulk = True if punch else (None if punch is None else False)
+        self.is_done = False
+        self.previous_card_name = None  # type: Optional[bytes]
+        self.nbytes = 0
+        self.include_tree = defaultdict(list)  # type: Dict[int, List[int]]
+
+        # card_offsets[card_name][ifile] = [offset1, offset2, ...]
+        self.card_offsets = defaultdict(dict)  # type: Dict[bytes, Dict[int, List[int]]]
+
+    def scan_file(self, bdf_filename: str, basename: bool=False) -> None:
+        """scans the blocks of a file"""
+        obj = self.obj
+        if basename:
+            bdf_filename_inc = os.path.join(obj.include_dir, os.path.basename(bdf_filename))
+        else:
+            bdf_filename_inc = os.path.join(obj.include_dir, bdf_filename)
+        bdf_filename_inc = normalize_zip_filename(bdf_filename_inc)
+        obj._validate_open_file(bdf_filename, bdf_filename_inc)
+        obj.log.debug('scanning %r' % bdf_filename_inc)
+        ifile = len(obj.active_filenames)
+        obj.active_filenames.append(bdf_filename_inc)
+
+        offset = 0
+        tail = b''
+        with open_file(_filename(bdf_filename_inc), 'rb') as bdf_file:
+            while not self.is_done:
+                data = bdf_file.read(BLOCK_SIZE)
+                if not data:
+                    if tail:
+                        self._scan_block(tail + b'\n', ifile, offset, is_last=True)
+                        self.nbytes += len(tail)
+                    break
+                data = tail + data
+                iend = data.rfind(b'\n') + 1
+                block, tail = data[:iend], data[iend:]
+                iend = self._scan_block(block, ifile, offset, is_last=False)
+
+                # an INCLUDE that continues past the block is rescanned
+                # with the next block
+                tail = block[iend:] + tail
+                offset += iend
+                self.nbytes += iend
+
+    def _scan_block(self, block: bytes, ifile: int, offset: int, is_last: bool) -> int:
+        """
+        Scans the complete lines in a block
+
+        Returns
+        -------
+        iend : int
+            the index of the first byte that wasn't scanned
+        """
+        pos = 0
+        nbytes = len(block)
+        block_cards = None
+        while pos < nbytes and not self.is_done:
+            if self.is_bulk is None:
+                match = FIRST_LINE_REGEX.search(block, pos)
+                if match is None:
+                    break
+                line = _get_line(block, match.start())
+                self.is_bulk = _is_bulk_data_line(line.decode(self.encoding))
+                continue
+
+            if self.is_bulk:
+                # the plain cards are scanned at once
+                if block_cards is None:
+                    block_cards = _get_block_cards(block)
+                pos = self._scan_bulk_cards(block_cards, pos, nbytes, ifile, offset)
+                match = CARD_REGEX.search(block, pos)
+                if match is None:
+                    break
+                card_name = match.group(1)[:8].upper()
+            else:
+                match = CONTROL_REGEX.search(block, pos)
+                if match is None:
+                    break
+                card_name = match.group(1).upper()
+
+            istart = match.start()
+            pos = match.end()
+            if card_name == b'INCLUDE':
+                include_lines, iend = self._get_include_lines(block, istart, is_last)
+                if include_lines is None:
+                    return istart
+                pos = iend
+                self._scan_include(include_lines, ifile)
+            elif card_name.startswith(b'BEGIN'):
+                line = _get_line(block, istart).decode(self.encoding)
+                uline = line.split('$')[0].strip().upper()
+                if not self.is_bulk and _is_begin_bulk(uline):
+                    self.is_bulk = True
+            else:
+                nrepeats = 1
+                if card_name.startswith(b'='):
+                    # =, =4, =(4) replicate the previous card
+                    nrepeats = 1 if card_name == b'=' else int(card_name[1:].strip(b'()'))
+                    card_name = self.previous_card_name
+                offsets = self.card_offsets[card_name]
+                if ifile not in offsets:
+                    offsets[ifile] = []
+                offsets[ifile].extend([offset + istart] * nrepeats)
+                self.previous_card_name = card_name
+                if card_name == b'ENDDATA':
+                    self.is_done = True
+        return nbytes
+
+    def _scan_bulk_cards(self, block_cards: Tuple[List[bytes], np.ndarray, np.ndarray],
+                         pos: int, nbytes: int, ifile: int, offset: int) -> int:
+        """
+        Scans the cards from pos up to the next INCLUDE, BEGIN, ENDDATA
+        or replicated card at once, which is much faster than scanning
+        one card at a time.
+
+        Returns
+        -------
+        pos : int
+            the index of the first card that wasn't scanned
+        """
+        card_names, istarts, ispecials = block_cards
+        i0 = np.searchsorted(istarts, pos)
+        jspecial = np.searchsorted(ispecials, i0)
+        if jspecial < len(ispecials):
+            i1 = ispecials[jspecial]
+            pos = int(istarts[i1])
+        else:
+            i1 = len(card_names)
+            pos = nbytes
+        if i1 == i0:
+            return pos
+
+        card_names = card_names[i0:i1]
+        appends = {}
+        for card_name in set(card_names):
+            offsets = self.card_offsets[card_name[:8]]
+            if ifile not in offsets:
+                offsets[ifile] = []
+            appends[card_name] = offsets[ifile].append
+        for card_name, istart in zip(card_names, (istarts[i0:i1] + offset).tolist()):
+            appends[card_name](istart)
+        self.previous_card_name = card_names[-1][:8]
+        return pos
+
+    def _get_include_lines(self, block: bytes, istart: int,
+                           is_last: bool) -> Tuple[Optional[List[str]], int]:
+        """
+        Gets the lines of an INCLUDE, which may be split across
+        multiple lines (see ``BDFInputPy._iter_file_lines``)
+
+        Returns
+        -------
+        include_lines : List[str] / None
+            None if the INCLUDE isn't complete in this block
+        iend : int
+            the index after the INCLUDE
+        """
+        iend = block.find(b'\n', istart) + 1
+        line = block[istart:iend].decode(self.encoding).rstrip('\r\n')
+        line_base = line.split('$')[0]
+        include_lines = [line_base.strip()]
+        line_base = line_base[8:].strip()
+        if "'" in line_base and not (line_base.startswith("'") and line_base.endswith("'")):
+            while not line.split('$')[0].rstrip().endswith("'"):
+                if iend >= len(block):
+                    if is_last:
+                        msg = 'There was an invalid filename found while parsing (index).\n'
+                        msg += 'include_lines = %s' % include_lines
+                        raise IndexError(msg)
+                    return None, istart
+                iend2 = block.find(b'\n', iend) + 1
+                line = block[iend:iend2].decode(self.encoding).split('$')[0].strip()
+                include_lines.append(line)
+                iend = iend2
+        return include_lines, iend
+
+    def _scan_include(self, include_lines: List[str], ifile: int) -> None:
+        """scans an INCLUDE file"""
+        obj = self.obj
+        bdf_filename2 = get_include_filename(include_lines, include_dir=obj.include_dir)
+        obj.include_lines[ifile].append((include_lines, bdf_filename2))
+        jfile = len(obj.active_filenames)
+        self.include_tree[ifile].append(jfile)
+        self.scan_file(bdf_filename2)
+
+
+def _get_header_punch(bdf_filename: str, punch: Optional[bool],
+                      encoding: str) -> Optional[bool]:
+    """checks the ``$pyNastran: punch=True`` header"""
+    with open_file(_filename(bdf_filename), 'r', encoding=encoding, errors='replace') as bdf_file:
+        for line in bdf_file:
+            if not line.startswith('$'):
+                break
+            key, value = _parse_pynastran_header(line)
+            if not key:
+                break
+            if key == 'punch':
+                punch = value == 'true'
+    return punch
+
+
+def _get_block_cards(block: bytes) -> Tuple[List[bytes], np.ndarray, np.ndarray]:
+    """
+    Gets the possible cards in a block
+
+    Returns
+    -------
+    card_names : List[bytes]
+        the upper case card names
+    istarts : (ncards, ) int ndarray
+        the index of the start of the card
+    ispecials : (nspecial, ) int ndarray
+        the index of the INCLUDE, BEGIN, ENDDATA and replicated cards
+        in card_names
+    """
+    ublock = b'\n' + block.upper()
+    card_names = BLOCK_CARD_REGEX.findall(ublock)
+
+    # the cards start on the lines that start with a letter/equals sign
+    chars = np.frombuffer(ublock, dtype='uint8')
+    istarts = np.flatnonzero(chars[:-1] == ord('\n'))
+    first_chars = chars[istarts + 1]
+    is_card = ((first_chars >= ord('A')) & (first_chars <= ord('Z'))) | (first_chars == ord('='))
+    istarts = istarts[is_card]
+    assert len(istarts) == len(card_names), 'nstarts=%s ncards=%s' % (
+        len(istarts), len(card_names))
+
+    # the leading newline offsets the indices
+    ispecial_starts = [match.start() for match in BLOCK_SPECIAL_REGEX.finditer(ublock)]
+    ispecials = np.searchsorted(istarts, ispecial_starts)
+    return card_names, istarts, ispecials
+
+
+def _get_line(block: bytes, istart: int) -> bytes:
+    """gets the line that starts at istart"""
+    iend = block.find(b'\n', istart)
+    return block[istart:iend].rstrip(b'\r')
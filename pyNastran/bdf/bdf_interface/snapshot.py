@@ -0,0 +1,611 @@
+"""
+defines:
+ - save_snapshot(model, snapshot_filename)
+ - model = load_snapshot(snapshot_filename, model=None, log=None, debug=True)
+ - model2 = copy_model(model, xref=None)
+
+A snapshot is a versioned binary image of an (uncross-referenced) BDF.
+
+The cards in the big card dictionaries (e.g., ``model.nodes``,
+``model.elements``) are grouped by class and each attribute of a
+group is stored as a packed numpy array (e.g., the nid, cp, cd and xyz
+of all the GRIDs).  Small groups and irregular cards (e.g., loads,
+which are stored in lists) go into a side table, which is pickled with
+the rest of the model (e.g., the params, case control).
+
+The file is an uncompressed numpy ``.npz`` file:
+
+ - header : the json header with the version and the packed groups
+ - side_table : the pickled model
+ - group0.keys, group0.ipos : the dictionary keys and positions of a group
+ - group0/nid, group0/xyz, ... : the packed attributes of a group
+
+.. warning:: like ``BDF.load``, the side table is a pickle, so only load
+             snapshots from a trusted source
+
+"""
+from __future__ import annotations
+import io
+import json
+import types
+import pickle
+import importlib
+from itertools import chain, repeat
+from operator import attrgetter
+from typing import List, Dict, Tuple, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.cards.base_card import BaseCard
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+SNAPSHOT_FORMAT = 'pyNastran.bdf.snapshot'
+
+#: the version of the snapshot format; increment this if the layout
+#: changes (old snapshots are then rejected)
+SNAPSHOT_VERSION = 1
+
+#: smaller groups of cards are stored in the side table
+MIN_PACKED_CARDS = 100
+
+
+class _Missing:
+    """flags an unset __slots__ attribute"""
+    def __repr__(self) -> str:
+        return 'MISSING'
+
+    def __copy__(self) -> _Missing:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> _Missing:
+        return self
+
+MISSING = _Missing()
+
+#: the types that are packed into 1D arrays
+SCALAR_DTYPES = {int: 'int64', float: 'float64', bool: 'bool'}
+
+#: the types of the *_ref attributes that aren't cross-referenced cards
+PLAIN_TYPES = {type(None), _Missing, int, float, str}
+
+#: the attributes that are never stored (e.g., the DEQATN functions)
+FUNCTION_TYPES = (types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+
+def save_snapshot(model: BDF, snapshot_filename: str) -> None:
+    """
+    Saves a BDF as a snapshot
+
+    Parameters
+    ----------
+    model : BDF()
+        the model to save; it's not modified, but the snapshot is
+        always uncross-referenced
+    snapshot_filename : str / file
+        the path to the snapshot or a binary file object
+
+    The ids stored on the cards (e.g., ``CQUAD4.nodes``) are saved, so
+    ids that were changed through the cross-referenced objects (e.g.,
+    ``CQUAD4.nodes_ref``) require an ``uncross_reference`` first.
+
+    """
+    header, arrays = _pack_model(model)
+    arrays['header'] = _to_bytes_array(json.dumps(header).encode('utf8'))
+    if isinstance(snapshot_filename, str):
+        # np.savez adds a .npz extension to filenames
+        with open(snapshot_filename, 'wb') as snapshot_file:
+            np.savez(snapshot_file, **arrays)
+    else:
+        np.savez(snapshot_filename, **arrays)
+
+
+def load_snapshot(snapshot_filename: str, model=None, log=None, debug: bool=True) -> BDF:
+    """
+    Loads a snapshot
+
+    Parameters
+    ----------
+    snapshot_filename : str / file
+        the path to the snapshot or a binary file object
+    model : BDF(); default=None -> BDF(log=log, debug=debug)
+        an empty model to load the snapshot into
+    log : logger; default=None
+        a python logging module object
+    debug : bool/None; default=True
+        used to set the logger if no logger is passed in
+
+    Returns
+    -------
+    model : BDF()
+        the uncross-referenced model
+
+    """
+    arrays = _load_arrays(snapshot_filename)
+    header = _read_header(arrays)
+    if model is None:
+        from pyNastran.bdf.bdf import BDF
+        model = BDF(log=log, debug=debug, mode=header['mode'])
+    _unpack_model(model, header, arrays)
+    return model
+
+
+def copy_model(model: BDF, xref=None) -> BDF:
+    """
+    Copies a model using the snapshot format without writing a file
+
+    Parameters
+    ----------
+    model : BDF()
+        the model to copy; it's not modified
+    xref : bool; default=None
+        cross-reference the copy
+        None : cross-reference the copy if the model is cross-referenced
+
+    Returns
+    -------
+    model2 : BDF()
+        the copied model
+
+    """
+    header, arrays = _pack_model(model)
+    model2 = model.__class__(log=model.log, mode=header['mode'])
+    _unpack_model(model2, header, arrays)
+    if xref is None:
+        xref = model._xref
+    if xref:
+        model2.cross_reference()
+        model2._xref = True
+    return model2
+
+
+def _load_arrays(snapshot_filename: str) -> Dict[str, np.ndarray]:
+    """loads the arrays from a snapshot"""
+    try:
+        npz_file = np.load(snapshot_filename, allow_pickle=False)
+    except ValueError:
+        # not a numpy file
+        npz_file = None
+    if not hasattr(npz_file, 'files'):
+        raise RuntimeError('%r is not a BDF snapshot' % snapshot_filename)
+
+    with npz_file:
+        arrays = {key: npz_file[key] for key in npz_file.files}
+    return arrays
+
+
+def _read_header(arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """gets and checks the snapshot header"""
+    try:
+        header = json.loads(arrays.pop('header').tobytes().decode('utf8'))
+    except KeyError:
+        raise RuntimeError('the file is not a BDF snapshot; missing the header')
+    if header.get('format') != SNAPSHOT_FORMAT:
+        raise RuntimeError('the file is not a BDF snapshot; format=%r' % header.get('format'))
+    if header['version'] != SNAPSHOT_VERSION:
+        raise RuntimeError('snapshot version=%s is not supported; expected version=%s' % (
+            header['version'], SNAPSHOT_VERSION))
+    return header
+
+
+def _pack_model(model: BDF) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """packs the model into a json-able header and a dict of arrays"""
+    state = model.__getstate__()
+    state['_xref'] = False
+
+    header = {
+        'format': SNAPSHOT_FORMAT,
+        'version': SNAPSHOT_VERSION,
+        'mode': model._nastran_format,
+        'slots': [],
+    }  # type: Dict[str, Any]
+    arrays = {}  # type: Dict[str, np.ndarray]
+    igroup = 0
+    for slot_name in model._slot_to_type_map:
+        cards_dict = state.get(slot_name)
+        if not isinstance(cards_dict, dict) or len(cards_dict) < MIN_PACKED_CARDS:
+            continue
+
+        positions_by_class = {}  # type: Dict[type, List[int]]
+        cards = list(cards_dict.values())
+        for i, card in enumerate(cards):
+            if isinstance(card, BaseCard):
+                positions_by_class.setdefault(card.__class__, []).append(i)
+
+        keys = list(cards_dict.keys())
+        is_packed = np.zeros(len(cards), dtype='bool')
+        groups = []
+        for cls, positions in positions_by_class.items():
+            if len(positions) < MIN_PACKED_CARDS:
+                continue
+            group_prefix = 'group%d' % igroup
+            igroup += 1
+            group = _pack_cards(cls, [cards[i] for i in positions], group_prefix + '/',
+                                arrays, model)
+            group['keys'] = _pack_column([keys[i] for i in positions],
+                                         group_prefix + '.keys', arrays, model)
+            arrays[group_prefix + '.ipos'] = np.array(positions, dtype='int64')
+            is_packed[positions] = True
+            groups.append(group)
+
+        if not groups:
+            continue
+        iside = np.flatnonzero(~is_packed)
+        state[slot_name] = {keys[i]: cards[i] for i in iside}
+        arrays[slot_name + '.ipos'] = iside
+        header['slots'].append({
+            'name': slot_name,
+            'ncards': len(cards),
+            'groups': groups,
+        })
+
+    arrays['side_table'] = _to_bytes_array(_dumps(state, model))
+    return header, arrays
+
+
+def _unpack_model(model: BDF, header: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+    """loads the packed model into an empty model"""
+    state = _loads(arrays['side_table'], model)
+    for slot in header['slots']:
+        slot_name = slot['name']
+        ncards = slot['ncards']
+        keys = [None] * ncards
+        cards = [None] * ncards  # type: List[Any]
+
+        side_cards = state[slot_name]
+        for i, (key, card) in zip(arrays[slot_name + '.ipos'].tolist(), side_cards.items()):
+            keys[i] = key
+            cards[i] = card
+
+        for group in slot['groups']:
+            group_prefix = group['prefix'][:-1]
+            group_cards = _unpack_cards(group, arrays, model)
+            group_keys = _unpack_column(group['keys'], arrays, model)
+            ipos = arrays[group_prefix + '.ipos'].tolist()
+            for i, key, card in zip(ipos, group_keys, group_cards):
+                keys[i] = key
+                cards[i] = card
+        state[slot_name] = dict(zip(keys, cards))
+
+    model.__dict__.update(state)
+    if model.case_control_deck is not None:
+        model.case_control_deck.log = model.log
+    for super_model in model.superelement_models.values():
+        super_model.log = model.log
+
+
+def _pack_cards(cls: type, cards: List[BaseCard], prefix: str,
+                arrays: Dict[str, np.ndarray], model: BDF) -> Dict[str, Any]:
+    """packs a group of cards of the same class into arrays"""
+    names = list(_get_slot_names(cls))
+    if hasattr(cards[0], '__dict__'):
+        names_set = set(names)
+        for card in cards:
+            for name in card.__dict__:
+                if name not in names_set:
+                    names_set.add(name)
+                    names.append(name)
+
+    columns = []
+    for name in names:
+        try:
+            values = list(map(attrgetter(name), cards))
+        except AttributeError:
+            values = [getattr(card, name, MISSING) for card in cards]
+        columns.append(_pack_column(values, prefix + name, arrays, model))
+
+    group = {
+        'prefix': prefix,
+        'class': '%s:%s' % (cls.__module__, cls.__qualname__),
+        'ncards': len(cards),
+        'columns': columns,
+    }
+    return group
+
+
+def _unpack_cards(group: Dict[str, Any], arrays: Dict[str, np.ndarray],
+                  model: BDF) -> List[BaseCard]:
+    """creates the cards in a group"""
+    module_name, class_name = group['class'].split(':')
+    cls = importlib.import_module(module_name)
+    for name in class_name.split('.'):
+        cls = getattr(cls, name)
+
+    ncards = group['ncards']
+    cards = list(map(object.__new__, repeat(cls, ncards)))
+    prefix_len = len(group['prefix'])
+    for column in group['columns']:
+        name = column['key'][prefix_len:]
+        values = _unpack_column(column, arrays, model)
+        if 'missing' in column:
+            is_set = ~arrays[column['key'] + '.missing']
+            cards_set = [cards[i] for i in np.flatnonzero(is_set)]
+            values = [values[i] for i in np.flatnonzero(is_set)]
+        else:
+            cards_set = cards
+        # map avoids the overhead of a python loop for big groups
+        list(map(setattr, cards_set, repeat(name, len(cards_set)), values))
+    return cards
+
+
+def _pack_column(values: List[Any], key: str, arrays: Dict[str, np.ndarray],
+                 model: BDF) -> Dict[str, Any]:
+    """
+    Packs the values of an attribute into an array
+
+    Parameters
+    ----------
+    values : List[Any]
+        the values
+    key : str
+        the name of the array
+    arrays : Dict[str, np.ndarray]
+        the packed arrays, which is updated
+    model : BDF()
+        the model being packed
+
+    Returns
+    -------
+    column : Dict[str, Any]
+        the metadata for the column
+        kind : str
+            int, float, bool, ndarray, int_list, float_list,
+            none, object
+        missing : bool
+            some values are MISSING (unset __slots__)
+        none : bool
+            some values are None
+
+    """
+    column = {'key': key}  # type: Dict[str, Any]
+    name = key.rsplit('/', 1)[-1]
+    value_types = set(map(type, values))
+    if (name.endswith('_ref') and not value_types.issubset(PLAIN_TYPES)) or any(
+            issubclass(value_type, FUNCTION_TYPES) for value_type in value_types):
+        values = [_uncross_reference_value(name, value) for value in values]
+        value_types = set(map(type, values))
+
+    if _Missing in value_types:
+        arrays[key + '.missing'] = np.array([value is MISSING for value in values])
+        column['missing'] = True
+    is_none = type(None) in value_types
+    if is_none:
+        is_none_array = np.array([value is None for value in values])
+    value_types.difference_update([_Missing, type(None)])
+
+    if not value_types:
+        column['kind'] = 'none'
+        return column
+
+    kind = 'object'
+    data = None
+    if len(value_types) == 1:
+        value_type = value_types.pop()
+        if value_type in SCALAR_DTYPES:
+            kind = value_type.__name__
+            if is_none or 'missing' in column:
+                null = value_type()
+                values = [null if value is None or value is MISSING else value
+                          for value in values]
+            try:
+                data = np.array(values, dtype=SCALAR_DTYPES[value_type])
+            except OverflowError:
+                # big integers
+                kind = 'object'
+        elif value_type is np.ndarray and not is_none and 'missing' not in column:
+            shapes = {(value.shape, value.dtype) for value in values}
+            if len(shapes) == 1:
+                kind = 'ndarray'
+                data = np.array(values)
+        elif value_type is list and not is_none and 'missing' not in column:
+            kind, data, list_mask = _pack_list_column(values)
+            if list_mask is not None:
+                arrays[key + '.none'] = list_mask
+
+    if kind == 'object':
+        is_set = [value is not MISSING for value in values]
+        data = _to_bytes_array(_dumps(
+            [value for value, is_seti in zip(values, is_set) if is_seti], model))
+    elif is_none:
+        arrays[key + '.none'] = is_none_array
+        column['none'] = True
+    column['kind'] = kind
+    arrays[key] = data
+    return column
+
+
+def _pack_list_column(values: List[List[Any]]) -> Tuple[str, Any, Any]:
+    """
+    Packs lists of ints/floats (e.g., the nodes of the elements) into a
+    2D array; None is flagged in a mask
+    """
+    lengths = set(map(len, values))
+    if len(lengths) != 1:
+        return 'object', None, None
+    nvalues = lengths.pop()
+    if nvalues == 0:
+        return 'object', None, None
+
+    item_types = set(map(type, chain.from_iterable(values)))
+    is_none = type(None) in item_types
+    item_types.discard(type(None))
+    if item_types == {int}:
+        kind, dtype, null = 'int_list', 'int64', 0
+    elif item_types == {float}:
+        kind, dtype, null = 'float_list', 'float64', 0.
+    else:
+        return 'object', None, None
+
+    mask = None
+    if is_none:
+        mask = np.array([[item is None for item in value] for value in values])
+        values = [[null if item is None else item for item in value]
+                  for value in values]
+    try:
+        data = np.array(values, dtype=dtype)
+    except OverflowError:
+        return 'object', None, None
+    return kind, data, mask
+
+
+def _unpack_column(column: Dict[str, Any], arrays: Dict[str, np.ndarray],
+                   model: BDF) -> List[Any]:
+    """gets the values for a column; MISSING values are not included for object columns"""
+    key = column['key']
+    kind = column['kind']
+    if kind == 'none':
+        if 'missing' in column:
+            return [None] * len(arrays[key + '.missing'])
+        return repeat(None)
+    if kind == 'object':
+        values = _loads(arrays[key], model)
+        if 'missing' in column:
+            # put the placeholders back, so the indices are consistent
+            values_iter = iter(values)
+            values = [MISSING if is_missing else next(values_iter)
+                      for is_missing in arrays[key + '.missing'].tolist()]
+        return values
+
+    data = arrays[key]
+    if kind == 'ndarray':
+        # views of one array
+        return list(data)
+    values = data.tolist()
+    none_key = key + '.none'
+    if none_key in arrays:
+        mask = arrays[none_key]
+        if kind in ('int_list', 'float_list'):
+            for i, j in zip(*np.nonzero(mask)):
+                values[i][j] = None
+        else:
+            for i in np.flatnonzero(mask):
+                values[i] = None
+    return values
+
+
+def _get_slot_names(cls: type) -> List[str]:
+    """gets the __slots__ of a class and its base classes"""
+    names = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots, )
+        for name in slots:
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    return names
+
+
+def _get_card_state(card: BaseCard) -> Dict[str, Any]:
+    """gets the uncross-referenced attributes of a card"""
+    state = {}
+    for name in _get_slot_names(card.__class__):
+        value = getattr(card, name, MISSING)
+        if value is not MISSING:
+            state[name] = value
+    if hasattr(card, '__dict__'):
+        state.update(card.__dict__)
+
+    for name, value in state.items():
+        state[name] = _uncross_reference_value(name, value)
+    return state
+
+
+def _uncross_reference_value(name: str, value: Any) -> Any:
+    """
+    Removes cross-referenced cards (e.g., ``nodes_ref``) and DEQATN
+    functions; some ``*_ref`` attributes are data (e.g., ``AERO.rho_ref``)
+    """
+    if isinstance(value, FUNCTION_TYPES):
+        return None
+    if name.endswith('_ref') and _has_card(value):
+        return None
+    return value
+
+
+def _has_card(value: Any) -> bool:
+    """is the value a card or a list/dict of cards"""
+    if isinstance(value, BaseCard):
+        return True
+    if isinstance(value, (list, tuple)):
+        return any(_has_card(valuei) for valuei in value)
+    if isinstance(value, dict):
+        return any(_has_card(valuei) for valuei in value.values())
+    return False
+
+
+def _rebuild_card(cls: type, state: Dict[str, Any]) -> BaseCard:
+    """creates a card from ``_get_card_state``"""
+    card = object.__new__(cls)
+    for name, value in state.items():
+        setattr(card, name, value)
+    return card
+
+
+def _reduce_card(card: BaseCard) -> Tuple[Any, Tuple[type, Dict[str, Any]]]:
+    """pickles a card without its cross-referenced attributes"""
+    return _rebuild_card, (card.__class__, _get_card_state(card))
+
+
+class _CardDispatchTable:
+    """
+    A pickle dispatch table that uncross-references the cards, so the
+    model doesn't need to be uncross-referenced to be pickled
+    """
+    def get(self, cls: type, default=None):
+        """used by the pure python pickler"""
+        if issubclass(cls, BaseCard):
+            return _reduce_card
+        return default
+
+    def __getitem__(self, cls: type):
+        """used by the C pickler"""
+        if issubclass(cls, BaseCard):
+            return _reduce_card
+        raise KeyError(cls)
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickles an object without the cross-referenced attributes of the
+    cards.  References to the model (e.g., ``model.zona.model``) are
+    stored as the model being loaded, so it isn't pickled again.
+    """
+    def __init__(self, file_obj, model: BDF) -> None:
+        super().__init__(file_obj, protocol=pickle.HIGHEST_PROTOCOL)
+        self.dispatch_table = _CardDispatchTable()
+        self.model = model
+
+    def persistent_id(self, obj: Any):
+        if obj is self.model:
+            return 'model'
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """loads the ``_SnapshotPickler`` data into the model"""
+    def __init__(self, file_obj, model: BDF) -> None:
+        super().__init__(file_obj)
+        self.model = model
+
+    def persistent_load(self, pid: str) -> BDF:
+        if pid == 'model':
+            return self.model
+        raise pickle.UnpicklingError('unsupported persistent id=%r' % pid)
+
+
+def _dumps(obj: Any, model: BDF) -> bytes:
+    """pickles an object with ``_SnapshotPickler``"""
+    bytes_file = io.BytesIO()
+    _SnapshotPickler(bytes_file, model).dump(obj)
+    return bytes_file.getvalue()
+
+
+def _loads(data: np.ndarray, model: BDF) -> Any:
+    """unpickles an object from ``_dumps``"""
+    return _SnapshotUnpickler(io.BytesIO(data.tobytes()), model).load()
+
+
+def _to_bytes_array(data: bytes) -> np.ndarray:
+    """stores bytes as a uint8 array"""
+    return np.frombuffer(data, dtype='uint8')
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import List, Set, Dict, Any, Union, TYPE_CHECKING
+from pyNastran.bdf.bdf_interface.lazy_cards import LazyCardDict
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
 
@@ -285,12 +286,16 @@ def get_bdf_stats(model: BDF, return_type: str='string',
             continue
             #raise RuntimeError(msg)
 
-        for card in card_group.values():
-            if isinstance(card, list):
-                for card2 in card:
-                    groups.add(card2.type)
-            else:
-                groups.add(card.type)
+        if isinstance(card_group, LazyCardDict):
+            # don't parse the cards
+            groups = card_group.card_types()
+        else:
+            for card in card_group.values():
+                if isinstance(card, list):
+                    for card2 in card:
+                        groups.add(card2.type)
+                else:
+                    groups.add(card.type)
 
         group_msg = []
         for card_name in sorted(groups):
@@ -0,0 +1,117 @@
+"""tests the vectorized small field parser"""
+# pylint: disable=W0212
+import unittest
+from io import StringIO
+from cpylog import get_logger
+
+import numpy as np
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.fast_parse import _doubles, _integers
+
+
+def _read(lines, fast_parse, xref=False):
+    """reads a punch deck"""
+    log = get_logger(log=None, level='error', encoding='utf-8')
+    model = BDF(log=log)
+    bdf_file = StringIO()
+    bdf_file.write(''.join(lines))
+    bdf_file.seek(0)
+    model.read_bdf(bdf_file, punch=True, xref=xref, fast_parse=fast_parse)
+    return model
+
+
+def _write(model):
+    """writes a model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+class TestFastParse(unittest.TestCase):
+    """tests fast_parse_cards"""
+
+    def test_doubles(self):
+        """tests the float conversion"""
+        fields = np.array([b'1.', b'', b'-1.5-3', b'2.+3', b'1.5D-2', b'.5e1', b'-.1E+2'])
+        values, is_valid = _doubles(fields, 4.)
+        assert is_valid.all(), is_valid
+        expected = [1., 4., -1.5e-3, 2.e3, 1.5e-2, 5., -10.]
+        assert np.allclose(values, expected), values
+
+        # integers and junk aren't floats
+        fields = np.array([b'1', b'1.0', b'cat', b'1.-2-3'])
+        unused_values, is_valid = _doubles(fields, 0.)
+        assert is_valid.tolist() == [False, True, False, False], is_valid
+
+    def test_integers(self):
+        """tests the integer conversion"""
+        fields = np.array([b'1', b'', b'-3', b'+4'])
+        values, is_valid = _integers(fields, 10)
+        assert is_valid.all(), is_valid
+        assert values.tolist() == [1, 10, -3, 4], values
+
+        fields = np.array([b'1', b'', b'1.0'])
+        values, is_valid = _integers(fields)
+        assert is_valid.tolist() == [True, False, False], is_valid
+
+    def test_fast_parse(self):
+        """tests that the fast parser matches the standard parser"""
+        lines = [
+            '$ node 1\n',
+            'GRID           1       0      0.      0.      0.\n',
+            'GRID           2       0  1.23-4    1.+1 -2.5D-1       0     123\n',
+            'GRID,3,,1.0,1.0,0.0\n',
+            'GRID           4              1.      1.      0.\n',
+            'GRID*                  5               0              2.              1.\n',
+            '*                     0.\n',
+            'GRID           6              1.      1.      0.\n',
+            'CQUAD4         1      10       1       2       4       3     0.1     0.5\n',
+            'CQUAD4         2               1       2       4       3       5\n',
+            'CTRIA3         3      10       1       2       4\n',
+            'CTETRA         4      20       1       2       4       6\n',
+            'CTETRA         5      20       1       2       4       6       3\n',
+            'CHEXA          6      20       1       2       4       3       5       6+\n',
+            '+             10      11\n',
+            'CBAR           7      30       1       2      0.      0.      1.\n',
+            'CBAR           8      30       1       2       6' + ' ' * 21 + 'GOO\n',
+            '+' + ' ' * 23 + '      0.      0.     0.1\n',
+            'PSHELL,10,1,0.1\n',
+            'MAT1,1,3.0e7,,0.3\n',
+        ]
+        model = _read(lines, fast_parse=False)
+        model_fast = _read(lines, fast_parse=True)
+        assert _write(model) == _write(model_fast)
+        assert model_fast.card_count == model.card_count, model_fast.card_count
+        assert model_fast.nodes[1].comment == '$ node 1\n', model_fast.nodes[1].comment
+        assert np.allclose(model_fast.nodes[2].xyz, [1.23e-4, 10., -0.25])
+        assert model_fast.nodes[2].ps == '123', model_fast.nodes[2].ps
+        assert model_fast.elements[1].theta_mcid == 0.1
+        assert model_fast.elements[2].theta_mcid == 5
+        assert model_fast.elements[4].__class__.__name__ == 'CTETRA4'
+        assert model_fast.elements[5].__class__.__name__ == 'CTETRA10'
+        assert model_fast.elements[5].node_ids == [1, 2, 4, 6, 3, None, None, None, None, None]
+        assert model_fast.elements[6].__class__.__name__ == 'CHEXA8'
+        assert model_fast.elements[8].g0 == 6
+        assert model_fast.elements[8].offt == 'GOO'
+
+    def test_fast_parse_errors(self):
+        """tests that invalid cards use the standard parser"""
+        lines = [
+            'GRID           1       0      0.      0.      0.\n',
+            'GRID           2       0       1      0.      0.\n',
+        ]
+        with self.assertRaises(SyntaxError):
+            _read(lines, fast_parse=True)
+
+        lines = [
+            'GRID           1       0      0.      0.      0.\n',
+            'GRID           1       0      1.      0.      0.\n',
+        ]
+        with self.assertRaises(AssertionError):
+            _read(lines, fast_parse=False)
+        with self.assertRaises(AssertionError):
+            _read(lines, fast_parse=True)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -8,8 +8,10 @@ from io import StringIO
 from cpylog import get_logger
 
 import numpy as np
+from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.bdf_interface.pybdf import (
     BDFInputPy, _show_bad_file, _lines_to_decks, MissingDeckSections)
+from pyNastran.bdf.bdf_interface.scan_bdf import scan_bdf
 
 
 class TestPyBDF(unittest.TestCase):
@@ -293,5 +295,60 @@ class TestPyBDF(unittest.TestCase):
         os.remove('main.bdf')
         os.remove('inc.inc')
 
+    def test_scan_bdf(self):
+        """tests the name-only scan of a deck"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        with open('scan_inc.inc', 'w') as bdf_file:
+            bdf_file.write(
+                '$ a comment\n'
+                'GRID*                  3                             1.0             1.0\n'
+                '*                    0.0\n'
+                'grid,4,,0.,1.,0.\n'
+                '=,*1,,*1.\n'
+                '=2\n'
+            )
+
+        bdf_filename = 'scan.bdf'
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'SUBCASE 1\n'
+                '  DISP = ALL\n'
+                'BEGIN BULK\n'
+                'GRID,1,,0.,0.,0.\n'
+                'GRID    2               1.      0.      0.\n'
+                "INCLUDE 'scan\n"
+                "  _inc.inc'\n"
+                'CQUAD4,1,2,1,2,3,4,\n'
+                ',,,0.1,0.1,0.1,0.1\n'
+                'CQUAD4         2       2       3       4       5       6\n'
+                '+' + 23 * ' ' + '0.1\n'
+                'PSHELL  2       1       0.1\n'
+                'ENDDATA\n'
+                'GRID,10,,0.,0.,0.\n'
+            )
+
+        scan = scan_bdf(bdf_filename, log=log)
+        assert scan.card_count == {'CQUAD4': 2, 'ENDDATA': 1, 'GRID': 7, 'PSHELL': 1}, scan.card_count
+        assert len(scan.filenames) == 2, scan.filenames
+        assert scan.include_tree == {0: [1]}, scan.include_tree
+        str(scan)
+        scan.get_stats()
+
+        with open(bdf_filename, 'rb') as bdf_file:
+            data = bdf_file.read()
+        for ifile, offset in scan.card_offsets['CQUAD4']:
+            assert ifile == 0
+            assert data[offset:offset+6] == b'CQUAD4'
+
+        # the cards that are read match
+        model = BDF(log=log)
+        model.read_bdf(bdf_filename, xref=False)
+        scan_card_count = dict(model.card_count)
+        assert scan.card_count == scan_card_count, scan_card_count
+        os.remove(bdf_filename)
+        os.remove('scan_inc.inc')
+
 if __name__ == '__main__':
     unittest.main()
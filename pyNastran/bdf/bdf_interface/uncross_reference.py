@@ -15,6 +15,8 @@ class UnXrefMesh(SafeXrefMesh):
     def uncross_reference(self, word: str='') -> None:
         """uncross references the model"""
         self.log.debug("Uncross Referencing%s..." % word)
+        self._xref = False
+        self._xref_arrays = None
         self._uncross_reference_nodes()
         self._uncross_reference_coords()
         self._uncross_reference_elements()
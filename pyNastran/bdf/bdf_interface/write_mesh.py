@@ -9,10 +9,12 @@ from io import StringIO, IOBase
 from collections import defaultdict, OrderedDict
 from typing import List, Dict, Union, Optional, Tuple, Any, cast
 
+from pyNastran.utils.compressed_file import open_file
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
-from pyNastran.bdf.cards.nodes import write_xpoints
+from pyNastran.bdf.cards.nodes import write_xpoints, write_grids
+from pyNastran.bdf.bdf_interface.lazy_cards import load_lazy_cards
 
 
 class WriteMesh(BDFAttributes):
@@ -81,7 +83,7 @@ class WriteMesh(BDFAttributes):
                   encoding: Optional[str]=None,
                   size: int=8, is_double: bool=False,
                   interspersed: bool=False, enddata: Optional[bool]=None,
-                  write_header: bool=True, close: bool=True) -> None:
+                  write_header: bool=True, close: bool=True, nworkers: int=1) -> None:
         """
         Writes the BDF.
 
@@ -89,6 +91,7 @@ class WriteMesh(BDFAttributes):
         ----------
         out_filename : varies; default=None
             str        - the name to call the output bdf
+                         a .gz, .bz2 or .xz extension compresses the file
             file       - a file object
             StringIO() - a StringIO object
             None       - pops a dialog
@@ -113,6 +116,13 @@ class WriteMesh(BDFAttributes):
             flag for writing the pyNastran header
         close : bool; default=True
             should the output file be closed
+        nworkers : int; default=1
+            the number of processes used to format the cards;
+            the sections (and chunks of the nodes/elements) are
+            formatted in parallel and written in the serial order,
+            so the file is the same as nworkers=1.  Requires the
+            'fork' start method (e.g., Linux); otherwise, the cards
+            are written serially.
 
         """
         is_long_ids = False
@@ -143,7 +153,7 @@ class WriteMesh(BDFAttributes):
             bdf_file = out_filename
         else:
             self.log.debug('---starting BDF.write_bdf of %s---' % out_filename)
-            bdf_file = open(out_filename, 'w', encoding=encoding)
+            bdf_file = open_file(out_filename, 'w', encoding=encoding)
         self._write_header(bdf_file, encoding, write_header=write_header)
 
 
@@ -154,32 +164,126 @@ class WriteMesh(BDFAttributes):
                 superelement.write_bdf(out_filename=bdf_file, encoding=encoding,
                                        size=size, is_double=is_double,
                                        interspersed=interspersed, enddata=False,
-                                       write_header=False, close=False)
+                                       write_header=False, close=False, nworkers=nworkers)
                 bdf_file.write('$' + '*'*80+'\n')
             bdf_file.write('BEGIN BULK\n')
 
-        self._write_params(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_nodes(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        if nworkers is not None and nworkers > 1 and not self.is_bdf_vectorized:
+            self._write_bulk_data_parallel(bdf_file, size, is_double, interspersed,
+                                           is_long_ids, nworkers)
+        else:
+            self._write_bulk_data_serial(bdf_file, size, is_double, interspersed, is_long_ids)
+        if (enddata is None and 'ENDDATA' in self.card_count) or enddata:
+            bdf_file.write('ENDDATA\n')
+        if close:
+            bdf_file.close()
+
+    def _write_bulk_data_parallel(self, bdf_file: Any, size: int, is_double: bool,
+                                  interspersed: bool, is_long_ids: bool, nworkers: int) -> None:
+        """
+        Writes the bulk data deck like ``write_bdf``, but formats the
+        cards in worker processes.  The workers are forked, so they
+        use a copy of the model instead of pickling the cards.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            self.log.warning('write_bdf(nworkers=%s) requires the fork start method; '
+                             'writing serially' % nworkers)
+            self._write_bulk_data_serial(bdf_file, size, is_double, interspersed, is_long_ids)
+            return
+
+        # the workers can't parse the lazy cards for the parent
+        load_lazy_cards(self)
+        tasks = self._get_write_tasks(size, interspersed, is_long_ids, nworkers)
+        self.log.debug('writing %i sections with %i workers' % (len(tasks), nworkers))
+
+        # the initializer arguments of a forked worker aren't pickled
+        mp_context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=nworkers, mp_context=mp_context,
+                                 initializer=_init_write_worker,
+                                 initargs=(self, size, is_double, is_long_ids)) as executor:
+            # map returns the sections in order, so they're streamed
+            # to the file as soon as the previous ones are done
+            for text in executor.map(_run_write_task, tasks):
+                bdf_file.write(text)
+
+    def _write_bulk_data_serial(self, bdf_file: Any, size: int, is_double: bool,
+                                interspersed: bool, is_long_ids: bool) -> None:
+        """writes the tasks from ``_get_write_tasks`` in this process"""
+        tasks = self._get_write_tasks(size, interspersed, is_long_ids, nworkers=1)
+        for task in tasks:
+            _write_task(self, bdf_file, task, size, is_double, is_long_ids)
+
+    def _get_write_tasks(self, size: int, interspersed: bool, is_long_ids: bool,
+                         nworkers: int) -> List[Tuple[Any, ...]]:
+        """
+        Splits the bulk data deck into tasks in the order of ``write_bdf``
+
+        Parameters
+        ----------
+        size : int; {8, 16}
+            the field size
+        interspersed : bool
+            write the elements and properties interspersed
+        is_long_ids : bool
+            the ids require the large field format
+        nworkers : int
+            1 : the GRIDs and elements are written by _write_grids and
+                _write_elements
+            >1 : the GRIDs and elements are split into chunks
+
+        Returns
+        -------
+        tasks : List[task]
+            ('method', method_name, args, options) : a section (e.g., _write_params);
+                options overrides the size/is_long_ids passed to ``write_bdf``
+            ('cards', slot, keys, size, is_long_ids) : a chunk of a dictionary of cards
+            ('text', text) : a section header
+
+        """
+        tasks = [('method', '_write_params', (), {})]  # type: List[Tuple[Any, ...]]
+
+        # _write_nodes
+        tasks.append(('method', '_write_points', (), {}))
+        if nworkers <= 1:
+            tasks.append(('method', '_write_grids', (), {'is_long_ids': None}))
+        elif self.nodes:
+            grid_size, grid_is_long_ids = self._write_mesh_long_ids_size(size, None)
+            header = '$NODES\n'
+            if self.grdset:
+                header += self.grdset.write_card(grid_size)
+            tasks.append(('text', header))
+            tasks.extend(_get_card_chunk_tasks('nodes', self.nodes, grid_size,
+                                               grid_is_long_ids, nworkers))
+        tasks.append(('method', '_write_seqgp', (), {}))
 
         if interspersed:
-            self._write_elements_interspersed(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            tasks.append(('method', '_write_elements_interspersed', (), {}))
         else:
-            self._write_elements(bdf_file, size, is_double, is_long_ids=is_long_ids)
-            self._write_properties(bdf_file, size, is_double, is_long_ids=is_long_ids)
-            #self._write_properties_by_element_type(bdf_file, size, is_double, is_long_ids)
-        self._write_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
-
-        self._write_masses(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            if nworkers <= 1:
+                tasks.append(('method', '_write_elements', (), {}))
+            else:
+                # _write_elements
+                element_size, element_is_long_ids = self._write_mesh_long_ids_size(
+                    size, is_long_ids)
+                if self.elements:
+                    tasks.append(('text', '$ELEMENTS\n'))
+                    tasks.extend(_get_card_chunk_tasks('elements', self.elements, element_size,
+                                                       element_is_long_ids, nworkers))
+                tasks.append(('method', '_write_element_extras', (),
+                              {'size': element_size, 'is_long_ids': None}))
+            tasks.append(('method', '_write_properties', (), {}))
 
         # split out for write_bdf_symmetric
-        self._write_rigid_elements(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_aero(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        for method_name in ['_write_materials', '_write_masses',
+                            '_write_rigid_elements', '_write_aero']:
+            tasks.append(('method', method_name, (), {}))
 
-        self._write_common(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        if (enddata is None and 'ENDDATA' in self.card_count) or enddata:
-            bdf_file.write('ENDDATA\n')
-        if close:
-            bdf_file.close()
+        # _write_common
+        for method_name, args in self._get_common_write_methods():
+            tasks.append(('method', method_name, args, {}))
+        return tasks
 
     def _write_header(self, bdf_file: Any, encoding: str, write_header: bool=True) -> None:
         """Writes the executive and case control decks."""
@@ -251,8 +355,13 @@ class WriteMesh(BDFAttributes):
                         print('failed printing element...'
                               'type=%s eid=%s' % (element.type, eid))
                         raise
+        self._write_element_extras(bdf_file, size, is_double)
+
+    def _write_element_extras(self, bdf_file: Any, size: int=8, is_double: bool=False,
+                              is_long_ids: Optional[bool]=None) -> None:
+        """Writes the CBARAO, SNORM and NSM cards"""
         if self.ao_element_flags:
-            for (eid, element) in sorted(self.ao_element_flags.items()):
+            for (unused_eid, element) in sorted(self.ao_element_flags.items()):
                 bdf_file.write(element.write_card(size, is_double))
         if self.normals:
             for (unused_nid, snorm) in sorted(self.normals.items()):
@@ -330,14 +439,7 @@ class WriteMesh(BDFAttributes):
                 # this is a string...
                 #print("missing_property = ", card
                 bdf_file.write(card)
-
-        if self.ao_element_flags:
-            for (eid, element) in sorted(self.ao_element_flags.items()):
-                bdf_file.write(element.write_card(size, is_double))
-        if self.normals:
-            for (unused_nid, snorm) in sorted(self.normals.items()):
-                bdf_file.write(snorm.write_card(size, is_double))
-        self._write_nsm(bdf_file, size, is_double)
+        self._write_element_extras(bdf_file, size, is_double)
 
     def _write_aero(self, bdf_file: Any, size: int=8, is_double: bool=False,
                     is_long_ids: Optional[bool]=None) -> None:
@@ -449,33 +551,41 @@ class WriteMesh(BDFAttributes):
             is this double precision
 
         """
-        self._write_dmigs(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_loads(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_dynamic(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_aero_control(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_static_aero(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        for method_name, args in self._get_common_write_methods():
+            write_method = getattr(self, method_name)
+            write_method(bdf_file, size, is_double, *args, is_long_ids=is_long_ids)
 
+    def _get_common_write_methods(self) -> List[Tuple[str, Tuple[Any, ...]]]:
+        """gets the methods (and extra arguments) used by ``_write_common`` in order"""
         write_aero_in_flutter, write_aero_in_gust = self._find_aero_location()
-        self._write_flutter(bdf_file, size, is_double, write_aero_in_flutter,
-                            is_long_ids=is_long_ids)
-        self._write_gust(bdf_file, size, is_double, write_aero_in_gust, is_long_ids=is_long_ids)
-
-        self._write_thermal(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_thermal_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_constraints(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_optimization(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_tables(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_sets(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_superelements(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_contact(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_parametric(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_rejects(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_coords(bdf_file, size, is_double, is_long_ids=is_long_ids)
-
+        return [
+            ('_write_dmigs', ()),
+            ('_write_loads', ()),
+            ('_write_dynamic', ()),
+            ('_write_aero_control', ()),
+            ('_write_static_aero', ()),
+            ('_write_flutter', (write_aero_in_flutter, )),
+            ('_write_gust', (write_aero_in_gust, )),
+            ('_write_thermal', ()),
+            ('_write_thermal_materials', ()),
+            ('_write_constraints', ()),
+            ('_write_optimization', ()),
+            ('_write_tables', ()),
+            ('_write_sets', ()),
+            ('_write_superelements', ()),
+            ('_write_contact', ()),
+            ('_write_parametric', ()),
+            ('_write_rejects', ()),
+            ('_write_coords', ()),
+            ('_write_acmodl', ()),
+        ]
+
+    def _write_acmodl(self, bdf_file: Any, size: int=8, is_double: bool=False,
+                      is_long_ids: Optional[bool]=None) -> None:
+        """Writes the ACMODL card"""
         if self.acmodl:
             bdf_file.write(self.acmodl.write_card(size, is_double))
 
-
     def _write_constraints(self, bdf_file: Any, size: int=8, is_double: bool=False,
                            is_long_ids: Optional[bool]=None) -> None:
         """Writes the constraint cards sorted by ID"""
@@ -775,6 +885,16 @@ class WriteMesh(BDFAttributes):
     def _write_nodes(self, bdf_file: Any, size: int=8, is_double: bool=False,
                      is_long_ids: Optional[bool]=None) -> None:
         """Writes the NODE-type cards"""
+        self._write_points(bdf_file, size, is_double)
+        self._write_grids(bdf_file, size=size, is_double=is_double)
+        self._write_seqgp(bdf_file, size, is_double)
+
+        #if 0:  # not finished
+            #self._write_nodes_associated(bdf_file, size, is_double)
+
+    def _write_points(self, bdf_file: Any, size: int=8, is_double: bool=False,
+                      is_long_ids: Optional[bool]=None) -> None:
+        """Writes the SPOINT, EPOINT, POINT and axisymmetric node cards"""
         if self.spoints:
             bdf_file.write('$SPOINTS\n')
             bdf_file.write(write_xpoints('SPOINT', self.spoints))
@@ -800,13 +920,12 @@ class WriteMesh(BDFAttributes):
         if self.cyax:
             bdf_file.write(self.cyax.write_card(size, is_double))
 
-        self._write_grids(bdf_file, size=size, is_double=is_double)
+    def _write_seqgp(self, bdf_file: Any, size: int=8, is_double: bool=False,
+                     is_long_ids: Optional[bool]=None) -> None:
+        """Writes the SEQGP card"""
         if self.seqgp:
             bdf_file.write(self.seqgp.write_card(size, is_double))
 
-        #if 0:  # not finished
-            #self._write_nodes_associated(bdf_file, size, is_double)
-
     def _write_grids(self, bdf_file: Any, size: int=8, is_double: bool=False,
                      is_long_ids: Optional[bool]=None) -> None:
         """Writes the GRID-type cards"""
@@ -815,7 +934,8 @@ class WriteMesh(BDFAttributes):
             bdf_file.write('$NODES\n')
             if self.grdset:
                 bdf_file.write(self.grdset.write_card(size))
-            _write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            grids = [node for unused_nid, node in sorted(self.nodes.items())]
+            bdf_file.write(write_grids(grids, 16 if is_long_ids else size, is_double))
 
     #def _write_nodes_associated(self, bdf_file, size=8, is_double=False):
         #"""
@@ -1245,3 +1365,65 @@ def _write_dict(bdf_file, my_dict: Dict[int, Any], size: int, is_double: bool, i
     else:
         for (unused_nid, node) in sorted(my_dict.items()):
             bdf_file.write(node.write_card(size, is_double))
+
+
+#: the model, size, is_double and is_long_ids of a forked write_bdf worker;
+#: it's only set in the worker processes (see ``_init_write_worker``)
+_WORKER_STATE = None  # type: Optional[Tuple[Any, int, bool, bool]]
+
+
+def _get_card_chunk_tasks(slot: str, cards: Dict[int, Any], size: int, is_long_ids: bool,
+                          nworkers: int) -> List[Tuple[Any, ...]]:
+    """splits a dictionary of cards into sorted chunks"""
+    keys = sorted(cards)
+    # a few chunks per worker balances the load
+    nchunks = max(1, min(nworkers * 4, len(keys) // 1000))
+    chunk_size = -(-len(keys) // nchunks)
+    return [('cards', slot, keys[i:i + chunk_size], size, is_long_ids)
+            for i in range(0, len(keys), chunk_size)]
+
+
+def _init_write_worker(model, size: int, is_double: bool, is_long_ids: bool) -> None:
+    """stores the model in a forked write_bdf worker"""
+    global _WORKER_STATE
+    _WORKER_STATE = (model, size, is_double, is_long_ids)
+
+
+def _run_write_task(task: Tuple[Any, ...]) -> str:
+    """formats a task from ``_get_write_tasks`` in a forked worker"""
+    model, size, is_double, is_long_ids = _WORKER_STATE
+    bdf_file = StringIO()
+    _write_task(model, bdf_file, task, size, is_double, is_long_ids)
+    return bdf_file.getvalue()
+
+
+def _write_task(model, bdf_file: Any, task: Tuple[Any, ...],
+                size: int, is_double: bool, is_long_ids: bool) -> None:
+    """writes a task from ``_get_write_tasks``"""
+    task_type = task[0]
+    if task_type == 'method':
+        method_name, args, options = task[1:]
+        sizei = options.get('size', size)
+        is_long_idsi = options.get('is_long_ids', is_long_ids)
+        write_method = getattr(model, method_name)
+        write_method(bdf_file, sizei, is_double, *args, is_long_ids=is_long_idsi)
+    elif task_type == 'cards':
+        slot, keys, sizei, is_long_idsi = task[1:]
+        cards = getattr(model, slot)
+        if slot == 'nodes':
+            grids = [cards[key] for key in keys]
+            bdf_file.write(write_grids(grids, 16 if is_long_idsi else sizei, is_double))
+        elif is_long_idsi:
+            for key in keys:
+                bdf_file.write(cards[key].write_card_16(is_double))
+        else:
+            for key in keys:
+                card = cards[key]
+                try:
+                    bdf_file.write(card.write_card(sizei, is_double))
+                except:
+                    print('failed printing %s...type=%s id=%s' % (slot, card.type, key))
+                    raise
+    else:
+        assert task_type == 'text', task
+        bdf_file.write(task[1])
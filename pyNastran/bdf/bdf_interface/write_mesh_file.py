@@ -13,6 +13,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from io import StringIO
 
 import numpy as np
+from pyNastran.utils.compressed_file import open_file
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.write_mesh import WriteMesh
@@ -799,7 +800,7 @@ def _open_bdf_files(ifile_out_filenames, active_filenames, encoding):
         if hasattr(out_filename, 'read') and hasattr(out_filename, 'write'):
             bdf_file = out_filename
         else:
-            bdf_file = open(out_filename, 'w', encoding=encoding)
+            bdf_file = open_file(out_filename, 'w', encoding=encoding)
         bdf_files[ifile] = bdf_file
     bdf_file0 = bdf_files[0]
     return bdf_files, bdf_file0
@@ -0,0 +1,402 @@
+"""
+Defines the array-based cross-referencing for ``cross_reference(xref='arrays')``:
+ - XrefArrays(model)
+ - ElementArrays(element_type, ...)
+
+Instead of linking every card to the cards it references (e.g.,
+``elem.nodes_ref``), sorted id arrays are built for the nodes,
+coordinate systems, properties and materials and the elements store the
+index of their nodes/property.  Geometry queries (e.g., centroids,
+areas, mass) are then vectorized.
+
+.. code-block:: python
+
+   >>> model = read_bdf(bdf_filename, xref='arrays')
+   >>> xref_arrays = model.xref_arrays
+   >>> eids, centroids = xref_arrays.get_centroids('CQUAD4')
+   >>> eids, areas = xref_arrays.get_areas('CTRIA3')
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the number of corner nodes (used for the centroid)
+NCORNERS = {
+    'CTRIA3' : 3, 'CTRIA6' : 3, 'CTRIAR' : 3, 'CTRIAX' : 3, 'CTRIAX6' : 3,
+    'CQUAD4' : 4, 'CQUAD8' : 4, 'CQUADR' : 4, 'CQUAD' : 4, 'CQUADX' : 4, 'CSHEAR' : 4,
+    'CTETRA' : 4, 'CPYRAM' : 5, 'CPENTA' : 6, 'CHEXA' : 8,
+    'CROD' : 2, 'CONROD' : 2, 'CTUBE' : 2, 'CBAR' : 2, 'CBEAM' : 2,
+}
+#: elements that don't reference GRIDs (e.g., RINGAX, element faces)
+SKIP_ELEMENTS = {'CCONEAX', 'CHBDYE'}
+#: elements with a pid that isn't in model.properties (e.g., a PHBDY)
+NO_PROPERTY_ELEMENTS = {'CHBDYP'}
+TRI_SHELLS = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+QUAD_SHELLS = {'CQUAD4', 'CQUAD8', 'CQUADR', 'CQUAD'}
+
+
+class ElementArrays:
+    """
+    The connectivity of an element type
+
+    Attributes
+    ----------
+    element_type : str
+        the card type (e.g., 'CQUAD4', 'CTETRA')
+    element_ids : (nelements, ) int ndarray
+        the sorted element ids
+    property_ids : (nelements, ) int ndarray
+        the property ids; 0 for elements without a property (e.g., CONROD)
+    iproperty : (nelements, ) int ndarray
+        the index into ``XrefArrays.property_ids``; -1 if there is no property
+    inodes : (nelements, nnodes) int ndarray
+        the index into ``XrefArrays.node_ids``; -1 for a blank node
+        (e.g., a CTETRA10 midside node, a CHEXA8 in the CHEXA20 array)
+    tflag : (nelements, ) int ndarray
+        the shell thickness flag (shells only)
+    tscales : (nelements, ncorners) float ndarray
+        the shell thickness (T1, T2, ...); nan if blank (shells only)
+
+    """
+    def __init__(self, element_type: str, element_ids, property_ids, iproperty, inodes,
+                 tflag=None, tscales=None) -> None:
+        self.element_type = element_type
+        self.element_ids = element_ids
+        self.property_ids = property_ids
+        self.iproperty = iproperty
+        self.inodes = inodes
+        self.tflag = tflag
+        self.tscales = tscales
+
+    def __len__(self) -> int:
+        return len(self.element_ids)
+
+    def __repr__(self) -> str:
+        return 'ElementArrays(element_type=%r, nelements=%s, nnodes=%s)' % (
+            self.element_type, len(self.element_ids), self.inodes.shape[1])
+
+
+class XrefArrays:
+    """
+    Sorted id -> index maps for the nodes, coordinate systems, properties
+    and materials plus the element connectivity
+
+    Attributes
+    ----------
+    node_ids : (nnodes, ) int ndarray
+        the sorted GRID/SPOINT/EPOINT ids
+    nid_cp_cd : (nnodes, 3) int ndarray
+        the node id, CP, CD for each node
+    xyz_cid0 : (nnodes, 3) float ndarray
+        the node locations in the global frame
+    coord_ids : (ncoords, ) int ndarray
+        the sorted coordinate system ids
+    property_ids : (nproperties, ) int ndarray
+        the sorted property ids
+    material_ids : (nmaterials, ) int ndarray
+        the sorted (structural) material ids
+    elements : Dict[str, ElementArrays]
+        the connectivity by element type
+    mass_element_ids : (nconm2, ) int ndarray
+        the sorted CONM2 ids
+    mass_inodes : (nconm2, ) int ndarray
+        the index of the CONM2 node into ``node_ids``
+    mass : (nconm2, ) float ndarray
+        the CONM2 mass
+
+    """
+    def __init__(self, model: BDF, fdtype: str='float64', idtype: str='int32') -> None:
+        self.model = model
+        if idtype == 'int32' and _is_long_ids(model):
+            idtype = 'int64'
+        self.fdtype = fdtype
+        self.idtype = idtype
+
+        self.coord_ids = np.array(sorted(model.coords), dtype=idtype)
+        self.property_ids = np.array(sorted(model.properties), dtype=idtype)
+        self.material_ids = np.array(sorted(model.materials), dtype=idtype)
+
+        if model.nodes or model.spoints or model.epoints or model.gridb:
+            nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(
+                cid=0, fdtype=fdtype, idtype=idtype)[:2]
+        else:
+            nid_cp_cd = np.zeros((0, 3), dtype=idtype)
+            xyz_cid0 = np.zeros((0, 3), dtype=fdtype)
+        self.nid_cp_cd = nid_cp_cd
+        self.node_ids = nid_cp_cd[:, 0]
+        self.xyz_cid0 = xyz_cid0
+
+        self.elements = self._build_elements()
+        self._build_masses()
+
+    def _build_elements(self) -> Dict[str, ElementArrays]:
+        """builds the connectivity for each element type"""
+        idtype = self.idtype
+        elements_by_type = defaultdict(list)
+        for unused_eid, elem in sorted(self.model.elements.items()):
+            if elem.type in SKIP_ELEMENTS:
+                continue
+            elements_by_type[elem.type].append(elem)
+
+        elements = {}
+        for element_type, elems in sorted(elements_by_type.items()):
+            nodes = [_get_node_ids(elem) for elem in elems]
+            nnodes = max(len(node_ids) for node_ids in nodes)
+            nids = np.array([
+                [0 if nid is None else nid for nid in node_ids] + [0] * (nnodes - len(node_ids))
+                for node_ids in nodes], dtype=idtype).reshape(len(elems), nnodes)
+
+            eids = np.array([elem.eid for elem in elems], dtype=idtype)
+            msg = ', which is required by %s' % element_type
+            inodes = self.get_node_index(nids, msg=msg, eids=eids)
+
+            pids = np.array([getattr(elem, 'pid', 0) for elem in elems], dtype=idtype)
+            iproperty = np.full(len(pids), -1, dtype=idtype)
+            has_property = pids > 0
+            if element_type in NO_PROPERTY_ELEMENTS:
+                pass
+            elif has_property.any():
+                iproperty[has_property] = self.get_property_index(
+                    pids[has_property], msg=msg, eids=eids[has_property])
+
+            tflag = None
+            tscales = None
+            if element_type in TRI_SHELLS or element_type in QUAD_SHELLS:
+                tflag = np.array([getattr(elem, 'tflag', 0) for elem in elems], dtype=idtype)
+                # a blank T1, T2, ... is nan
+                ncorners = NCORNERS[element_type]
+                blank = [None] * ncorners
+                tscales = np.array([_get_tscales(elem, blank) for elem in elems],
+                                   dtype=self.fdtype).reshape(len(elems), ncorners)
+            elements[element_type] = ElementArrays(
+                element_type, eids, pids, iproperty, inodes,
+                tflag=tflag, tscales=tscales)
+        return elements
+
+    def _build_masses(self) -> None:
+        """builds the CONM2 arrays"""
+        conm2s = [mass for unused_eid, mass in sorted(self.model.masses.items())
+                  if mass.type == 'CONM2']
+        self.mass_element_ids = np.array([mass.eid for mass in conm2s], dtype=self.idtype)
+        nids = np.array([mass.nid for mass in conm2s], dtype=self.idtype)
+        self.mass_inodes = self.get_node_index(
+            nids, msg=', which is required by CONM2', eids=self.mass_element_ids)
+        self.mass = np.array([mass.mass for mass in conm2s], dtype=self.fdtype)
+
+    def get_node_index(self, nids, msg: str='', eids=None) -> np.ndarray:
+        """
+        Gets the index of the node ids in ``node_ids``
+
+        Parameters
+        ----------
+        nids : (n, ...) int ndarray
+            the node ids; 0 is a blank node
+        msg : str; default=''
+            additional error message
+        eids : (n, ) int ndarray; default=None
+            the element ids used for the error message
+
+        Returns
+        -------
+        inodes : (n, ...) int ndarray
+            the index into ``node_ids``; -1 for a blank node
+
+        """
+        inodes = _get_index(self.node_ids, nids, 'nids', 'are not a GRID, SPOINT, or EPOINT',
+                            msg, eids)
+        return inodes
+
+    def get_property_index(self, pids, msg: str='', eids=None) -> np.ndarray:
+        """Gets the index of the property ids in ``property_ids``"""
+        return _get_index(self.property_ids, pids, 'pids', 'not found', msg, eids)
+
+    def get_material_index(self, mids, msg: str='') -> np.ndarray:
+        """Gets the index of the material ids in ``material_ids``"""
+        return _get_index(self.material_ids, mids, 'mids', 'not found', msg, None)
+
+    def _get_elements(self, element_type: str) -> ElementArrays:
+        """gets the ElementArrays for an element type"""
+        try:
+            return self.elements[element_type]
+        except KeyError:
+            raise KeyError('element_type=%r not found; allowed=%s' % (
+                element_type, list(self.elements)))
+
+    def get_centroids(self, element_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the centroids of an element type (the average of the corner nodes)
+
+        Parameters
+        ----------
+        element_type : str
+            the element type (e.g., 'CQUAD4', 'CTETRA')
+
+        Returns
+        -------
+        element_ids : (nelements, ) int ndarray
+            the element ids
+        centroids : (nelements, 3) float ndarray
+            the centroids in the global frame
+
+        """
+        elements = self._get_elements(element_type)
+        ncorners = NCORNERS.get(element_type, elements.inodes.shape[1])
+        inodes = elements.inodes[:, :ncorners]
+        is_node = inodes >= 0
+        xyz = self.xyz_cid0[inodes] * is_node[:, :, np.newaxis]
+        centroids = xyz.sum(axis=1) / is_node.sum(axis=1)[:, np.newaxis]
+        return elements.element_ids, centroids
+
+    def _get_shell_normals(self, element_type: str) -> Tuple[ElementArrays, np.ndarray]:
+        """gets the non-unit normals of a tri/quad shell element type"""
+        elements = self._get_elements(element_type)
+        xyz = self.xyz_cid0
+        inodes = elements.inodes
+        if element_type in TRI_SHELLS:
+            normals = np.cross(xyz[inodes[:, 1]] - xyz[inodes[:, 0]],
+                               xyz[inodes[:, 2]] - xyz[inodes[:, 0]])
+        elif element_type in QUAD_SHELLS:
+            normals = np.cross(xyz[inodes[:, 2]] - xyz[inodes[:, 0]],
+                               xyz[inodes[:, 3]] - xyz[inodes[:, 1]])
+        else:
+            raise NotImplementedError('element_type=%r is not a tri/quad shell' % element_type)
+        return elements, normals
+
+    def get_areas(self, element_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the areas of a tri/quad shell element type
+        (e.g., CTRIA3, CQUAD4)
+
+        Returns
+        -------
+        element_ids : (nelements, ) int ndarray
+            the element ids
+        areas : (nelements, ) float ndarray
+            the areas
+
+        """
+        elements, normals = self._get_shell_normals(element_type)
+        areas = 0.5 * np.linalg.norm(normals, axis=1)
+        return elements.element_ids, areas
+
+    def get_normals(self, element_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the unit normals of a tri/quad shell element type
+        (e.g., CTRIA3, CQUAD4)
+
+        Returns
+        -------
+        element_ids : (nelements, ) int ndarray
+            the element ids
+        normals : (nelements, 3) float ndarray
+            the unit normals in the global frame
+
+        """
+        elements, normals = self._get_shell_normals(element_type)
+        normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+        return elements.element_ids, normals
+
+    def get_masses(self, element_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the masses of a tri/quad shell element type that uses a PSHELL
+        or the CONM2s (element_type='CONM2')
+
+        Returns
+        -------
+        element_ids : (nelements, ) int ndarray
+            the element ids
+        masses : (nelements, ) float ndarray
+            the masses
+
+        """
+        if element_type == 'CONM2':
+            return self.mass_element_ids, self.mass.copy()
+
+        element_ids, areas = self.get_areas(element_type)
+        elements = self.elements[element_type]
+        nsm, rho, thickness = self._get_pshell_arrays(elements)
+        thickness = thickness[elements.iproperty]
+
+        # thickness = mean(T) if tflag=0 else mean(T * t)
+        tscales = elements.tscales
+        is_relative = (elements.tflag == 1)[:, np.newaxis]
+        tscales = np.where(is_relative, tscales * thickness[:, np.newaxis], tscales)
+        tscales = np.where(np.isnan(tscales), thickness[:, np.newaxis], tscales)
+        thickness = tscales.mean(axis=1)
+
+        mass_per_area = nsm[elements.iproperty] + rho[elements.iproperty] * thickness
+        return element_ids, mass_per_area * areas
+
+    def _get_pshell_arrays(self, elements: ElementArrays) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """gets the nsm, rho, and thickness for each property"""
+        properties = self.model.properties
+        nproperties = len(self.property_ids)
+        nsm = np.full(nproperties, np.nan, dtype=self.fdtype)
+        rho = np.full(nproperties, np.nan, dtype=self.fdtype)
+        thickness = np.full(nproperties, np.nan, dtype=self.fdtype)
+        for iproperty in np.unique(elements.iproperty):
+            prop = properties[self.property_ids[iproperty]]
+            if prop.type != 'PSHELL':
+                raise NotImplementedError(
+                    'mass is only supported for PSHELL; pid=%s type=%s' % (prop.pid, prop.type))
+            msg = ', which is required by PSHELL pid=%s' % prop.pid
+            nsm[iproperty] = prop.nsm
+            rho[iproperty] = self.model.Material(prop.Mid(), msg=msg).Rho()
+            thickness[iproperty] = prop.t
+        return nsm, rho, thickness
+
+
+def _is_long_ids(model: BDF) -> bool:
+    """are there ids that don't fit in an int32?"""
+    imax = np.iinfo('int32').max
+    for cards in (model.nodes, model.elements, model.properties, model.materials,
+                  model.masses):
+        if cards and max(cards) > imax:
+            return True
+    return False
+
+
+def _get_node_ids(elem) -> List[Optional[int]]:
+    """gets the node ids without going through the xref'd nodes when possible"""
+    if getattr(elem, 'nodes_ref', None) is None:
+        nodes = getattr(elem, 'nodes', None)
+        if isinstance(nodes, list):
+            return nodes
+    return elem.node_ids
+
+
+def _get_tscales(elem, blank: List[None]) -> List[Optional[float]]:
+    """gets the T1, T2, ... values of a shell; None if blank"""
+    tscales = elem.get_thickness_scale()
+    return blank if tscales is None else tscales
+
+
+def _get_index(all_ids, ids, name: str, word: str, msg: str, eids) -> np.ndarray:
+    """
+    Gets the index of ids in all_ids, which is sorted.
+    An id of 0 is blank and has an index of -1.
+    """
+    ids = np.asarray(ids)
+    index = np.searchsorted(all_ids, ids)
+    is_blank = ids == 0
+    nall_ids = len(all_ids)
+    index_clipped = np.clip(index, 0, max(nall_ids - 1, 0))
+    if nall_ids:
+        is_found = (all_ids[index_clipped] == ids) | is_blank
+    else:
+        is_found = is_blank
+    if not is_found.all():
+        missing = np.unique(ids[~is_found]).tolist()
+        error_msg = '%s=%s %s%s' % (name, missing, word, msg)
+        if eids is not None:
+            is_missing = ~is_found
+            if is_missing.ndim > 1:
+                is_missing = is_missing.any(axis=1)
+            error_msg += ' eids=%s' % eids[is_missing].tolist()
+        raise KeyError(error_msg)
+    index_clipped[is_blank] = -1
+    return index_clipped
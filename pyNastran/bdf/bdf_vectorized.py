@@ -0,0 +1,470 @@
+"""
+Defines the array-based BDF model:
+ - VectorizedBDF()
+ - convert_bdf_to_vectorized(bdf_filename, ...)
+
+The nodes, shells, solids, bars/beams, rods, springs, masses, SPC/MPCs
+and loads are stored as ``CardArray`` objects (one per card class) that
+are sorted by id, so lookups use ``np.searchsorted``.  The remaining
+cards (e.g., properties, materials, coordinate systems) and the
+executive/case control decks are in ``model.model``, which is a
+standard ``BDF``.  The cards of the superelement models (``BEGIN SUPER``)
+aren't vectorized.
+
+There is no array reader: the cards aren't parsed into the arrays
+directly.  ``convert_bdf_to_vectorized`` runs ``read_bdf`` and then
+moves the card objects into the arrays, so it's slower than
+``read_bdf`` and its peak memory is the object model of a vectorized
+card class plus its arrays.  The gain is in the lookups and the array
+operations on the model.
+
+.. code-block:: python
+
+   >>> model = convert_bdf_to_vectorized(bdf_filename)
+   >>> quads = model.shells['CQUAD4']
+   >>> inodes = model.get_node_index(quads.nodes)
+   >>> xyz_cid0 = model.get_xyz_cid0()
+   >>> centroids = xyz_cid0[inodes, :].mean(axis=1)
+
+   # the object model
+   >>> bdf_model = model.to_bdf()
+   >>> model2 = VectorizedBDF.from_bdf(bdf_model)
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from itertools import count
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.card_arrays import CardArray, get_sorted_ids
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+
+#: group -> (BDF attribute, id name, card classes)
+VECTORIZED_GROUPS = {
+    'nodes' : ('nodes', 'nid', ['GRID']),
+    'shells' : ('elements', 'eid', [
+        'CTRIA3', 'CQUAD4', 'CTRIA6', 'CQUAD8', 'CTRIAR', 'CQUADR', 'CQUAD', 'CSHEAR']),
+    'solids' : ('elements', 'eid', [
+        'CTETRA4', 'CTETRA10', 'CPENTA6', 'CPENTA15',
+        'CHEXA8', 'CHEXA20', 'CPYRAM5', 'CPYRAM13']),
+    'bars' : ('elements', 'eid', ['CBAR', 'CBEAM']),
+    'rods' : ('elements', 'eid', ['CROD', 'CONROD', 'CTUBE']),
+    'springs' : ('elements', 'eid', ['CELAS1', 'CELAS2', 'CELAS3', 'CELAS4']),
+    'masses' : ('masses', 'eid', ['CONM1', 'CONM2', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4']),
+    'spcs' : ('spcs', 'conid', ['SPC', 'SPC1']),
+    'mpcs' : ('mpcs', 'conid', ['MPC']),
+    'loads' : ('loads', 'sid', [
+        'FORCE', 'FORCE1', 'FORCE2', 'MOMENT', 'MOMENT1', 'MOMENT2',
+        'PLOAD', 'PLOAD1', 'PLOAD2', 'PLOAD4', 'GRAV', 'SLOAD']),
+}
+#: the groups in ``VectorizedBDF.get_element_index``
+ELEMENT_GROUPS = ['shells', 'solids', 'bars', 'rods', 'springs']
+#: the BDF attributes that are Dict[id] = List[card]
+LIST_ATTRIBUTES = {'spcs', 'mpcs', 'loads'}
+CORD1_TYPES = {'CORD1R', 'CORD1C', 'CORD1S'}
+
+
+class VectorizedBDF:
+    """
+    An array-based BDF model
+
+    Attributes
+    ----------
+    model : BDF()
+        the cards that aren't vectorized and the executive/case control decks
+    nodes : Dict[str, CardArray]
+        the GRIDs ('GRID')
+    shells, solids, bars, rods, springs, masses : Dict[str, CardArray]
+        the elements by card class (e.g., 'CQUAD4', 'CTETRA10')
+    spcs, mpcs, loads : Dict[str, CardArray]
+        the SPC/SPC1, MPC and FORCE/MOMENT/PLOADx/GRAV/SLOAD cards by
+        card class; sorted by the SPC/MPC/load id
+
+    """
+    def __init__(self, log: Optional[SimpleLogger]=None, debug: Optional[bool]=True,
+                 mode: str='msc') -> None:
+        """
+        Creates an empty VectorizedBDF
+
+        Parameters
+        ----------
+        log : logger; default=None
+            a logger
+        debug : bool/None; default=True
+            used to set the logger if no logger is passed in
+        mode : str; default='msc'
+            the type of Nastran
+
+        """
+        self.model = BDF(debug=debug, log=log, mode=mode)
+        self.log = self.model.log
+        for group in VECTORIZED_GROUPS:
+            setattr(self, group, {})  # type: Dict[str, CardArray]
+
+        #: the index of the list cards (e.g., loads) in model.loads[sid],
+        #: so to_bdf keeps the order of the cards
+        self._positions = {}  # type: Dict[Tuple[str, str], np.ndarray]
+
+    @classmethod
+    def from_bdf(cls, model: BDF, copy: bool=True) -> VectorizedBDF:
+        """
+        Creates a VectorizedBDF from a BDF
+
+        Parameters
+        ----------
+        model : BDF()
+            the model
+        copy : bool; default=True
+            True : model isn't changed
+            False : the vectorized cards are moved out of the model, so
+                    they don't use memory twice
+
+        Returns
+        -------
+        vectorized_model : VectorizedBDF()
+            the array-based model
+
+        .. note:: the GRIDs of the CORD1x cards are also kept in
+                  ``vectorized_model.model.nodes`` for the coordinate
+                  systems
+
+        """
+        if copy:
+            model = model.copy(xref=False)
+        elif model._xref:
+            model.uncross_reference()
+            model._xref = False
+
+        vectorized_model = cls.__new__(cls)
+        vectorized_model.model = model
+        vectorized_model.log = model.log
+        vectorized_model._positions = {}
+
+        class_to_group = {}
+        attr_to_groups = defaultdict(list)
+        for group, (attr, unused_id_name, class_names) in VECTORIZED_GROUPS.items():
+            setattr(vectorized_model, group, {})
+            attr_to_groups[attr].append(group)
+            for class_name in class_names:
+                class_to_group[class_name] = group
+
+        cord1_nids = set()
+        for coord in model.coords.values():
+            if coord.type in CORD1_TYPES:
+                cord1_nids.update(coord.node_ids)
+
+        for attr, groups in attr_to_groups.items():
+            container = getattr(model, attr)
+            cards_by_class = defaultdict(list)
+            positions_by_class = defaultdict(list)
+            if attr in LIST_ATTRIBUTES:
+                for key, cards in list(container.items()):
+                    cards_to_keep = []
+                    for position, card in enumerate(cards):
+                        class_name = card.__class__.__name__
+                        if class_name in class_to_group:
+                            cards_by_class[class_name].append(card)
+                            positions_by_class[class_name].append(position)
+                        else:
+                            cards_to_keep.append(card)
+                    if cards_to_keep:
+                        container[key] = cards_to_keep
+                    else:
+                        del container[key]
+            else:
+                for key, card in list(container.items()):
+                    class_name = card.__class__.__name__
+                    if class_name in class_to_group:
+                        cards_by_class[class_name].append(card)
+                        if attr != 'nodes' or key not in cord1_nids:
+                            del container[key]
+
+            for class_name in list(cards_by_class):
+                # free the card objects of a class once it's in an array
+                cards = cards_by_class.pop(class_name)
+                group = class_to_group[class_name]
+                id_name = VECTORIZED_GROUPS[group][1]
+                card_array = CardArray(cards[0].__class__, id_name, cards)
+                getattr(vectorized_model, group)[class_name] = card_array
+                if class_name in positions_by_class:
+                    # CardArray uses a stable sort by id
+                    ids = np.array([getattr(card, id_name) for card in cards], dtype='int64')
+                    isort = np.argsort(ids, kind='stable')
+                    positions = np.array(positions_by_class[class_name], dtype='int32')
+                    vectorized_model._positions[(group, class_name)] = positions[isort]
+        return vectorized_model
+
+    def to_bdf(self) -> BDF:
+        """
+        Creates a BDF with card objects
+
+        Returns
+        -------
+        model : BDF()
+            the (uncross-referenced) model
+
+        """
+        model = self.model.copy(xref=False)
+        list_cards = defaultdict(lambda: defaultdict(list))
+        for group, (attr, unused_id_name, unused_class_names) in VECTORIZED_GROUPS.items():
+            container = getattr(model, attr)
+            for class_name, card_array in getattr(self, group).items():
+                cards = card_array.to_cards()
+                if attr in LIST_ATTRIBUTES:
+                    positions = self._positions.get((group, class_name))
+                    if positions is None or len(positions) != len(cards):
+                        positions = np.full(len(cards), -1, dtype='int32')
+                    for key, position, card in zip(card_array.ids.tolist(),
+                                                    positions.tolist(), cards):
+                        list_cards[attr][key].append((position, card))
+                else:
+                    for key, card in zip(card_array.ids.tolist(), cards):
+                        container[key] = card
+
+        for attr, cards_by_key in list_cards.items():
+            container = getattr(model, attr)
+            for key, position_cards in cards_by_key.items():
+                container[key] = _merge_cards(position_cards, container.get(key, []))
+
+        for attr in {attr for attr, unused_id_name, unused_class_names
+                     in VECTORIZED_GROUPS.values()}:
+            container = getattr(model, attr)
+            items = sorted(container.items())
+            container.clear()
+            container.update(items)
+        return model
+
+    def write_bdf(self, out_filename=None, **kwargs) -> None:
+        """
+        Writes the BDF (see ``BDF.write_bdf``)
+
+        Parameters
+        ----------
+        out_filename : varies; default=None
+            str        - the name to call the output bdf
+            file       - a file object
+            StringIO() - a StringIO object
+            None       - pops a dialog
+        kwargs : dict
+            the other ``BDF.write_bdf`` arguments (e.g., size, is_double)
+
+        """
+        self.to_bdf().write_bdf(out_filename, **kwargs)
+
+    @property
+    def grid(self) -> Optional[CardArray]:
+        """the GRIDs"""
+        return self.nodes.get('GRID')
+
+    @property
+    def node_ids(self) -> np.ndarray:
+        """the sorted GRID ids"""
+        grid = self.grid
+        if grid is None:
+            return np.zeros(0, dtype='int64')
+        return grid.ids
+
+    def get_node_index(self, nids, allow0: bool=False, msg: str='') -> np.ndarray:
+        """
+        Gets the index of the GRIDs with ``np.searchsorted``
+
+        Parameters
+        ----------
+        nids : int / (n, ...) int ndarray
+            the node ids (e.g., ``model.shells['CQUAD4'].nodes``)
+        allow0 : bool; default=False
+            a node id of 0 (e.g., a blank CTETRA10 midside node) has an
+            index of -1
+        msg : str; default=''
+            additional information for the error message
+
+        Returns
+        -------
+        inodes : int / (n, ...) int ndarray
+            the index into ``model.grid``
+
+        """
+        nids = np.asarray(nids)
+        if self.grid is None:
+            raise KeyError('there are no GRIDs')
+        if not allow0:
+            return self.grid.get_index(nids, msg=msg)
+        is_zero = nids == 0
+        inodes = np.full(nids.shape, -1, dtype='int64')
+        inodes[~is_zero] = self.grid.get_index(nids[~is_zero], msg=msg)
+        return inodes
+
+    def get_xyz_cid0(self) -> np.ndarray:
+        """
+        Gets the GRID locations in the global frame
+
+        Returns
+        -------
+        xyz_cid0 : (nnodes, 3) float ndarray
+            the locations; sorted by node id
+
+        """
+        grid = self.grid
+        if grid is None:
+            return np.zeros((0, 3), dtype='float64')
+        cps = grid.cp
+        if not np.any(cps):
+            return grid.xyz.copy()
+        return self.model.get_coord_table().transform(grid.xyz, cps, cid=0)
+
+    @property
+    def element_ids(self) -> np.ndarray:
+        """the sorted element ids of the shells, solids, bars, rods and springs"""
+        return self._get_sorted_element_ids()[0]
+
+    def _get_sorted_element_ids(self) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """gets the sorted element ids and the CardArray of each element"""
+        card_arrays = {}
+        for group in ELEMENT_GROUPS:
+            card_arrays.update(getattr(self, group))
+        eids, iarray = get_sorted_ids(card_arrays)
+        return eids, iarray, list(card_arrays)
+
+    def get_element_index(self, eids) -> Tuple[List[str], np.ndarray]:
+        """
+        Gets the card class and index of the elements with ``np.searchsorted``
+
+        Parameters
+        ----------
+        eids : (n, ) int ndarray
+            the element ids
+
+        Returns
+        -------
+        class_names : List[str]
+            the card class of each element (e.g., 'CQUAD4', 'CTETRA10')
+        index : (n, ) int ndarray
+            the index into the CardArray (e.g., ``model.shells['CQUAD4']``)
+
+        """
+        eids = np.atleast_1d(np.asarray(eids))
+        all_eids, iarray, class_names = self._get_sorted_element_ids()
+        i = np.searchsorted(all_eids, eids)
+        iclipped = np.minimum(i, len(all_eids) - 1)
+        is_found = (i < len(all_eids)) & (all_eids[iclipped] == eids)
+        if not np.all(is_found):
+            raise KeyError('eids=%s are not shell/solid/bar/rod/spring elements' % (
+                eids[~is_found].tolist()))
+
+        iarrays = iarray[i]
+        element_class_names = [class_names[iarrayi] for iarrayi in iarrays.tolist()]
+        card_arrays = {}
+        for group in ELEMENT_GROUPS:
+            card_arrays.update(getattr(self, group))
+        index = np.zeros(len(eids), dtype='int64')
+        for iarrayi in np.unique(iarrays):
+            j = np.where(iarrays == iarrayi)[0]
+            index[j] = card_arrays[class_names[iarrayi]].get_index(eids[j])
+        return element_class_names, index
+
+    def get_card_arrays(self) -> Dict[str, CardArray]:
+        """gets all the CardArrays by card class"""
+        card_arrays = {}
+        for group in VECTORIZED_GROUPS:
+            card_arrays.update(getattr(self, group))
+        return card_arrays
+
+    def get_bdf_stats(self, return_type: str='string') -> Any:
+        """
+        Print statistics for the vectorized cards and the other cards
+
+        Parameters
+        ----------
+        return_type : str (default='string')
+            the output type ('list', 'string')
+                'list' : list of strings
+                'string' : single, joined string
+
+        Returns
+        -------
+        return_data : str, optional
+            the output data
+
+        """
+        msg = ['---BDF Vectorized Statistics---']
+        for group in VECTORIZED_GROUPS:
+            card_arrays = getattr(self, group)
+            if not card_arrays:
+                continue
+            msg.append('%s:' % group)
+            for class_name, card_array in sorted(card_arrays.items()):
+                msg.append('  %-8s : %s' % (class_name, len(card_array)))
+        msg.append('')
+        msg.extend(self.model.get_bdf_stats(return_type='list'))
+        if return_type == 'string':
+            return '\n'.join(msg)
+        return msg
+
+    def __repr__(self) -> str:
+        ncards = sum(len(card_array) for card_array in self.get_card_arrays().values())
+        return 'VectorizedBDF(nvectorized_cards=%s)' % ncards
+
+
+def _merge_cards(position_cards: List[Tuple[int, Any]], other_cards: List[Any]) -> List[Any]:
+    """
+    Puts the vectorized cards back in their original location in a list
+    (e.g., model.loads[sid]); the other cards fill the open locations.
+    """
+    positions = {position for position, unused_card in position_cards}
+    open_positions = (i for i in count() if i not in positions)
+    position_cards = position_cards + [(next(open_positions), card) for card in other_cards]
+    # -1 (an unknown location) is put first
+    position_cards.sort(key=lambda position_card: position_card[0])
+    return [card for unused_position, card in position_cards]
+
+
+def convert_bdf_to_vectorized(bdf_filename: Optional[str]=None, validate: bool=True,
+                              punch: bool=False, encoding: Optional[str]=None,
+                              log: Optional[SimpleLogger]=None, debug: Optional[bool]=True,
+                              mode: str='msc', nworkers: int=1,
+                              fast_parse: bool=True) -> VectorizedBDF:
+    """
+    Reads a BDF with ``read_bdf`` and converts it into an array-based
+    model
+
+    Parameters
+    ----------
+    bdf_filename : str (default=None -> popup)
+        the bdf filename
+    validate : bool; default=True
+        runs various checks on the BDF
+    punch : bool; default=False
+        indicates whether the file is a punch file
+    encoding : str; default=None -> system default
+        the unicode encoding
+    log : logging module object / None
+        if log is set, debug is ignored and uses the
+        settings the logging object has
+    debug : bool/None; default=True
+        used to set the logger if no logger is passed in
+    mode : str; default='msc'
+        the type of Nastran
+    nworkers : int; default=1
+        the number of processes used to create the card objects
+    fast_parse : bool; default=True
+        use the vectorized parser for the small field GRID/element cards
+
+    Returns
+    -------
+    model : VectorizedBDF()
+        the array-based model
+
+    .. note:: this is ``read_bdf`` followed by
+              ``VectorizedBDF.from_bdf(model, copy=False)``, so it's
+              slower than ``read_bdf``; the vectorized cards are moved
+              out of the BDF, so they aren't stored twice
+
+    """
+    model = read_bdf(bdf_filename, validate=validate, xref=False, punch=punch,
+                     encoding=encoding, log=log, debug=debug, mode=mode,
+                     nworkers=nworkers, fast_parse=fast_parse)
+    return VectorizedBDF.from_bdf(model, copy=False)
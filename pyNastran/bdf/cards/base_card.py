@@ -39,7 +39,13 @@ class BaseCard:
      - comment
      - update_field(self, n, value)
 
+    The most common cards (e.g., GRID, CQUAD4) define ``__slots__`` to
+    reduce their memory usage, so the base classes of those cards must
+    also define ``__slots__`` (otherwise a ``__dict__`` is still created).
+
     """
+    __slots__ = ('_comment', 'ifile')
+
     def __init__(self) -> None:
         pass
         #ABC.__init__(self)
@@ -410,6 +416,7 @@ class Material(BaseCard):
 
 class Element(BaseCard):
     """defines the Element class"""
+    __slots__ = ()
     pid = 0  # CONM2, rigid
 
     def __init__(self) -> None:
@@ -6,7 +6,7 @@ The capitalization of the sub-functions is important.
 
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Callable, Dict, TYPE_CHECKING
 import numpy as np
 from numpy import (
     cos, sin, tan, log, log10, mean, exp, sqrt, square, mod, abs, sum,
@@ -25,15 +25,29 @@ def pi(num):
 
 def rss(*args):  # good
     """2-norm; generalized magnitude of vector for N components"""
-    return norm(args)
+    return np.sqrt(ssq(*args))
 
 def avg(*args):
-    """average"""
-    return np.mean(args)
+    """
+    average
+
+    A single sequence (e.g., the arguments of a DRESP2 equation) is
+    averaged; several arguments are averaged elementwise.
+    """
+    if len(args) == 1:
+        return np.mean(args[0])
+    return np.mean(np.broadcast_arrays(*args), axis=0)
 
 def ssq(*args):
-    """sum of squares"""
-    return np.square(args).sum()
+    """
+    sum of squares
+
+    A single sequence (e.g., the arguments of a DRESP2 equation) is
+    summed; several arguments are summed elementwise.
+    """
+    if len(args) == 1:
+        return np.square(args[0]).sum()
+    return np.square(np.broadcast_arrays(*args)).sum(axis=0)
 
 def logx(x, y):
     """log base_x(y)"""
@@ -41,7 +55,7 @@ def logx(x, y):
 
 def dim(x, y):
     """positive difference"""
-    return x - min(x, y)
+    return x - np.minimum(x, y)
 
 def db(p, pref):
     """sound pressure in decibels"""
@@ -141,6 +155,46 @@ def _get_ta(f):
 BUILTINS = ['del', 'eval', 'yield', 'async', 'await', 'property',
             'slice', 'filter', 'map']
 
+# the compiled equations, which are shared by all the DEQATN/DRESP2
+# cards (and models) with the same source; the oldest equation is
+# removed when the cache is full
+_FUNCTION_CACHE = {}  # type: Dict[str, Callable]
+_FUNCTION_CACHE_SIZE = 1024
+
+def compile_function(func_name: str, func_str: str) -> Callable:
+    """
+    Compiles the python source for an equation or gets it from the cache
+
+    Parameters
+    ----------
+    func_name : str
+        the name of the function defined by func_str
+    func_str : str
+        the python source (see ``fortran_to_python``)
+
+    Returns
+    -------
+    func : function
+        the compiled function
+
+    """
+    try:
+        return _FUNCTION_CACHE[func_str]
+    except KeyError:
+        pass
+
+    local_dict = {}
+    exec(func_str, globals(), local_dict)
+    func = local_dict[func_name]
+    if len(_FUNCTION_CACHE) >= _FUNCTION_CACHE_SIZE:
+        del _FUNCTION_CACHE[next(iter(_FUNCTION_CACHE))]
+    _FUNCTION_CACHE[func_str] = func
+    return func
+
+def clear_function_cache() -> None:
+    """clears the compiled equations"""
+    _FUNCTION_CACHE.clear()
+
 class DEQATN(BaseCard):  # needs work...
     """
     Design Equation Defintion
@@ -259,17 +313,14 @@ class DEQATN(BaseCard):  # needs work...
         default_values = {}
         if self.dtable is not None:
             default_values = self.dtable_ref.default_values
+
+        # the card isn't written to the docstring, so the same equation
+        # on multiple cards is only compiled once
         func_name, nargs, func_str = fortran_to_python(
-            self.eqs, default_values, str(self))
+            self.eqs, default_values)
         self.func_str = func_str
         self.func_name = func_name
-        try:
-            exec(func_str)
-        except SyntaxError:
-            print(func_str)
-            raise
-        #print(locals().keys())
-        func = locals()[func_name]
+        func = compile_function(func_name, func_str)
         setattr(self, func_name, func)
         #print(func)
         self.func = func
@@ -319,6 +370,48 @@ class DEQATN(BaseCard):  # needs work...
         return self.func(*args)
         #self.func(*args)
 
+    def evaluate_many(self, *args_arrays):
+        """
+        Evaluates the equation for arrays of inputs in one call
+
+        Parameters
+        ----------
+        *args_arrays : float / (n, ) float ndarray
+            the values of the arguments, which are broadcast
+            against each other
+
+        Returns
+        -------
+        out : (n, ) float ndarray
+            the value of the equation for each set of arguments
+
+        >>> deqatn.evaluate_many(np.array([1., 2., 3.]), 2.)
+        array([3., 4., 5.])
+
+        """
+        if len(args_arrays) > self.nargs:
+            msg = 'len(args) > nargs\n'
+            msg += 'nargs=%s len(args)=%s; func_name=%s' % (
+                self.nargs, len(args_arrays), self.func_name)
+            raise RuntimeError(msg)
+
+        args = np.broadcast_arrays(*[np.asarray(arg, dtype='float64')
+                                     for arg in args_arrays])
+        shape = args[0].shape if args else ()
+        try:
+            with np.errstate(all='ignore'):
+                out = np.asarray(self.func(*args), dtype='float64')
+        except (TypeError, ValueError):
+            # the equation uses scalar-only functions (e.g., min/max)
+            out = None
+
+        if out is None or out.shape != shape:
+            # evaluate the equation one set of arguments at a time
+            flat_args = [arg.ravel() for arg in args]
+            out = np.array([self.func(*argsi) for argsi in zip(*flat_args)],
+                           dtype='float64').reshape(shape)
+        return out
+
     def raw_fields(self):
         return [self.write_card()]
 
@@ -512,9 +605,7 @@ def fortran_to_python_short(line, unused_default_values):
     """the function used by the DRESP2"""
     func_str = 'def func(args):\n'
     func_str += '    return %s(args)\n' % line.strip()
-    local_dict = {}
-    exec(func_str, globals(), local_dict)
-    return local_dict['func']
+    return compile_function('func', func_str)
 
 def split_to_equations(lines):
     """
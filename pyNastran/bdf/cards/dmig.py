@@ -5,7 +5,6 @@ from typing import Tuple # , TYPE_CHECKING
 
 import numpy as np
 from numpy import array, zeros
-from scipy.sparse import coo_matrix  # type: ignore
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.base_card import BaseCard
@@ -2101,6 +2100,7 @@ def _get_row_col_map_2d(matrix, GCi, GCj, ifo):
 
 def _fill_sparse_matrix(matrix, nrows, ncols):
     """helper method for get_matrix"""
+    from scipy.sparse import coo_matrix  # type: ignore
     GCj = array(matrix.GCj, dtype='int32') - 1
     GCi = array(matrix.GCi, dtype='int32') - 1
     reals = array(matrix.Real, dtype='float32')
@@ -2296,6 +2296,7 @@ def get_dmi_matrix(matrix: DMI, is_sparse: bool=False,
     .. warning:: is_sparse=True WILL fail
 
     """
+    from scipy.sparse import coo_matrix  # type: ignore
     ifo = matrix.ifo
     GCj = array(matrix.GCj, dtype='int32') - 1
     GCi = array(matrix.GCi, dtype='int32') - 1
@@ -28,6 +28,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class LineElement(Element):  # CBAR, CBEAM, CBEAM3, CBEND
+    __slots__ = ()
+
     def __init__(self):
         Element.__init__(self)
         self.pid_ref = None  # type: Optional[Any]
@@ -374,6 +376,10 @@ class CBAR(LineElement):
     +-------+-------+-----+-------+-------+--------+-------+-------+-------+
 
     """
+    __slots__ = (
+        'eid', 'pid', 'ga', 'gb', 'x', 'g0', 'offt', 'pa', 'pb', 'wa', 'wb',
+        'pid_ref', 'ga_ref', 'gb_ref', 'g0_ref', 'g0_vector',
+    )
     type = 'CBAR'
     _field_map = {
         1: 'eid', 2:'pid', 3:'ga', 4:'gb',
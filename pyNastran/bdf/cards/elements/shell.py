@@ -127,6 +127,7 @@ def _normal4(n1, n2, n3, n4, card):
 
 
 class ShellElement(Element):
+    __slots__ = ()
     type = 'ShellElement'
 
     def __init__(self):
@@ -258,6 +259,8 @@ class ShellElement(Element):
 
 
 class TriShell(ShellElement):
+    __slots__ = ()
+
     def __init__(self):
         ShellElement.__init__(self)
         self.nodes_ref = None  # type: Optional[List[Any]]
@@ -455,6 +458,10 @@ class CTRIA3(TriShell):
     +--------+-------+-------+----+----+----+------------+---------+
 
     """
+    __slots__ = (
+        'eid', 'pid', 'nodes', 'zoffset', 'theta_mcid', 'tflag', 'T1', 'T2', 'T3',
+        'pid_ref', 'nodes_ref', 'theta_mcid_ref',
+    )
     type = 'CTRIA3'
     _field_map = {
         1: 'eid', 2:'pid', 6:'theta_mcid', 7:'zoffset', 10:'tflag',
@@ -1645,6 +1652,8 @@ class CTRIAR(TriShell):
 
 
 class QuadShell(ShellElement):
+    __slots__ = ()
+
     def __init__(self):
         ShellElement.__init__(self)
         self.nodes_ref = None  # type: Optional[List[Any]]
@@ -2155,6 +2164,10 @@ class CQUAD4(QuadShell):
     +--------+-------+-------+----+----+----+----+------------+---------+
 
     """
+    __slots__ = (
+        'eid', 'pid', 'nodes', 'zoffset', 'theta_mcid', 'tflag', 'T1', 'T2', 'T3', 'T4',
+        'pid_ref', 'nodes_ref', 'theta_mcid_ref',
+    )
     type = 'CQUAD4'
     cp_name_map = {
         'T1' : 'T1',
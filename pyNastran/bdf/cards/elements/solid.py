@@ -97,6 +97,7 @@ nnodes_map = {
     'CHEXA' : (8, 20),
 }
 class SolidElement(Element):
+    __slots__ = ()
     _field_map = {1: 'nid', 2:'pid'}
     _properties = ['faces']
 
@@ -221,6 +222,7 @@ class CHEXA8(SolidElement):
     |       | G7  | G8  |    |    |    |    |    |    |
     +-------+-----+-----+----+----+----+----+----+----+
     """
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     type = 'CHEXA'
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         data = [self.eid, self.Pid()] + self.node_ids
@@ -534,6 +536,7 @@ class CHEXA20(SolidElement):
     |       | G15 | G16 | G17 | G18 | G19 | G20 |     |     |
     +-------+-----+-----+-----+-----+-----+-----+-----+-----+
     """
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     type = 'CHEXA'
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         nodes = self.node_ids
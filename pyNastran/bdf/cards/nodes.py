@@ -38,9 +38,14 @@ from pyNastran.bdf.cards.collpase_card import collapse_thru_packs
 from pyNastran.bdf.bdf_interface.assign_type import (
     integer, integer_or_blank, double, double_or_blank, blank, integer_or_string,
     integer_or_double, components_or_blank)
-from pyNastran.bdf.field_writer_8 import print_card_8, print_float_8, print_int_card
-from pyNastran.bdf.field_writer_16 import print_float_16, print_card_16
-from pyNastran.bdf.field_writer_double import print_scientific_double, print_card_double
+from pyNastran.bdf.field_writer_8 import (
+    print_card_8, print_float_8, print_int_card,
+    FLOAT_8_POSITIVE_RANGES, FLOAT_8_NEGATIVE_RANGES,
+    _floats_to_chars, _fill_chars, _ints_to_chars)
+from pyNastran.bdf.field_writer_16 import (
+    print_float_16, print_card_16, FLOAT_16_POSITIVE_RANGES, FLOAT_16_NEGATIVE_RANGES)
+from pyNastran.bdf.field_writer_double import (
+    print_scientific_double, print_card_double, _scientific_double_to_chars)
 
 #u = str
 if TYPE_CHECKING:  # pragma: no cover
@@ -1006,6 +1011,10 @@ class GRID(BaseCard):
      node.set_position(model, array([1.,2.,3.]), cid=3)
 
     """
+    __slots__ = (
+        'nid', 'cp', 'xyz', 'cd', 'ps', 'seid',
+        'cp_ref', 'cd_ref', 'ps_ref', 'seid_ref', 'elements_ref',
+    )
     type = 'GRID'
 
     #: allows the get_field method and update_field methods to be used
@@ -1578,6 +1587,109 @@ class GRID(BaseCard):
         return self.comment + msg
 
 
+def write_grids(grids: List[GRID], size: int=8, is_double: bool=False) -> str:
+    """
+    Writes many GRIDs at once.  The fields are formatted as arrays, but
+    the output is the same as calling ``grid.write_card`` for each GRID.
+
+    Parameters
+    ----------
+    grids : List[GRID]
+        the GRIDs in the order they should be written
+    size : int; default=8
+        the size of the card (8/16)
+    is_double : bool; default=False
+        should the cards be written with double precision
+
+    Returns
+    -------
+    msg : str
+        the cards as a string
+
+    """
+    ngrids = len(grids)
+    if ngrids == 0:
+        return ''
+    width = 8 if size == 8 else 16
+    nids = np.array([grid.nid for grid in grids])
+    cps = np.array([grid.Cp() for grid in grids])
+    cds = np.array([grid.Cd() for grid in grids])
+    seids = np.array([grid.SEid() for grid in grids])
+    pss = ''.join(['%*s' % (width, grid.ps) for grid in grids])
+    xyz = np.array([grid.xyz for grid in grids], dtype='float64')
+
+    is_valid = len(pss) == ngrids * width
+    for ids in (nids, cps, cds, seids):
+        is_valid = is_valid and ids.dtype.kind in 'iu' and (
+            ids.max() < 10 ** width and ids.min() > -10 ** (width - 1))
+    xyz_chars = []
+    for i in range(3):
+        if size == 8:
+            chars, is_done = _floats_to_chars(
+                xyz[:, i], 8, FLOAT_8_POSITIVE_RANGES, FLOAT_8_NEGATIVE_RANGES)
+            is_valid = is_valid and _fill_chars(chars, xyz[:, i], is_done, print_float_8)
+        elif is_double:
+            chars, is_done = _scientific_double_to_chars(xyz[:, i])
+            is_valid = is_valid and _fill_chars(chars, xyz[:, i], is_done,
+                                                print_scientific_double)
+        else:
+            chars, is_done = _floats_to_chars(
+                xyz[:, i], 16, FLOAT_16_POSITIVE_RANGES, FLOAT_16_NEGATIVE_RANGES)
+            is_valid = is_valid and _fill_chars(chars, xyz[:, i], is_done, print_float_16)
+        xyz_chars.append(chars)
+    if not is_valid:
+        # a field doesn't fit; let the card figure it out
+        return ''.join(grid.write_card(size, is_double) for grid in grids)
+
+    ps_chars = np.frombuffer(pss.encode('ascii'), dtype='uint8').reshape(ngrids, width)
+    cp_chars = _int_or_blank_chars(cps, width)
+    cd_chars = _int_or_blank_chars(cds, width)
+    seid_chars = _int_or_blank_chars(seids, width)
+    newline = np.full((ngrids, 1), ord('\n'), dtype='uint8')
+    if size == 8:
+        # the default cards stop after z
+        card_chars = np.hstack([
+            _string_chars('GRID    ', ngrids), _ints_to_chars(nids, 8), cp_chars,
+            xyz_chars[0], xyz_chars[1], xyz_chars[2], newline,
+            cd_chars, ps_chars, seid_chars, newline])
+        is_default = (cds == 0) & (seids == 0) & np.array([grid.ps == '' for grid in grids])
+        is_used = np.ones(card_chars.shape, dtype='bool')
+        is_used[is_default, 49:] = False
+        is_used[~is_default, 48] = False
+    else:
+        # the 16 field cards always have the 2nd line
+        card_chars = np.hstack([
+            _string_chars('GRID*   ', ngrids), _ints_to_chars(nids, 16), cp_chars,
+            xyz_chars[0], xyz_chars[1], newline,
+            _string_chars('*       ', ngrids), xyz_chars[2], cd_chars, ps_chars, seid_chars,
+            newline])
+        is_used = np.ones(card_chars.shape, dtype='bool')
+
+    card_lengths = is_used.sum(axis=1)
+    msg = card_chars[is_used].tobytes().decode('ascii')
+    comments = [grid.comment for grid in grids]
+    if not any(comments):
+        return msg
+
+    # add the comments in front of their card
+    offsets = np.hstack([0, np.cumsum(card_lengths)]).tolist()
+    return ''.join([comment + msg[offsets[i]:offsets[i + 1]]
+                    for i, comment in enumerate(comments)])
+
+
+def _int_or_blank_chars(values: np.ndarray, width: int) -> np.ndarray:
+    """formats the integers with 0 as a blank field"""
+    chars = _ints_to_chars(values, width)
+    chars[values == 0, :] = ord(' ')
+    return chars
+
+
+def _string_chars(string: str, nrows: int) -> np.ndarray:
+    """repeats a string as an (nrows, len(string)) uint8 array"""
+    chars = np.frombuffer(string.encode('ascii'), dtype='uint8')
+    return np.tile(chars, (nrows, 1))
+
+
 class POINT(BaseCard):
     """
     +-------+-----+----+----+----+----+
@@ -3,6 +3,8 @@ defines the following card:
  - PARAM
 """
 # pylint: disable=C0103,R0902,R0904,R0914
+import numpy as np
+
 from pyNastran.bdf.cards.base_card import BaseCard
 from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
 from pyNastran.bdf.bdf_interface.assign_type import (
@@ -307,6 +309,13 @@ class PARAM(BaseCard):
         values = -1
         return PARAM(key, values, comment='')
 
+    def _finalize_hdf5(self, encoding):
+        """hdf5 helper function"""
+        if isinstance(self.values, np.ndarray):
+            self.values = self.values.tolist()
+        self.values = [value.decode(encoding) if isinstance(value, bytes) else value
+                       for value in self.values]
+
     def __init__(self, key, values, comment=''):
         """
         Creates a PARAM card
@@ -1,4 +1,10 @@
+import os
+import copy
+import pickle
+import tracemalloc
 import unittest
+
+from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.cards.collpase_card import collapse_thru_by
 from pyNastran.bdf.bdf_interface.subcase_utils import expand_thru_case_control
 from pyNastran.bdf.cards.expand_card import expand_thru, expand_thru_by
@@ -150,6 +156,94 @@ class TestBaseCard(unittest.TestCase):
         expected = [1, 'THRU', 8]
         self.assertEqual(collapse_thru_by(data), expected, collapse_thru_by(data))
 
+    def test_slots(self):
+        """tests the cards that use ``__slots__``"""
+        model = _slots_model()
+        cards = list(model.nodes.values()) + list(model.elements.values())
+        assert len(cards) == 12, cards
+        for card in cards:
+            assert not hasattr(card, '__dict__'), card.type
+        model.elements[10].comment = 'cquad4'
+        model.elements[30].ifile = 2
+
+        model.cross_reference()
+        for card in cards:
+            card2 = copy.deepcopy(card)
+            assert card2.raw_fields() == card.raw_fields()
+            card3 = pickle.loads(pickle.dumps(card))
+            assert card3.write_card() == card.write_card()
+
+        assert model.nodes[1].object_attributes() == [
+            'cd', 'cd_ref', 'comment', 'cp', 'cp_ref', 'elements_ref',
+            'nid', 'ps', 'seid', 'type', 'xyz'], model.nodes[1].object_attributes()
+        assert 'pid_ref' in model.elements[10].object_attributes()
+        assert model.elements[10].pid_ref.pid == 1
+        assert model.elements[40].ga_ref.nid == 1
+        assert model.elements[30].nodes_ref[7].nid == 8
+
+        model.uncross_reference()
+        assert model.elements[10].pid_ref is None
+        assert model.elements[40].ga_ref is None
+
+        model.save(obj_filename='slots.obj', unxref=False)
+        model2 = BDF(debug=None)
+        model2.load(obj_filename='slots.obj')
+        os.remove('slots.obj')
+        assert model2.elements[10].comment == '$cquad4\n'
+        assert model2.elements[30].ifile == 2
+        model2.cross_reference()
+        assert model2.elements[20].nodes_ref[0] is model2.nodes[1]
+
+    def test_slots_memory(self):
+        """compares the memory of a slotted card to a card with a ``__dict__``"""
+        nnodes = 2000
+        model = BDF(debug=None)
+        for nid in range(1, nnodes+1):
+            model.add_grid(nid, [1., 2., 3.])
+        nodes = list(model.nodes.values())
+
+        # both copies share the xyz arrays, so we're just measuring the objects
+        bytes_slots = _get_bytes_per_card(lambda: [copy.copy(node) for node in nodes])
+        bytes_dict = _get_bytes_per_card(
+            lambda: [_DictCard(node, node.__slots__) for node in nodes])
+        assert bytes_slots < bytes_dict, (bytes_slots / nnodes, bytes_dict / nnodes)
+
+
+class _DictCard:
+    """stores the attributes of a card in a ``__dict__`` (the pre-slots layout)"""
+    def __init__(self, card, names):
+        for name in names + ('_comment', 'ifile'):
+            if hasattr(card, name):
+                setattr(self, name, getattr(card, name))
+
+
+def _get_bytes_per_card(func) -> int:
+    """gets the memory allocated by func; the return value of func must be kept"""
+    tracemalloc.start()
+    size0 = tracemalloc.get_traced_memory()[0]
+    unused_cards = func()
+    size1 = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size1 - size0
+
+
+def _slots_model() -> BDF:
+    """makes a model with each of the slotted cards"""
+    model = BDF(debug=None)
+    xyzs = [[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.],
+            [0., 0., 1.], [1., 0., 1.], [1., 1., 1.], [0., 1., 1.]]
+    for nid, xyz in enumerate(xyzs, start=1):
+        model.add_grid(nid, xyz)
+    model.add_cquad4(10, 1, [1, 2, 3, 4])
+    model.add_ctria3(20, 1, [1, 2, 3])
+    model.add_chexa(30, 2, [1, 2, 3, 4, 5, 6, 7, 8])
+    model.add_cbar(40, 3, [1, 2], [0., 0., 1.], None)
+    model.add_pshell(1, mid1=1, t=0.1)
+    model.add_psolid(2, 1)
+    model.add_pbar(3, 1)
+    model.add_mat1(1, 3.0e7, None, 0.3)
+    return model
+
 
 if __name__ == '__main__':
     unittest.main()
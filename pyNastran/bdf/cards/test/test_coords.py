@@ -952,6 +952,53 @@ class TestCoords(unittest.TestCase):
             coord.global_to_local
             coord.local_to_global
 
+    def test_coord_table(self):
+        """tests the cached coordinate systems and the batched transform"""
+        model = BDF(debug=False)
+        model.add_cord2r(1, [1., 2., 3.], [1., 2., 4.], [2., 3., 3.])
+        model.add_cord2c(2, [0., 1., 0.], [0., 1., 1.], [1., 1., 0.], rid=1)
+        model.add_grid(1, [1., 10., 1.], cp=2)
+        model.add_grid(2, [1., 10., 2.], cp=2)
+        model.add_grid(3, [1., 100., 1.], cp=2)
+        model.add_cord1s(3, 1, 2, 3)
+        model.add_grid(4, [2., 30., 60.], cp=3)
+        model.add_grid(5, [4., 5., 6.], cp=1)
+
+        coord_table = model.get_coord_table()
+        assert coord_table is model.get_coord_table()
+        assert coord_table.cids.tolist() == [0, 1, 2, 3]
+
+        nids = [1, 2, 3, 4, 5]
+        xyz_cp = np.array([model.nodes[nid].xyz for nid in nids])
+        cps = [model.nodes[nid].cp for nid in nids]
+        xyz_cid0 = model.transform_xyz_to_cid(xyz_cp, cps, cid=0)
+        xyz_cid2 = model.transform_xyz_to_cid(xyz_cp, cps, cid=2)
+        xyz_cid3 = model.transform_xyz_to_cid(xyz_cp, cps, cid=3)
+
+        model.cross_reference()
+        for cid in [1, 2, 3]:
+            coord = model.coords[cid]
+            assert allclose(coord_table.origins[cid], coord.origin), cid
+            assert allclose(coord_table.betas[cid], coord.beta()), cid
+        for i, nid in enumerate(nids):
+            node = model.nodes[nid]
+            assert allclose(xyz_cid0[i, :], node.get_position()), nid
+            assert allclose(xyz_cid2[i, :], node.get_position_wrt(model, 2)), nid
+            assert allclose(xyz_cid3[i, :], node.get_position_wrt(model, 3)), nid
+
+        # the table is rebuilt when a coord changes
+        model.coords[1].e1 = np.array([2., 2., 3.])
+        coord_table2 = model.get_coord_table()
+        assert coord_table2 is not coord_table
+        assert allclose(coord_table2.origins[1], [2., 2., 3.])
+        model.nodes[1].xyz[0] = 2.
+        assert model.get_coord_table() is not coord_table2
+
+        with self.assertRaises(KeyError):
+            model.transform_xyz_to_cid(xyz_cp, [0, 0, 0, 0, 10], cid=0)
+        with self.assertRaises(KeyError):
+            model.transform_xyz_to_cid(xyz_cp, cps, cid=10)
+
     def test_gmcord(self):
         """tests GMCORD"""
         cid = 1
@@ -7,6 +7,9 @@ import numpy as np
 #import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.cards.test.utils import save_load_deck
+from pyNastran.bdf.cards import deqatn
+from pyNastran.bdf.cards.deqatn import (
+    rss, ssq, avg, fortran_to_python_short, compile_function)
 
 
 #root_path = pyNastran.__path__[0]
@@ -489,5 +492,62 @@ class TestDEQATN(unittest.TestCase):
         ]
         model.add_card(deqatn_card, 'DEQATN', is_list=False)
 
+    def test_deqatn_cache_evaluate_many(self):
+        """the compiled equations are shared and may be evaluated for arrays"""
+        model = BDF(debug=None)
+        model.add_deqatn(1, ['f(x,y) = x*y + rss(x, y)'])
+        model.add_deqatn(2, ['f(x,y) = x*y + rss(x, y)'])
+        model.add_deqatn(3, ['f(x,y) = max(x, y) + dim(x, y)'])
+        model.cross_reference()
+
+        model2 = BDF(debug=None)
+        model2.add_deqatn(10, ['f(x,y) = x*y + rss(x, y)'])
+        model2.cross_reference()
+
+        eq1 = model.dequations[1]
+        assert eq1.func is model.dequations[2].func
+        assert eq1.func is model2.dequations[10].func
+
+        x = np.array([1., 2., 3., 4.])
+        y = np.array([2., 2., 1., 0.5])
+        out = eq1.evaluate_many(x, y)
+        expected = [eq1.evaluate(xi, yi) for xi, yi in zip(x, y)]
+        assert np.allclose(out, expected), out
+
+        # broadcasting a scalar
+        out = eq1.evaluate_many(x, 2.)
+        assert np.allclose(out, x * 2. + np.sqrt(x ** 2 + 4.)), out
+
+        # max doesn't support arrays, so it's evaluated one at a time
+        eq3 = model.dequations[3]
+        out = eq3.evaluate_many(x, y)
+        expected = [eq3.evaluate(xi, yi) for xi, yi in zip(x, y)]
+        assert np.allclose(out, expected), out
+
+        with self.assertRaises(RuntimeError):
+            eq1.evaluate_many(x, y, y)
+
+    def test_deqatn_sequence_functions(self):
+        """a single sequence is reduced; several arguments are elementwise"""
+        assert np.allclose(rss([3., 4.]), 5.)
+        assert np.allclose(ssq([3., 4.]), 25.)
+        assert np.allclose(avg([3., 4.]), 3.5)
+        assert np.allclose(rss(3., 4.), 5.)
+        assert np.allclose(rss(np.array([3., 6.]), np.array([4., 8.])), [5., 10.])
+        assert np.allclose(avg(np.array([3., 6.]), 1.), [2., 3.5])
+
+        # DRESP2 string equations are called with a list of the arguments
+        for name, expected in [('RSS', 5.), ('SSQ', 25.), ('AVG', 3.5), ('SUM', 7.)]:
+            func = fortran_to_python_short(name.lower(), None)
+            assert np.allclose(func([3., 4.]), expected), name
+
+    def test_deqatn_function_cache_size(self):
+        """the oldest equations are removed from a full cache"""
+        nfuncs = deqatn._FUNCTION_CACHE_SIZE + 10
+        funcs = [compile_function('func', 'def func(x):\n    return x + %i\n' % i)
+                 for i in range(nfuncs)]
+        assert len(deqatn._FUNCTION_CACHE) <= deqatn._FUNCTION_CACHE_SIZE
+        assert funcs[-1](1) == nfuncs
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -3,7 +3,7 @@ import unittest
 
 import numpy as np
 from pyNastran.bdf.bdf import BDF, BDFCard
-from pyNastran.bdf.cards.nodes import GRID, SPOINTs as SPOINT
+from pyNastran.bdf.cards.nodes import GRID, SPOINTs as SPOINT, write_grids
 
 class TestNodes(unittest.TestCase):
     def test_point(self):
@@ -141,6 +141,23 @@ class TestNodes(unittest.TestCase):
         self.assertEqual(n1.get_field(7), ps, msg='%s' % n1.get_field(7))
         self.assertEqual(n1.get_field(8), seid, msg='%s' % n1.get_field(8))
 
+    def test_write_grids(self):
+        """tests that write_grids is the same as GRID.write_card"""
+        grids = [
+            GRID(1, [0., 0., 0.]),
+            GRID(2, [1.5, -2.25, 1e-10], cp=1, comment='node 2'),
+            GRID(3, [1e20, -0.123456789, 12345678.], cd=-1, ps='123', seid=4),
+            GRID(12345678, [np.pi, -np.e, 0.001], cp=2, cd=3),
+        ]
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            expected = ''.join(grid.write_card(size, is_double) for grid in grids)
+            self.assertEqual(write_grids(grids, size, is_double), expected)
+
+        # the id doesn't fit in a small field, so the card writes it
+        grids.append(GRID(123456789, [0., 0., 0.]))
+        expected = ''.join(grid.write_card(8, False) for grid in grids)
+        self.assertEqual(write_grids(grids, 8, False), expected)
+        self.assertEqual(write_grids([], 8, False), '')
 
     def test_spoint_01(self):
         """tests SPOINT"""
@@ -1,11 +1,13 @@
 """defines various shell element tests"""
 import os
 import unittest
+import numpy as np
 from cpylog import SimpleLogger
 
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.cards.test.utils import save_load_deck
-from pyNastran.bdf.mesh_utils.mass_properties import mass_properties_nsm
+from pyNastran.bdf.mesh_utils.mass_properties import (
+    mass_properties_nsm, mass_properties_vectorized)
 import pyNastran
 
 PKG_PATH = pyNastran.__path__[0]
@@ -181,6 +183,8 @@ class TestNsm(unittest.TestCase):
                 if mass1 != mass1_expected:
                     unused_mass2 = mass_properties_nsm(model, nsm_id=nsm_id, debug=True)[0]
                     raise RuntimeError('nsm_id=%s mass != %s; mass1=%s' % (nsm_id, mass1_expected, mass1))
+                mass2 = mass_properties_vectorized(model, nsm_id=nsm_id)[0]
+                assert np.allclose(mass1, mass2), 'nsm_id=%s mass1=%s mass2=%s' % (nsm_id, mass1, mass2)
             #print('mass[%s] = %s' % (nsm_id, mass))
             #print('----------------------------------------------')
 
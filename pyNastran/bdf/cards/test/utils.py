@@ -85,6 +85,7 @@ def save_load_deck(model, xref='standard', punch=True, run_remove_unused=True,
         model3 = BDF(debug=False, log=model.log, mode='msc')
         model3.load(obj_filename='model.obj')
         os.remove('model.obj')
+        _run_snapshot(model2)
     else:
         model2.uncross_reference()
         model3 = model2
@@ -163,6 +164,20 @@ def _run_hdf5(model2, log, run_save_load_hdf5=True):
                 log.error(msg)
         os.remove(hdf5_filename)
 
+def _run_snapshot(model2):
+    """helper method"""
+    snapshot_filename = 'model.snapshot'
+    model2.save_snapshot(snapshot_filename)
+    model4 = BDF(log=model2.log)
+    model4.load_snapshot(snapshot_filename)
+    os.remove(snapshot_filename)
+
+    bdf_stream2 = StringIO()
+    model2.write_bdf(bdf_stream2, close=False)
+    bdf_stream4 = StringIO()
+    model4.write_bdf(bdf_stream4, close=False)
+    assert bdf_stream2.getvalue() == bdf_stream4.getvalue()
+
 def _run_mass_properties(model2, nnodes, nelements, run_mass_properties=True):
     """helper method"""
     if not(run_mass_properties and nelements):
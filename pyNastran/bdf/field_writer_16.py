@@ -3,11 +3,13 @@ Defines functions for single precision 16 character field writing.
 """
 import sys
 from typing import List, Union, Optional, Any
+import numpy as np
 from numpy import float32, isnan  # type: ignore
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.utils import wipe_empty_fields
-from pyNastran.bdf.field_writer_8 import set_blank_if_default
+from pyNastran.bdf.field_writer_8 import (
+    set_blank_if_default, _ints_to_fields, _floats_to_fields, _strings_to_fields)
 
 def set_string16_blank_if_default(value: Any, default: Any) -> str:
     """helper method for writing BDFs"""
@@ -290,3 +292,152 @@ def print_card_16(fields, wipe_fields=True):
     if not out.endswith('\n'):
         out += '\n'
     return out
+
+
+#: the (lower bound, upper bound, number of decimals) of the fixed point
+#: ranges of print_float_16; values outside these ranges use print_float_16
+FLOAT_16_POSITIVE_RANGES = [
+    (0.001, 1., 15)] + [(10. ** i, 10. ** (i + 1), 14 - i) for i in range(14)]
+FLOAT_16_NEGATIVE_RANGES = [
+    (-1., -0.01, 14)] + [(-10. ** (i + 1), -10. ** i, 13 - i) for i in range(13)]
+
+
+def print_int_16_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of integers with 16-character width fields
+
+    Parameters
+    ----------
+    values : (n, ) int ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : (n, ) '<U16' ndarray
+        the 16-character strings (same as ``'%16i' % value``)
+
+    """
+    return _ints_to_fields(values, 16)
+
+
+def print_float_16_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of floats in nastran 16-character width syntax.
+    This is the array version of ``print_float_16``; the output is the same.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print; nan is a blank field
+
+    Returns
+    -------
+    fields : (n, ) '<U16' ndarray
+        the 16-character strings
+
+    """
+    return _floats_to_fields(values, 16, FLOAT_16_POSITIVE_RANGES, FLOAT_16_NEGATIVE_RANGES,
+                             print_float_16)
+
+
+def print_field_16_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of values with 16-character width fields.
+    This is the array version of ``print_field_16``.
+
+    Parameters
+    ----------
+    values : (n, ) ndarray
+        int, float (nan is blank), str or object (None is blank) values
+
+    Returns
+    -------
+    fields : (n, ) '<U16' ndarray
+        the 16-character strings
+
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return print_int_16_array(values)
+    elif values.dtype.kind == 'f':
+        return print_float_16_array(values)
+    elif values.dtype.kind == 'U':
+        return _strings_to_fields(values, 16)
+    return np.array([print_field_16(value) for value in values.tolist()], dtype='<U16')
+
+
+def print_card_16_array(card_name: str, columns: List[np.ndarray],
+                        wipe_fields: bool=True) -> np.ndarray:
+    """
+    Prints many nastran-style cards with 16-character width fields.
+    This is the array version of ``print_card_16``.
+
+    Parameters
+    ----------
+    card_name : str
+        the name of the card (e.g., 'CQUAD4')
+    columns : List[ndarray]
+        the fields of the cards; columns[i][j] is field i+1 of card j
+        (see ``print_field_16_array``)
+    wipe_fields : bool; default=True
+        remove the trailing blank (None/''/nan) fields of each card
+
+    Returns
+    -------
+    cards : (ncards, ) str ndarray
+        the cards in large field format; ``''.join(cards)`` is the
+        text block
+
+    """
+    return _print_card_16_array(card_name, columns, print_field_16_array, wipe_fields)
+
+
+def _print_card_16_array(card_name: str, columns: List[np.ndarray],
+                         print_field_array: Any, wipe_fields: bool) -> np.ndarray:
+    """joins the formatted fields using the print_card_16 line rules"""
+    columns = [np.asarray(column) for column in columns]
+    nfields = len(columns)
+    nrows = len(columns[0]) if nfields else 1
+
+    # the number of fields on each card
+    nfields_card = np.full(nrows, nfields, dtype='int32')
+    if wipe_fields:
+        nfields_card[:] = 0
+        for ifield, column in enumerate(columns):
+            if column.dtype.kind == 'U':
+                column = np.char.strip(column)
+                is_blank = column == ''
+            elif column.dtype.kind == 'O':
+                column = np.array([value.strip() if isinstance(value, str) else value
+                                   for value in column.tolist()] + [None],
+                                  dtype=object)[:-1]
+                is_blank = np.array([value is None or value == '' for value in column.tolist()],
+                                    dtype='bool')
+            elif column.dtype.kind == 'f':
+                is_blank = np.isnan(column)
+            else:
+                is_blank = np.zeros(nrows, dtype='bool')
+            nfields_card[~is_blank] = ifield + 1
+            columns[ifield] = column
+    # the cards are padded to 2 lines of 4 fields
+    nlines_card = 2 * ((nfields_card + 7) // 8)
+
+    fields = [print_field_array(column) for column in columns]
+    blank = np.full(nrows, ' ' * 16, dtype='<U16')
+    nlines = 2 * ((nfields + 7) // 8)
+    fields += [blank] * (4 * nlines - nfields)
+
+    card = np.full(nrows, '%-8s' % (card_name + '*'), dtype=object)
+    for iline in range(nlines):
+        line = card if iline == 0 else np.full(nrows, '*       ', dtype=object)
+        for field in fields[4 * iline:4 * iline + 4]:
+            line = line + field.astype(object)
+        line = np.char.rstrip(line.astype(str), ' ')
+        if iline == 0:
+            card = line
+        else:
+            card = np.where(iline < nlines_card, np.char.add(np.char.add(card, '\n'), line),
+                            card)
+    # a card without fields is just the card name
+    card = np.where(nlines_card == 0, card_name.rstrip(' *'), card)
+    return np.char.add(card, '\n')
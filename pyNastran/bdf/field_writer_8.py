@@ -1,6 +1,7 @@
 """Defines functions for single precision 8 character field writing."""
 import sys
-from typing import List, Union, Any
+from typing import List, Tuple, Union, Any
+import numpy as np
 from numpy import float32, isnan
 
 
@@ -403,3 +404,329 @@ def print_int_card_blocks(fields_blocks: List[Any]) -> str:
             raise SyntaxError('is_all_ints must be a boolean.  is_all_ints=%r' % is_all_ints)
     out = out.rstrip(' \n') + '\n'  # removes blank lines at the end of cards
     return out
+
+
+#: the (lower bound, upper bound, number of decimals) of the fixed point
+#: ranges of print_float_8; values outside these ranges use print_float_8
+FLOAT_8_POSITIVE_RANGES = [
+    (0.001, 1., 7), (1., 10., 6), (10., 100., 5), (100., 1000., 4),
+    (1000., 10000., 3), (10000., 100000., 2), (100000., 1000000., 1),
+]
+FLOAT_8_NEGATIVE_RANGES = [
+    (-1., -0.01, 6), (-10., -1., 5), (-100., -10., 4), (-1000., -100., 3),
+    (-10000., -1000., 2), (-100000., -10000., 1),
+]
+
+
+def print_int_8_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of integers with 8-character width fields
+
+    Parameters
+    ----------
+    values : (n, ) int ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : (n, ) '<U8' ndarray
+        the 8-character strings (same as ``'%8i' % value``)
+
+    """
+    return _ints_to_fields(values, 8)
+
+
+def print_float_8_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of floats in nastran 8-character width syntax.
+    This is the array version of ``print_float_8``; the output is the same.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print; nan is a blank field
+
+    Returns
+    -------
+    fields : (n, ) '<U8' ndarray
+        the 8-character strings
+
+    """
+    return _floats_to_fields(values, 8, FLOAT_8_POSITIVE_RANGES, FLOAT_8_NEGATIVE_RANGES,
+                             print_float_8)
+
+
+def print_field_8_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of values with 8-character width fields.
+    This is the array version of ``print_field_8``.
+
+    Parameters
+    ----------
+    values : (n, ) ndarray
+        int, float (nan is blank), str or object (None is blank) values
+
+    Returns
+    -------
+    fields : (n, ) '<U8' ndarray
+        the 8-character strings
+
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return print_int_8_array(values)
+    elif values.dtype.kind == 'f':
+        return print_float_8_array(values)
+    elif values.dtype.kind == 'U':
+        return _strings_to_fields(values, 8)
+    return np.array([print_field_8(value) for value in values.tolist()], dtype='<U8')
+
+
+def print_card_8_array(card_name: str, columns: List[np.ndarray]) -> np.ndarray:
+    """
+    Prints many nastran-style cards with 8-character width fields.
+    This is the array version of ``print_card_8``.
+
+    Parameters
+    ----------
+    card_name : str
+        the name of the card (e.g., 'CQUAD4')
+    columns : List[ndarray]
+        the fields of the cards; columns[i][j] is field i+1 of card j
+        (see ``print_field_8_array``)
+
+    Returns
+    -------
+    cards : (ncards, ) str ndarray
+        the cards in small field format; ``''.join(cards)`` is the
+        text block
+
+    .. code-block:: python
+
+       >>> eids = np.array([10, 11])
+       >>> mass = np.array([1.0, 2.5])
+       >>> cards = print_card_8_array('CONM2', [eids, np.array([1, 2]), mass])
+       >>> print(''.join(cards))
+       CONM2         10       1      1.
+       CONM2         11       2     2.5
+
+    """
+    fields = [print_field_8_array(column) for column in columns]
+    return _join_card_fields_8(card_name, fields)
+
+
+def _join_card_fields_8(card_name: str, fields: List[np.ndarray]) -> np.ndarray:
+    """joins the formatted fields using the print_card_8 line rules"""
+    nfields = len(fields)
+    nrows = len(fields[0]) if nfields else 1
+    first_line = np.full(nrows, '%-8s' % card_name, dtype=object)
+    lines = []
+    for ifield in range(0, nfields, 8):
+        line = first_line if ifield == 0 else np.full(nrows, '        ', dtype=object)
+        for field in fields[ifield:ifield + 8]:
+            line = line + field.astype(object)
+        lines.append(line.astype(str))
+
+    # full lines are stripped and blank continuation lines are written as '+'
+    card = None
+    for iline, line in enumerate(lines):
+        is_full_line = 8 * (iline + 1) <= nfields
+        if is_full_line:
+            line = np.char.rstrip(line, ' ')
+            if iline > 0:
+                line = np.where(line == '', '+', line)
+        card = line if card is None else np.char.add(np.char.add(card, '\n'), line)
+    if card is None:
+        card = first_line.astype(str)
+    return np.char.add(np.char.rstrip(card, ' \n+'), '\n')
+
+
+def _strings_to_fields(values: np.ndarray, width: int) -> np.ndarray:
+    """right justifies the strings (e.g., '%8s' % value)"""
+    fields = np.char.rjust(values, width)
+    _check_field_width(fields, values, width)
+    return fields.astype('<U%d' % width)
+
+
+def _check_field_width(fields: np.ndarray, values: np.ndarray, width: int) -> None:
+    """the fields must have a length of ``width``"""
+    lengths = np.char.str_len(fields)
+    if (lengths != width).any():
+        i = np.where(lengths != width)[0][0]
+        msg = 'field=%r is not %d characters long...raw_value=%r' % (
+            fields[i], width, values[i])
+        raise RuntimeError(msg)
+
+
+def _ints_to_fields(values: np.ndarray, width: int) -> np.ndarray:
+    """formats integers as right justified strings (e.g., '%8i' % value)"""
+    return _chars_to_fields(_ints_to_chars(values, width), width)
+
+
+def _ints_to_chars(values: np.ndarray, width: int) -> np.ndarray:
+    """formats integers as an (n, width) uint8 array of right justified characters"""
+    values = np.asarray(values, dtype='int64')
+    nvalues = len(values)
+    is_negative = values < 0
+    abs_values = np.abs(values)
+    ndigits = _get_ndigits(abs_values)
+    nchars = ndigits + is_negative
+    if nvalues and nchars.max() > width:
+        i = np.argmax(nchars > width)
+        msg = 'field=%r is not %d characters long...raw_value=%r' % (
+            '%*i' % (width, values[i]), width, values[i])
+        raise RuntimeError(msg)
+
+    chars = np.full((nvalues, width), ord(' '), dtype='uint8')
+    _fill_digits(chars, abs_values, ndigits, width - 1)
+    rows = np.where(is_negative)[0]
+    chars[rows, width - nchars[rows]] = ord('-')
+    return chars
+
+
+def _floats_to_fields(values: np.ndarray, width: int,
+                      positive_ranges: List[Tuple[float, float, int]],
+                      negative_ranges: List[Tuple[float, float, int]],
+                      print_float: Any) -> np.ndarray:
+    """formats floats as strings (see ``_floats_to_chars``)"""
+    values = np.asarray(values, dtype='float64')
+    chars, is_done = _floats_to_chars(values, width, positive_ranges, negative_ranges)
+    return _fill_fields(chars, values, is_done, print_float)
+
+
+def _floats_to_chars(values: np.ndarray, width: int,
+                     positive_ranges: List[Tuple[float, float, int]],
+                     negative_ranges: List[Tuple[float, float, int]]) -> Tuple[np.ndarray,
+                                                                              np.ndarray]:
+    """
+    Formats the floats that are written in fixed point notation (e.g.,
+    ``('%8.6f' % value).strip(' 0')``) with integer math.  The other
+    values (e.g., scientific notation, blanks, values that are too close
+    to a rounding tie) aren't done and must use the scalar print method.
+
+    Returns
+    -------
+    chars : (n, width) uint8 ndarray
+        the right justified characters
+    is_done : (n, ) bool ndarray
+        was the value formatted
+
+    """
+    values = np.asarray(values, dtype='float64')
+    nvalues = len(values)
+    chars = np.full((nvalues, width), ord(' '), dtype='uint8')
+    is_done = np.zeros(nvalues, dtype='bool')
+
+    # positive ranges are [lower, upper); negative ranges are (lower, upper]
+    ranges = [(lower, upper, ndecimal, False) for lower, upper, ndecimal in positive_ranges]
+    ranges += [(lower, upper, ndecimal, True) for lower, upper, ndecimal in negative_ranges]
+    for lower, upper, ndecimal, is_negative in ranges:
+        if is_negative:
+            irange = np.where((values > lower) & (values <= upper))[0]
+        else:
+            irange = np.where((values >= lower) & (values < upper))[0]
+        if len(irange) == 0:
+            continue
+
+        # '%.nf' rounds the exact value half to even, so values that
+        # are near a tie (after scaling) are written with print_float
+        scaled = np.abs(values[irange]) * 10. ** ndecimal
+        floor = np.floor(scaled)
+        is_tie = np.abs(scaled - floor - 0.5) <= 4. * np.spacing(scaled)
+        irange = irange[~is_tie]
+        scaled = np.rint(scaled[~is_tie]).astype('int64')
+
+        power = 10 ** ndecimal
+        integer = scaled // power
+        decimal = scaled % power
+
+        # strip the trailing zeros of the decimal and the leading 0 of the integer
+        ndecimal_digits = np.full(len(irange), ndecimal, dtype='int64')
+        for unused_i in range(ndecimal):
+            is_zero = (decimal % 10 == 0) & (ndecimal_digits > 0)
+            if not is_zero.any():
+                break
+            decimal[is_zero] //= 10
+            ndecimal_digits[is_zero] -= 1
+        ninteger_digits = _get_ndigits(integer)
+        ninteger_digits[integer == 0] = 0
+        nchars = ninteger_digits + 1 + ndecimal_digits + is_negative
+
+        is_valid = nchars <= width
+        irange = irange[is_valid]
+        charsi = np.full((len(irange), width), ord(' '), dtype='uint8')
+        _fill_digits(charsi, decimal[is_valid], ndecimal_digits[is_valid], width - 1)
+        idot = width - 1 - ndecimal_digits[is_valid]
+        charsi[np.arange(len(irange)), idot] = ord('.')
+        _fill_digits(charsi, integer[is_valid], ninteger_digits[is_valid], idot - 1)
+        if is_negative:
+            charsi[np.arange(len(irange)), width - nchars[is_valid]] = ord('-')
+        chars[irange, :] = charsi
+        is_done[irange] = True
+    return chars, is_done
+
+
+def _fill_fields(chars: np.ndarray, values: np.ndarray, is_done: np.ndarray,
+                 print_float: Any) -> np.ndarray:
+    """converts ``chars`` to strings and prints the values that aren't done"""
+    width = chars.shape[1]
+    fields = _chars_to_fields(chars, width)
+    ifallback = np.where(~is_done)[0]
+    if len(ifallback):
+        fallback = [print_float(value) for value in values[ifallback].tolist()]
+        # print_float may return a longer field (e.g., a 3 digit exponent)
+        max_length = max(len(field) for field in fallback)
+        if max_length > width:
+            fields = fields.astype('<U%d' % max_length)
+        fields[ifallback] = fallback
+    return fields
+
+
+def _fill_chars(chars: np.ndarray, values: np.ndarray, is_done: np.ndarray,
+                print_float: Any) -> bool:
+    """
+    Prints the values that aren't done into ``chars``.  Returns False
+    if one of the fields isn't ``width`` characters long.
+    """
+    width = chars.shape[1]
+    ifallback = np.where(~is_done)[0]
+    if len(ifallback) == 0:
+        return True
+    fallback = ''.join(print_float(value) for value in values[ifallback].tolist())
+    if len(fallback) != width * len(ifallback):
+        return False
+    chars[ifallback, :] = np.frombuffer(fallback.encode('ascii'), dtype='uint8').reshape(
+        len(ifallback), width)
+    return True
+
+
+def _get_ndigits(values: np.ndarray) -> np.ndarray:
+    """gets the number of digits in positive integers (0 has 1 digit)"""
+    ndigits = np.ones(len(values), dtype='int64')
+    power = 10
+    for unused_i in range(18):
+        is_bigger = values >= power
+        if not is_bigger.any():
+            break
+        ndigits += is_bigger
+        power *= 10
+    return ndigits
+
+
+def _fill_digits(chars: np.ndarray, values: np.ndarray, ndigits: np.ndarray,
+                 ilast: Union[int, np.ndarray]) -> None:
+    """writes the digits of ``values`` to ``chars`` ending at column ``ilast``"""
+    if len(values) == 0:
+        return
+    irows = np.arange(len(values))
+    ilast = np.broadcast_to(ilast, values.shape)
+    values = values.copy()
+    for idigit in range(ndigits.max()):
+        is_digit = idigit < ndigits
+        chars[irows[is_digit], ilast[is_digit] - idigit] = ord('0') + values[is_digit] % 10
+        values //= 10
+
+
+def _chars_to_fields(chars: np.ndarray, width: int) -> np.ndarray:
+    """converts an (n, width) uint8 array to a '<Uwidth' array"""
+    return np.ascontiguousarray(chars).view('S%d' % width).ravel().astype('<U%d' % width)
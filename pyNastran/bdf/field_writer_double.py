@@ -2,9 +2,13 @@
 Defines functions for double precision 16 character field writing.
 """
 import sys
-from typing import List, Union
+from typing import List, Tuple, Union
+import numpy as np
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.utils import wipe_empty_fields
+from pyNastran.bdf.field_writer_8 import (
+    _ints_to_fields, _strings_to_fields, _fill_digits, _fill_fields)
+from pyNastran.bdf.field_writer_16 import _print_card_16_array
 
 def print_scientific_double(value: float) -> str:
     """
@@ -116,3 +120,146 @@ def print_card_double(fields: List[Union[int, float, str, None]], wipe_fields: b
     if not out.endswith('\n'):
         out += '\n'
     return out
+
+
+def print_scientific_double_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of floats in 16-character scientific double precision.
+    This is the array version of ``print_scientific_double``.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    fields : (n, ) '<U16' ndarray
+        the 16-character strings (e.g., 5.0000000000D+01)
+
+    """
+    values = np.asarray(values, dtype='float64')
+    chars, is_done = _scientific_double_to_chars(values)
+    return _fill_fields(chars, values, is_done, print_scientific_double)
+
+
+def _scientific_double_to_chars(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Formats the floats in 16-character scientific double precision with
+    integer math.  Some values (e.g., 0., nan, values that are too close
+    to a rounding tie) aren't done and must use print_scientific_double.
+
+    Returns
+    -------
+    chars : (n, 16) uint8 ndarray
+        the characters
+    is_done : (n, ) bool ndarray
+        was the value formatted
+
+    """
+    nvalues = len(values)
+    chars = np.full((nvalues, 16), ord(' '), dtype='uint8')
+
+    # 0, nan, inf and 3 digit exponents use print_scientific_double
+    abs_values = np.abs(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exponent = np.floor(np.log10(abs_values))
+    is_valid = np.isfinite(exponent) & (np.abs(exponent) < 98)
+    ivalid = np.where(is_valid)[0]
+    exponent = exponent[ivalid].astype('int64')
+    is_negative = values[ivalid] < 0.
+
+    # positive numbers have 11 significant digits; negative have 10
+    ndigits = np.where(is_negative, 10, 11)
+    scaled = abs_values[ivalid] * 10. ** (ndigits - 1 - exponent).astype('float64')
+
+    # log10 may be off by 1 and '%e' rounds the exact value half to even,
+    # so values that are near a tie (after scaling) are left to print_scientific_double
+    mantissa = np.rint(scaled).astype('int64')
+    upper = 10 ** ndigits
+    lower = 10 ** (ndigits - 1)
+    is_carry = mantissa == upper
+    mantissa[is_carry] //= 10
+    exponent[is_carry] += 1
+    is_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= 8. * np.spacing(scaled)
+    is_ok = ~is_tie & (mantissa >= lower) & (mantissa < upper) & (np.abs(exponent) < 100)
+    ivalid = ivalid[is_ok]
+    mantissa = mantissa[is_ok]
+    exponent = exponent[is_ok]
+    is_negative = is_negative[is_ok]
+    ndigits = ndigits[is_ok]
+    lower = lower[is_ok]
+
+    # d.ddddddddddD+ee (positive) or -d.dddddddddD+ee (negative)
+    nrows = len(ivalid)
+    irows = np.arange(nrows)
+    charsi = np.full((nrows, 16), ord(' '), dtype='uint8')
+    abs_exponent = np.abs(exponent)
+    charsi[:, 15] = ord('0') + abs_exponent % 10
+    charsi[:, 14] = ord('0') + abs_exponent // 10
+    charsi[:, 13] = np.where(exponent < 0, ord('-'), ord('+'))
+    charsi[:, 12] = ord('D')
+    _fill_digits(charsi, mantissa % lower, ndigits - 1, 11)
+    istart = 16 - 5 - ndigits
+    charsi[irows, istart + 1] = ord('.')
+    charsi[irows, istart] = ord('0') + mantissa // lower
+    charsi[irows[is_negative], 0] = ord('-')
+    chars[ivalid, :] = charsi
+
+    is_done = np.zeros(nvalues, dtype='bool')
+    is_done[ivalid] = True
+    return chars, is_done
+
+
+def print_field_double_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of values with 16-character width fields.
+    This is the array version of ``print_field_double``.
+
+    Parameters
+    ----------
+    values : (n, ) ndarray
+        int, float64 (nan is blank), str or object (None is blank) values
+
+    Returns
+    -------
+    fields : (n, ) '<U16' ndarray
+        the 16-character strings
+
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return _ints_to_fields(values, 16)
+    elif values.dtype == 'float64':
+        fields = print_scientific_double_array(values)
+        fields[np.isnan(values)] = ' ' * 16
+        return fields
+    elif values.dtype.kind == 'U':
+        return _strings_to_fields(values, 16)
+    return np.array([print_field_double(value) for value in values.tolist()], dtype='<U16')
+
+
+def print_card_double_array(card_name: str, columns: List[np.ndarray],
+                            wipe_fields: bool=True) -> np.ndarray:
+    """
+    Prints many nastran-style cards with 16-character width fields.
+    This is the array version of ``print_card_double``.
+
+    Parameters
+    ----------
+    card_name : str
+        the name of the card (e.g., 'GRID')
+    columns : List[ndarray]
+        the fields of the cards; columns[i][j] is field i+1 of card j
+        (see ``print_field_double_array``)
+    wipe_fields : bool; default=True
+        remove the trailing blank (None/''/nan) fields of each card
+
+    Returns
+    -------
+    cards : (ncards, ) str ndarray
+        the cards in large field format; ``''.join(cards)`` is the
+        text block
+
+    """
+    return _print_card_16_array(card_name, columns, print_field_double_array, wipe_fields)
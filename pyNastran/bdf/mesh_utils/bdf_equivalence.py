@@ -6,10 +6,12 @@ defines:
                                   size=8, is_double=False,
                                   remove_collapsed_elements=False,
                                   avoid_collapsed_elements=False,
-                                  crash_on_collapse=False, log=None, debug=True)
+                                  crash_on_collapse=False, log=None, debug=True,
+                                  method='new', nworkers=1, tile_size=None)
 
 """
-from itertools import combinations
+from itertools import combinations, product
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict, Union, Optional, Any
 import numpy as np
 from numpy import (array, unique, arange, searchsorted,
@@ -31,7 +33,8 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
                           remove_collapsed_elements: bool=False,
                           avoid_collapsed_elements: bool=False,
                           crash_on_collapse: bool=False,
-                          log=None, debug: bool=True, method: str='new'):
+                          log=None, debug: bool=True, method: str='new',
+                          nworkers: int=1, tile_size: Optional[float]=None):
     """
     Equivalences nodes; keeps the lower node id; creates two nodes with the same
 
@@ -48,6 +51,7 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
         should the nodes be renumbered (default=False)
     neq_max : int
         the number of "close" points (default=4)
+        (not supported with method='union_find')
     xref : bool
         does the model need to be cross_referenced
         (default=True; only applies to model option)
@@ -59,10 +63,12 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
     is_double : bool; default=False
         the field precision to write
     remove_collapsed_elements : bool; default=False (unsupported)
+        (raises a NotImplementedError with method='union_find')
         True  : 1D/2D/3D elements will not be collapsed;
                 CELASx/CDAMP/MPC/etc. are not considered
         False : no elements will be removed
     avoid_collapsed_elements : bool; default=False (unsupported)
+        (raises a NotImplementedError with method='union_find')
         True  : only collapses that don't break 1D/2D/3D elements will be considered;
                 CELASx/CDAMP/MPC/etc. are considered
         False : element can be collapsed
@@ -77,6 +83,19 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
     method: str; default='new'
         'new': doesn't require neq_max; new in v1.3
         'old': use neq_max; used in v1.2
+        'union_find': doesn't require neq_max; finds all the pairs of
+                      nodes within tol (optionally in spatial tiles) and
+                      merges each group of connected nodes into the lowest
+                      node id, so chains (e.g., 3->2->1) are fully merged
+    nworkers : int; default=1
+        the number of threads used to search the tiles
+        (only applies to method='union_find')
+    tile_size : float; default=None
+        the edge length of the cubic tiles that the nodes are binned into;
+        each tile is searched with its own kdtree, which limits the memory
+        for very large meshes.  Must be greater than tol.
+        None : one tile (nworkers=1) or ~nworkers tiles per axis
+        (only applies to method='union_find')
     log : logger(); default=None
         bdf logging
 
@@ -96,6 +115,25 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
     """
     if not isinstance(tol, float):
         tol = float(tol)
+    if method == 'union_find':
+        if remove_collapsed_elements or avoid_collapsed_elements:
+            raise NotImplementedError(
+                "remove_collapsed_elements/avoid_collapsed_elements are not supported "
+                "with method='union_find'")
+        if neq_max != 4:
+            raise ValueError("neq_max=%r is not used by method='union_find'; "
+                             "all the nodes within tol are merged" % neq_max)
+        model = _eq_nodes_union_find(
+            bdf_filename, tol, renumber_nodes=renumber_nodes, xref=xref,
+            node_set=node_set, nworkers=nworkers, tile_size=tile_size,
+            log=log, debug=debug)
+        if bdf_filename_out is not None:
+            model.write_bdf(bdf_filename_out, size=size, is_double=is_double)
+        if crash_on_collapse:
+            model2 = BDF(log=log, debug=debug)
+            model2.read_bdf(bdf_filename_out)
+        return model
+
     nodes_xyz, model, nids, inew = _eq_nodes_setup(
         bdf_filename, tol, renumber_nodes=renumber_nodes,
         xref=xref, node_set=node_set, log=log, debug=debug)
@@ -458,6 +496,206 @@ def _eq_nodes_build_tree_new(kdt,
 
     return kdt, nid_pairs
 
+def _eq_nodes_union_find(bdf_filename, tol: float,
+                         renumber_nodes: bool=False, xref: bool=True,
+                         node_set=None, nworkers: int=1,
+                         tile_size: Optional[float]=None,
+                         log=None, debug: bool=True) -> BDF:
+    """helper function for ``bdf_equivalence_nodes`` with method='union_find'"""
+    if node_set is not None and renumber_nodes:
+        raise NotImplementedError('node_set is not None & renumber_nodes=True')
+    model = get_bdf_model(bdf_filename, xref=xref, log=log, debug=debug)
+    nids, nodes_xyz = _get_nids_xyz_cid0_array(model, node_set)
+    if len(nids) == 0:
+        return model
+
+    pairs = _find_close_node_pairs(nodes_xyz, tol, tile_size=tile_size, nworkers=nworkers)
+    iroot = _union_find(len(nids), pairs)
+    _eq_nodes_final_union_find(model, nids, iroot)
+    return model
+
+def _get_nids_xyz_cid0_array(model: BDF,
+                             node_set=None) -> Tuple[NDArrayNint, NDArrayN3float]:
+    """
+    Gets the sorted GRID ids and their global positions; the SPOINTs and
+    EPOINTs are not included
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    node_set : List[int] / (n, ) ndarray; default=None
+        the nodes to consider
+
+    """
+    if len(model.nodes) == 0:
+        return np.zeros(0, dtype='int32'), np.zeros((0, 3), dtype='float64')
+    nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(
+        cid=0, fdtype='float64', idtype='int32')[:2]
+    all_nids = nid_cp_cd[:, 0]
+    nids = array(sorted(model.nodes), dtype='int32')
+    if node_set is not None:
+        assert len(node_set) > 0, node_set
+        node_set = unique(asarray(list(node_set), dtype='int32'))
+        diff_nodes = setdiff1d(node_set, nids)
+        if len(diff_nodes) != 0:
+            msg = ('The following nodes cannot be found, but are included'
+                   ' in the reduced set; nids=%s' % diff_nodes)
+            raise RuntimeError(msg)
+        nids = node_set
+    inids = searchsorted(all_nids, nids)
+    return nids, xyz_cid0[inids, :]
+
+def _find_close_node_pairs(nodes_xyz: NDArrayN3float, tol: float,
+                           tile_size: Optional[float]=None,
+                           nworkers: int=1) -> NDArrayNint:
+    """
+    Finds all the pairs of nodes that are within tol of each other
+
+    The nodes are binned into cubic tiles of tile_size.  Each tile is
+    searched with a kdtree of the nodes in the tile and the nodes of the
+    neighboring tiles that are within tol of the tile, so only one tile
+    is in memory per worker.  A pair is kept by the tile of the lower
+    index, so every pair is found once.
+
+    Parameters
+    ----------
+    nodes_xyz : (nnodes, 3) float ndarray
+        the xyzs to equivalence
+    tol : float
+        the spherical equivalence tolerance
+    tile_size : float; default=None
+        the edge length of a tile; must be greater than tol
+        None : one tile (nworkers=1) or ~nworkers tiles per axis
+    nworkers : int; default=1
+        the number of threads
+
+    Returns
+    -------
+    pairs : (npairs, 2) int ndarray
+        the sorted (i, j) indices of the nodes, where i < j
+
+    """
+    nnodes = nodes_xyz.shape[0]
+    xyz_min = nodes_xyz.min(axis=0)
+    extent = (nodes_xyz.max(axis=0) - xyz_min).max()
+    if tile_size is None:
+        if nworkers == 1:
+            tile_size = 2. * extent + 2. * tol
+        else:
+            tile_size = max(extent / nworkers, 2. * tol)
+    if tile_size <= tol:
+        raise ValueError('tile_size=%s must be greater than tol=%s' % (tile_size, tol))
+    # pad the tolerance slightly, so round off at the tile boundaries is safe
+    tol_tile = tol + 1e-8 * tile_size
+
+    # bin the nodes
+    ijk = np.floor((nodes_xyz - xyz_min) / tile_size).astype('int64')
+    nijk = ijk.max(axis=0) + 1
+    tile_ids = (ijk[:, 0] * nijk[1] + ijk[:, 1]) * nijk[2] + ijk[:, 2]
+    isort = np.argsort(tile_ids, kind='stable')
+    utile_ids, istart, ncount = unique(
+        tile_ids[isort], return_index=True, return_counts=True)
+    tiles = {tile_id: isort[i0:i0 + n]
+             for tile_id, i0, n in zip(utile_ids.tolist(), istart.tolist(), ncount.tolist())}
+    offsets = list(product([-1, 0, 1], repeat=3))
+
+    def _find_tile_pairs(tile_id):
+        """finds the pairs for the nodes in one tile"""
+        inodes = tiles[tile_id]
+        i, j, k = ijk[inodes[0]]
+        inodes_tile = [inodes]
+        for di, dj, dk in offsets:
+            if di == dj == dk == 0:
+                continue
+            ii, jj, kk = i + di, j + dj, k + dk
+            if not (0 <= ii < nijk[0] and 0 <= jj < nijk[1] and 0 <= kk < nijk[2]):
+                continue
+            neighbor = tiles.get((ii * nijk[1] + jj) * nijk[2] + kk)
+            if neighbor is not None:
+                inodes_tile.append(neighbor)
+
+        inodes_tile = np.hstack(inodes_tile)
+        if len(inodes_tile) > len(inodes):
+            # only keep the neighbor nodes within tol of the tile
+            lower = xyz_min + ijk[inodes[0]] * tile_size - tol_tile
+            upper = lower + tile_size + 2 * tol_tile
+            xyz = nodes_xyz[inodes_tile, :]
+            is_close = np.all((xyz >= lower) & (xyz <= upper), axis=1)
+            is_close[:len(inodes)] = True
+            inodes_tile = inodes_tile[is_close]
+
+        kdt = _get_tree(nodes_xyz[inodes_tile, :])
+        ipairs = kdt.query_pairs(tol, output_type='ndarray')
+        if len(ipairs) == 0:
+            return ipairs.reshape(0, 2)
+        pairs = np.sort(inodes_tile[ipairs], axis=1)
+        is_owner = tile_ids[pairs[:, 0]] == tile_id
+        return pairs[is_owner, :]
+
+    if nworkers > 1 and len(tiles) > 1:
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            pairs_list = list(executor.map(_find_tile_pairs, tiles))
+    else:
+        pairs_list = [_find_tile_pairs(tile_id) for tile_id in tiles]
+    pairs = np.vstack(pairs_list) if pairs_list else np.zeros((0, 2), dtype='int64')
+    assert pairs.max(initial=0) < max(nnodes, 1)
+    return pairs
+
+def _union_find(nnodes: int, pairs: NDArrayNint) -> NDArrayNint:
+    """
+    Finds the groups of connected nodes
+
+    Parameters
+    ----------
+    nnodes : int
+        the number of nodes
+    pairs : (npairs, 2) int ndarray
+        the (i, j) indices of the connected nodes
+
+    Returns
+    -------
+    iroot : (nnodes, ) int ndarray
+        the lowest node index in the group of each node
+
+    """
+    parent = arange(nnodes)
+    if len(pairs) == 0:
+        return parent
+    inode1 = pairs[:, 0]
+    inode2 = pairs[:, 1]
+    while 1:
+        # link the higher root to the lower root
+        root1 = parent[inode1]
+        root2 = parent[inode2]
+        is_linked = root1 == root2
+        if is_linked.all():
+            break
+        root1 = root1[~is_linked]
+        root2 = root2[~is_linked]
+        np.minimum.at(parent, np.maximum(root1, root2), np.minimum(root1, root2))
+
+        # path compression
+        while 1:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    return parent
+
+def _eq_nodes_final_union_find(model: BDF, nids: NDArrayNint, iroot: NDArrayNint) -> None:
+    """apply nodal equivalencing to model; the lowest node id in each group is kept"""
+    iremove = np.where(iroot != arange(len(nids)))[0]
+    for nid2, nid1 in zip(nids[iremove].tolist(), nids[iroot[iremove]].tolist()):
+        node1 = model.nodes[nid1]
+        node2 = model.nodes[nid2]
+        node2.nid = node1.nid
+        node2.xyz = node1.xyz
+        node2.cp = node1.cp
+        assert node2.cd == node1.cd
+        assert node2.ps == node1.ps
+        assert node2.seid == node1.seid
+
 def _get_tree(nodes_xyz, msg=''):
     """gets the kdtree"""
     assert isinstance(nodes_xyz, np.ndarray), type(nodes_xyz)
@@ -1,11 +1,14 @@
 """
 defines:
-  - extract_bodies(bdf_filename)
+  - extract_bodies(bdf_filename, mpc_id=0)
+  - extract_bodies_arrays(bdf_filename, mpc_id=None)
 
 """
-from collections import defaultdict
+from itertools import chain
 import numpy as np
-from pyNastran.bdf.bdf import BDF, read_bdf, print_card_16
+import scipy.sparse
+from scipy.sparse.csgraph import connected_components
+from pyNastran.bdf.bdf import BDF, read_bdf
 
 def extract_bodies(bdf_filename, mpc_id=0):
     """
@@ -21,6 +24,14 @@ def extract_bodies(bdf_filename, mpc_id=0):
         >0 : use this MPC set
         not supported
 
+    Returns
+    -------
+    body_eids : Dict[ibody] = Set[eid]
+        ibody : int
+            the body id; starts from 0
+        eid : int
+            an element id or a rigid element id + max(model.elements)
+
     Considers:
      - elements
      - rigid_elements
@@ -31,18 +42,72 @@ def extract_bodies(bdf_filename, mpc_id=0):
       - MPCADD
       - DMIx
 
-    Doesn't support:
-      - xref
-      - duplicate element ids
-      - large values
+    .. seealso:: ``extract_bodies_arrays`` for the masses, MPCs and
+                 the unshifted rigid element ids
+
+    """
+    model = _get_model(bdf_filename)
+    rigid_offset = 0
+    if len(model.elements):
+        rigid_offset = max(model.elements)
+    body_eids = {}
+    for ibody, (eids, rigid_eids, unused_mass_ids) in _extract_bodies(
+            model, mpc_id=None, consider_masses=False).items():
+        body_eids[ibody] = set(eids.tolist()) | set((rigid_eids + rigid_offset).tolist())
+    return body_eids
+
+def extract_bodies_arrays(bdf_filename, mpc_id=None):
+    """
+    Finds the isolated bodies
+
+    The elements, rigid elements, masses and MPCs are the rows of a
+    sparse element-node incidence matrix and the bodies are the
+    connected components of the element-node graph.
+
+    Parameters
+    ----------
+    bdf_filename : str/BDF
+        str : the path the the *.bdf file
+        BDF : a BDF() boject
+    mpc_id : int; default=None
+        None : don't consider MPCs
+        0 : consider all MPCs
+        >0 : use this MPC set (includes MPCADDs)
+
+    Returns
+    -------
+    body_eids : Dict[ibody] = [eids, rigid_eids, mass_ids]
+        ibody : int
+            the body id; starts from 0 and is ordered by the lowest
+            element, then rigid element, then mass id
+        eids : (n, ) int ndarray
+            the sorted element ids
+        rigid_eids : (n, ) int ndarray
+            the sorted rigid element ids
+        mass_ids : (n, ) int ndarray
+            the sorted mass ids
+
+    Considers:
+     - elements
+     - rigid_elements
+     - masses
+     - MPC/MPCADD (optional)
+
+    Doesn't consider:
+      - DMIx
 
     """
+    model = _get_model(bdf_filename)
+    return _extract_bodies(model, mpc_id=mpc_id, consider_masses=True)
+
+def _get_model(bdf_filename):
+    """gets the BDF"""
     if isinstance(bdf_filename, BDF):
-        model = bdf_filename
-    else:
-        model = read_bdf(bdf_filename, xref=False)
+        return bdf_filename
+    return read_bdf(bdf_filename, xref=False)
 
-    debug = False
+def _extract_bodies(model, mpc_id=None, consider_masses=True):
+    """finds the bodies; see ``extract_bodies_arrays``"""
     nnodes = len(model.nodes)
     nspoints = 0
     nepoints = 0
@@ -55,145 +120,76 @@ def extract_bodies(bdf_filename, mpc_id=0):
     if npoints == 0 or nelements == 0:
         return {}
 
-    nid_to_eid_map = defaultdict(list)
-    eid_to_nid_map = defaultdict(list)
-    for eid, elem in model.elements.items():
-        if debug:  # pragma: no cover
-            print(print_card_16(elem.repr_fields()))
-        node_ids = elem.node_ids
-        eid_to_nid_map[eid] = node_ids
-        for nid in node_ids:
-            if nid is None:
-                continue
-            nid_to_eid_map[nid].append(eid)
-
-    rigid_offset = 0
-    if len(model.elements):
-        rigid_offset = max(model.elements)
-    for eid, elem in model.rigid_elements.items():
-        if debug:  # pragma: no cover
-            print(print_card_16(elem.repr_fields()))
-        eid += rigid_offset
-        assert eid not in model.elements, 'eid=%s cannot be used twice' % eid
-        #node_ids = elem.node_ids
+    # the rows of the incidence matrix are the elements, rigid elements,
+    # masses and MPCs (in that order); the columns are the nodes
+    eids = np.array(sorted(model.elements), dtype='int32')
+    rigid_eids = np.array(sorted(model.rigid_elements), dtype='int32')
+    mass_ids = np.array(sorted(model.masses) if consider_masses else [], dtype='int32')
+    node_lists = [model.elements[eid].node_ids for eid in eids.tolist()]
+    for eid in rigid_eids.tolist():
+        elem = model.rigid_elements[eid]
         node_ids = elem.independent_nodes + elem.dependent_nodes
-        eid_to_nid_map[eid] = node_ids
-        for nid in node_ids:
-            if nid is None:
-                raise RuntimeError(elem)
-            nid_to_eid_map[nid].append(eid)
-    #mpc_offset = rigid_offset + max(model.rigid_elements)
-
-    if len(nid_to_eid_map) == 0:
-        raise RuntimeError(model.get_bdf_stats())
-        #return {}
-
-    nids_used = set()
-    eids_used = set()
-    ibody = 0
-    keys = list(nid_to_eid_map.keys())
-    all_nids_to_check = set(keys)
-    key0 = keys[0]
-    nids_to_check = set([key0])
-    if debug:  # pragma: no cover
-        print('all_nids_to_check= ', all_nids_to_check)
-    body_eids = {ibody : set()}
-    nbodies_max = 3
-    while all_nids_to_check:
-        if debug:  # pragma: no cover
-            print(all_nids_to_check)
-        while nids_to_check:
-            #if len(nids_to_check) < 10:
-                #print('nids_to_check =', nids_to_check)
-            nid = nids_to_check.pop()
-            if debug:  # pragma: no cover
-                print('nid = ', nid)
-                print('all_nids_to_check =', all_nids_to_check)
-            if nid not in all_nids_to_check:
-                msg = 'nids_to_check = %s' % nids_to_check
-                raise RuntimeError(msg)
-            if debug:  # pragma: no cover
-                print('nids_used         =', nids_used)
-                print('all_nids_to_check =', all_nids_to_check)
-
-            nids_used.add(nid)
-            if debug:  # pragma: no cover
-                print('  adding nid=%s' % nid)
-            all_nids_to_check.remove(nid)
-            if debug:  # pragma: no cover
-                print('  nids_used         =', nids_used)
-                print('  all_nids_to_check =', all_nids_to_check)
-
-            eids = nid_to_eid_map[nid]
-            if debug:  # pragma: no cover
-                print('  eids = %s' % eids)
-            for eidi in eids:
-                if eidi in eids_used:
-                    continue
-                eids_used.add(eidi)
-                try:
-                    elem = model.elements[eidi]
-                except KeyError:
-                    elem = model.rigid_elements[eidi - rigid_offset]
-                if debug:  # pragma: no cover
-                    print(print_card_16(elem.repr_fields()))
-                    print('adding eidi=%s' % eidi)
-                body_eids[ibody].add(eidi)
-                nidsi = eid_to_nid_map[eidi]
-                for nidi in nidsi:
-                    if nidi not in nids_used:
-                        nids_to_check.add(nidi)
-                        if debug:  # pragma: no cover
-                            print('  adding nid=%s' % nidi)
-                del nidsi # , elem
-            if debug:  # pragma: no cover
-                print('next eid\n')
-                print('---------------------------')
-            del nid, eids
-
-        if len(body_eids[ibody]) == 0:
-            return body_eids
-            # unused node
-            #try:
-                #nid = nids_to_check.pop()
-            #except KeyError:
-                #break
-            #continue
-            #msg = 'cannot find a new body...nbodies=%s\nelements:' % ibody
-            #for nid, eids in sorted(nid_to_eid_map.items()):
-                #msg += '  nid=%r eids=%s\n' % (nid, eids)
-                #for eid in eids:
-                    #try:
-                        #elem = model.elements[eid]
-                    #except KeyError:
-                        #elem = model.rigid_elements[eid - rigid_offset]
-                    #msg += print_card_16(elem.repr_fields())
-
-                    #msg += 'eid=%s used=%s\n\n' % (eid, eid in eids_used)
-                #msg += '----------------\n'
-            #msg += ''
-            #raise RuntimeError(msg + model.get_bdf_stats())
-        ibody += 1
-        if ibody > nbodies_max:
-            raise RuntimeError('Too many bodies...\n' + model.get_bdf_stats())
-        body_eids[ibody] = set()
-        #print('--------------------------------------')
-    if len(body_eids[ibody]) == 0:
-        del body_eids[ibody]
-
-    body_eids2 = {}
-    for ibody, body in sorted(body_eids.items()):
-        abody = np.unique(np.array(list(body), dtype='int64'))
-        ielem = np.where(abody <= rigid_offset)
-        irigid = np.where(abody > rigid_offset)
-        #ielem = np.asarray(ielem, dtype='int32')
-        #ielem = np.asarray(ielem, dtype='int32')
-        body_eids2[ibody] = [
-            np.asarray(abody[ielem], dtype='int32'),
-            np.asarray(abody[irigid], dtype='int32')
+        if None in node_ids:
+            raise RuntimeError(elem)
+        node_lists.append(node_ids)
+    node_lists.extend(model.masses[eid].node_ids for eid in mass_ids.tolist())
+    node_lists.extend(mpc.node_ids for mpc in _get_mpcs(model, mpc_id))
+    nrows = len(node_lists)
+
+    nnodes_per_row = np.array([len(node_ids) for node_ids in node_lists], dtype='int64')
+    irow = np.repeat(np.arange(nrows), nnodes_per_row)
+    # a blank node (e.g., a grounded CELAS2) is 0
+    nids = np.array([0 if nid is None else nid
+                     for nid in chain.from_iterable(node_lists)], dtype='int64')
+    is_node = nids > 0
+    irow = irow[is_node]
+    unids, inode = np.unique(nids[is_node], return_inverse=True)
+    if len(inode) == 0:
+        return {}
+
+    nvertices = nrows + len(unids)
+    incidence = scipy.sparse.coo_matrix(
+        (np.ones(len(irow), dtype='int8'), (irow, nrows + inode)),
+        shape=(nvertices, nvertices))
+    unused_ncomponents, labels = connected_components(incidence, directed=False)
+
+    # an element without nodes isn't part of a body
+    is_connected = np.zeros(nrows, dtype='bool')
+    is_connected[irow] = True
+
+    neids = len(eids)
+    nrigid = len(rigid_eids)
+    nmasses = len(mass_ids)
+    row_labels = labels[:neids + nrigid + nmasses]
+    is_connected = is_connected[:neids + nrigid + nmasses]
+
+    # number the bodies in the order they're found
+    irows = np.where(is_connected)[0]
+    unused_ulabels, ifirst, ilabel = np.unique(
+        row_labels[irows], return_index=True, return_inverse=True)
+    ibody = np.argsort(np.argsort(ifirst))[ilabel]
+    isort = np.argsort(ibody, kind='stable')
+    irows_split = np.split(irows[isort], np.cumsum(np.bincount(ibody))[:-1])
+
+    body_eids = {}
+    irigid0 = neids
+    imass0 = neids + nrigid
+    for ibodyi, irowsi in enumerate(irows_split):
+        body_eids[ibodyi] = [
+            eids[irowsi[irowsi < irigid0]],
+            rigid_eids[irowsi[(irowsi >= irigid0) & (irowsi < imass0)] - irigid0],
+            mass_ids[irowsi[irowsi >= imass0] - imass0],
         ]
-    #print('body_eids = %s' % body_eids2)
-    nbodies = len(body_eids2)
+
+    nbodies = len(body_eids)
     if nbodies > 1:
-        print('nbodies = %i' % nbodies)
-    return body_eids2
+        model.log.info('nbodies = %i' % nbodies)
+    return body_eids
+
+def _get_mpcs(model, mpc_id):
+    """gets the MPCs to consider"""
+    if mpc_id is None:
+        return []
+    if mpc_id == 0:
+        return [mpc for mpcs in model.mpcs.values() for mpc in mpcs]
+    return model.get_reduced_mpcs(mpc_id, consider_mpcadd=True, stop_on_failure=True)
@@ -1,19 +1,25 @@
 """
 defines:
  - get_element_faces(model, element_ids=None)
+ - get_solid_face_arrays(model, element_ids=None)
  - get_solid_skin_faces(model)
  - write_skin_solid_faces(model, skin_filename,
                           write_solids=False, write_shells=True,
                           size=8, is_double=False, encoding=None)
 
 """
-from copy import deepcopy
 from collections import defaultdict
-from typing import List, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any
+
+import numpy as np
 
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.bdf import read_bdf, BDF
 
+SOLID_TYPES = {'CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM'}
+#: element class -> the node indices of each face
+_FACE_TEMPLATES = {}  # type: Dict[type, List[List[int]]]
+
 def get_element_faces(model: BDF, element_ids: Optional[List[int]]=None) -> Any:
     """
     Gets the elements and faces that are skinned from solid elements.
@@ -52,6 +58,97 @@ def get_element_faces(model: BDF, element_ids: Optional[List[int]]=None) -> Any:
     return eid_faces
 
 
+def get_solid_face_arrays(model: BDF, element_ids: Optional[List[int]]=None,
+                          ) -> Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Gets the faces of the solid elements (CTETRA, CPENTA, CHEXA, CPYRAM)
+    as arrays.  This includes internal faces.
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    element_ids : List[int] / None
+        skin a subset of element faces
+        default=None -> all elements
+
+    Returns
+    -------
+    face_arrays : Dict[nface_nodes] = (eids, faces, iface)
+        nface_nodes : int
+           the number of nodes on the face (3, 4, 6, 8)
+        eids : (nfaces, ) int ndarray
+           the element id of each face
+        faces : (nfaces, nface_nodes) int ndarray
+           the face nodes in the order of ``element.faces``;
+           a blank (midside) node is 0
+        iface : (nfaces, ) int ndarray
+           the index of the face in ``get_element_faces(model)``
+
+    """
+    if element_ids is None:
+        element_ids = model.element_ids
+
+    # the faces of an element class are the same for each element, so
+    # they're gathered by class and found with the class's face template
+    nodes_by_class = defaultdict(list)
+    ielements_by_class = defaultdict(list)
+    eids_by_class = defaultdict(list)
+    for ielement, eid in enumerate(element_ids):
+        elem = model.elements[eid]
+        if elem.type in SOLID_TYPES:
+            cls = elem.__class__
+            nodes_by_class[cls].append(elem.nodes)
+            ielements_by_class[cls].append(ielement)
+            eids_by_class[cls].append(eid)
+
+    # CHEXA has the most faces
+    nfaces_max = 6
+    eids_list = defaultdict(list)
+    faces_list = defaultdict(list)
+    ifaces_list = defaultdict(list)
+    for cls, nodes in nodes_by_class.items():
+        nodes = _nodes_to_array(nodes)
+        eids = np.array(eids_by_class[cls], dtype=nodes.dtype)
+        ielements = np.array(ielements_by_class[cls], dtype='int64')
+        for iface, face_template in enumerate(_get_face_template(cls, nodes.shape[1])):
+            nface_nodes = len(face_template)
+            faces_list[nface_nodes].append(nodes[:, face_template])
+            eids_list[nface_nodes].append(eids)
+            ifaces_list[nface_nodes].append(ielements * nfaces_max + iface)
+
+    face_arrays = {}
+    for nface_nodes, faces in faces_list.items():
+        face_arrays[nface_nodes] = (
+            np.hstack(eids_list[nface_nodes]),
+            np.vstack(faces),
+            np.hstack(ifaces_list[nface_nodes]),
+        )
+    return face_arrays
+
+
+def _nodes_to_array(nodes: List[List[Optional[int]]]) -> np.ndarray:
+    """converts the element nodes to an array; a blank node is 0"""
+    try:
+        return np.array(nodes, dtype='int64')
+    except TypeError:
+        nodes_array = np.array(nodes, dtype='object')
+        nodes_array[np.equal(nodes_array, None)] = 0
+        return nodes_array.astype('int64')
+
+
+def _get_face_template(cls: type, nnodes: int) -> List[List[int]]:
+    """gets the node indices of the faces of an element class"""
+    try:
+        return _FACE_TEMPLATES[cls]
+    except KeyError:
+        pass
+    elem = cls(1, 1, list(range(1, nnodes + 1)))
+    face_template = [[nid - 1 for nid in face] for face in elem.faces.values()]
+    _FACE_TEMPLATES[cls] = face_template
+    return face_template
+
+
 def get_solid_skin_faces(model: BDF) -> Any:
     """
     Gets the elements and faces that are skinned from solid elements
@@ -68,49 +165,59 @@ def get_solid_skin_faces(model: BDF) -> Any:
        key : sorted face
        value : list of element ids with that face
     face_map : Dict[tuple(int, int, ...)] = List[int]
-       key : sorted face
+       key : sorted face (including the internal faces)
        value : unsorted face
 
+    A blank (midside) node is None and is at the end of the sorted face.
+
     """
-    eid_faces = get_element_faces(model)
-    face_set = defaultdict(int)
+    face_arrays = get_solid_face_arrays(model)
+
+    all_faces = []
+    for eids, faces, ifaces in face_arrays.values():
+        nfaces = len(faces)
+        sorted_faces = np.sort(faces, axis=1)
+
+        # group the same faces (the first node is the primary key); the
+        # faces in a group are in order
+        isort = np.lexsort((ifaces, ) + tuple(sorted_faces.T[::-1]))
+        sorted_faces_sorted = sorted_faces[isort]
+        is_new_face = np.ones(nfaces, dtype='bool')
+        is_new_face[1:] = np.any(sorted_faces_sorted[1:] != sorted_faces_sorted[:-1], axis=1)
+        istart = np.flatnonzero(is_new_face)
+        iend = np.hstack([istart[1:], nfaces])
+
+        # faces that are shared by 2 elements are internal
+        is_skin = (iend - istart) != 2
+        eids_sorted = eids[isort]
+        for i0, i1, is_skini in zip(istart.tolist(), iend.tolist(), is_skin.tolist()):
+            ifirst = isort[i0]
+            ilast = isort[i1 - 1]
+            all_faces.append((
+                ifaces[ifirst],
+                _to_face(sorted_faces[ifirst], is_sorted=True),
+                eids_sorted[i0:i1].tolist() if is_skini else None,
+                _to_face(faces[ilast]),
+            ))
+
+    # the faces are in the order of get_element_faces
+    all_faces.sort(key=lambda face: face[0])
     eid_set = defaultdict(list)
     face_map = {}
-    for eid, face in eid_faces:
-        #print(eid, face)
-        raw_face = deepcopy(face)
-        try:
-            face.sort()
-        except:
-            print('face = %s' % str(face))
-            raise
-        tface = tuple(face)
-        #print(tface)
-        face_set[tface] += 1
-        eid_set[tface].append(eid)
+    for unused_iface, tface, eids, raw_face in all_faces:
+        if eids is not None:
+            eid_set[tface] = eids
         face_map[tface] = raw_face
+    return eid_set, face_map
 
-    #print('eid_set:')
-    #for tface, eidset in eid_set.items():
-        #print(tface, eidset)
-
-    #print('face_set:')
-    #for tface, faceset in face_set.items():
-        #print(tface, faceset)
-
-    #print('face_map:')
-    #for tface, facemap in face_map.items():
-        #print(tface, facemap)
-
-    del_faces = []
-    for face, face_count in face_set.items():
-        if face_count == 2:
-            del_faces.append(face)
 
-    for face in del_faces:
-        del face_set[face]
-        del eid_set[face]
-    return eid_set, face_map
+def _to_face(face: np.ndarray, is_sorted: bool=False) -> Any:
+    """converts a face to a tuple (sorted) or list (raw); 0 is None"""
+    face = [nid if nid != 0 else None for nid in face.tolist()]
+    if is_sorted:
+        nblank = face.count(None)
+        return tuple(face[nblank:] + face[:nblank])
+    return face
 
 
 def write_skin_solid_faces(model, skin_filename,
@@ -255,9 +362,7 @@ def _write_skin_solid_faces(model, skin_filename, face_map,
     #encoding = model.get_encoding(encoding)
     with open(skin_filename, 'w') as bdf_file:
         bdf_file.write('$ pyNastran: punch=True\n')
-        for nid in sorted(nids_to_write):
-            if nid is None:
-                continue
+        for nid in sorted(nid for nid in nids_to_write if nid is not None):
             node = model.nodes[nid]
             bdf_file.write(node.write_card(size=size, is_double=is_double))
 
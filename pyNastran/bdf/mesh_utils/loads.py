@@ -4,10 +4,12 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_batch
+      find the net force/moment on the model for many load cases
 
 """
 from __future__ import annotations
-from typing import Tuple, Dict, Optional, TYPE_CHECKING
+from typing import Tuple, List, Dict, Set, Optional, Any, TYPE_CHECKING
 from math import radians, sin, cos
 import numpy as np
 from numpy import array, cross, allclose, mean
@@ -15,6 +17,7 @@ from numpy.linalg import norm  # type: ignore
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.utils import get_xyz_cid0_dict, transform_load
 from pyNastran.bdf.cards.loads.static_loads import update_pload4_vector
+from pyNastran.bdf.mesh_utils.node_arrays import get_xyz_cid0_array, get_element_node_xyz
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.nptyping import NDArray3float
     from pyNastran.bdf.bdf import BDF, Subcase
@@ -81,110 +84,8 @@ def sum_forces_moments(model: BDF, p0: np.ndarray, loadcase_id: int,
 
     unsupported_types = set()
     for load, scale in zip(loads, scale_factors):
-        #if load.type not in ['FORCE1']:
-            #continue
-        if load.type == 'FORCE':
-            if load.Cid() != 0:
-                cp_ref = load.cid_ref
-                #from pyNastran.bdf.bdf import CORD2R
-                #cp_ref = CORD2R()
-                f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
-            else:
-                f = load.mag * load.xyz * scale
-
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE1':
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE2':
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'MOMENT':
-            if load.Cid() != 0:
-                cp = load.cid_ref
-                #from pyNastran.bdf.bdf import CORD2R
-                #cp = CORD2R()
-                m = load.mag * cp.transform_vector_to_global(load.xyz) * scale
-            else:
-                m = load.mag * load.xyz * scale
-            M += m
-        elif load.type == 'MOMENT1':
-            m = load.mag * load.xyz * scale
-            M += m
-        elif load.type == 'MOMENT2':
-            m = load.mag * load.xyz * scale
-            M += m
-
-        elif load.type == 'PLOAD':
-            nodes = load.node_ids
-            nnodes = len(nodes)
-            if nnodes == 3:
-                n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
-                axb = cross(n1 - n2, n1 - n3)
-                centroid = (n1 + n2 + n3) / 3.
-            elif nnodes == 4:
-                n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
-                axb = cross(n1 - n3, n2 - n4)
-                centroid = (n1 + n2 + n3 + n4) / 4.
-            else:
-                msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
-                raise RuntimeError(msg)
-
-            area, normal = _get_area_normal(axb, nodes, xyz)
-            r = centroid - p
-            f = load.pressure * area * normal * scale
-            m = cross(r, f)
-
-            F += f
-            M += m
-
-        elif load.type == 'PLOAD1':
-            _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p)
-
-        elif load.type == 'PLOAD2':
-            pressure = load.pressure * scale
-            for eid in load.element_ids:
-                elem = model.elements[eid]
-                if elem.type in ['CTRIA3', 'CQUAD4', 'CSHEAR', 'CQUADR', 'CTRIAR']:
-                    n = elem.Normal()
-                    area = elem.Area()
-                    f = pressure * n * area
-                    r = elem.Centroid() - p
-                    m = cross(r, f)
-                    F += f
-                    M += m
-                else:
-                    model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
-                        loadcase_id, elem.type, load.type))
-        elif load.type == 'PLOAD4':
-            _pload4_total(loadcase_id, load, scale, xyz, F, M, p)
-
-        elif load.type == 'GRAV':
-            if include_grav:  # this will be super slow
-                gravity = load.GravityVector() * scale
-                for eid, elem in model.elements.items():
-                    centroid = elem.Centroid()
-                    mass = elem.Mass()
-                    r = centroid - p
-                    f = mass * gravity
-                    m = cross(r, f)
-                    F += f
-                    M += m
-        else:
-            # we collect them so we only get one print
-            unsupported_types.add(load.type)
+        _sum_load(model, loadcase_id, load, scale, xyz, F, M, p,
+                  include_grav, unsupported_types)
 
     for load_type in unsupported_types:
         model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
@@ -197,6 +98,120 @@ def sum_forces_moments(model: BDF, p0: np.ndarray, loadcase_id: int,
     F2, M2 = transform_load(F, M, cid0, cid, model)
     return F2, M2
 
+
+def _sum_load(model: BDF, loadcase_id: int, load, scale: float,
+              xyz: Dict[int, np.ndarray],
+              F: np.ndarray, M: np.ndarray, p: np.ndarray,
+              include_grav: bool, unsupported_types: Set[str]) -> None:
+    """
+    helper method for ``sum_forces_moments`` that adds the force/moment
+    of one load to F and M
+    """
+    #if load.type not in ['FORCE1']:
+        #continue
+    if load.type == 'FORCE':
+        if load.Cid() != 0:
+            cp_ref = load.cid_ref
+            #from pyNastran.bdf.bdf import CORD2R
+            #cp_ref = CORD2R()
+            f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
+        else:
+            f = load.mag * load.xyz * scale
+
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'FORCE1':
+        f = load.mag * load.xyz * scale
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'FORCE2':
+        f = load.mag * load.xyz * scale
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'MOMENT':
+        if load.Cid() != 0:
+            cp = load.cid_ref
+            #from pyNastran.bdf.bdf import CORD2R
+            #cp = CORD2R()
+            m = load.mag * cp.transform_vector_to_global(load.xyz) * scale
+        else:
+            m = load.mag * load.xyz * scale
+        M += m
+    elif load.type == 'MOMENT1':
+        m = load.mag * load.xyz * scale
+        M += m
+    elif load.type == 'MOMENT2':
+        m = load.mag * load.xyz * scale
+        M += m
+
+    elif load.type == 'PLOAD':
+        nodes = load.node_ids
+        nnodes = len(nodes)
+        if nnodes == 3:
+            n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
+            axb = cross(n1 - n2, n1 - n3)
+            centroid = (n1 + n2 + n3) / 3.
+        elif nnodes == 4:
+            n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
+            axb = cross(n1 - n3, n2 - n4)
+            centroid = (n1 + n2 + n3 + n4) / 4.
+        else:
+            msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
+            raise RuntimeError(msg)
+
+        area, normal = _get_area_normal(axb, nodes, xyz)
+        r = centroid - p
+        f = load.pressure * area * normal * scale
+        m = cross(r, f)
+
+        F += f
+        M += m
+
+    elif load.type == 'PLOAD1':
+        _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p)
+
+    elif load.type == 'PLOAD2':
+        pressure = load.pressure * scale
+        for eid in load.element_ids:
+            elem = model.elements[eid]
+            if elem.type in ['CTRIA3', 'CQUAD4', 'CSHEAR', 'CQUADR', 'CTRIAR']:
+                n = elem.Normal()
+                area = elem.Area()
+                f = pressure * n * area
+                r = elem.Centroid() - p
+                m = cross(r, f)
+                F += f
+                M += m
+            else:
+                model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
+                    loadcase_id, elem.type, load.type))
+    elif load.type == 'PLOAD4':
+        _pload4_total(loadcase_id, load, scale, xyz, F, M, p)
+
+    elif load.type == 'GRAV':
+        if include_grav:  # this will be super slow
+            gravity = load.GravityVector() * scale
+            for eid, elem in model.elements.items():
+                centroid = elem.Centroid()
+                mass = elem.Mass()
+                r = centroid - p
+                f = mass * gravity
+                m = cross(r, f)
+                F += f
+                M += m
+    else:
+        # we collect them so we only get one print
+        unsupported_types.add(load.type)
+
 def _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p):
     """helper method for ``sum_forces_moments``"""
     elem = load.eid_ref
@@ -224,9 +239,9 @@ def _pload1_bar_beam(model, unused_loadcase_id, load, elem, scale, xyz, F, M, p)
     p2 = load.p2 * scale
 
     nodes = elem.node_ids
-    n1, n2 = xyz[nodes[0]], xyz[nodes[1]]
-    n1 += elem.wa
-    n2 += elem.wb
+    # don't modify the node positions in xyz, which may be reused
+    n1 = xyz[nodes[0]] + elem.wa
+    n2 = xyz[nodes[1]] + elem.wb
 
     bar_vector = n2 - n1
     L = norm(bar_vector)
@@ -426,185 +441,555 @@ def sum_forces_moments_elements(model: BDF, p0: int, loadcase_id: int,
     xyz = get_xyz_cid0_dict(model, xyz_cid0)
 
     unsupported_types = set()
+    for load, scale in zip(loads, scale_factors):
+        _sum_load_elements(model, loadcase_id, load, scale, eids, nids, xyz, F, M, p,
+                           include_grav, unsupported_types)
+
+    for loadtype in unsupported_types:
+        model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, loadtype))
+    #model.log.info("case=%s F=%s M=%s\n" % (loadcase_id, F, M))
+
+    if cid == 0:
+        return F, M
+    cid0 = 0
+    F2, M2 = transform_load(F, M, cid0, cid, model)
+    return F2, M2
+
+
+def _sum_load_elements(model: BDF, loadcase_id: int, load, scale: float,
+                       eids, nids, xyz: Dict[int, np.ndarray],
+                       F: np.ndarray, M: np.ndarray, p: np.ndarray,
+                       include_grav: bool, unsupported_types: Set[str]) -> None:
+    """
+    helper method for ``sum_forces_moments_elements`` that adds the
+    force/moment of one load to F and M
+    """
     shell_elements = {
         'CTRIA3', 'CQUAD4', 'CTRIAR', 'CQUADR',
         'CTRIA6', 'CQUAD8', 'CQUAD', 'CSHEAR'}
     skip_loads = {'QVOL'}
-    for load, scale in zip(loads, scale_factors):
-        #if load.type not in ['FORCE1']:
-            #continue
-        #print(load.type)
-        loadtype = load.type
-        if loadtype == 'FORCE':
-            if load.node_id not in nids:
-                continue
-            if load.Cid() != 0:
-                cp_ref = load.cid_ref
-                #from pyNastran.bdf.bdf import CORD2R
-                #cp = CORD2R()
-                f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
-            else:
-                f = load.mag * load.xyz * scale
-
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-
-        elif load.type == 'FORCE1':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
-                continue
-
+    #if load.type not in ['FORCE1']:
+        #continue
+    #print(load.type)
+    loadtype = load.type
+    if loadtype == 'FORCE':
+        if load.node_id not in nids:
+            return
+        if load.Cid() != 0:
+            cp_ref = load.cid_ref
+            #from pyNastran.bdf.bdf import CORD2R
+            #cp = CORD2R()
+            f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
+        else:
             f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE2':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
-                continue
 
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'MOMENT':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
-                continue
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = cross(r, f)
+        F += f
+        M += m
+
+    elif load.type == 'FORCE1':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return
 
-            if load.Cid() != 0:
-                cp_ref = load.cid_ref
-                m = cp_ref.transform_vector_to_global(load.xyz)
-            else:
-                m = load.xyz
-            M += load.mag * m * scale
-        elif load.type == 'MOMENT1':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
-                continue
-            m = load.mag * load.xyz * scale
-            M += m
-        elif loadtype == 'MOMENT2':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
-                continue
-            m = load.mag * load.xyz * scale
-            M += m
-
-        elif loadtype == 'PLOAD':
-            nodes = load.node_ids
-            nnodes = len(nodes)
-            nodesi = 0
-            if nnodes == 3:
-                n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
-                axb = cross(n1 - n2, n1 - n3)
-                centroid = (n1 + n2 + n3) / 3.
-
-            elif nnodes == 4:
-                n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
-                axb = cross(n1 - n3, n2 - n4)
-                centroid = (n1 + n2 + n3 + n4) / 4.
-                if nodes[3] in nids:
-                    nodesi += 1
-            else:
-                raise RuntimeError('invalid number of nodes on PLOAD card; '
-                                   'nodes=%s' % str(nodes))
-            if nodes[0] in nids:
-                nodesi += 1
-            if nodes[1] in nids:
-                nodesi += 1
-            if nodes[2] in nids:
+        f = load.mag * load.xyz * scale
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'FORCE2':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return
+
+        f = load.mag * load.xyz * scale
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'MOMENT':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return
+
+        if load.Cid() != 0:
+            cp_ref = load.cid_ref
+            m = cp_ref.transform_vector_to_global(load.xyz)
+        else:
+            m = load.xyz
+        M += load.mag * m * scale
+    elif load.type == 'MOMENT1':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return
+        m = load.mag * load.xyz * scale
+        M += m
+    elif loadtype == 'MOMENT2':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return
+        m = load.mag * load.xyz * scale
+        M += m
+
+    elif loadtype == 'PLOAD':
+        nodes = load.node_ids
+        nnodes = len(nodes)
+        nodesi = 0
+        if nnodes == 3:
+            n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
+            axb = cross(n1 - n2, n1 - n3)
+            centroid = (n1 + n2 + n3) / 3.
+
+        elif nnodes == 4:
+            n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
+            axb = cross(n1 - n3, n2 - n4)
+            centroid = (n1 + n2 + n3 + n4) / 4.
+            if nodes[3] in nids:
                 nodesi += 1
+        else:
+            raise RuntimeError('invalid number of nodes on PLOAD card; '
+                               'nodes=%s' % str(nodes))
+        if nodes[0] in nids:
+            nodesi += 1
+        if nodes[1] in nids:
+            nodesi += 1
+        if nodes[2] in nids:
+            nodesi += 1
 
-            area, normal = _get_area_normal(axb, nodes, xyz)
-            r = centroid - p
-            f = load.pressure * area * normal * scale
-            m = cross(r, f)
+        area, normal = _get_area_normal(axb, nodes, xyz)
+        r = centroid - p
+        f = load.pressure * area * normal * scale
+        m = cross(r, f)
 
-            node_scale = nodesi / float(nnodes)
-            F += f * node_scale
-            M += m * node_scale
+        node_scale = nodesi / float(nnodes)
+        F += f * node_scale
+        M += m * node_scale
 
-        elif loadtype == 'PLOAD1':
-            _pload1_elements(model, loadcase_id, load, scale, eids, xyz, F, M, p)
+    elif loadtype == 'PLOAD1':
+        _pload1_elements(model, loadcase_id, load, scale, eids, xyz, F, M, p)
 
-        elif loadtype == 'PLOAD2':
-            pressure = load.pressure * scale
-            for eid in load.element_ids:
+    elif loadtype == 'PLOAD2':
+        pressure = load.pressure * scale
+        for eid in load.element_ids:
+            if eid not in eids:
+                continue
+            elem = model.elements[eid]
+            if elem.type in shell_elements:
+                normal = elem.Normal()
+                area = elem.Area()
+                f = pressure * normal * area
+                r = elem.Centroid() - p
+                m = cross(r, f)
+                F += f
+                M += m
+            else:
+                #model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
+                    #loadcase_id, elem.type, loadtype))
+                raise NotImplementedError('case=%s etype=%r loadtype=%r not supported' % (
+                    loadcase_id, elem.type, loadtype))
+    elif loadtype == 'PLOAD4':
+        _pload4_elements(loadcase_id, load, scale, eids, xyz, F, M, p)
+
+    elif loadtype == 'GRAV':
+        if include_grav:  # this will be super slow
+            g = load.GravityVector() * scale
+            for eid, elem in model.elements.items():
                 if eid not in eids:
                     continue
-                elem = model.elements[eid]
-                if elem.type in shell_elements:
-                    normal = elem.Normal()
-                    area = elem.Area()
-                    f = pressure * normal * area
-                    r = elem.Centroid() - p
-                    m = cross(r, f)
-                    F += f
-                    M += m
-                else:
-                    #model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
-                        #loadcase_id, elem.type, loadtype))
-                    raise NotImplementedError('case=%s etype=%r loadtype=%r not supported' % (
-                        loadcase_id, elem.type, loadtype))
-        elif loadtype == 'PLOAD4':
-            _pload4_elements(loadcase_id, load, scale, eids, xyz, F, M, p)
-
-        elif loadtype == 'GRAV':
-            if include_grav:  # this will be super slow
-                g = load.GravityVector() * scale
-                for eid, elem in model.elements.items():
-                    if eid not in eids:
-                        continue
-                    centroid = elem.Centroid()
-                    mass = elem.Mass()
-                    r = centroid - p
-                    f = mass * g
-                    m = cross(r, f)
-                    F += f
-                    M += m
-        elif loadtype in skip_loads:
+                centroid = elem.Centroid()
+                mass = elem.Mass()
+                r = centroid - p
+                f = mass * g
+                m = cross(r, f)
+                F += f
+                M += m
+    elif loadtype in skip_loads:
+        return
+    else:
+        # we collect them so we only get one print
+        unsupported_types.add(loadtype)
+
+#: the number of corner nodes of the shells with a vectorized PLOAD4
+PLOAD4_SHELL_NFACE = {
+    'CTRIA3': 3, 'CTRIA6': 3, 'CTRIAR': 3,
+    'CQUAD4': 4, 'CQUAD8': 4, 'CQUAD': 4, 'CQUADR': 4, 'CSHEAR': 4,
+}
+
+def sum_forces_moments_batch(model: BDF, p0: np.ndarray, loadcase_ids: List[int],
+                             eids: Optional[List[int]]=None,
+                             nids: Optional[List[int]]=None,
+                             cid: int=0,
+                             include_grav: bool=False,
+                             xyz_cid0: Optional[Dict[int, NDArray3float]]=None,
+                             ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sums applied forces & moments about a reference point p0 for many
+    load cases in one pass.
+
+    Each load card is summed once, even if it's used by many load cases
+    (e.g., through a LOAD card), and the PLOAD4 pressures on shells are
+    summed as arrays using the area, normal, and centroid of each element,
+    which are calculated once.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_ids : List[int]
+        the LOAD=IDs to analyze
+    eids : List[int]; default=None
+        the list of elements to include (e.g. the loads due to a PLOAD4)
+    nids : List[int]; default=None
+        the list of nodes to include (e.g. the loads due to a FORCE card)
+    cid : int; default=0
+        the coordinate system for the summation
+    include_grav : bool; default=False
+        includes gravity in the summation (not supported)
+    xyz_cid0 : None / Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    forces : (nloadcases, 3) float ndarray
+        the forces
+    moments : (nloadcases, 3) float ndarray
+        the moments
+
+    If eids and nids are None, the loads are summed like
+    ``sum_forces_moments``; otherwise, they're summed like
+    ``sum_forces_moments_elements``, where None is all the elements/nodes.
+
+    .. note:: the PLOAD1 moment depends on the other loads, so a load
+              case with a PLOAD1 is summed with ``sum_forces_moments``
+              (or ``sum_forces_moments_elements``)
+
+    """
+    loadcase_ids = list(loadcase_ids)
+    for loadcase_id in loadcase_ids:
+        if not isinstance(loadcase_id, integer_types):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+
+    p = _get_load_summation_point(model, p0, cid=0)
+    is_total = eids is None and nids is None
+    if not is_total:
+        eids = set(model.element_ids) if eids is None else set(eids)
+        nids = set(model.node_ids) if nids is None else set(nids)
+
+    # a load case is a series of load sets (e.g., the FORCE/PLOAD4 cards
+    # with the same id) and scale factors; a load set that's used by many
+    # load cases is only summed once
+    load_sets = []
+    set_loadcase_ids = []
+    isets = {}
+    load_combinations = {}
+    case_isets = []
+    case_scales = []
+    for loadcase_id in loadcase_ids:
+        load_case = model.Load(loadcase_id, consider_load_combinations=True)
+        isets_case = []
+        scales = []
+        for loads, scale in _reduce_load_case_sets(
+                model, load_case, load_combinations=load_combinations):
+            key = id(loads)
+            if key not in isets:
+                isets[key] = len(load_sets)
+                load_sets.append(loads)
+                set_loadcase_ids.append(loadcase_id)
+            isets_case.append(isets[key])
+            scales.append(scale)
+        case_isets.append(np.array(isets_case, dtype='int64'))
+        case_scales.append(np.array(scales, dtype='float64'))
+
+    # the unique cards of each load set
+    nsets = len(load_sets)
+    cards = []
+    card_loadcase_ids = []
+    icards = {}
+    iset_cards = []
+    icard_sets = []
+    has_pload1 = np.zeros(nsets, dtype='bool')
+    for iset, loads in enumerate(load_sets):
+        for load in loads:
+            if load.type == 'LOAD':
+                continue
+            if load.type == 'PLOAD1':
+                has_pload1[iset] = True
+            key = id(load)
+            if key not in icards:
+                icards[key] = len(cards)
+                cards.append(load)
+                card_loadcase_ids.append(set_loadcase_ids[iset])
+            iset_cards.append(iset)
+            icard_sets.append(icards[key])
+
+    all_nids, xyz_cid0_array = get_xyz_cid0_array(model, xyz_cid0)
+    if xyz_cid0 is None:
+        xyz_cid0 = dict(zip(all_nids.tolist(), xyz_cid0_array))
+
+    # the force/moment of each card for a scale factor of 1.0
+    ncards = len(cards)
+    card_forces = np.zeros((ncards, 3), dtype='float64')
+    card_moments = np.zeros((ncards, 3), dtype='float64')
+    card_unsupported_types = {}
+    ipload4s = []
+    for icard, load in enumerate(cards):
+        if _is_vectorized_pload4(load):
+            ipload4s.append(icard)
+            continue
+        if load.type == 'PLOAD1':
             continue
+        unsupported_types = set()
+        if is_total:
+            _sum_load(model, card_loadcase_ids[icard], load, 1.0, xyz_cid0,
+                      card_forces[icard], card_moments[icard], p,
+                      include_grav, unsupported_types)
         else:
-            # we collect them so we only get one print
-            unsupported_types.add(loadtype)
+            _sum_load_elements(model, card_loadcase_ids[icard], load, 1.0, eids, nids,
+                               xyz_cid0, card_forces[icard], card_moments[icard], p,
+                               include_grav, unsupported_types)
+        if unsupported_types:
+            card_unsupported_types[icard] = unsupported_types
+
+    if ipload4s:
+        ipload4s = np.array(ipload4s, dtype='int64')
+        card_forces[ipload4s], card_moments[ipload4s] = _sum_pload4_shells(
+            [cards[icard] for icard in ipload4s.tolist()],
+            all_nids, xyz_cid0_array, p, eids=None if is_total else eids)
+
+    # the force/moment of each load set
+    set_forces = np.zeros((nsets, 3), dtype='float64')
+    set_moments = np.zeros((nsets, 3), dtype='float64')
+    set_unsupported_types = {}
+    if icard_sets:
+        iset_cards = np.array(iset_cards, dtype='int64')
+        icard_sets = np.array(icard_sets, dtype='int64')
+        for i in range(3):
+            set_forces[:, i] = np.bincount(
+                iset_cards, weights=card_forces[icard_sets, i], minlength=nsets)
+            set_moments[:, i] = np.bincount(
+                iset_cards, weights=card_moments[icard_sets, i], minlength=nsets)
+        for iset, icard in zip(iset_cards.tolist(), icard_sets.tolist()):
+            if icard in card_unsupported_types:
+                set_unsupported_types.setdefault(iset, set()).update(
+                    card_unsupported_types[icard])
+
+    nloadcases = len(loadcase_ids)
+    forces = np.zeros((nloadcases, 3), dtype='float64')
+    moments = np.zeros((nloadcases, 3), dtype='float64')
+    for icase, loadcase_id in enumerate(loadcase_ids):
+        isets_case = case_isets[icase]
+        if has_pload1[isets_case].any():
+            if is_total:
+                forces[icase], moments[icase] = sum_forces_moments(
+                    model, p, loadcase_id, include_grav=include_grav, xyz_cid0=xyz_cid0)
+            else:
+                forces[icase], moments[icase] = sum_forces_moments_elements(
+                    model, p, loadcase_id, eids, nids,
+                    include_grav=include_grav, xyz_cid0=xyz_cid0)
+            continue
 
-    for loadtype in unsupported_types:
-        model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, loadtype))
-    #model.log.info("case=%s F=%s M=%s\n" % (loadcase_id, F, M))
+        scales = case_scales[icase]
+        forces[icase] = scales @ set_forces[isets_case]
+        moments[icase] = scales @ set_moments[isets_case]
+        if set_unsupported_types:
+            unsupported_types = set()
+            for iset in isets_case.tolist():
+                unsupported_types.update(set_unsupported_types.get(iset, ()))
+            for load_type in sorted(unsupported_types):
+                model.log.warning('case=%s loadtype=%r not supported' % (
+                    loadcase_id, load_type))
+
+    if cid != 0:
+        cid0 = 0
+        for icase in range(nloadcases):
+            forces[icase], moments[icase] = transform_load(
+                forces[icase], moments[icase], cid0, cid, model)
+    return forces, moments
+
+def _reduce_load_case_sets(model: BDF, load_case, scale: float=1.,
+                           unallowed_load_ids: Optional[List[int]]=None,
+                           load_combinations: Optional[Dict[int, List[Any]]]=None):
+    """
+    Reduces a load case like ``model.get_reduced_loads``, but keeps the
+    cards of each load id together
 
-    if cid == 0:
-        return F, M
-    cid0 = 0
-    F2, M2 = transform_load(F, M, cid0, cid, model)
-    return F2, M2
+    Returns
+    -------
+    load_sets : List[(loads, scale)]
+        loads : List[load]
+            the cards for a load id; LOAD cards are skipped by the caller
+        scale : float
+            the scale factor on the cards
+
+    load_combinations : Dict[id(loads)] = List[LOAD]; default=None
+        the LOAD cards in each load id, which are stored so a big load id
+        is only searched once
+
+    """
+    if unallowed_load_ids is None:
+        unallowed_load_ids = []
+    if load_combinations is None:
+        load_combinations = {}
+    key = id(load_case)
+    if key not in load_combinations:
+        load_combinations[key] = [load for load in load_case if load.type == 'LOAD']
+
+    load_sets = [(load_case, scale)]
+    for load in load_combinations[key]:
+        load_scale = load.scale * scale
+        assert len(load.load_ids) == len(load.scale_factors), str(load)
+        for load_idi, scalei in zip(load.load_ids, load.scale_factors):
+            # prevents recursion
+            if load_idi in unallowed_load_ids:
+                msg = 'There is a recursion error.  LOAD trace=%s; load_id=%s' % (
+                    unallowed_load_ids, load_idi)
+                raise RuntimeError(msg)
+            load_casei = model.Load(load_idi, consider_load_combinations=True)
+            load_sets += _reduce_load_case_sets(
+                model, load_casei, scale=load_scale * scalei,
+                unallowed_load_ids=unallowed_load_ids + [load_idi],
+                load_combinations=load_combinations)
+    return load_sets
+
+def _is_vectorized_pload4(load) -> bool:
+    """is this a PLOAD4 pressure on shells that can be summed as arrays"""
+    if load.type != 'PLOAD4' or load.surf_or_line != 'SURF' or load.line_load_dir != 'NORM':
+        return False
+    if np.abs(load.nvector).max() != 0. and load.Cid() not in [0, None]:
+        return False
+    return all(elem.type in PLOAD4_SHELL_NFACE for elem in load.eids_ref)
+
+def _sum_pload4_shells(loads, all_nids: np.ndarray, xyz_cid0: np.ndarray, p: np.ndarray,
+                       eids: Optional[Set[int]]=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sums the PLOAD4 pressures on shells for a scale factor of 1.0
+
+    Parameters
+    ----------
+    loads : List[PLOAD4]
+        the PLOAD4 cards
+    all_nids : (nnodes, ) int ndarray
+        the sorted node ids
+    xyz_cid0 : (nnodes, 3) float ndarray
+        the node positions in the global frame
+    p : (3, ) float ndarray
+        the point to sum moments about
+    eids : Set[int]; default=None -> all
+        the elements to include
+
+    Returns
+    -------
+    forces : (nloads, 3) float ndarray
+        the force of each card
+    moments : (nloads, 3) float ndarray
+        the moment of each card
+
+    """
+    nloads = len(loads)
+    elements = [elem for load in loads for elem in load.eids_ref]
+    element_ids = np.array([elem.eid for elem in elements], dtype='int64')
+    iload = np.repeat(np.arange(nloads), [len(load.eids_ref) for load in loads])
+    if eids is not None:
+        ikeep = np.where(np.isin(element_ids, np.array(sorted(eids), dtype='int64')))[0]
+        elements = [elements[i] for i in ikeep.tolist()]
+        element_ids = element_ids[ikeep]
+        iload = iload[ikeep]
+
+    forces = np.zeros((nloads, 3), dtype='float64')
+    moments = np.zeros((nloads, 3), dtype='float64')
+    if len(element_ids) == 0:
+        return forces, moments
+
+    # the geometry of an element is only calculated once
+    unused_ueids, ifirst, ielement = np.unique(
+        element_ids, return_index=True, return_inverse=True)
+    nface, area, centroid, normal = _get_shell_area_centroid_normal(
+        [elements[i] for i in ifirst.tolist()], all_nids, xyz_cid0)
+
+    # the pressure and direction of each card
+    pressures = np.zeros((nloads, 2), dtype='float64')
+    is_normal = np.zeros(nloads, dtype='bool')
+    load_dirs = np.zeros((nloads, 3), dtype='float64')
+    for i, load in enumerate(loads):
+        pressures[i, 0] = _mean_pressure_on_pload4(load.pressures[:3], load, None)
+        pressures[i, 1] = _mean_pressure_on_pload4(load.pressures[:4], load, None)
+        nvector = load.nvector
+        if np.abs(nvector).max() == 0.:
+            is_normal[i] = True
+        else:
+            load_dirs[i] = nvector / np.linalg.norm(nvector)
+
+    nfacei = nface[ielement]
+    pressure = np.where(nfacei == 3, pressures[iload, 0], pressures[iload, 1])
+    load_dir = np.where(is_normal[iload, np.newaxis], normal[ielement], load_dirs[iload])
+    f = (pressure * area[ielement])[:, np.newaxis] * load_dir
+    m = np.cross(centroid[ielement] - p, f)
+    for i in range(3):
+        forces[:, i] = np.bincount(iload, weights=f[:, i], minlength=nloads)
+        moments[:, i] = np.bincount(iload, weights=m[:, i], minlength=nloads)
+    return forces, moments
+
+def _get_shell_area_centroid_normal(elements, all_nids: np.ndarray, xyz_cid0: np.ndarray,
+                                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the number of corner nodes, area, centroid, and normal of some
+    shells as arrays
+
+    The area/normal are calculated like ``_get_pload4_area_centroid_normal_nface``.
+    """
+    nelements = len(elements)
+    nface = np.array([PLOAD4_SHELL_NFACE[elem.type] for elem in elements], dtype='int32')
+    axb = np.zeros((nelements, 3), dtype='float64')
+    centroid = np.zeros((nelements, 3), dtype='float64')
+
+    itri = np.where(nface == 3)[0]
+    if len(itri):
+        n1, n2, n3 = get_element_node_xyz(
+            all_nids, xyz_cid0, [elements[i] for i in itri.tolist()], 3, 'PLOAD4 triangle')
+        axb[itri] = np.cross(n1 - n2, n1 - n3)
+        centroid[itri] = (n1 + n2 + n3) / 3.
+
+    iquad = np.where(nface == 4)[0]
+    if len(iquad):
+        n1, n2, n3, n4 = get_element_node_xyz(
+            all_nids, xyz_cid0, [elements[i] for i in iquad.tolist()], 4, 'PLOAD4 quad')
+        axb[iquad] = np.cross(n1 - n3, n2 - n4)
+        centroid[iquad] = (n1 + n2 + n3 + n4) / 4.
+
+    nunit = np.linalg.norm(axb, axis=1)
+    izero = np.where(nunit == 0.)[0]
+    if len(izero):
+        eids = [elements[i].eid for i in izero.tolist()]
+        raise FloatingPointError('the PLOAD4 elements have an area of 0.0; eids=%s' % eids)
+    area = 0.5 * nunit
+    normal = axb / nunit[:, np.newaxis]
+    return nface, area, centroid, normal
 
 
 def _bar_eq_pload1(load, elem, xyz, Ldir,
@@ -14,6 +14,7 @@ import numpy as np
 #from pyNastran.bdf.cards.materials import get_mat_props_S
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.utils.mathematics import integrate_positive_unit_line
+from pyNastran.bdf.mesh_utils.node_arrays import get_xyz_cid0_array, get_element_node_xyz
 
 NO_MASS = {
     # has mass
@@ -396,6 +397,25 @@ def _increment_inertia(centroid, reference_point, m, mass, cg, I):
     cg += m * centroid
     return mass
 
+def _increment_inertia_array(centroids, reference_point, m, mass, cg, I):
+    """vectorized version of ``_increment_inertia``"""
+    dxyz = centroids - reference_point
+    x = dxyz[:, 0]
+    y = dxyz[:, 1]
+    z = dxyz[:, 2]
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    I[0] += m.dot(y2 + z2)  # Ixx
+    I[1] += m.dot(x2 + z2)  # Iyy
+    I[2] += m.dot(x2 + y2)  # Izz
+    I[3] += m.dot(x * y)    # Ixy
+    I[4] += m.dot(x * z)    # Ixz
+    I[5] += m.dot(y * z)    # Iyz
+    mass += m.sum()
+    cg += m.dot(centroids)
+    return mass
+
 def mass_properties_nsm(model, element_ids=None, mass_ids=None, nsm_id=None,
                         reference_point=None,
                         sym_axis=None, scale=None, inertia_reference='cg',
@@ -566,6 +586,367 @@ def mass_properties_nsm(model, element_ids=None, mass_ids=None, nsm_id=None,
     mass, cg, inertia = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, inertia)
     return mass, cg, inertia
 
+#: the element types that are handled by ``mass_properties_vectorized``;
+#: the rest use the ``mass_properties_nsm`` helpers
+VECTORIZED_MASS_TYPES = {
+    'CROD', 'CONROD', 'CTUBE', 'CBAR',
+    'CTRIA3', 'CTRIA6', 'CTRIAR',
+    'CQUAD4', 'CQUAD8', 'CQUADR',
+    'CSHEAR',
+    'CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM',
+}
+
+def mass_properties_vectorized(model, element_ids=None, mass_ids=None, nsm_id=None,
+                               reference_point=None,
+                               sym_axis=None, scale=None, inertia_reference='cg',
+                               xyz_cid0_dict=None, debug=False):
+    """
+    Calculates mass properties in the global system about the
+    reference point.  Considers NSM, NSM1, NSML, NSML1.
+
+    This is the array-based version of ``mass_properties_nsm``.  The
+    elements are grouped by type, the lengths/areas/volumes, centroids
+    and masses of each group are calculated from a node position array
+    and the mass, cg, and inertia are summed at once.  Element types
+    that aren't in ``VECTORIZED_MASS_TYPES`` (e.g., CBEAM, CONM2) use the
+    ``mass_properties_nsm`` helpers.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    element_ids : list[int]; (n, ) ndarray, optional
+        An array of element ids.
+    mass_ids : list[int]; (n, ) ndarray, optional
+        An array of mass ids.
+    nsm_id : int
+        the NSM id to consider
+    reference_point : ndarray/int, optional
+        type : ndarray
+            An array that defines the origin of the frame.
+            default = <0,0,0>.
+        type : int
+            the node id
+    sym_axis : str, optional
+        The axis to which the model is symmetric.
+        If AERO cards are used, this can be left blank.
+        allowed_values = 'no', x', 'y', 'z', 'xy', 'yz', 'xz', 'xyz'
+    scale : float, optional
+        The WTMASS scaling value.
+        default=None -> PARAM, WTMASS is used
+        float > 0.0
+    inertia_reference : str; default='cg'
+        'cg' : inertia is taken about the cg
+        'ref' : inertia is about the reference point
+    xyz_cid0_dict : dict[nid] : xyz; default=None -> auto-calculate
+        mapping of the node id to the global position
+    debug : bool; default=False
+        developer debug; may be removed in the future
+
+    Returns
+    -------
+    mass : float
+        The mass of the model.
+    cg : ndarray
+        The cg of the model as an array.
+    inertia : ndarray
+        Moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]).
+
+    .. seealso:: mass_properties_nsm
+
+    """
+    reference_point, is_cg = _update_reference_point(
+        model, reference_point, inertia_reference)
+    element_ids, unused_elements, mass_ids, unused_masses = _mass_properties_elements_init(
+        model, element_ids, mass_ids)
+
+    all_nids, xyz_cid0 = get_xyz_cid0_array(model, xyz_cid0_dict)
+
+    mass = 0.
+    cg = array([0., 0., 0.])
+    inertia = array([0., 0., 0., 0., 0., 0., ])
+
+    idtype = model._upcast_int_dtype(dtype='int32')
+    all_eids = np.array(list(model.elements.keys()), dtype=idtype)
+    all_eids.sort()
+
+    all_mass_ids = np.array(list(model.masses.keys()), dtype=idtype)
+    all_mass_ids.sort()
+    element_ids_array = np.asarray(element_ids, dtype=idtype)
+
+    etypes_skipped = set()
+    area_eids_pids = defaultdict(list)
+    areas = defaultdict(list)
+    nsm_centroids_area = defaultdict(list)
+
+    length_eids_pids = defaultdict(list)
+    nsm_centroids_length = defaultdict(list)
+    lengths = defaultdict(list)
+
+    element_masses = []
+    element_centroids = []
+    xyz = None
+    no_mass = NO_MASS
+    for etype, eids in model._type_to_id_map.items():
+        if etype in no_mass or len(eids) == 0:
+            continue
+        if etype not in VECTORIZED_MASS_TYPES:
+            if xyz is None:
+                xyz = xyz_cid0_dict
+                if xyz is None:
+                    xyz = dict(zip(all_nids.tolist(), xyz_cid0))
+            mass, cg, inertia = _get_mass_nsm(
+                model, element_ids, mass_ids,
+                all_eids, all_mass_ids, etypes_skipped,
+                etype, eids, xyz,
+                length_eids_pids, nsm_centroids_length, lengths,
+                area_eids_pids, nsm_centroids_area, areas,
+                mass, cg, inertia, reference_point)
+            continue
+
+        eids2 = get_sub_eids(all_eids, eids, etype)
+        if len(eids2) == 0:
+            continue
+        elements = [model.elements[eid] for eid in eids2]
+        out = _get_mass_array(etype, eids2, elements, all_nids, xyz_cid0)
+        eids2, pids, massi, centroid, area_length, nsm_key, is_area = out
+        if len(eids2) == 0:
+            continue
+
+        if nsm_key is not None and nsm_id:
+            # the (eid, pid), area/length, and centroid are only needed
+            # to distribute the NSM
+            if is_area:
+                area_eids_pids[nsm_key].extend(zip(eids2.tolist(), pids.tolist()))
+                areas[nsm_key].extend(area_length.tolist())
+                nsm_centroids_area[nsm_key].extend(centroid)
+            else:
+                length_eids_pids[nsm_key].extend(zip(eids2.tolist(), pids.tolist()))
+                lengths[nsm_key].extend(area_length.tolist())
+                nsm_centroids_length[nsm_key].extend(centroid)
+
+        is_selected = np.isin(eids2, element_ids_array)
+        element_masses.append(massi[is_selected])
+        element_centroids.append(centroid[is_selected, :])
+
+    if element_masses:
+        mass = _increment_inertia_array(
+            np.vstack(element_centroids), reference_point, np.hstack(element_masses),
+            mass, cg, inertia)
+
+    model_eids = np.array(list(model.elements.keys()), dtype=idtype)
+    model_pids = np.array(list(model.properties.keys()), dtype=idtype)
+    mass = _apply_nsm(model, nsm_id,
+                      model_eids, model_pids,
+                      area_eids_pids, areas, nsm_centroids_area,
+                      length_eids_pids, lengths, nsm_centroids_length,
+                      mass, cg, inertia, reference_point, debug=debug)
+    if mass:
+        cg /= mass
+
+    # only transform if we're calculating the inertia about the cg
+    if is_cg:
+        xyz_ref = reference_point
+        xyz_ref2 = cg
+        inertia = transform_inertia(mass, cg, xyz_ref, xyz_ref2, inertia)
+
+    mass, cg, inertia = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, inertia)
+    return mass, cg, inertia
+
+def _get_property_values(elements, pids, func):
+    """
+    Calls ``func(element)`` for the first element of each property and
+    maps the value back to every element
+    """
+    upids, ifirst, ipid = np.unique(pids, return_index=True, return_inverse=True)
+    values = np.array([func(elements[i]) for i in ifirst.tolist()], dtype='float64')
+    assert len(values) == len(upids)
+    return values[ipid]
+
+def _get_mass_array(etype, eids, elements, all_nids, xyz_cid0):
+    """
+    Gets the masses of a group of elements of the same type
+
+    Returns
+    -------
+    out : tuple
+        eids : (n, ) int ndarray
+            the element ids with mass (e.g., no PLPLANE shells)
+        pids : (n, ) int ndarray
+            the property ids (-42 for a CONROD)
+        mass : (n, ) float ndarray
+            the mass of each element
+        centroid : (n, 3) float ndarray
+            the centroid of each element
+        area_length : (n, ) float ndarray
+            the area/length of each element, which is used by the NSM
+        nsm_key : str / None
+            the key for the NSM dictionaries (e.g., 'PSHELL', 'PBAR');
+            None for solid elements
+        is_area : bool
+            is area_length an area or a length
+
+    """
+    nsm_key = None
+    is_area = False
+    area_length = None
+    if etype in ['CROD', 'CONROD', 'CTUBE', 'CBAR']:
+        xyz1, xyz2 = get_element_node_xyz(all_nids, xyz_cid0, elements, 2, etype)
+        centroid = (xyz1 + xyz2) / 2.
+        area_length = norm(xyz2 - xyz1, axis=1)
+        if etype == 'CONROD':
+            nsm_key = 'CONROD'
+            pids = np.full(len(eids), -42, dtype=eids.dtype)  # faked number
+            mass_per_length = np.array([elem.MassPerLength() for elem in elements])
+        else:
+            nsm_key = {'CROD': 'PROD', 'CTUBE': 'PTUBE', 'CBAR': 'PBAR'}[etype]
+            pids = np.array([elem.pid for elem in elements], dtype=eids.dtype)
+            if etype == 'CROD':
+                mass_per_length = _get_property_values(
+                    elements, pids, lambda elem: elem.MassPerLength())
+            else:
+                mass_per_length = _get_property_values(
+                    elements, pids, lambda elem: elem.pid_ref.MassPerLength())
+        mass = mass_per_length * area_length
+
+    elif etype in ['CTRIA3', 'CTRIA6', 'CTRIAR', 'CQUAD4', 'CQUAD8', 'CQUADR']:
+        is_area = True
+        nsm_key = 'PSHELL'
+        if etype.startswith('CTRIA'):
+            nnodes = 3
+            xyz1, xyz2, xyz3 = get_element_node_xyz(all_nids, xyz_cid0, elements, 3, etype)
+            centroid = (xyz1 + xyz2 + xyz3) / 3.
+            area_length = 0.5 * norm(cross(xyz1 - xyz2, xyz1 - xyz3), axis=1)
+            thicknesses = [[elem.T1, elem.T2, elem.T3] for elem in elements]
+        else:
+            nnodes = 4
+            xyz1, xyz2, xyz3, xyz4 = get_element_node_xyz(all_nids, xyz_cid0, elements, 4, etype)
+            centroid = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+            area_length = 0.5 * norm(cross(xyz3 - xyz1, xyz4 - xyz2), axis=1)
+            thicknesses = [[elem.T1, elem.T2, elem.T3, elem.T4] for elem in elements]
+        pids = np.array([elem.pid for elem in elements], dtype=eids.dtype)
+        tflag = np.array([elem.tflag for elem in elements])
+        # a blank thickness is nan
+        thickness = np.array(thicknesses, dtype='float64').reshape(len(eids), nnodes)
+        mass_per_area = _get_shell_mass_per_area(elements, pids, tflag, thickness)
+        is_mass = ~np.isnan(mass_per_area)
+        if not is_mass.all():
+            # PLPLANE/PPLANE
+            eids = eids[is_mass]
+            pids = pids[is_mass]
+            centroid = centroid[is_mass, :]
+            area_length = area_length[is_mass]
+            mass_per_area = mass_per_area[is_mass]
+        mass = mass_per_area * area_length
+
+    elif etype == 'CSHEAR':
+        is_area = True
+        nsm_key = 'PSHEAR'
+        xyz1, xyz2, xyz3, xyz4 = get_element_node_xyz(all_nids, xyz_cid0, elements, 4, etype)
+        centroid = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+        area_length = 0.5 * norm(cross(xyz3 - xyz1, xyz4 - xyz2), axis=1)
+        pids = np.array([elem.pid for elem in elements], dtype=eids.dtype)
+        mass_per_area = _get_property_values(
+            elements, pids, lambda elem: elem.pid_ref.MassPerArea())
+        mass = mass_per_area * area_length
+
+    elif etype in ['CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM']:
+        pids = np.array([elem.pid for elem in elements], dtype=eids.dtype)
+        if etype == 'CTETRA':
+            xyz1, xyz2, xyz3, xyz4 = get_element_node_xyz(all_nids, xyz_cid0, elements, 4, etype)
+            centroid = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+            volume = -np.einsum('ij,ij->i', xyz1 - xyz4, cross(xyz2 - xyz4, xyz3 - xyz4)) / 6.
+        elif etype == 'CPYRAM':
+            xyz1, xyz2, xyz3, xyz4, xyz5 = get_element_node_xyz(
+                all_nids, xyz_cid0, elements, 5, etype)
+            centroid1 = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+            area1 = 0.5 * norm(cross(xyz3 - xyz1, xyz4 - xyz2), axis=1)
+            centroid = (centroid1 + xyz5) / 2.
+            volume = area1 / 3. * norm(centroid1 - xyz5, axis=1)
+        elif etype == 'CPENTA':
+            xyz1, xyz2, xyz3, xyz4, xyz5, xyz6 = get_element_node_xyz(
+                all_nids, xyz_cid0, elements, 6, etype)
+            area1 = 0.5 * norm(cross(xyz3 - xyz1, xyz2 - xyz1), axis=1)
+            area2 = 0.5 * norm(cross(xyz6 - xyz4, xyz5 - xyz4), axis=1)
+            centroid1 = (xyz1 + xyz2 + xyz3) / 3.
+            centroid2 = (xyz4 + xyz5 + xyz6) / 3.
+            centroid = (centroid1 + centroid2) / 2.
+            volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+        else:
+            xyz1, xyz2, xyz3, xyz4, xyz5, xyz6, xyz7, xyz8 = get_element_node_xyz(
+                all_nids, xyz_cid0, elements, 8, etype)
+            centroid1 = (xyz1 + xyz2 + xyz3 + xyz4) / 4.
+            area1 = 0.5 * norm(cross(xyz3 - xyz1, xyz4 - xyz2), axis=1)
+            centroid2 = (xyz5 + xyz6 + xyz7 + xyz8) / 4.
+            area2 = 0.5 * norm(cross(xyz7 - xyz5, xyz8 - xyz6), axis=1)
+            centroid = (centroid1 + centroid2) / 2.
+            volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+        rho = _get_property_values(elements, pids, lambda elem: elem.Rho())
+        mass = rho * volume
+    else:  # pragma: no cover
+        raise NotImplementedError(etype)
+    return eids, pids, mass, centroid, area_length, nsm_key, is_area
+
+def _get_shell_mass_per_area(elements, pids, tflag, thickness):
+    """
+    Gets the mass per area of a group of CTRIA3/CQUAD4-like elements,
+    which considers the T1-T4 thicknesses for a PSHELL
+
+    Returns
+    -------
+    mass_per_area : (n, ) float ndarray
+        the mass per area; nan for a PLPLANE/PPLANE
+    """
+    upids, ifirst, ipid = np.unique(pids, return_index=True, return_inverse=True)
+    nupids = len(upids)
+    is_pshell = np.zeros(nupids, dtype='bool')
+    prop_thickness = np.zeros(nupids, dtype='float64')
+    rho = np.zeros(nupids, dtype='float64')
+    nsm = np.zeros(nupids, dtype='float64')
+    prop_mass_per_area = np.full(nupids, np.nan, dtype='float64')
+    for i, ielem in enumerate(ifirst.tolist()):
+        prop = elements[ielem].pid_ref
+        if prop.type == 'PSHELL':
+            is_pshell[i] = True
+            prop_thickness[i] = prop.Thickness()
+            rho[i] = prop.Rho()
+            nsm[i] = prop.nsm
+        elif prop.type in ['PCOMP', 'PCOMPG']:
+            prop_mass_per_area[i] = prop.get_mass_per_area()
+        elif prop.type in ['PLPLANE', 'PPLANE']:
+            pass
+        else:
+            raise NotImplementedError(prop.type)
+
+    mass_per_area = prop_mass_per_area[ipid]
+    ipshell = np.where(is_pshell[ipid])[0]
+    if len(ipshell) == 0:
+        return mass_per_area
+
+    tflag = tflag[ipshell]
+    if not np.all((tflag == 0) | (tflag == 1)):  # pragma: no cover
+        raise RuntimeError('tflag=%r' % tflag[(tflag != 0) & (tflag != 1)][0])
+    ipid_pshell = ipid[ipshell]
+    ti = prop_thickness[ipid_pshell][:, np.newaxis]
+    thickness = thickness[ipshell, :]
+    is_blank = np.isnan(thickness)
+
+    # tflag=0 : absolute
+    # tflag=1 : relative
+    is_relative = (tflag == 1)[:, np.newaxis]
+    thickness = np.where(is_relative, thickness * ti, thickness)
+    thickness = np.where(is_blank, ti, thickness)
+    thickness_sum = thickness.sum(axis=1)
+    if not np.all(thickness_sum > 0.):
+        ibad = np.where(thickness_sum <= 0.)[0][0]
+        raise AssertionError('eid=%s thicknesses=%s' % (
+            elements[ipshell[ibad]].eid, thickness[ibad, :].tolist()))
+    t = thickness_sum / thickness.shape[1]
+
+    # m/A = rho * t + nsm
+    mass_per_area[ipshell] = nsm[ipid_pshell] + rho[ipid_pshell] * t
+    return mass_per_area
+
 
 def get_sub_eids(all_eids, eids, etype):
     """supports limiting the element/mass ids"""
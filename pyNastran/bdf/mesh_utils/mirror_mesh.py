@@ -22,6 +22,23 @@ from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.mesh_utils.internal_utils import get_bdf_model
 
 
+#: the node order of a mirrored solid, so it isn't inside out
+#: (e.g., the top and bottom faces of a CHEXA are swapped)
+SOLID_MIRROR_NODE_ORDER = {
+    ('CTETRA', 4): [0, 2, 1, 3],
+    ('CTETRA', 10): [0, 2, 1, 3,
+                     6, 5, 4, 7, 9, 8],
+    ('CPYRAM', 5): [0, 3, 2, 1, 4],
+    ('CPYRAM', 13): [0, 3, 2, 1, 4,
+                     8, 7, 6, 5, 9, 12, 11, 10],
+    ('CPENTA', 6): [3, 4, 5, 0, 1, 2],
+    ('CPENTA', 15): [3, 4, 5, 0, 1, 2,
+                     12, 13, 14, 9, 10, 11, 6, 7, 8],
+    ('CHEXA', 8): [4, 5, 6, 7, 0, 1, 2, 3],
+    ('CHEXA', 20): [4, 5, 6, 7, 0, 1, 2, 3,
+                    16, 17, 18, 19, 12, 13, 14, 15, 8, 9, 10, 11],
+}
+
 def bdf_mirror_plane(bdf_filename: Union[str, BDF], plane, mirror_model=None,
                      log=None, debug: bool=True, use_nid_offset: bool=True):
     """mirrors a model about an arbitrary plane"""
@@ -359,7 +376,7 @@ def __mirror_elements(model: BDF, mirror_model: BDF,
         'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
         'CVISC',
     }
-    solids = {'CHEXA', 'CPENTA', 'CTETRA', 'CYPRAM'}
+    solids = {'CHEXA', 'CPENTA', 'CTETRA', 'CPYRAM'}
     generic_types = {
         'CSHEAR',
         'CTRIAX6',
@@ -412,14 +429,16 @@ def __mirror_elements(model: BDF, mirror_model: BDF,
                 element_cids.add(element.theta_mcid)
                 element2.theta_mcid += cid_offset
         elif etype in solids:
-            # what about inverting solids?
+            # mirroring turns the solid inside out, so the nodes are
+            # reordered to keep a positive volume
             nodes2 = [node_id + nid_offset if node_id is not None else None
                      for node_id in nodes1]
-            etypes_skipped.add(etype)
-            element2.nodes2 = nodes2
-            element2.cross_reference(model)
-            vol = element2.Volume()
-            assert vol >= 0., vol
+            inodes = SOLID_MIRROR_NODE_ORDER[(etype, len(nodes2))]
+            element2.nodes = [nodes2[inode] for inode in inodes]
+            if mirror_model is model:
+                element2.cross_reference(model)
+                vol = element2.Volume()
+                assert vol >= 0., vol
         elif etype in shell_nones:
             nodes2 = [node_id + nid_offset if node_id is not None else None
                      for node_id in nodes1]
@@ -0,0 +1,86 @@
+"""
+Defines array helpers for the node positions that are shared by the
+vectorized mass properties and load summations:
+  - all_nids, xyz_cid0 = get_xyz_cid0_array(model, xyz_cid0_dict=None)
+  - xyz1, xyz2, ... = get_element_node_xyz(all_nids, xyz_cid0, elements, nnodes, etype)
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+
+def get_xyz_cid0_array(model: BDF,
+                       xyz_cid0_dict: Optional[Dict[int, np.ndarray]]=None,
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the sorted node ids and their positions in the global frame
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    xyz_cid0_dict : Dict[nid] = (3, ) float ndarray; default=None
+        the positions of the nodes in the global frame
+        None : use model.nodes
+
+    Returns
+    -------
+    all_nids : (nnodes, ) int ndarray
+        the sorted node ids
+    xyz_cid0 : (nnodes, 3) float ndarray
+        the positions of the nodes in the global frame
+
+    """
+    if xyz_cid0_dict is not None:
+        all_nids = np.array(sorted(xyz_cid0_dict), dtype='int64')
+        xyz_cid0 = np.array([xyz_cid0_dict[nid] for nid in all_nids.tolist()], dtype='float64')
+        xyz_cid0 = xyz_cid0.reshape(len(all_nids), 3)
+    elif model.nodes:
+        out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int64')
+        nid_cp_cd, xyz_cid0 = out[:2]
+        all_nids = nid_cp_cd[:, 0]
+    else:
+        all_nids = np.zeros(0, dtype='int64')
+        xyz_cid0 = np.zeros((0, 3), dtype='float64')
+    return all_nids, xyz_cid0
+
+
+def get_element_node_xyz(all_nids: np.ndarray, xyz_cid0: np.ndarray,
+                         elements: List[Any], nnodes: int, etype: str) -> List[np.ndarray]:
+    """
+    Gets the positions of the first nnodes nodes of each element
+
+    Parameters
+    ----------
+    all_nids : (nnodes_all, ) int ndarray
+        the sorted node ids (see ``get_xyz_cid0_array``)
+    xyz_cid0 : (nnodes_all, 3) float ndarray
+        the positions of the nodes in the global frame
+    elements : List[Element]
+        the elements (all of the same type)
+    nnodes : int
+        the number of nodes to get (e.g., 4 for a CQUAD8)
+    etype : str
+        the element type for the error message
+
+    Returns
+    -------
+    xyzs : List[(nelements, 3) float ndarray]
+        the positions of node 1, node 2, ... of each element
+
+    """
+    nids = np.array([elem.nodes[:nnodes] for elem in elements], dtype='int64')
+    if len(all_nids) == 0:
+        raise KeyError('there are no nodes for %s eid=%s' % (etype, elements[0].eid))
+    inids = np.minimum(np.searchsorted(all_nids, nids), len(all_nids) - 1)
+    is_missing = all_nids[inids] != nids
+    if is_missing.any():
+        ieid = np.where(is_missing.any(axis=1))[0][0]
+        msg = 'missing nodes for %s eid=%s; nids=%s' % (
+            etype, elements[ieid].eid, nids[ieid].tolist())
+        raise KeyError(msg)
+    xyz = xyz_cid0[inids, :]
+    return [xyz[:, i, :] for i in range(nnodes)]
@@ -1,13 +1,15 @@
 """
 defines:
- - get_solid_skin_faces(model)
+ - write_skin_solid_faces(model, skin_filename,
+                          write_solids=False, write_shells=True,
+                          size=8, is_double=False, encoding=None)
 
-"""
-from collections import defaultdict
-from copy import deepcopy
+get_solid_skin_faces(model) is in pyNastran.bdf.mesh_utils.free_faces
 
+"""
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
+from pyNastran.bdf.mesh_utils.free_faces import get_solid_skin_faces
 
 
 def write_skin_solid_faces(model, skin_filename,
@@ -98,71 +100,6 @@ def write_skin_solid_faces(model, skin_filename,
                             size=size, is_double=is_double, encoding=encoding)
 
 
-def get_solid_skin_faces(model):
-    """
-    Gets the elements and faces that are skinned from solid elements.
-    This doesn't include internal faces or existing shells.
-
-    Parameters
-    ----------
-    model : BDF()
-        the BDF object
-
-    Returns
-    -------
-    eid_set : Dict[sorted_face] = eids
-       sorted_face : tuple(int, int, ...)
-           the face nids in sorted order
-       eids : List[int]
-           list of element ids with that face
-    face_map : Dict[sorted_face] = face
-       sorted_face : tuple(int, int, ...)
-           the face nids in sorted order
-       face : List(int, int, ...)
-           the face nids
-
-    """
-    eid_faces = model.get_element_faces()
-    face_set = defaultdict(int)
-    eid_set = defaultdict(list)
-    face_map = {}
-    for eid, face in eid_faces:
-        #print(eid, face)
-        raw_face = deepcopy(face)
-        try:
-            face.sort()
-        except:
-            print('face = %s' % str(face))
-            raise
-        tface = tuple(face)
-        #print(tface)
-        face_set[tface] += 1
-        eid_set[tface].append(eid)
-        face_map[tface] = raw_face
-
-    #print('eid_set:')
-    #for tface, eidset in eid_set.items():
-        #print(tface, eidset)
-
-    #print('face_set:')
-    #for tface, faceset in face_set.items():
-        #print(tface, faceset)
-
-    #print('face_map:')
-    #for tface, facemap in face_map.items():
-        #print(tface, facemap)
-
-    del_faces = []
-    for face, face_count in face_set.items():
-        if face_count == 2:
-            del_faces.append(face)
-
-    for face in del_faces:
-        del face_set[face]
-        del eid_set[face]
-    return eid_set, face_map
-
-
 def _write_skin_solid_faces(model, skin_filename, face_map,
                             nids_to_write, eids_to_write, mids_to_write, eid_set,
                             eid_shell, pid_shell, mid_shell,
@@ -209,9 +146,7 @@ def _write_skin_solid_faces(model, skin_filename, face_map,
     encoding = model.get_encoding(encoding)
     with open(skin_filename, 'w', encoding=encoding) as bdf_file:
         bdf_file.write('$ pyNastran: punch=True\n')
-        for nid in sorted(nids_to_write):
-            if nid is None:
-                continue
+        for nid in sorted(nid for nid in nids_to_write if nid is not None):
             node = model.nodes[nid]
             bdf_file.write(node.write_card(size=size, is_double=is_double))
 
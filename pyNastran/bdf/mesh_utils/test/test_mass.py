@@ -5,6 +5,7 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.node_arrays import get_xyz_cid0_array, get_element_node_xyz
 from pyNastran.utils import object_methods
 
 PKG_PATH = pyNastran.__path__[0]
@@ -163,5 +164,32 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_node_arrays(self):
+        """tests get_xyz_cid0_array and get_element_node_xyz"""
+        model = BDF(debug=False)
+        model.add_grid(3, [0., 1., 0.], cp=1)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_cord2r(1, [0., 0., 1.], [0., 0., 2.], [1., 0., 1.])
+        model.add_ctria3(10, 100, [1, 2, 3])
+        model.add_ctria3(11, 100, [3, 2, 4])
+        model.cross_reference(xref_elements=False, xref_properties=False)
+
+        all_nids, xyz_cid0 = get_xyz_cid0_array(model)
+        assert all_nids.tolist() == [1, 2, 3], all_nids
+        assert np.allclose(xyz_cid0[2], [0., 1., 1.]), xyz_cid0
+
+        xyz_cid0_dict = {nid: node.get_position() for nid, node in model.nodes.items()}
+        all_nids2, xyz_cid02 = get_xyz_cid0_array(model, xyz_cid0_dict)
+        assert np.array_equal(all_nids, all_nids2)
+        assert np.allclose(xyz_cid0, xyz_cid02)
+
+        xyz1, xyz2, xyz3 = get_element_node_xyz(
+            all_nids, xyz_cid0, [model.elements[10]], 3, 'CTRIA3')
+        assert np.allclose(xyz1, [[0., 0., 0.]]), xyz1
+        assert np.allclose(xyz3, [[0., 1., 1.]]), xyz3
+        with self.assertRaises(KeyError):
+            get_element_node_xyz(all_nids, xyz_cid0, [model.elements[11]], 3, 'CTRIA3')
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
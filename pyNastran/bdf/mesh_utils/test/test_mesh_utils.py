@@ -2,6 +2,7 @@
 import os
 import unittest
 from io import StringIO
+from itertools import product
 
 from docopt import DocoptExit
 import numpy as np
@@ -9,8 +10,10 @@ from cpylog import SimpleLogger
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_equivalence import bdf_equivalence_nodes
+from pyNastran.bdf.mesh_utils.bdf_equivalence import (
+    bdf_equivalence_nodes, _find_close_node_pairs, _union_find)
 from pyNastran.bdf.mesh_utils.export_mcids import export_mcids
+from pyNastran.bdf.mesh_utils.extract_bodies import extract_bodies, extract_bodies_arrays
 from pyNastran.bdf.mesh_utils.split_cbars_by_pin_flag import split_cbars_by_pin_flag
 from pyNastran.bdf.mesh_utils.split_elements import split_line_elements
 from pyNastran.bdf.mesh_utils.pierce_shells import (
@@ -18,7 +21,7 @@ from pyNastran.bdf.mesh_utils.pierce_shells import (
 from pyNastran.bdf.mesh_utils.mirror_mesh import (
     write_bdf_symmetric, bdf_mirror, bdf_mirror_plane)
 from pyNastran.bdf.mesh_utils.mass_properties import (
-    mass_properties, mass_properties_nsm)  #mass_properties_breakdown
+    mass_properties, mass_properties_nsm, mass_properties_vectorized)  #mass_properties_breakdown
 from pyNastran.bdf.mesh_utils.make_half_model import make_half_model
 from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge
 from pyNastran.bdf.mesh_utils.utils import cmd_line
@@ -123,6 +126,151 @@ class TestMeshUtils(unittest.TestCase):
         cmd_line(argv=['bdf', 'free_faces', bdf_filename, skin_filename], quiet=True)
         os.remove(skin_filename)
 
+    def test_solid_skin_faces(self):
+        """tests get_solid_skin_faces with CHEXA8, CPENTA6 and blank CTETRA10 midside nodes"""
+        from pyNastran.bdf.mesh_utils.free_faces import (
+            get_solid_skin_faces, get_solid_face_arrays, write_skin_solid_faces)
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        model.add_psolid(1, 1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        x = np.linspace(0., 1., num=4)
+        create_structured_chexas(model, 1, x, x, x, 4, 4, 4, eid=1, nid=1)
+        nids = [nid for nid in model.nodes if model.nodes[nid].xyz[2] == 1.]
+        for i, nid in enumerate(nids[:4]):
+            model.add_grid(100 + i, model.nodes[nid].xyz + [0., 0., 1.])
+
+        # a CPENTA6 and a CTETRA10 that don't share faces with the CHEXA8s
+        model.add_cpenta(100, 1, [1, 2, 3, 101, 102, 103])
+        model.add_ctetra(101, 1, [100, 101, 102, 103, None, None, None, None, None, None])
+        face_arrays = get_solid_face_arrays(model)
+        eids, faces, ifaces = face_arrays[4]
+        assert faces.shape == (27 * 6 + 3, 4), faces.shape
+        assert np.array_equal(faces[0], model.elements[1].faces[1])
+        assert faces.shape[0] == len(eids) == len(ifaces)
+        assert face_arrays[6][1][:, 3:].max() == 0
+
+        eid_set, face_map = get_solid_skin_faces(model)
+        # 54 CHEXA8 faces, 5 CPENTA6 faces and the CTETRA10 faces
+        assert len(eid_set) == 54 + 5 + 4, len(eid_set)
+        for face, eids in eid_set.items():
+            assert len(eids) == 1, (face, eids)
+        tetra_faces = [face for face, eids in eid_set.items() if eids == [101]]
+        assert tetra_faces[0] == (100, 101, 102, None, None, None), tetra_faces
+        assert face_map[tetra_faces[0]] == [100, 101, 102, None, None, None]
+
+        # the original implementation
+        eid_set_expected = {}
+        face_count = {}
+        for eid, face in model.get_element_faces():
+            if eid == 101:
+                continue
+            tface = tuple(sorted(face))
+            face_count[tface] = face_count.get(tface, 0) + 1
+            eid_set_expected.setdefault(tface, []).append(eid)
+        eid_set_expected = {face: eids for face, eids in eid_set_expected.items()
+                            if face_count[face] != 2}
+        eid_set_no_tetra = {face: eids for face, eids in eid_set.items() if eids != [101]}
+        assert list(eid_set_no_tetra.items()) == list(eid_set_expected.items())
+
+        # the internal faces are in face_map and eid_set is a defaultdict
+        assert len(face_map) == len(face_count) + 4, len(face_map)
+        assert set(face_count) < set(face_map)
+        eid_set[(1, 2, 3, 4)].append(1000)
+
+        skin_filename = os.path.join(DIRNAME, 'skin_faces.bdf')
+        write_skin_solid_faces(model, skin_filename)
+        model2 = read_bdf(skin_filename, log=log)
+        assert model2.card_count['CQUAD4'] == 54 + 3, model2.card_count
+        assert model2.card_count['CTRIA6'] == 4, model2.card_count
+        os.remove(skin_filename)
+
+    def test_mass_properties_vectorized(self):
+        """tests mass_properties_vectorized against mass_properties_nsm"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'bwb', 'bwb_saero.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        eids = list(model.elements)[::3]
+        xyz_cid0_dict = {nid: node.get_position() for nid, node in model.nodes.items()}
+        for kwargs in [{}, {'reference_point': [10., 20., 30.], 'inertia_reference': 'ref'},
+                       {'element_ids': eids, 'mass_ids': list(model.masses)},
+                       {'element_ids': eids, 'xyz_cid0_dict': xyz_cid0_dict}]:
+            mass1, cg1, inertia1 = mass_properties_nsm(model, **kwargs)
+            mass2, cg2, inertia2 = mass_properties_vectorized(model, **kwargs)
+            assert np.allclose(mass1, mass2), (kwargs, mass1, mass2)
+            assert np.allclose(cg1, cg2), (kwargs, cg1, cg2)
+            assert np.allclose(inertia1, inertia2), (kwargs, inertia1, inertia2)
+
+        model = BDF(log=log)
+        model.add_psolid(1, 1)
+        model.add_mat1(1, 3.0e7, None, 0.3, rho=0.1)
+        x = np.linspace(0., 1., num=4)
+        create_structured_chexas(model, 1, x, x, 2 * x, 4, 4, 4, eid=1, nid=1)
+        model.cross_reference()
+        mass, cg, unused_inertia = mass_properties_vectorized(model)
+        assert np.allclose(mass, 0.2), mass
+        assert np.allclose(cg, [0.5, 0.5, 1.0]), cg
+
+    def test_extract_bodies(self):
+        """tests extract_bodies with rigid elements, masses and MPCs"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        x = np.linspace(0., 1., num=3)
+        create_structured_chexas(model, 1, x, x, x, 3, 3, 3, eid=1, nid=1)
+        create_structured_chexas(model, 1, x + 2., x, x, 3, 3, 3, eid=101, nid=101)
+        for nid in range(201, 206):
+            model.add_grid(nid, [5., 0., float(nid)])
+        model.add_rbe2(1001, 201, '123456', [202])
+        model.add_conm2(2001, 202, 1.0)
+        model.add_conm2(2002, 205, 1.0)
+        model.add_celas2(3001, 1.0, [204, None])
+        model.add_mpc(1, [27, 101], ['3', '3'], [1., -1.])
+        model.add_mpc(2, [202, 204], ['1', '1'], [1., -1.])
+        model.add_mpcadd(3, [1, 2])
+
+        bodies = extract_bodies(model)
+        assert len(bodies) == 4, bodies
+        assert bodies[0] == set(range(1, 9)), bodies[0]
+        assert bodies[1] == set(range(101, 109)), bodies[1]
+        assert bodies[2] == {3001}, bodies[2]
+        assert bodies[3] == {3001 + 1001}, bodies[3]
+        assert bodies == extract_bodies(model, mpc_id=0)
+
+        bodies = extract_bodies_arrays(model)
+        assert len(bodies) == 5, bodies
+        eids, rigid_eids, mass_ids = bodies[0]
+        assert np.array_equal(eids, np.arange(1, 9)), eids
+        assert len(rigid_eids) == 0 and len(mass_ids) == 0
+        assert np.array_equal(bodies[1][0], np.arange(101, 109)), bodies[1]
+        assert np.array_equal(bodies[2][0], [3001]), bodies[2]
+        assert np.array_equal(bodies[3][1], [1001]), bodies[3]
+        assert np.array_equal(bodies[3][2], [2001]), bodies[3]
+        assert np.array_equal(bodies[4][2], [2002]), bodies[4]
+
+        bodies = extract_bodies_arrays(model, mpc_id=1)
+        assert len(bodies) == 4, bodies
+        assert np.array_equal(bodies[0][0], np.hstack([np.arange(1, 9), np.arange(101, 109)]))
+
+        bodies = extract_bodies_arrays(model, mpc_id=3)
+        assert len(bodies) == 3, bodies
+        assert np.array_equal(bodies[1][0], [3001]), bodies[1]
+        assert np.array_equal(bodies[1][1], [1001]), bodies[1]
+        bodies0 = extract_bodies_arrays(model, mpc_id=0)
+        assert len(bodies0) == 3, bodies0
+        for ibody, body in bodies.items():
+            for ids, ids0 in zip(body, bodies0[ibody]):
+                assert np.array_equal(ids, ids0)
+
+    def test_stats(self):
+        """tests bdf stats"""
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        scan = cmd_line(argv=['bdf', 'stats', bdf_filename], quiet=True)
+        model = read_bdf(bdf_filename, xref=False, debug=None)
+        assert scan.card_count == dict(model.card_count), scan.card_count
+
+        model2 = cmd_line(argv=['bdf', 'stats', bdf_filename, '--profile'], quiet=True)
+        assert model2.profile_stats['cards']['CTETRA']['count'] == model.card_count['CTETRA']
+
     def test_structured_cquads(self):
         """tests create_structured_cquad4s"""
         pid = 42
@@ -318,6 +466,9 @@ class TestMeshUtils(unittest.TestCase):
         with self.assertRaises(SystemExit):
             cmd_line(argv=['bdf', 'merge'])
 
+        with self.assertRaises(SystemExit):
+            cmd_line(argv=['bdf', 'stats'])
+
         with self.assertRaises(SystemExit):
             cmd_line(argv=['bdf', 'export_caero_mesh'])
 
@@ -735,6 +886,35 @@ class TestMeshUtils(unittest.TestCase):
         make_half_model(model, plane='xz', zero_tol=1e-12)
         #model.validate()
 
+    def test_mirror_solids(self):
+        """mirrors a CHEXA, CPENTA, and CTETRA"""
+        log = SimpleLogger(level='warning')
+        model = BDF(log=log)
+        model.add_grid(1, [0., 1., 0.])
+        model.add_grid(2, [1., 1., 0.])
+        model.add_grid(3, [1., 2., 0.])
+        model.add_grid(4, [0., 2., 0.])
+        model.add_grid(5, [0., 1., 1.])
+        model.add_grid(6, [1., 1., 1.])
+        model.add_grid(7, [1., 2., 1.])
+        model.add_grid(8, [0., 2., 1.])
+        model.add_chexa(1, 10, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_cpenta(2, 10, [1, 2, 3, 5, 6, 7])
+        model.add_ctetra(3, 10, [1, 2, 3, 5])
+        model.add_psolid(10, 100)
+        model.add_mat1(100, 3.0e7, None, 0.3, rho=1.0)
+
+        model, nid_offset, eid_offset = bdf_mirror(model, plane='xz', log=log)
+        assert len(model.elements) == 6, model.elements
+        for eid in [1, 2, 3]:
+            elem = model.elements[eid]
+            elem2 = model.elements[eid + eid_offset]
+            assert set(elem2.node_ids) == {nid + nid_offset for nid in elem.node_ids}, elem2
+            assert np.allclose(elem.Volume(), elem2.Volume()), (elem.Volume(), elem2.Volume())
+            centroid = elem.Centroid()
+            centroid2 = elem2.Centroid()
+            assert np.allclose(centroid * [1., -1., 1.], centroid2), (centroid, centroid2)
+
     def test_pierce_model(self):
         """tests pierce_shell_model"""
         log = SimpleLogger(level='error')
@@ -1201,6 +1381,67 @@ class TestEquiv(unittest.TestCase):
         node_ids = list(sorted(model.nodes))
         assert node_ids == [1], node_ids
 
+    def test_eq_union_find(self):
+        """tests method='union_find' with chains, a node_set and tiles"""
+        log = SimpleLogger(level='error')
+        bdf_filename_out = os.path.join(DIRNAME, 'eq_union_find.bdf')
+
+        # the chain 10->9->...->1 is fully merged
+        model = BDF(log=log)
+        for nid in range(1, 11):
+            model.add_grid(nid, [0., 0., 0.])
+        model.add_celas2(1, 2.0, [10, None], c1=2, c2=0)
+        bdf_equivalence_nodes(model, bdf_filename_out, 1.0, xref=True,
+                              log=log, debug=False, method='union_find')
+        model = save_check_nodes(bdf_filename_out, log, nnodes=1)
+        assert list(model.nodes) == [1], list(model.nodes)
+
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(20, [1., 0., 0.])
+        model.add_grid(3, [1.01, 0., 0.])
+        model.add_grid(41, [1., 1., 0.])
+        model.add_grid(4, [1., 1., 0.])
+        model.add_grid(40, [1., 1., 0.])
+        model.add_grid(5, [0., 1., 0.])
+        model.add_grid(6, [0., 1.01, 0.])
+        model.add_ctria3(1, 100, [1, 20, 6])
+        model.add_ctria3(10, 100, [3, 40, 5])
+        model.add_pshell(100, mid1=1000, t=0.1)
+        model.add_mat1(1000, 3.0, None, 0.3)
+        bdf_equivalence_nodes(model, bdf_filename_out, 0.2, node_set=[4, 40, 41],
+                              log=log, debug=False, method='union_find')
+        model = save_check_nodes(bdf_filename_out, log, nnodes=6)
+        assert list(sorted(model.nodes)) == [1, 3, 4, 5, 6, 20], list(sorted(model.nodes))
+        assert model.elements[10].node_ids == [3, 4, 5], model.elements[10].node_ids
+
+        # tiles give the same result as one tree
+        x = np.linspace(0., 1., num=11)
+        nodes_xyz = np.array(list(product(x, x, x)))
+        nodes_xyz = np.vstack([nodes_xyz, nodes_xyz[::7, :] + 0.001])
+        pairs = _find_close_node_pairs(nodes_xyz, 0.01)
+        for tile_size, nworkers in [(0.15, 1), (0.3, 2), (None, 3)]:
+            pairsi = _find_close_node_pairs(nodes_xyz, 0.01, tile_size=tile_size,
+                                            nworkers=nworkers)
+            assert len(pairsi) == len(pairs) == 191, len(pairsi)
+            assert np.array_equal(pairsi[np.lexsort(pairsi.T[::-1])], pairs[np.lexsort(pairs.T[::-1])])
+        with self.assertRaises(ValueError):
+            _find_close_node_pairs(nodes_xyz, 0.01, tile_size=0.005)
+
+        iroot = _union_find(6, np.array([[4, 5], [2, 4], [0, 1]]))
+        assert np.array_equal(iroot, [0, 0, 2, 3, 2, 2]), iroot
+
+        # the options of the other methods aren't silently ignored
+        with self.assertRaises(NotImplementedError):
+            bdf_equivalence_nodes(model, None, 0.2, remove_collapsed_elements=True,
+                                  log=log, debug=False, method='union_find')
+        with self.assertRaises(NotImplementedError):
+            bdf_equivalence_nodes(model, None, 0.2, avoid_collapsed_elements=True,
+                                  log=log, debug=False, method='union_find')
+        with self.assertRaises(ValueError):
+            bdf_equivalence_nodes(model, None, 0.2, neq_max=10,
+                                  log=log, debug=False, method='union_find')
+
 
 def save_check_nodes(bdf_filename, log, nnodes, skip_cards=None):
     model = BDF(log=log, debug=False)
@@ -7,7 +7,8 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_batch)
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
@@ -483,6 +484,50 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(F2_expected, F1), 'loadcase_id=%s F_expected=%s F1=%s' % (loadcase_id, F2_expected, F1))
         self.assertTrue(allclose(M2_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M2_expected, M1))
 
+    def test_loads_sum_batch(self):
+        """tests that sum_forces_moments_batch matches the load case loop"""
+        model = BDF(log=log, debug=False)
+        bdf_filename = os.path.join(model_path, 'plate', 'plate.bdf')
+        model.read_bdf(bdf_filename)
+        model.add_cord2r(100, [1., 2., 3.], [1., 2., 4.], [2., 3., 3.])
+        model.cross_reference()
+        loadcase_ids = list(model.load_combinations) + list(model.loads)
+
+        p0 = array([1., 2., 0.5])
+        eids = list(model.element_ids)[::2]
+        nids = list(model.node_ids)[::2]
+        for cid in [0, 100]:
+            forces, moments = sum_forces_moments_batch(model, p0, loadcase_ids, cid=cid)
+            forces2, moments2 = sum_forces_moments_batch(
+                model, p0, loadcase_ids, eids=eids, nids=nids, cid=cid)
+            assert forces.shape == (len(loadcase_ids), 3), forces.shape
+            for i, loadcase_id in enumerate(loadcase_ids):
+                F1, M1 = sum_forces_moments(model, p0, loadcase_id, cid=cid)
+                assert np.allclose(F1, forces[i]), 'loadcase_id=%s F1=%s F=%s' % (
+                    loadcase_id, F1, forces[i])
+                assert np.allclose(M1, moments[i]), 'loadcase_id=%s M1=%s M=%s' % (
+                    loadcase_id, M1, moments[i])
+
+                F2, M2 = sum_forces_moments_elements(model, p0, loadcase_id, eids, nids, cid=cid)
+                assert np.allclose(F2, forces2[i]), 'loadcase_id=%s F2=%s F=%s' % (
+                    loadcase_id, F2, forces2[i])
+                assert np.allclose(M2, moments2[i]), 'loadcase_id=%s M2=%s M=%s' % (
+                    loadcase_id, M2, moments2[i])
+
+        # PLOAD1s are summed one load case at a time
+        model = BDF(log=log, debug=False)
+        bdf_filename = os.path.join(model_path, 'elements', 'static_elements.bdf')
+        model.read_bdf(bdf_filename)
+        p0 = 1
+        loadcase_ids = [10000, 123458]
+        forces, moments = sum_forces_moments_batch(model, p0, loadcase_ids)
+        for i, loadcase_id in enumerate(loadcase_ids):
+            F1, M1 = sum_forces_moments(model, p0, loadcase_id)
+            assert np.allclose(F1, forces[i]), 'loadcase_id=%s F1=%s F=%s' % (
+                loadcase_id, F1, forces[i])
+            assert np.allclose(M1, moments[i]), 'loadcase_id=%s M1=%s M=%s' % (
+                loadcase_id, M1, moments[i])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -6,6 +6,7 @@ defines:
     bdf mirror       IN_BDF_FILENAME [-o OUT_BDF_FILENAME] [--plane PLANE] [--tol TOL]\n'
     bdf export_mcids IN_BDF_FILENAME [-o OUT_GEOM_FILENAME]\n'
     bdf split_cbars_by_pin_flags IN_BDF_FILENAME [-o OUT_BDF_FILENAME]\n'
+    bdf stats        IN_BDF_FILENAME [--punch] [--profile] [--memory]\n'
 
 """
 import os
@@ -820,6 +821,60 @@ def cmd_line_split_cbars_by_pin_flag(argv=None, quiet=False):
     split_cbars_by_pin_flag(bdf_filename_in, pin_flags_filename=pin_flags_filename,
                             bdf_filename_out=bdf_filename_out)
 
+def cmd_line_stats(argv=None, quiet=False):
+    """command line interface to scan_bdf and read_bdf(..., profile=True)"""
+    if argv is None:
+        argv = sys.argv
+
+    from docopt import docopt
+    import pyNastran
+    msg = (
+        'Usage:\n'
+        '  bdf stats IN_BDF_FILENAME [--punch] [--profile] [--memory]\n'
+        '  bdf stats -h | --help\n'
+        '  bdf stats -v | --version\n'
+        '\n'
+
+        "Positional Arguments:\n"
+        "  IN_BDF_FILENAME    path to input BDF/DAT/NAS file\n"
+        '\n'
+
+        'Options:\n'
+        '  --punch            flag to indicate that the file has no executive/case control decks\n'
+        '  --profile          read and cross-reference the model and print the time\n'
+        '                     of each phase and card type\n'
+        '  --memory           also print the change in memory (requires --profile; slower)\n\n'
+
+        'Info:\n'
+        '  -h, --help      show this help message and exit\n'
+        "  -v, --version   show program's version number and exit\n"
+    )
+    if len(argv) == 1:
+        sys.exit(msg)
+
+    ver = str(pyNastran.__version__)
+    data = docopt(msg, version=ver, argv=argv[1:])
+    if not quiet:  # pragma: no cover
+        print(data)
+
+    from pyNastran.bdf.bdf_interface.scan_bdf import scan_bdf
+    bdf_filename = data['IN_BDF_FILENAME']
+    punch = True if data['--punch'] else None
+    level = 'debug' if not quiet else 'warning'
+    log = SimpleLogger(level=level, encoding='utf-8', log_func=None)
+    if data['--profile']:
+        from pyNastran.bdf.bdf import read_bdf
+        profile = 'memory' if data['--memory'] else True
+        model = read_bdf(bdf_filename, punch=bool(punch), log=log, profile=profile)
+        if not quiet:  # pragma: no cover
+            print(model.get_profile_stats())
+        return model
+
+    scan = scan_bdf(bdf_filename, punch=punch, log=log)
+    if not quiet:  # pragma: no cover
+        print(scan.get_stats())
+    return scan
+
 def cmd_line_transform(argv=None, quiet=False):
     """command line interface to export_caero_mesh"""
     if argv is None:
@@ -1131,6 +1186,7 @@ def cmd_line(argv=None, quiet=False):
         '  bdf transform                   IN_BDF_FILENAME [-o OUT_BDF_FILENAME] [--shift XYZ]\n'
         '  bdf export_caero_mesh           IN_BDF_FILENAME [-o OUT_BDF_FILENAME] [--subpanels] [--pid PID]\n'
         '  bdf split_cbars_by_pin_flags    IN_BDF_FILENAME [-o OUT_BDF_FILENAME] [-p PIN_FLAGS_CSV_FILENAME]\n'
+        '  bdf stats                       IN_BDF_FILENAME [--punch] [--profile] [--memory]\n'
     )
 
     if dev:
@@ -1152,6 +1208,7 @@ def cmd_line(argv=None, quiet=False):
         '  bdf filter             -h | --help\n'
         '  bdf export_caero_mesh  -h | --help\n'
         '  bdf split_cbars_by_pin_flags  -h | --help\n'
+        '  bdf stats              -h | --help\n'
     )
 
     if dev:
@@ -1186,6 +1243,8 @@ def cmd_line(argv=None, quiet=False):
         cmd_line_export_caero_mesh(argv, quiet=quiet)
     elif argv[1] == 'transform':
         cmd_line_transform(argv, quiet=quiet)
+    elif argv[1] == 'stats':
+        return cmd_line_stats(argv, quiet=quiet)
     elif argv[1] == 'filter' and dev:  # TODO: make better name
         cmd_line_filter(argv, quiet=quiet)
     elif argv[1] == 'free_faces':
@@ -1156,6 +1156,8 @@ def _load_hdf5_param(group, key, encoding):
             pass
         else:
             value = value.tolist()
+            value = [val.decode(encoding) if isinstance(val, bytes) else val
+                     for val in value]
 
     elif 'object' in sub_group:
         value, options = _load_hdf5_object(key, keys, sub_group, encoding)
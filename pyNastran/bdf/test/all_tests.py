@@ -17,6 +17,7 @@ from pyNastran.bdf.bdf_interface.test.test_assign_type import TestAssignType
 from pyNastran.bdf.bdf_interface.test.test_bdf_interface import TestBDFInterface
 from pyNastran.bdf.bdf_interface.test.test_dev_utils import DevUtils
 from pyNastran.bdf.bdf_interface.test.test_case_control_deck import CaseControlTest
+from pyNastran.bdf.bdf_interface.test.test_fast_parse import TestFastParse
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -473,6 +473,43 @@ class TestBDF(Tester):
         #with self.assertRaises(SyntaxError):
             #model.pop_parse_errors()
 
+    def test_safe_xref_parallel(self):
+        """tests safe_cross_reference(nworkers=4) gives the same model/messages as nworkers=1"""
+        from unittest import mock
+        from cpylog import SimpleLogger
+        def _run(bdf_filename, nworkers, pids_to_remove=None):
+            """helper for ``test_safe_xref_parallel``"""
+            messages = []
+            log = SimpleLogger(level='debug', log_func=(
+                lambda typ, unused_filename, unused_lineno, msg: messages.append((typ, msg))))
+            model = read_bdf(bdf_filename, xref=False, log=log)
+            for pid in pids_to_remove or []:
+                del model.properties[pid]
+            del messages[:]
+            try:
+                # the threads are only used by a free-threaded Python
+                with mock.patch('pyNastran.bdf.bdf_interface.safe_cross_reference.'
+                                '_is_free_threaded', return_value=True):
+                    model.safe_cross_reference(nworkers=nworkers)
+            except Exception as error:
+                messages.append(('exception', str(error)))
+            return model, messages
+
+        bdf_filename = os.path.join(MODEL_PATH, 'iSat', 'ISat_Launch_Sm_Rgd.dat')
+        model1, messages1 = _run(bdf_filename, 1)
+        model4, messages4 = _run(bdf_filename, 4)
+        assert messages1 == messages4
+        assert allclose(mass_properties(model1)[0], mass_properties(model4)[0])
+
+        # xref errors and the exception for a DVPREL1 with a missing property
+        bdf_filename = os.path.join(MODEL_PATH, 'bwb', 'bwb_saero.bdf')
+        model1, messages1 = _run(bdf_filename, 1, pids_to_remove=[10601])
+        model4, messages4 = _run(bdf_filename, 4, pids_to_remove=[10601])
+        assert messages1 == messages4
+        assert 'Failed to safe xref elements' in messages1[1][1], messages1
+        assert messages1[-1][0] == 'exception', messages1[-1]
+        assert isinstance(model4.log, SimpleLogger), model4.log
+
     def test_bdf_xref_safe(self):
         """testing various safe_xref methods"""
         model = BDF(debug=False, log=None, mode='msc')
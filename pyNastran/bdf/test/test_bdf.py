@@ -42,7 +42,7 @@ from pyNastran.bdf.subcase import Subcase
 from pyNastran.bdf.mesh_utils.export_mcids import export_mcids, export_mcids_all
 from pyNastran.bdf.mesh_utils.extract_bodies import extract_bodies
 from pyNastran.bdf.mesh_utils.mass_properties import (
-    mass_properties, mass_properties_nsm)  #, mass_properties_breakdown
+    mass_properties, mass_properties_nsm, mass_properties_vectorized)  #, mass_properties_breakdown
 from pyNastran.bdf.mesh_utils.forces_moments import get_temperatures_array
 from pyNastran.bdf.mesh_utils.mpc_dependency import (
     get_mpc_node_ids, get_mpc_node_ids_c1,
@@ -1852,6 +1852,10 @@ def check_mass(fem1: BDF, quiet: bool=False):
     assert np.allclose(mass1, mass2), f'mass1={mass1} mass2={mass2}'
     assert np.allclose(cg1, cg2), f'mass={mass1}\ncg1={cg1} cg2={cg2}'
     assert np.allclose(inertia1, inertia2, atol=1e-5), f'mass={mass1} cg={cg1}\ninertia1={inertia1}\ninertia2={inertia2}\ndinertia={inertia1-inertia2}'
+    mass3, cg3, inertia3 = mass_properties_vectorized(fem1, reference_point=None, sym_axis=None)
+    assert np.allclose(mass2, mass3), f'mass2={mass2} mass3={mass3}'
+    assert np.allclose(cg2, cg3), f'mass={mass2}\ncg2={cg2} cg3={cg3}'
+    assert np.allclose(inertia2, inertia3, atol=1e-5), f'mass={mass2} cg={cg2}\ninertia2={inertia2}\ninertia3={inertia3}'
 
     for nsm_id in chain(fem1.nsms, fem1.nsmadds):
         mass, unused_cg, unused_inertia = mass_properties_nsm(
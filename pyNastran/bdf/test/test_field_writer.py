@@ -6,9 +6,13 @@ from pyNastran.bdf.field_writer import print_card
 from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8,
                                           set_default_if_blank,
                                           set_blank_if_default, is_same, print_card_8,
-                                          print_scientific_8)
+                                          print_scientific_8, print_float_8_array,
+                                          print_int_8_array, print_card_8_array)
 from pyNastran.bdf.field_writer_16 import print_field_16, print_card_16, print_float_16, print_scientific_16
-from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.field_writer_16 import print_float_16_array, print_card_16_array
+from pyNastran.bdf.field_writer_double import (
+    print_card_double, print_scientific_double, print_scientific_double_array,
+    print_card_double_array)
 
 
 from pyNastran.bdf.bdf_interface.assign_type import interpret_value
@@ -483,6 +487,100 @@ class Testfield_writer_8(unittest.TestCase):
         unused_negative_output = [print_float_16(-x) for x in nums]
 
 
+class TestFieldWriterArrays(unittest.TestCase):
+    """the array writers must match the scalar writers"""
+    def test_float_array(self):
+        """tests print_float_8_array, print_float_16_array, print_scientific_double_array"""
+        nums = [0., -0., np.nan, 0.5, 0.125, 9.9999999, 0.99999996, 999999.95, -0.99999995,
+                0.001, -0.01, 1e6, -1e5, 1.5e-10, -2.5e20, 1e-99, 1e100]
+        for istart in np.arange(-13, 16):
+            nums.extend(np.logspace(istart, istart+1, num=200, endpoint=True).tolist())
+        nums += [-num for num in nums]
+        nums += np.round(np.linspace(-1000., 1000., num=2001), 3).tolist()
+        nums = np.array(nums)
+
+        for print_float, print_float_array in [(print_float_8, print_float_8_array),
+                                               (print_float_16, print_float_16_array),
+                                               (print_scientific_double,
+                                                print_scientific_double_array)]:
+            expected = [print_float(num) for num in nums.tolist()]
+            actual = print_float_array(nums)
+            for num, expectedi, actuali in zip(nums, expected, actual):
+                self.assertEqual(actuali, expectedi, msg='%s: num=%r' % (
+                    print_float_array.__name__, num))
+
+    def test_int_array(self):
+        """tests print_int_8_array"""
+        ints = np.array([0, 1, -1, 12345678, -1234567, 42])
+        fields = print_int_8_array(ints)
+        self.assertEqual(fields.tolist(), ['%8i' % i for i in ints])
+        with self.assertRaises(RuntimeError):
+            print_int_8_array(np.array([123456789]))
+
+    def test_card_array(self):
+        """tests print_card_8_array, print_card_16_array, print_card_double_array"""
+        eids = np.array([1, 20, 300])
+        floats = np.array([1.0, np.nan, -2.5])
+        strings = np.array(['', 'THRU', 'A'])
+        objects = np.array([None, 4, ''], dtype=object)
+        columns = [eids, floats, strings, eids, eids, objects, eids, eids, floats, objects]
+        # nan is a blank field
+        rows = [['CARD'] + [value.item() if isinstance(value, np.generic) else value
+                            for value in [column[i] for column in columns]]
+                for i in range(3)]
+        rows_blank = [[None if isinstance(value, float) and np.isnan(value) else value
+                       for value in row] for row in rows]
+
+        cards = print_card_8_array('CARD', columns)
+        self.assertEqual(cards.tolist(), [print_card_8(row) for row in rows_blank])
+        cards = print_card_16_array('CARD', columns)
+        self.assertEqual(cards.tolist(), [print_card_16(row) for row in rows_blank])
+        cards = print_card_double_array('CARD', columns)
+        self.assertEqual(cards.tolist(), [print_card_double(row) for row in rows_blank])
+
+    def test_card_array_random(self):
+        """compares the card array writers to the scalar writers for random cards"""
+        rng = np.random.RandomState(42)
+        writers = [
+            (print_card_8_array, print_card_8),
+            (print_card_16_array, print_card_16),
+            (print_card_double_array, print_card_double),
+        ]
+        ncards = 5
+        for unused_i in range(200):
+            columns = []
+            for unused_j in range(rng.randint(1, 20)):
+                kind = rng.randint(4)
+                if kind == 0:
+                    column = rng.randint(-1000, 100000, size=ncards)
+                elif kind == 1:
+                    column = rng.randn(ncards) * 10. ** rng.randint(-10, 10)
+                    column[rng.rand(ncards) < 0.3] = np.nan
+                elif kind == 2:
+                    column = np.array([rng.choice(['', ' ', 'ABC', 'XY'])
+                                       for unused_k in range(ncards)])
+                else:
+                    column = np.array([None if rng.rand() < 0.5 else int(rng.randint(10))
+                                       for unused_k in range(ncards)], dtype=object)
+                columns.append(column)
+
+            rows = []
+            for k in range(ncards):
+                row = ['CARD']
+                for column in columns:
+                    value = column[k]
+                    if isinstance(value, np.generic):
+                        value = value.item()
+                    if isinstance(value, float) and np.isnan(value):
+                        value = None
+                    row.append(value)
+                rows.append(row)
+
+            for print_card_array, print_card in writers:
+                cards = print_card_array('CARD', columns)
+                self.assertEqual(cards.tolist(), [print_card(row[:]) for row in rows])
+
+
 def compare(value_in):
     field = print_field_8(value_in)
     val = interpret_value(field)
@@ -1,11 +1,16 @@
 import os
 import unittest
+from collections import defaultdict
 from io import StringIO
 
+import numpy as np
 from cpylog import get_logger
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.errors import DuplicateIDsError
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
 from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.lazy_cards import LazyCardDict
 from pyNastran.bdf.bdf_interface.include_file import (
     split_filename_into_tokens, get_include_filename,
     PurePosixPath, PureWindowsPath,
@@ -262,6 +267,610 @@ class TestReadWrite(unittest.TestCase):
         card_lines4 = ['GRDSET', 1, 'd2', 'e2', 'f2']
         model.add_card(card_lines4, 'GRDSET')
 
+    def test_read_bdf_nworkers(self):
+        """tests that the process-parallel reader matches the serial reader"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        model = read_bdf(bdf_filename, xref=False, log=log)
+        model2 = read_bdf(bdf_filename, xref=False, log=log, nworkers=2)
+        assert model.card_count == model2.card_count, model2.card_count
+        for name in ['nodes', 'elements', 'properties', 'materials', 'loads', 'spcs']:
+            cards = getattr(model, name)
+            cards2 = getattr(model2, name)
+            assert list(cards) == list(cards2), name
+            for key, card in cards.items():
+                assert str(card) == str(cards2[key]), str(cards2[key])
+
+    def test_read_bdf_nworkers_duplicate(self):
+        """tests that the process-parallel reader finds duplicate ids"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        lines = [
+            'GRID,1,,0.0,0.0,0.0',
+            'GRID,2,,1.0,0.0,0.0',
+            'CROD,10,100,1,2',
+            'CROD,10,100,2,1',
+            'PROD,100,1000,1.0',
+            'MAT1,1000,3.0e7,,0.3',
+        ]
+        bdf_file = StringIO()
+        bdf_file.write('\n'.join(lines))
+        bdf_file.seek(0)
+        model = BDF(log=log, debug=False)
+        with self.assertRaises(DuplicateIDsError):
+            model.read_bdf(bdf_file, punch=True, nworkers=2)
+
+    def test_read_bdf_cache_dir(self):
+        """tests that the parsed model cache is invalidated by an INCLUDE"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        cache_dir = os.path.join(TEST_PATH, 'cache_dir')
+        bdf_filename = os.path.join(TEST_PATH, 'cache_main.bdf')
+        include_filename = os.path.join(TEST_PATH, 'cache_include.inc')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                'GRID,1,,0.0,0.0,0.0\n'
+                "INCLUDE 'cache_include.inc'\n"
+                'ENDDATA\n')
+        with open(include_filename, 'w') as bdf_file:
+            bdf_file.write('GRID,2,,1.0,0.0,0.0\n')
+
+        model = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert len(model.nodes) == 2, model.nodes
+        assert len(os.listdir(cache_dir)) == 2, os.listdir(cache_dir)
+
+        model = read_bdf(bdf_filename, log=log, cache_dir=cache_dir, xref=False)
+        assert len(model.nodes) == 2, model.nodes
+        assert model.sol == 101, model.sol
+
+        # the include changes size, so the cache is stale
+        with open(include_filename, 'w') as bdf_file:
+            bdf_file.write('GRID,2,,1.0,0.0,0.0\n'
+                           'GRID,3,,2.0,0.0,0.0\n')
+        model = read_bdf(bdf_filename, log=log, cache_dir=cache_dir, cache_hash=True)
+        assert len(model.nodes) == 3, model.nodes
+        model = read_bdf(bdf_filename, log=log, cache_dir=cache_dir, cache_hash=True)
+        assert len(model.nodes) == 3, model.nodes
+
+        for filename in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, filename))
+        os.rmdir(cache_dir)
+        os.remove(bdf_filename)
+        os.remove(include_filename)
+
+    def test_read_bdf_cache_dir_zip(self):
+        """tests that the parsed model cache is invalidated by a zip-archived INCLUDE"""
+        import time
+        import zipfile
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        cache_dir = os.path.join(TEST_PATH, 'cache_dir_zip')
+        bdf_filename = os.path.join(TEST_PATH, 'cache_main_zip.bdf')
+        zip_filename = os.path.join(TEST_PATH, 'cache_archive.zip')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'CEND\n'
+                'BEGIN BULK\n'
+                'GRID,1,,0.0,0.0,0.0\n'
+                "INCLUDE 'cache_archive.zip/cache_include.inc'\n"
+                'ENDDATA\n')
+        with zipfile.ZipFile(zip_filename, 'w') as zip_file:
+            zip_file.writestr('cache_include.inc', 'GRID,2,,1.0,0.0,0.0\n')
+
+        model = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert len(model.nodes) == 2, model.nodes
+        json_filename = [filename for filename in os.listdir(cache_dir)
+                         if filename.endswith('.json')][0]
+        with open(os.path.join(cache_dir, json_filename), 'r') as json_file:
+            assert 'cache_include.inc' in json_file.read()
+
+        # the archive changes, so the cache is stale
+        time.sleep(0.01)
+        with zipfile.ZipFile(zip_filename, 'w') as zip_file:
+            zip_file.writestr('cache_include.inc',
+                              'GRID,2,,1.0,0.0,0.0\n'
+                              'GRID,3,,2.0,0.0,0.0\n')
+        model = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert len(model.nodes) == 3, model.nodes
+
+        for filename in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, filename))
+        os.rmdir(cache_dir)
+        os.remove(bdf_filename)
+        os.remove(zip_filename)
+
+    def test_refresh_includes(self):
+        """tests that a changed INCLUDE file can be re-read"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(TEST_PATH, 'refresh_main.bdf')
+        include_filename = os.path.join(TEST_PATH, 'refresh_include.inc')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                'GRID,1,,0.0,0.0,0.0\n'
+                'GRID,2,,1.0,0.0,0.0\n'
+                'GRID,3,,1.0,1.0,0.0\n'
+                'PROD,100,1000,1.0\n'
+                "INCLUDE 'refresh_include.inc'\n"
+                'ENDDATA\n')
+        with open(include_filename, 'w') as bdf_file:
+            bdf_file.write('MAT1,1000,3.0e7,,0.3\n'
+                           'CROD,10,100,1,2\n')
+
+        model = read_bdf(bdf_filename, log=log, save_file_structure=True)
+        assert model.refresh_includes() == []
+        assert model.card_count['CROD'] == 1, model.card_count
+
+        with open(include_filename, 'w') as bdf_file:
+            bdf_file.write('$ steel\n'
+                           'MAT1,1000,1.0e7,,0.3\n'
+                           'CROD,10,100,1,2\n'
+                           'CROD,11,100,2,3\n')
+        refreshed_filenames = model.refresh_includes()
+        assert refreshed_filenames == [os.path.abspath(include_filename)], refreshed_filenames
+        model2 = read_bdf(bdf_filename, log=log)
+
+        assert sorted(model.elements) == sorted(model2.elements), model.elements
+        assert model.card_count == model2.card_count, model.card_count
+        assert model.materials[1000].e == 1.0e7, model.materials[1000]
+        assert model.materials[1000].comment == '$ steel\n', model.materials[1000].comment
+        assert model.elements[10].pid_ref.mid_ref.e == 1.0e7, model.elements[10].pid_ref
+        assert model.elements[11].nodes_ref[1].nid == 3
+        assert model.properties[100].mid_ref is model.materials[1000]
+        model.get_mass_breakdown()
+
+        # the cards were uncross-referenced before they were linked again
+        model.uncross_reference()
+        assert model.properties[100].mid == 1000, model.properties[100].mid
+        assert model.elements[11].nodes == [2, 3], model.elements[11].nodes
+
+        # new INCLUDEs require read_bdf
+        model.cross_reference()
+        with open(include_filename, 'w') as bdf_file:
+            bdf_file.write('MAT1,1000,1.0e7,,0.3\n'
+                           "INCLUDE 'refresh_main.bdf'\n")
+        with self.assertRaises(NotImplementedError):
+            model.refresh_includes()
+
+        os.remove(bdf_filename)
+        os.remove(include_filename)
+
+    def test_iter_bdf_cards(self):
+        """tests streaming the cards without building the model"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(TEST_PATH, 'test_include2.bdf')
+        model = read_bdf(bdf_filename, log=log, xref=False)
+
+        card_count = defaultdict(int)
+        model2 = BDF(log=log)
+        for card_name, fields, unused_comment, ifile, iline in model2.iter_bdf_cards(bdf_filename):
+            card_count[card_name] += 1
+            if card_name == 'GRID':
+                nid = int(fields[1])
+                assert nid in model.nodes, nid
+                assert ifile > 0, (ifile, iline)
+        assert dict(card_count) == {key: value for key, value in model.card_count.items()
+                                    if key != 'ENDDATA'}, card_count
+        assert model2.active_filenames == model.active_filenames
+        assert len(model2.nodes) == 0
+
+        bdf_file = StringIO()
+        bdf_file.write(
+            '$ node 1\n'
+            'GRID,1,,0.0,0.0,0.0\n'
+            'CONM2   2       1       0       1.0\n'
+            '        1.0             2.0\n'
+            'ENDDATA\n'
+            'GRID,3\n')
+        bdf_file.seek(0)
+        cards = list(model2.iter_bdf_cards(bdf_file, punch=None))
+        assert cards == [
+            ('GRID', ['GRID', '1', None, '0.0', '0.0', '0.0'], ' node 1', 0, 1),
+            ('CONM2', ['CONM2', '2', '1', '0', '1.0', None, None, None, None,
+                       '1.0', None, '2.0'], '', 0, 2),
+        ], cards
+
+    def test_read_bdf_lazy(self):
+        """tests that the lazy cards are parsed when they're used"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'iSat', 'ISat_Launch_Sm_Rgd.dat')
+        model = read_bdf(bdf_filename, log=log, xref=False)
+        model_lazy = read_bdf(bdf_filename, log=log, xref=False, lazy=True)
+        assert isinstance(model_lazy.elements, LazyCardDict)
+        assert model_lazy.card_count == model.card_count
+
+        # no parsing
+        assert model_lazy.get_bdf_stats() == model.get_bdf_stats()
+        assert isinstance(model_lazy.nodes, LazyCardDict)
+        assert isinstance(model_lazy.elements, LazyCardDict)
+
+        # the loaded attribute is a normal dictionary
+        nodes = model_lazy.nodes
+        assert len(nodes) == len(model.nodes)
+        assert nodes.is_loaded
+        assert type(model_lazy.nodes) is dict
+        assert model_lazy.nodes == nodes
+        assert isinstance(model_lazy.elements, LazyCardDict)
+
+        eids = model_lazy.get_card_ids_by_card_types(['CQUAD4'])['CQUAD4']
+        assert type(model_lazy.elements) is dict
+        assert eids == model.get_card_ids_by_card_types(['CQUAD4'])['CQUAD4']
+        assert model_lazy.card_count == model.card_count
+
+        bdf_file = StringIO()
+        bdf_file_lazy = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model_lazy.write_bdf(bdf_file_lazy, close=False)
+        assert bdf_file_lazy.getvalue() == bdf_file.getvalue()
+        model_lazy.cross_reference()
+        model_lazy.get_mass_breakdown()
+
+        # parsing errors are raised when the cards are used
+        bdf_file = StringIO()
+        bdf_file.write('GRID,1,,0.0,0.0,0.0\n'
+                       'GRID,2,,1.0,0.0,0.0\n'
+                       'CROD,10,100,1,2\n'
+                       'CROD,10,100,1,2.0\n')
+        bdf_file.seek(0)
+        model_lazy = read_bdf(bdf_file, log=log, punch=True, xref=False, lazy=True)
+        assert len(model_lazy.nodes) == 2
+        with self.assertRaises(SyntaxError):
+            model_lazy.elements.keys()
+
+    def test_read_bdf_xref_arrays(self):
+        """tests xref='arrays' against the standard cross-referencing"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'iSat', 'ISat_Launch_Sm_Rgd.dat')
+        model = read_bdf(bdf_filename, log=log, xref=True)
+        model_arrays = read_bdf(bdf_filename, log=log, xref='arrays')
+        assert model_arrays._xref is False
+        assert model_arrays.elements[1].pid_ref is None
+
+        xref_arrays = model_arrays.xref_arrays
+        assert np.array_equal(xref_arrays.node_ids, sorted(model.nodes))
+        for element_type in ['CQUAD4', 'CTRIA3', 'CBAR', 'CHEXA']:
+            eids, centroids = xref_arrays.get_centroids(element_type)
+            expected = [model.elements[eid].Centroid() for eid in eids]
+            assert np.allclose(centroids, expected), element_type
+
+        for element_type in ['CQUAD4', 'CTRIA3']:
+            eids, areas = xref_arrays.get_areas(element_type)
+            assert np.allclose(areas, [model.elements[eid].Area() for eid in eids])
+            eids, masses = xref_arrays.get_masses(element_type)
+            assert np.allclose(masses, [model.elements[eid].Mass() for eid in eids])
+
+        eids, masses = xref_arrays.get_masses('CONM2')
+        assert np.allclose(masses, [model.masses[eid].Mass() for eid in eids])
+
+        model_arrays.uncross_reference()
+        assert model_arrays.xref_arrays is None
+
+        # missing nodes are reported by element
+        bdf_file = StringIO()
+        bdf_file.write('GRID,1,,0.0,0.0,0.0\n'
+                       'GRID,2,,1.0,0.0,0.0\n'
+                       'CROD,10,100,1,3\n'
+                       'PROD,100,1000,1.0\n'
+                       'MAT1,1000,3.0e7,,0.3\n')
+        bdf_file.seek(0)
+        with self.assertRaises(KeyError):
+            read_bdf(bdf_file, log=log, punch=True, xref='arrays')
+
+    def test_write_bdf_nworkers(self):
+        """tests that write_bdf(nworkers=2) is the same as the serial writer"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'iSat', 'ISat_Launch_Sm_Rgd.dat')
+        model = read_bdf(bdf_filename, log=log, xref=True)
+        for size, interspersed in [(8, False), (16, False), (8, True)]:
+            bdf_file_serial = StringIO()
+            model.write_bdf(bdf_file_serial, size=size, interspersed=interspersed,
+                            close=False)
+            bdf_file_parallel = StringIO()
+            model.write_bdf(bdf_file_parallel, size=size, interspersed=interspersed,
+                            close=False, nworkers=2)
+            assert bdf_file_serial.getvalue() == bdf_file_parallel.getvalue(), (size, interspersed)
+
+    def test_hdf5_compression_cards(self):
+        """tests the chunked/compressed hdf5 file and loading a subset of the cards"""
+        import tempfile
+        import h5py
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        model = read_bdf(bdf_filename, log=log, xref=False)
+        with tempfile.TemporaryDirectory() as dirname:
+            hdf5_filename = os.path.join(dirname, 'solid_bending_gzip.h5')
+            model.export_hdf5_filename(hdf5_filename, compression='gzip')
+            with h5py.File(hdf5_filename, 'r') as h5_file:
+                xyz = h5_file['nodes/GRID/xyz']
+                assert xyz.chunks is not None
+                assert xyz.compression == 'gzip'
+
+            model2 = BDF(log=log)
+            model2.load_hdf5_filename(hdf5_filename)
+            model3 = BDF(log=log)
+            model3.load_hdf5_filename(hdf5_filename, cards=['GRID', 'CTETRA'])
+
+        bdf_file = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        bdf_file2 = StringIO()
+        model2.write_bdf(bdf_file2, close=False)
+        bulk = bdf_file.getvalue().split('BEGIN BULK')[1]
+        bulk2 = bdf_file2.getvalue().split('BEGIN BULK')[1]
+        assert bulk == bulk2
+
+        assert len(model3.nodes) == len(model.nodes)
+        assert len(model3.elements) == len(model.elements)
+        assert len(model3.properties) == 0
+        assert len(model3.materials) == 0
+
+    def test_snapshot(self):
+        """tests save_snapshot/load_snapshot and copy"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        snapshot_filename = os.path.join(TEST_PATH, 'solid_bending.snapshot')
+        model = read_bdf(bdf_filename, log=log)
+
+        # the GRIDs and CTETRAs are packed; the loads/spcs/etc. are pickled
+        model.nodes[1].comment = 'node 1'
+        model.nodes[2].ps = '123'
+        bdf_file = StringIO()
+        model.write_bdf(bdf_file, close=False)
+
+        model.save_snapshot(snapshot_filename)
+        assert model._xref
+        model2 = BDF(log=log)
+        model2.load_snapshot(snapshot_filename)
+        assert not model2._xref
+        os.remove(snapshot_filename)
+
+        bdf_file2 = StringIO()
+        model2.write_bdf(bdf_file2, close=False)
+        assert bdf_file.getvalue() == bdf_file2.getvalue()
+        assert model2.nodes[1].comment == '$node 1\n', model2.nodes[1].comment
+        assert model2.nodes[3].cp_ref is None
+        assert np.array_equal(model2.nodes[3].xyz, model.nodes[3].xyz)
+        assert list(model2.elements) == list(model.elements)
+        model2.cross_reference()
+        assert model2._xref
+        assert model2.copy().elements[1].nodes_ref is not None
+        mass1 = mass_properties(model)[0]
+        mass2 = mass_properties(model2)[0]
+        assert np.allclose(mass1, mass2), (mass1, mass2)
+
+        # the copy doesn't share anything with the model
+        model3 = model.copy()
+        assert model3._xref
+        model3.nodes[3].xyz[0] += 1.
+        model3.elements[1].nodes[0] = 4
+        assert model.nodes[3].xyz[0] == model2.nodes[3].xyz[0]
+        assert model.elements[1].nodes[0] != 4
+        assert model3.elements[1].nodes_ref[0] is not model.elements[1].nodes_ref[0]
+
+        model4 = model.copy(xref=False)
+        assert not model4._xref
+        assert model4.elements[1].nodes_ref is None
+        model4.safe_cross_reference()
+        assert model4._xref
+        model4.uncross_reference()
+        assert model4.copy().elements[1].nodes_ref is None
+
+        with self.assertRaises(RuntimeError):
+            model2.load_snapshot(bdf_filename)
+
+    def test_snapshot_superelements(self):
+        """tests that the copied superelement models can still add cards"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'other', 'see101nd.bdf')
+        model = read_bdf(bdf_filename, xref=False, log=log)
+        assert len(model.superelement_models) > 0
+        bdf_file = StringIO()
+        model.write_bdf(bdf_file, close=False)
+
+        model2 = model.copy()
+        for super_model in model2.superelement_models.values():
+            assert super_model.log is model2.log
+            super_model.add_card(['GRID', 999999, None, 1., 2., 3.], 'GRID', is_list=True)
+
+        model3 = model2.copy().copy()
+        nodes = [super_model.nodes for super_model in model3.superelement_models.values()]
+        assert all(999999 in nodesi for nodesi in nodes)
+        assert 999999 not in list(model.superelement_models.values())[0].nodes
+
+        bdf_file2 = StringIO()
+        model.copy().copy().write_bdf(bdf_file2, close=False)
+        assert bdf_file.getvalue() == bdf_file2.getvalue()
+
+    def test_profile(self):
+        """tests read_bdf(..., profile=True) and cross_reference(..., profile=True)"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        assert model.profile_stats is None
+        assert 'profiling was not enabled' in model.get_profile_stats()
+
+        model = read_bdf(bdf_filename, log=log, profile=True)
+        stats = model.profile_stats
+        phases = stats['phases']
+        for phase in ['read_lines', 'tokenize', 'add_cards', 'validate',
+                      'cross_reference', 'cross_reference.elements']:
+            assert phases[phase]['count'] == 1, phase
+            assert phases[phase]['time'] >= 0., phase
+            assert phases[phase]['memory'] is None, phase
+        cards = stats['cards']
+        assert cards['GRID']['count'] == model.card_count['GRID'], cards['GRID']
+        assert cards['CTETRA']['count'] == model.card_count['CTETRA'], cards['CTETRA']
+        assert phases['add_cards']['time'] >= sum(card['time'] for card in cards.values())
+        msg = model.get_profile_stats()
+        assert 'CTETRA' in msg and 'cross_reference.nodes' in msg, msg
+        assert model.get_profile_stats(return_type='list')[0] == '---BDF Profile---'
+
+        # the profile isn't active after read_bdf
+        model.add_grid(1000, [0., 0., 0.])
+        model.add_card(['GRID', 1001], 'GRID', is_list=True)
+        assert model.profile_stats['cards']['GRID']['count'] == model.card_count['GRID'] - 1
+
+        model = read_bdf(bdf_filename, xref=False, log=log)
+        model.cross_reference(profile='memory')
+        phases = model.profile_stats['phases']
+        assert 'read_lines' not in phases, phases
+        assert isinstance(phases['cross_reference.elements']['memory'], int), phases
+        assert model.profile_stats['cards'] == {}
+
+        with self.assertRaises(ValueError):
+            read_bdf(bdf_filename, log=log, profile='cat')
+
+    def test_convert_bdf_to_vectorized(self):
+        """tests convert_bdf_to_vectorized and the conversion to/from the object model"""
+        from pyNastran.bdf.bdf_vectorized import convert_bdf_to_vectorized, VectorizedBDF
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filenames = [
+            os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf'),
+            os.path.join(MODEL_PATH, 'elements', 'static_elements.bdf'),
+            # superelements
+            os.path.join(MODEL_PATH, 'other', 'see101nd.bdf'),
+            os.path.join(MODEL_PATH, 'other', 'see101ta.bdf'),
+            os.path.join(MODEL_PATH, 'iSat', 'ISat_Launch_Sm_Rgd.dat'),
+        ]
+        for bdf_filename in bdf_filenames:
+            model = read_bdf(bdf_filename, xref=False, log=log)
+            bdf_file = StringIO()
+            model.write_bdf(bdf_file, close=False)
+
+            vmodel = convert_bdf_to_vectorized(bdf_filename, log=log)
+            bdf_file2 = StringIO()
+            vmodel.write_bdf(bdf_file2, close=False)
+            assert bdf_file.getvalue() == bdf_file2.getvalue(), bdf_filename
+
+            # the input model isn't changed
+            vmodel2 = VectorizedBDF.from_bdf(model)
+            bdf_file3 = StringIO()
+            model.write_bdf(bdf_file3, close=False)
+            assert bdf_file.getvalue() == bdf_file3.getvalue(), bdf_filename
+            assert len(vmodel2.node_ids) == len(vmodel.node_ids)
+            bdf_file4 = StringIO()
+            vmodel2.to_bdf().write_bdf(bdf_file4, close=False)
+            assert bdf_file.getvalue() == bdf_file4.getvalue(), bdf_filename
+
+        model = vmodel.to_bdf()
+        assert not model._xref
+        assert len(model.elements) == len(vmodel.element_ids) + len(vmodel.model.elements)
+        for group in ['nodes', 'shells', 'solids', 'bars', 'masses', 'spcs']:
+            assert getattr(vmodel, group), group
+        assert 'CQUAD4' in vmodel.get_bdf_stats()
+
+    def test_vectorized_lookups(self):
+        """tests the node/element lookups of VectorizedBDF"""
+        from pyNastran.bdf.bdf_vectorized import VectorizedBDF
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        model = BDF(log=log)
+        model.add_grid(10, [0., 0., 0.])
+        model.add_grid(30, [1., 0., 0.], cp=1)
+        model.add_grid(20, [1., 1., 0.])
+        model.add_grid(40, [0., 1., 0.])
+        model.add_cord2r(1, [0., 0., 1.], [0., 0., 2.], [1., 0., 1.])
+        model.add_cquad4(2, 1, [10, 30, 20, 40])
+        model.add_ctria3(1, 1, [10, 30, 20], theta_mcid=1)
+        model.add_conrod(5, 1, [10, 40])
+        model.add_ctetra(3, 2, [10, 30, 20, 40, None, None, None, None, None, None])
+        model.add_spc1(1, '123', [40, 10, 20])
+        model.add_spc1(1, '456', [10])
+        model.add_force(2, 20, 1., [1., 0., 0.])
+        model.add_force(2, 10, 2., [1., 0., 0.])
+
+        vmodel = VectorizedBDF.from_bdf(model)
+        assert np.array_equal(vmodel.node_ids, [10, 20, 30, 40])
+        assert np.array_equal(vmodel.get_node_index([40, 10]), [3, 0])
+        quad = vmodel.shells['CQUAD4']
+        inodes = vmodel.get_node_index(quad.nodes)
+        assert np.array_equal(inodes, [[0, 2, 1, 3]])
+
+        xyz_cid0 = vmodel.get_xyz_cid0()
+        assert np.allclose(xyz_cid0[2], [1., 0., 1.]), xyz_cid0
+        with self.assertRaises(KeyError):
+            vmodel.get_node_index([10, 50])
+
+        # blank CTETRA10 midside nodes
+        tetra = vmodel.solids['CTETRA10']
+        assert np.array_equal(vmodel.get_node_index(tetra.nodes, allow0=True)[0, 4:], [-1] * 6)
+        assert tetra.to_cards()[0].nodes[4:] == [None] * 6
+
+        assert np.array_equal(vmodel.element_ids, [1, 2, 3, 5])
+        class_names, index = vmodel.get_element_index([5, 2, 1])
+        assert class_names == ['CONROD', 'CQUAD4', 'CTRIA3'], class_names
+        assert np.array_equal(index, [0, 0, 0])
+        with self.assertRaises(KeyError):
+            vmodel.get_element_index([4])
+
+        # ragged SPC1 nodes and the loads are sorted by id
+        spc1 = vmodel.spcs['SPC1']
+        assert [nodes.tolist() for nodes in spc1.nodes] == [[10, 20, 40], [10]]
+        forces = vmodel.loads['FORCE']
+        assert np.array_equal(forces.node[forces.get_slice(2)], [20, 10])
+
+        model2 = vmodel.to_bdf()
+        assert [card.nodes for card in model2.spcs[1]] == [[10, 20, 40], [10]]
+        assert [card.node for card in model2.loads[2]] == [20, 10]
+        assert model2.elements[1].theta_mcid == 1
+        assert list(model2.elements) == [1, 2, 3, 5]
+
+    def test_read_write_compressed(self):
+        """tests reading/writing compressed decks and zip-archived INCLUDEs"""
+        import bz2
+        import gzip
+        import lzma
+        import zipfile
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        bdf_filename = os.path.join(TEST_PATH, 'compressed.bdf.gz')
+        nodes_filename = os.path.join(TEST_PATH, 'compressed_nodes.inc.xz')
+        props_filename = os.path.join(TEST_PATH, 'compressed_props.inc.bz2')
+        zip_filename = os.path.join(TEST_PATH, 'compressed_archive.zip')
+        with gzip.open(bdf_filename, 'wt') as bdf_file:
+            bdf_file.write(
+                'CEND\n'
+                'BEGIN BULK\n'
+                "INCLUDE 'compressed_nodes.inc.xz'\n"
+                "INCLUDE 'compressed_props.inc.bz2'\n"
+                "INCLUDE 'compressed_archive.zip/elements/elements.inc'\n"
+                'MAT1,1,3.0e7,,0.3\n'
+                'ENDDATA\n')
+        with lzma.open(nodes_filename, 'wt') as bdf_file:
+            bdf_file.write(
+                'GRID,1,,0.,0.,0.\n'
+                'GRID,2,,1.,0.,0.\n'
+                'GRID,3,,1.,1.,0.\n'
+                'GRID,4,,0.,1.,0.\n')
+        with bz2.open(props_filename, 'wt') as bdf_file:
+            bdf_file.write('PSHELL,1,1,0.1\n')
+        with zipfile.ZipFile(zip_filename, 'w') as zip_file:
+            zip_file.writestr('elements/elements.inc', 'CQUAD4,1,1,1,2,3,4\n')
+
+        model = read_bdf(bdf_filename, log=log)
+        assert len(model.nodes) == 4, model.nodes
+        assert len(model.elements) == 1, model.elements
+        assert len(model.properties) == 1, model.properties
+        assert len(model.active_filenames) == 4, model.active_filenames
+
+        bdf_file = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        for ext, module in [('.gz', gzip), ('.bz2', bz2), ('.xz', lzma)]:
+            bdf_filename_out = os.path.join(TEST_PATH, 'compressed_out.bdf' + ext)
+            model.write_bdf(bdf_filename_out)
+            with module.open(bdf_filename_out, 'rt') as bdf_file_out:
+                assert bdf_file_out.read() == bdf_file.getvalue()
+            model2 = read_bdf(bdf_filename_out, log=log)
+            assert len(model2.elements) == 1, model2.elements
+            os.remove(bdf_filename_out)
+
+        with zipfile.ZipFile(zip_filename, 'a') as zip_file:
+            zip_file.writestr('model.bdf', bdf_file.getvalue())
+        model3 = read_bdf(os.path.join(zip_filename, 'model.bdf'), log=log)
+        assert len(model3.elements) == 1, model3.elements
+
+        for filename in [bdf_filename, nodes_filename, props_filename, zip_filename]:
+            os.remove(filename)
+
     def test_include_end(self):
         """tests multiple levels of includes"""
         log = get_logger(log=None, level='info', encoding='utf-8')
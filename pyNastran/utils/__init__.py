@@ -96,6 +96,10 @@ def check_path(filename: str, name: str='file') -> None:
     except TypeError:
         msg = 'cannot find %s=%r\n' % (name, filename)
         raise TypeError(msg)
+    if not exists:
+        # a file in a zip archive (e.g., 'models.zip/model.bdf')
+        from pyNastran.utils.compressed_file import is_zip_member
+        exists = is_zip_member(filename)
     if not exists:
         msg = 'cannot find %s=%r\n%s' % (name, filename, print_bad_path(filename))
         raise FileNotFoundError(msg)
@@ -0,0 +1,145 @@
+"""
+defines:
+ - bdf_file = open_file(filename, mode='r', encoding=None, errors=None)
+ - zip_filename, member = split_zip_filename(filename)
+ - filename = normalize_zip_filename(filename)
+ - is_zip_member(filename)
+ - is_file(filename)
+
+Supports reading/writing gzip (.gz), bzip2 (.bz2) and lzma (.xz)
+compressed files and reading files in a zip archive, which are
+referenced like a directory:
+
+    models.zip/fem/model.bdf
+
+The files are read as streams, so they're never decompressed to disk.
+"""
+import io
+import os
+import re
+import bz2
+import gzip
+import lzma
+import zipfile
+import posixpath
+from typing import Tuple, Optional, Any
+
+#: the modules used to open the compressed files
+COMPRESSION_MODULES = {
+    '.gz': gzip,
+    '.bz2': bz2,
+    '.xz': lzma,
+}
+
+# the path to an archive followed by the path in the archive
+ZIP_REGEX = re.compile(r'\.zip[\\/]', re.IGNORECASE)
+
+
+def split_zip_filename(filename: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Splits the path to a file in a zip archive
+
+    Parameters
+    ----------
+    filename : str
+        the path to the file (e.g., 'models.zip/fem/model.bdf')
+
+    Returns
+    -------
+    zip_filename : str / None
+        the path to the zip archive (e.g., 'models.zip')
+        None if filename isn't in a zip archive
+    member : str / None
+        the path in the archive (e.g., 'fem/model.bdf')
+
+    """
+    for match in ZIP_REGEX.finditer(filename):
+        zip_filename = filename[:match.end() - 1]
+        if os.path.isfile(zip_filename) and zipfile.is_zipfile(zip_filename):
+            member = posixpath.normpath(filename[match.end():].replace('\\', '/'))
+            if member == '..' or member.startswith('../'):
+                # the file is outside the archive
+                return None, None
+            return zip_filename, member
+    return None, None
+
+
+def normalize_zip_filename(filename: str) -> str:
+    """
+    Removes the archive from paths that go back out of a zip archive
+    (e.g., 'models.zip/../model.bdf' -> 'model.bdf'), which happens
+    when a file in an archive includes a file outside of it.
+    """
+    if ZIP_REGEX.search(filename) and split_zip_filename(filename)[0] is None:
+        return os.path.normpath(filename)
+    return filename
+
+
+def is_zip_member(filename: str) -> bool:
+    """is the file in a zip archive?"""
+    zip_filename, member = split_zip_filename(filename)
+    if zip_filename is None:
+        return False
+    with zipfile.ZipFile(zip_filename) as zip_file:
+        try:
+            zip_file.getinfo(member)
+        except KeyError:
+            return False
+    return True
+
+
+def is_file(filename: str) -> bool:
+    """is the filename a file or a file in a zip archive?"""
+    return os.path.isfile(filename) or is_zip_member(filename)
+
+
+def open_file(filename: str, mode: str='r', encoding: Optional[str]=None,
+              errors: Optional[str]=None) -> Any:
+    """
+    Opens a plain, compressed (gz, bz2, xz) or zip-archived file
+
+    Parameters
+    ----------
+    filename : str
+        the file to open
+    mode : str; default='r'
+        'r', 'rb', 'w', 'wb'
+        files in a zip archive can only be read
+    encoding : str; default=None
+        the encoding for a text mode
+    errors : str; default=None
+        how to handle unicode errors for a text mode
+
+    Returns
+    -------
+    file_obj : file
+        a file object, which is decoded as it's read
+
+    """
+    is_binary = 'b' in mode
+    if is_binary:
+        assert encoding is None, 'encoding=%r must be None for mode=%r' % (encoding, mode)
+
+    ext = os.path.splitext(filename)[1].lower()
+    if ext in COMPRESSION_MODULES:
+        module = COMPRESSION_MODULES[ext]
+        if is_binary:
+            return module.open(filename, mode)
+        return module.open(filename, mode.replace('t', '') + 't',
+                           encoding=encoding, errors=errors)
+
+    zip_filename, member = split_zip_filename(filename)
+    if zip_filename is not None:
+        if 'r' not in mode:
+            raise NotImplementedError('writing to a zip archive is not supported; '
+                                      'filename=%r' % filename)
+        # the archive stays open until the member is closed
+        with zipfile.ZipFile(zip_filename) as zip_file:
+            member_file = zip_file.open(member)
+        if is_binary:
+            return member_file
+        return io.TextIOWrapper(member_file, encoding=encoding, errors=errors)
+
+    if is_binary:
+        return open(filename, mode)
+    return open(filename, mode, encoding=encoding, errors=errors)
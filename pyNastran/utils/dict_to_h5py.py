@@ -454,12 +454,22 @@ class HDF5Importer:
         model[key] = new_dict
 
 
+def _is_vlen_str(h5_result_attr) -> bool:
+    """is the dataset a variable length string (e.g., written as a str)"""
+    string_info = h5py.check_string_dtype(h5_result_attr.dtype)
+    return string_info is not None and string_info.length is None
+
+
 def _cast(h5_result_attr):
     """converts the h5py type back into the actual type"""
     if h5_result_attr is None:
         return None
 
     if len(h5_result_attr.shape) == 0:
-        return np.array(h5_result_attr).tolist()
+        value = np.array(h5_result_attr).tolist()
+        if isinstance(value, bytes) and _is_vlen_str(h5_result_attr):
+            # h5py>=3 returns variable length strings as bytes
+            value = value.decode('utf8')
+        return value
         #raise NotImplementedError(h5_result_attr.dtype)
     return np.array(h5_result_attr)
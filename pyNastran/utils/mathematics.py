@@ -31,7 +31,6 @@ import numpy as np
 from numpy.linalg import norm  # type: ignore
 
 #from scipy.linalg import solve_banded  # type: ignore
-from scipy.integrate import quad  # type: ignore
 
 # should future proof this as it handles 1.9.0.dev-d1dbf8e, 1.10.2, and 1.6.2
 #_numpy_version = [int(i) for i in numpy.__version__.split('.') if i.isdigit()]
@@ -159,6 +158,8 @@ def integrate_unit_line(x, y):
     """
     if len(set(y)) == 1:
         return y[0]  # (x1-x0 = 1., so yBar*1 = yBar)
+    # scipy is slow to import, so it's imported when it's used
+    from scipy.integrate import quad  # type: ignore
     try:
         assert len(x) == len(y), 'x=%s y=%s' % (x, y)
         # integrate the area; y=f(x); A=integral(y*dx,x)
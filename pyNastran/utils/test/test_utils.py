@@ -55,6 +55,26 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             gauss(6)
 
+    def test_import_time(self):
+        """
+        ``from pyNastran.bdf.bdf import read_bdf`` doesn't run
+        ``git describe`` or import scipy/h5py/matplotlib/pandas/vtk/qtpy
+        """
+        import subprocess
+        import sys
+        code = (
+            'import sys\n'
+            'from pyNastran.bdf.bdf import read_bdf\n'
+            'import pyNastran\n'
+            "heavy_modules = {'scipy', 'h5py', 'matplotlib', 'pandas', 'vtk', 'qtpy'}\n"
+            "is_heavy = any(name.split('.')[0] in heavy_modules for name in sys.modules)\n"
+            "print('__version__' in vars(pyNastran), is_heavy)\n"
+        )
+        out = subprocess.check_output([sys.executable, '-c', code])
+        is_version, is_heavy = out.decode('utf-8').split()
+        assert is_version == 'False', out
+        assert is_heavy == 'False', out
+
     def test_print_bad_path(self):
         """tests ``print_bad_path``"""
         # passed: C:\work